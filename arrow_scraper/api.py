@@ -4,7 +4,7 @@ API-Only Flask Backend for Arrow Tuning System
 Provides RESTful API endpoints for the Nuxt 3 frontend
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Blueprint, Response, current_app, request, jsonify, send_from_directory
 from flask_cors import CORS
 import json
 import os
@@ -40,10 +40,15 @@ from component_database import ComponentDatabase
 from spine_service import UnifiedSpineService
 from compatibility_engine import CompatibilityEngine
 from change_log_service import ChangeLogService
+from catalog_snapshot import CatalogSnapshotManager
+from manufacturer_matcher import ManufacturerIndexCache
+from maintenance_scheduler import MaintenanceScheduler, maintenance_enabled
+import perf_monitor
 
 # Import authentication functions
 import jwt
 from auth import token_required, get_user_from_google_token
+from user_cache import get_user_cache
 
 def import_arrow_data_validator():
     """
@@ -100,31 +105,36 @@ def get_current_user_optional():
         if not token:
             return None
         
-        data = jwt.decode(token, os.environ.get("SECRET_KEY", "arrow-tuning-secret-key-change-in-production"), algorithms=["HS256"])
-        db = UnifiedDatabase()
-        current_user = db.get_user_by_id(data["user_id"])
-        return current_user
+        user_cache = get_user_cache()
+        data = user_cache.decode_token(token, os.environ.get("SECRET_KEY", "arrow-tuning-secret-key-change-in-production"))
+        return user_cache.get_user(data["user_id"])
     except Exception as e:
         print(f"Optional auth failed (this is OK for public endpoints): {e}")
         return None
 
-# Create Flask app
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'arrow-tuning-secret-key-change-in-production')
-
-# Enable CORS in Flask (nginx CORS disabled to prevent duplicates)
-CORS(app, 
-     origins=[
-         "http://localhost:3000",  # Nuxt dev server
-         "http://localhost:3001",  # Nuxt dev server alternate port
-         "http://localhost",       # Nginx proxy
-         "http://localhost:80",    # Nginx proxy with port
-         "https://archerytool.online", # Production domain
-         "https://www.archerytool.online", # Production domain with www
-     ], 
-     methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'], 
-     allow_headers=['Content-Type', 'Authorization'],
-     supports_credentials=True)
+# Routes are grouped into one blueprint per domain; create_app() registers them
+catalog_bp = Blueprint('catalog', __name__)        # arrows, manufacturers, components, equipment lookups
+calculator_bp = Blueprint('calculator', __name__)  # spine, ballistics and performance calculators
+tuning_bp = Blueprint('tuning', __name__)          # tuning guides, sessions, configs and history
+setups_bp = Blueprint('setups', __name__)          # bow setups, setup arrows, bow equipment
+journal_bp = Blueprint('journal', __name__)
+users_bp = Blueprint('users', __name__)            # login and user profile
+admin_bp = Blueprint('admin', __name__)
+backup_bp = Blueprint('backup', __name__)
+scraping_bp = Blueprint('scraping', __name__)
+system_bp = Blueprint('system', __name__)          # health, debug, uploads
+
+BLUEPRINTS = [catalog_bp, calculator_bp, tuning_bp, setups_bp, journal_bp, users_bp,
+              admin_bp, backup_bp, scraping_bp, system_bp]
+
+CORS_ORIGINS = [
+    "http://localhost:3000",  # Nuxt dev server
+    "http://localhost:3001",  # Nuxt dev server alternate port
+    "http://localhost",       # Nginx proxy
+    "http://localhost:80",    # Nginx proxy with port
+    "https://archerytool.online", # Production domain
+    "https://www.archerytool.online", # Production domain with www
+]
 
 # Global variables for lazy initialization
 tuning_system = None
@@ -133,6 +143,9 @@ unified_database = None
 component_database = None
 spine_service = None
 compatibility_engine = None
+catalog_snapshots = None
+manufacturer_index_cache = None
+maintenance_scheduler = None
 
 # In-memory session storage (use Redis in production)
 tuning_sessions = {}
@@ -606,6 +619,86 @@ def get_database():
             database = None
     return database
 
+def get_catalog_snapshot():
+    """Memory-mapped catalog snapshot for the current catalog version, or None to fall back to SQL"""
+    global catalog_snapshots
+    if catalog_snapshots is None:
+        db = get_database()
+        if not db:
+            return None
+        catalog_snapshots = CatalogSnapshotManager(db.db_path)
+    return catalog_snapshots.current()
+
+def get_manufacturer_index():
+    """Prebuilt manufacturer suggestion index, rebuilt when manufacturers change"""
+    global manufacturer_index_cache
+    if manufacturer_index_cache is None:
+        db = get_database()
+        if not db:
+            return None
+        manufacturer_index_cache = ManufacturerIndexCache(db.db_path)
+    return manufacturer_index_cache.current()
+
+def invalidate_manufacturer_index():
+    """Rebuild the suggestion index on next use (other workers follow the catalog version)"""
+    if manufacturer_index_cache is not None:
+        manufacturer_index_cache.invalidate()
+
+def get_maintenance_scheduler():
+    """Background database maintenance for this worker (thread starts on the first request)"""
+    global maintenance_scheduler
+    if maintenance_scheduler is None:
+        db = get_database()
+        if not db:
+            return None
+        maintenance_scheduler = MaintenanceScheduler(db.db_path)
+    return maintenance_scheduler
+
+def note_database_activity():
+    """Feed request traffic to the maintenance scheduler so it only works while traffic is low"""
+    if maintenance_enabled():
+        scheduler = get_maintenance_scheduler()
+        if scheduler:
+            scheduler.note_request()
+
+def begin_request_metrics():
+    """Start counting SQL statements and hot-path spans for this request"""
+    if request.method == 'OPTIONS':
+        return
+    rule = request.url_rule.rule if request.url_rule else '<unmatched>'
+    perf_monitor.monitor.begin_request(f"{request.method} {rule}")
+
+def record_response_status(response):
+    """Remember the response status for end_request_metrics"""
+    perf_monitor.monitor.record_status(response.status_code)
+    return response
+
+def end_request_metrics(exc=None):
+    """Fold the request into the per-endpoint latency and query aggregates (always runs)"""
+    perf_monitor.monitor.end_request()
+
+def get_catalog_statistics(db):
+    """Catalog statistics from the snapshot when available, else from the database"""
+    snapshot = get_catalog_snapshot()
+    return snapshot.statistics() if snapshot else db.get_statistics()
+
+def get_catalog_counts(db, column):
+    """(value, arrow count) pairs for an arrows column, ordered by value, NULLs excluded"""
+    snapshot = get_catalog_snapshot()
+    if snapshot and snapshot.has_column('arrows', column):
+        return list(snapshot.value_counts('arrows', column).items())
+    
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT {column}, COUNT(*) as count 
+        FROM arrows 
+        WHERE {column} IS NOT NULL 
+        GROUP BY {column} 
+        ORDER BY {column}
+    ''')
+    return [(row[column], row['count']) for row in cursor.fetchall()]
+
 def get_unified_database():
     """Get unified database with lazy initialization for journal and user data"""
     global unified_database
@@ -719,7 +812,6 @@ def get_compatibility_engine():
     return compatibility_engine
 
 # Error handler
-@app.errorhandler(Exception)
 def handle_error(error):
     """Global error handler"""
     import traceback
@@ -735,7 +827,7 @@ def handle_error(error):
     }), 500
 
 # Root endpoint
-@app.route('/', methods=['GET'])
+@system_bp.route('/', methods=['GET'])
 def root():
     """Root endpoint - redirect to health check"""
     return jsonify({
@@ -755,8 +847,20 @@ def root():
         }
     })
 
+# Prometheus scrape target; only served when PERF_METRICS_TOKEN is set (sent as a Bearer token)
+@system_bp.route('/api/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Request, SQL and span metrics in Prometheus text format"""
+    import hmac
+    metrics_token = os.environ.get('PERF_METRICS_TOKEN')
+    if not metrics_token:
+        return jsonify({'error': 'Metrics endpoint is disabled'}), 404
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {metrics_token}'):
+        return jsonify({'error': 'Invalid metrics token'}), 401
+    return Response(perf_monitor.monitor.prometheus(), mimetype='text/plain; version=0.0.4')
+
 # Simple health check that doesn't require database
-@app.route('/api/simple-health', methods=['GET'])
+@system_bp.route('/api/simple-health', methods=['GET'])
 def simple_health():
     """Simple health check without database dependency"""
     return jsonify({
@@ -772,7 +876,7 @@ def simple_health():
     })
 
 # Health check endpoint
-@app.route('/api/health', methods=['GET'])
+@system_bp.route('/api/health', methods=['GET'])
 def health_check():
     """System health check"""
     try:
@@ -806,7 +910,7 @@ def health_check():
         }), 500
 
 # Database Stats API
-@app.route('/api/database/stats', methods=['GET'])
+@catalog_bp.route('/api/database/stats', methods=['GET'])
 def get_database_stats():
     """Get database statistics"""
     try:
@@ -814,7 +918,7 @@ def get_database_stats():
         if not db:
             return jsonify({'error': 'Database not available'}), 500
             
-        stats = db.get_statistics()
+        stats = get_catalog_statistics(db)
         
         return jsonify({
             'total_arrows': stats.get('total_arrows', 0),
@@ -838,7 +942,7 @@ def get_database_stats():
         return jsonify({'error': str(e)}), 500
 
 # Git Commits API
-@app.route('/api/git/commits', methods=['GET'])
+@system_bp.route('/api/git/commits', methods=['GET'])
 @token_required
 def get_git_commits(current_user):
     """Get recent git commits for authenticated users"""
@@ -890,7 +994,7 @@ def get_git_commits(current_user):
         return jsonify({'error': str(e)}), 500
 
 # Arrow Database API
-@app.route('/api/arrows', methods=['GET'])
+@catalog_bp.route('/api/arrows', methods=['GET'])
 def get_arrows():
     """Get arrows with optional filtering"""
     try:
@@ -957,7 +1061,7 @@ def get_arrows():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/<int:arrow_id>', methods=['GET'])
+@catalog_bp.route('/api/arrows/<int:arrow_id>', methods=['GET'])
 def get_arrow_details(arrow_id):
     """Get detailed information about a specific arrow"""
     try:
@@ -1002,7 +1106,7 @@ def get_arrow_details(arrow_id):
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
 # Manufacturers API
-@app.route('/api/manufacturers', methods=['GET'])
+@catalog_bp.route('/api/manufacturers', methods=['GET'])
 def get_manufacturers():
     """Get list of all manufacturers with arrow counts"""
     try:
@@ -1010,7 +1114,7 @@ def get_manufacturers():
         if not db:
             return jsonify({'error': 'Database not available'}), 500
             
-        stats = db.get_statistics()
+        stats = get_catalog_statistics(db)
         manufacturers = stats.get('manufacturers', [])
         
         # Return manufacturer data
@@ -1020,7 +1124,7 @@ def get_manufacturers():
         return jsonify({'error': str(e)}), 500
 
 # Bow Equipment Manufacturers API
-@app.route('/api/bow-equipment/manufacturers', methods=['GET'])
+@setups_bp.route('/api/bow-equipment/manufacturers', methods=['GET'])
 def get_bow_equipment_manufacturers():
     """Get manufacturers organized by bow equipment categories"""
     try:
@@ -1089,7 +1193,7 @@ def get_bow_equipment_manufacturers():
         return jsonify({'error': str(e)}), 500
 
 # Manufacturer Autocomplete and Status API
-@app.route('/api/manufacturers/suggestions', methods=['GET'])
+@catalog_bp.route('/api/manufacturers/suggestions', methods=['GET'])
 def get_manufacturer_suggestions():
     """Get manufacturer suggestions for autocomplete with learning integration"""
     try:
@@ -1102,51 +1206,26 @@ def get_manufacturer_suggestions():
         
         suggestions = []
         
-        # Search in approved manufacturers first
-        db = get_database()
-        if not db:
+        # Search in approved manufacturers first (prebuilt fuzzy index: typos, aliases, abbreviations)
+        manufacturer_index = get_manufacturer_index()
+        if manufacturer_index is None:
             return jsonify({"error": "Database not available"}), 500
-        if db:
-            conn = db.get_connection()
-            cursor = conn.cursor()
-            
-            # Search manufacturers with category support
-            cursor.execute('''
-                SELECT DISTINCT m.name, mec.category_name
-                FROM manufacturers m
-                LEFT JOIN manufacturer_equipment_categories mec ON m.id = mec.manufacturer_id
-                WHERE m.is_active = 1 
-                AND LOWER(m.name) LIKE LOWER(?)
-                AND (mec.category_name = ? OR mec.category_name IS NULL)
-                ORDER BY 
-                    CASE WHEN LOWER(m.name) = LOWER(?) THEN 0 ELSE 1 END,
-                    LENGTH(m.name),
-                    m.name
-                LIMIT ?
-            ''', (f'%{query}%', category, query, limit))
-            
-            # Group results by manufacturer name
-            manufacturer_data = {}
-            for row in cursor.fetchall():
-                name = row['name']
-                cat = row['category_name']
-                
-                if name not in manufacturer_data:
-                    manufacturer_data[name] = {
-                        'name': name,
-                        'status': 'approved',
-                        'categories': [],
-                        'usage_count': 0
-                    }
-                
-                if cat and cat not in manufacturer_data[name]['categories']:
-                    manufacturer_data[name]['categories'].append(cat)
-            
-            # Convert to list and add to suggestions
-            for manufacturer in manufacturer_data.values():
-                suggestions.append(manufacturer)
-            
-            conn.close()
+        
+        def approved_in_category(manufacturer):
+            # Manufacturers without category mappings are offered for every category
+            return manufacturer['is_active'] and (
+                not category or not manufacturer['categories'] or category in manufacturer['categories'])
+        
+        for manufacturer in manufacturer_index.get_suggestions(query, category, limit, include=approved_in_category):
+            categories = list(manufacturer['categories'])
+            if category:
+                categories = [category] if category in categories else []
+            suggestions.append({
+                'name': manufacturer['name'],
+                'status': 'approved',
+                'categories': categories,
+                'usage_count': 0
+            })
         
         # Search in pending manufacturers and equipment models (user learning data)
         try:
@@ -1235,7 +1314,7 @@ def get_manufacturer_suggestions():
         print(f"Error getting manufacturer suggestions: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/manufacturers/status', methods=['GET'])
+@catalog_bp.route('/api/manufacturers/status', methods=['GET'])
 def get_manufacturer_status():
     """Get manufacturer approval status"""
     try:
@@ -1312,7 +1391,7 @@ def get_manufacturer_status():
         print(f"Error checking manufacturer status: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/materials', methods=['GET'])
+@catalog_bp.route('/api/materials', methods=['GET'])
 def get_materials():
     """Get list of all materials with arrow counts"""
     try:
@@ -1320,22 +1399,11 @@ def get_materials():
         if not db:
             return jsonify({'error': 'Database not available'}), 500
             
-        # Get materials directly from database
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT material, COUNT(*) as count 
-            FROM arrows 
-            WHERE material IS NOT NULL 
-            GROUP BY material 
-            ORDER BY material
-        ''')
-        
         materials = []
-        for row in cursor.fetchall():
+        for material, count in get_catalog_counts(db, 'material'):
             materials.append({
-                'material': row['material'],
-                'count': row['count']
+                'material': material,
+                'count': count
             })
         
         return jsonify(materials)
@@ -1343,7 +1411,7 @@ def get_materials():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/materials/grouped', methods=['GET'])
+@catalog_bp.route('/api/materials/grouped', methods=['GET'])
 def get_grouped_materials():
     """Get list of grouped material categories with arrow counts"""
     try:
@@ -1351,17 +1419,6 @@ def get_grouped_materials():
         if not db:
             return jsonify({'error': 'Database not available'}), 500
             
-        # Get materials directly from database
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT material, COUNT(*) as count 
-            FROM arrows 
-            WHERE material IS NOT NULL 
-            GROUP BY material 
-            ORDER BY material
-        ''')
-        
         # Group materials into categories
         material_groups = {
             'Carbon': 0,
@@ -1370,9 +1427,8 @@ def get_grouped_materials():
             'Wood': 0
         }
         
-        for row in cursor.fetchall():
-            material = row['material'].lower()
-            count = row['count']
+        for material, count in get_catalog_counts(db, 'material'):
+            material = material.lower()
             
             # Categorize materials
             if 'wood' in material or 'cedar' in material or 'pine' in material or 'bamboo' in material:
@@ -1398,7 +1454,7 @@ def get_grouped_materials():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrow-types', methods=['GET'])
+@catalog_bp.route('/api/arrow-types', methods=['GET'])
 def get_arrow_types():
     """Get list of all arrow types with arrow counts"""
     try:
@@ -1406,22 +1462,11 @@ def get_arrow_types():
         if not db:
             return jsonify({'error': 'Database not available'}), 500
             
-        # Get arrow types directly from database
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT arrow_type, COUNT(*) as count 
-            FROM arrows 
-            WHERE arrow_type IS NOT NULL 
-            GROUP BY arrow_type 
-            ORDER BY arrow_type
-        ''')
-        
         arrow_types = []
-        for row in cursor.fetchall():
+        for arrow_type, count in get_catalog_counts(db, 'arrow_type'):
             arrow_types.append({
-                'arrow_type': row['arrow_type'],
-                'count': row['count']
+                'arrow_type': arrow_type,
+                'count': count
             })
         
         return jsonify(arrow_types)
@@ -1545,7 +1590,7 @@ def calculate_simple_spine(draw_weight, arrow_length, point_weight, bow_type, st
     }
 
 # Tuning Calculation API
-@app.route('/api/tuning/calculate-spine', methods=['POST'])
+@calculator_bp.route('/api/tuning/calculate-spine', methods=['POST'])
 def calculate_spine():
     """Calculate recommended spine for given bow configuration - UNIFIED VERSION"""
     try:
@@ -1602,7 +1647,7 @@ def calculate_spine():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning/recommendations', methods=['POST'])
+@calculator_bp.route('/api/tuning/recommendations', methods=['POST'])
 def get_arrow_recommendations():
     """Get arrow recommendations for given bow configuration"""
     try:
@@ -1804,7 +1849,7 @@ def get_arrow_recommendations():
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
 # Tuning Sessions API
-@app.route('/api/tuning/sessions', methods=['POST'])
+@calculator_bp.route('/api/tuning/sessions', methods=['POST'])
 def create_tuning_session():
     """Create a new tuning session"""
     try:
@@ -1832,7 +1877,7 @@ def create_tuning_session():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning-guides/sessions', methods=['POST'])
+@tuning_bp.route('/api/tuning-guides/sessions', methods=['POST'])
 @token_required
 def create_enhanced_tuning_session(current_user):
     """Create a new enhanced tuning session with database storage"""
@@ -1894,7 +1939,7 @@ def create_enhanced_tuning_session(current_user):
         if 'conn' in locals():
             conn.close()
 
-@app.route('/api/tuning-guides/sessions/<int:session_id>/complete', methods=['POST'])
+@tuning_bp.route('/api/tuning-guides/sessions/<int:session_id>/complete', methods=['POST'])
 @token_required
 def complete_tuning_session(current_user, session_id):
     """Complete a tuning session and optionally save results to journal"""
@@ -1991,7 +2036,7 @@ def complete_tuning_session(current_user, session_id):
         if 'conn' in locals():
             conn.close()
 
-@app.route('/api/tuning-guides/sessions/<int:session_id>', methods=['GET'])
+@tuning_bp.route('/api/tuning-guides/sessions/<int:session_id>', methods=['GET'])
 @token_required  
 def get_tuning_guide_session(current_user, session_id):
     """Get tuning session details"""
@@ -2052,7 +2097,7 @@ def get_tuning_guide_session(current_user, session_id):
         if 'conn' in locals():
             conn.close()
 
-@app.route('/api/tuning-guides/<int:session_id>', methods=['GET'])
+@tuning_bp.route('/api/tuning-guides/<int:session_id>', methods=['GET'])
 @token_required  
 def get_session_data(current_user, session_id):
     """Get tuning session data for the frontend page - simplified endpoint"""
@@ -2144,7 +2189,7 @@ def get_session_data(current_user, session_id):
         if 'conn' in locals():
             conn.close()
 
-@app.route('/api/tuning-guides/sessions/<int:session_id>/test', methods=['POST'])
+@tuning_bp.route('/api/tuning-guides/sessions/<int:session_id>/test', methods=['POST'])
 @token_required
 def record_tuning_test(current_user, session_id):
     """Record a test result for a tuning session"""
@@ -2334,7 +2379,7 @@ def record_tuning_test(current_user, session_id):
 
 # User Authentication API
 
-@app.route('/api/auth/google', methods=['POST'])
+@users_bp.route('/api/auth/google', methods=['POST'])
 def google_auth():
     data = request.get_json()
     code = data.get('code')
@@ -2352,12 +2397,12 @@ def google_auth():
         'user_id': user['id'],
         'needs_profile_completion': needs_profile_completion,
         'exp': datetime.now(timezone.utc) + timedelta(hours=24)
-    }, app.config['SECRET_KEY'], algorithm='HS256')
+    }, current_app.config['SECRET_KEY'], algorithm='HS256')
 
     return jsonify({'token': jwt_token, 'needs_profile_completion': needs_profile_completion})
 
 
-@app.route('/api/user', methods=['GET'])
+@users_bp.route('/api/user', methods=['GET'])
 @token_required
 def get_user(current_user):
     """Get current authenticated user's details including archer profile"""
@@ -2395,7 +2440,7 @@ def get_user(current_user):
 
     return jsonify(user_dict)
 
-@app.route('/api/user/profile', methods=['PUT'])
+@users_bp.route('/api/user/profile', methods=['PUT'])
 @token_required
 def update_user_profile(current_user):
     """Update current authenticated user's profile details including archer-specific fields"""
@@ -2526,7 +2571,7 @@ def update_user_profile(current_user):
         return jsonify({'error': str(e)}), 500
 
 # Bow Setups API
-@app.route('/api/bow-setups', methods=['GET'])
+@setups_bp.route('/api/bow-setups', methods=['GET'])
 @token_required
 def get_bow_setups(current_user):
     """Get all bow setups for the current user"""
@@ -2541,7 +2586,7 @@ def get_bow_setups(current_user):
     conn.close()
     return jsonify([dict(row) for row in setups])
 
-@app.route('/api/bow-setups/<int:setup_id>', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>', methods=['GET'])
 @token_required
 def get_bow_setup(current_user, setup_id):
     """Get a specific bow setup with its details"""
@@ -2566,7 +2611,7 @@ def get_bow_setup(current_user, setup_id):
     finally:
         conn.close()
 
-@app.route('/api/bow-setups', methods=['POST'])
+@setups_bp.route('/api/bow-setups', methods=['POST'])
 @token_required
 def create_bow_setup(current_user):
     """Create a new bow setup with manufacturer learning"""
@@ -2658,7 +2703,7 @@ def create_bow_setup(current_user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>', methods=['PUT'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>', methods=['PUT'])
 @token_required
 def update_bow_setup(current_user, setup_id):
     """Update a bow setup with change logging"""
@@ -2829,7 +2874,7 @@ def update_bow_setup(current_user, setup_id):
         print(f"Error updating bow setup: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>', methods=['DELETE'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>', methods=['DELETE'])
 @token_required
 def delete_bow_setup(current_user, setup_id):
     """Delete a bow setup"""
@@ -2857,7 +2902,7 @@ def delete_bow_setup(current_user, setup_id):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/bow-setups/<int:setup_id>/arrows', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/arrows', methods=['POST'])
 @token_required
 def add_arrow_to_setup(current_user, setup_id):
     """Add an arrow to a bow setup"""
@@ -3150,7 +3195,7 @@ def add_arrow_to_setup(current_user, setup_id):
         return jsonify({'error': 'Failed to add arrow to setup'}), 500
 
 
-@app.route('/api/bow-setups/<int:setup_id>/arrows', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/arrows', methods=['GET'])
 @token_required
 def get_setup_arrows(current_user, setup_id):
     """Get all arrows associated with a bow setup"""
@@ -3329,7 +3374,7 @@ def get_setup_arrows(current_user, setup_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/setup-arrows/<int:arrow_setup_id>', methods=['DELETE'])
+@setups_bp.route('/api/setup-arrows/<int:arrow_setup_id>', methods=['DELETE'])
 @token_required
 def remove_arrow_from_setup(current_user, arrow_setup_id):
     """Remove an arrow from a bow setup"""
@@ -3391,7 +3436,7 @@ def remove_arrow_from_setup(current_user, arrow_setup_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/arrows/calculate-performance', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/arrows/calculate-performance', methods=['POST'])
 @token_required
 def calculate_setup_arrows_performance(current_user, setup_id):
     """Calculate performance metrics for all arrows in a bow setup"""
@@ -3590,7 +3635,7 @@ def calculate_setup_arrows_performance(current_user, setup_id):
         print(f"Error calculating setup arrows performance: {e}")
         return jsonify({'error': 'Failed to calculate performance'}), 500
 
-@app.route('/api/setup-arrows/<int:setup_arrow_id>/calculate-performance', methods=['POST'])
+@setups_bp.route('/api/setup-arrows/<int:setup_arrow_id>/calculate-performance', methods=['POST'])
 def calculate_individual_arrow_performance(setup_arrow_id):
     """Calculate performance metrics for a single arrow in a bow setup"""
     conn = None
@@ -3851,7 +3896,7 @@ def calculate_individual_arrow_performance(setup_arrow_id):
         if conn:
             conn.close()
 
-@app.route('/api/bow-setups/<int:setup_id>/arrows/<int:arrow_id>', methods=['PUT'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/arrows/<int:arrow_id>', methods=['PUT'])
 @token_required  
 def update_bow_setup_arrow(current_user, setup_id, arrow_id):
     """Update an arrow configuration in a bow setup by setup_id and arrow_id"""
@@ -3990,7 +4035,7 @@ def update_arrow_in_setup_internal(arrow_setup_id, data, conn, user_id=None):
         'arrow_setup': response_data
     })
 
-@app.route('/api/setup-arrows/<int:arrow_setup_id>', methods=['PUT'])
+@setups_bp.route('/api/setup-arrows/<int:arrow_setup_id>', methods=['PUT'])
 @token_required
 def update_arrow_in_setup(current_user, arrow_setup_id):
     """Update an arrow configuration in a bow setup"""
@@ -4032,7 +4077,7 @@ def update_arrow_in_setup(current_user, arrow_setup_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/setup-arrows/<int:setup_arrow_id>/details', methods=['GET'])
+@setups_bp.route('/api/setup-arrows/<int:setup_arrow_id>/details', methods=['GET'])
 def get_setup_arrow_details(setup_arrow_id):
     """Get comprehensive details for a specific arrow setup including arrow data, setup configuration, and performance"""
     conn = None
@@ -4172,7 +4217,7 @@ def get_setup_arrow_details(setup_arrow_id):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/tuning/sessions/<session_id>', methods=['GET'])
+@calculator_bp.route('/api/tuning/sessions/<session_id>', methods=['GET'])
 def get_tuning_session(session_id):
     """Get a specific tuning session"""
     try:
@@ -4186,7 +4231,7 @@ def get_tuning_session(session_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning/sessions', methods=['GET'])
+@calculator_bp.route('/api/tuning/sessions', methods=['GET'])
 def get_tuning_sessions():
     """Get all tuning sessions"""
     try:
@@ -4200,7 +4245,7 @@ def get_tuning_sessions():
         return jsonify({'error': str(e)}), 500
 
 # Arrow compatibility check
-@app.route('/api/arrows/compatible', methods=['POST'])
+@catalog_bp.route('/api/arrows/compatible', methods=['POST'])
 def check_arrow_compatibility():
     """Check arrow compatibility with bow configuration"""
     try:
@@ -4278,7 +4323,7 @@ def check_arrow_compatibility():
         return jsonify({'error': f'Compatible arrows error: {str(e)}'}), 500
 
 # Real-time compatibility score calculation
-@app.route('/api/calculate-compatibility-score', methods=['POST'])
+@catalog_bp.route('/api/calculate-compatibility-score', methods=['POST'])
 def calculate_compatibility_score():
     """Calculate real-time compatibility score for arrow configuration changes"""
     try:
@@ -4429,12 +4474,22 @@ def calculate_compatibility_score():
         return jsonify({'error': f'Compatibility calculation failed: {str(e)}'}), 500
 
 # Static File Serving for Images
-@app.route('/api/images/<filename>')
+@catalog_bp.route('/api/images/<filename>')
 def serve_image(filename):
-    """Serve downloaded arrow images"""
+    """Serve downloaded arrow images (?size=thumb|medium serves the pre-sized WebP variant)"""
     try:
         images_dir = Path(__file__).parent / 'data' / 'images'
         
+        # Pre-sized variants are generated at ingest by image_pipeline
+        size = request.args.get('size')
+        if size in ('thumb', 'medium') and not filename.endswith('.svg'):
+            variant_dir = images_dir / 'variants' / size
+            variant_name = f"{Path(filename).stem}.webp"
+            if (variant_dir / variant_name).exists():
+                response = send_from_directory(str(variant_dir), variant_name, mimetype='image/webp')
+                response.headers['Cache-Control'] = 'public, max-age=31536000'
+                return response
+        
         # Check if file exists before trying to serve it
         file_path = images_dir / filename
         
@@ -4494,7 +4549,7 @@ def get_image_url(arrow_id, image_url=None, saved_images=None, local_image_path=
 
 # ===== COMPONENT API ENDPOINTS =====
 
-@app.route('/api/components', methods=['GET'])
+@catalog_bp.route('/api/components', methods=['GET'])
 def get_components():
     """Get components with optional filtering"""
     try:
@@ -4526,7 +4581,7 @@ def get_components():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/components/categories', methods=['GET'])
+@catalog_bp.route('/api/components/categories', methods=['GET'])
 def get_component_categories():
     """Get all component categories"""
     try:
@@ -4545,7 +4600,7 @@ def get_component_categories():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/components/statistics', methods=['GET'])
+@catalog_bp.route('/api/components/statistics', methods=['GET'])
 def get_component_statistics():
     """Get component database statistics"""
     try:
@@ -4559,7 +4614,7 @@ def get_component_statistics():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/<int:arrow_id>/compatible-components', methods=['GET'])
+@catalog_bp.route('/api/arrows/<int:arrow_id>/compatible-components', methods=['GET'])
 def get_arrow_compatible_components(arrow_id):
     """Get components compatible with a specific arrow"""
     try:
@@ -4587,7 +4642,7 @@ def get_arrow_compatible_components(arrow_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/compatibility/check', methods=['POST'])
+@catalog_bp.route('/api/compatibility/check', methods=['POST'])
 def check_compatibility():
     """Check compatibility between arrow and component"""
     try:
@@ -4617,7 +4672,7 @@ def check_compatibility():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/compatibility/batch', methods=['POST'])
+@catalog_bp.route('/api/compatibility/batch', methods=['POST'])
 def batch_compatibility_check():
     """Check compatibility for multiple arrow-component pairs"""
     try:
@@ -4655,7 +4710,7 @@ def batch_compatibility_check():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/components', methods=['POST'])
+@catalog_bp.route('/api/components', methods=['POST'])
 def add_component():
     """Add a new component (admin/scraper endpoint)"""
     try:
@@ -4711,7 +4766,7 @@ def admin_required(f):
     
     return decorated_function
 
-@app.route('/api/admin/statistics', methods=['GET'])
+@admin_bp.route('/api/admin/statistics', methods=['GET'])
 @token_required
 @admin_required
 def get_admin_statistics(current_user):
@@ -4806,7 +4861,7 @@ def get_admin_statistics(current_user):
         print(f"Statistics error: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/users', methods=['GET'])
+@admin_bp.route('/api/admin/users', methods=['GET'])
 @token_required
 @admin_required
 def get_all_users_admin(current_user):
@@ -4826,7 +4881,7 @@ def get_all_users_admin(current_user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/users/<int:user_id>/admin', methods=['PUT'])
+@admin_bp.route('/api/admin/users/<int:user_id>/admin', methods=['PUT'])
 @token_required
 @admin_required
 def set_user_admin_status(current_user, user_id):
@@ -4856,7 +4911,7 @@ def set_user_admin_status(current_user, user_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/users/<int:user_id>/status', methods=['PUT'])
+@admin_bp.route('/api/admin/users/<int:user_id>/status', methods=['PUT'])
 @token_required
 @admin_required
 def update_user_status(current_user, user_id):
@@ -4887,7 +4942,7 @@ def update_user_status(current_user, user_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/users/<int:user_id>', methods=['DELETE'])
+@admin_bp.route('/api/admin/users/<int:user_id>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_user(current_user, user_id):
@@ -4923,7 +4978,7 @@ def delete_user(current_user, user_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/check', methods=['GET'])
+@admin_bp.route('/api/admin/check', methods=['GET'])
 @token_required
 def check_admin_status(current_user):
     """Check if current user has admin access"""
@@ -4946,7 +5001,7 @@ def check_admin_status(current_user):
 
 # ===== ADMIN BACKUP/RESTORE API ENDPOINTS =====
 
-@app.route('/api/admin/backup-test', methods=['GET'])
+@backup_bp.route('/api/admin/backup-test', methods=['GET'])
 def backup_test_new():
     """Simple backup test endpoint without auth"""
     from datetime import datetime
@@ -4959,7 +5014,7 @@ def backup_test_new():
 
 # ===== ADMIN ARROW MANAGEMENT API ENDPOINTS =====
 
-@app.route('/api/admin/arrows', methods=['GET'])
+@admin_bp.route('/api/admin/arrows', methods=['GET'])
 @token_required
 @admin_required
 def get_all_arrows_admin(current_user):
@@ -5039,7 +5094,7 @@ def get_all_arrows_admin(current_user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/arrows/<int:arrow_id>', methods=['GET'])
+@admin_bp.route('/api/admin/arrows/<int:arrow_id>', methods=['GET'])
 @token_required
 @admin_required
 def get_arrow_admin(current_user, arrow_id):
@@ -5087,7 +5142,7 @@ def get_arrow_admin(current_user, arrow_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/arrows/<int:arrow_id>', methods=['PUT'])
+@admin_bp.route('/api/admin/arrows/<int:arrow_id>', methods=['PUT'])
 @token_required
 @admin_required
 def update_arrow_admin(current_user, arrow_id):
@@ -5188,7 +5243,7 @@ def update_arrow_admin(current_user, arrow_id):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/arrows/<int:arrow_id>', methods=['DELETE'])
+@admin_bp.route('/api/admin/arrows/<int:arrow_id>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_arrow_admin(current_user, arrow_id):
@@ -5225,7 +5280,7 @@ def delete_arrow_admin(current_user, arrow_id):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/arrows', methods=['POST'])
+@admin_bp.route('/api/admin/arrows', methods=['POST'])
 @token_required
 @admin_required
 def create_arrow_admin(current_user):
@@ -5314,7 +5369,7 @@ def create_arrow_admin(current_user):
 
 # ===== UNIFIED MANUFACTURER MANAGEMENT API ENDPOINTS (ADMIN) =====
 
-@app.route('/api/admin/manufacturers', methods=['GET'])
+@admin_bp.route('/api/admin/manufacturers', methods=['GET'])
 @token_required
 @admin_required
 def get_manufacturers_admin(current_user):
@@ -5411,7 +5466,7 @@ def get_manufacturers_admin(current_user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/manufacturers/<int:manufacturer_id>', methods=['PUT'])
+@admin_bp.route('/api/admin/manufacturers/<int:manufacturer_id>', methods=['PUT'])
 @token_required
 @admin_required
 def update_manufacturer_admin(current_user, manufacturer_id):
@@ -5480,6 +5535,7 @@ def update_manufacturer_admin(current_user, manufacturer_id):
         # Get updated manufacturer data
         cursor.execute("SELECT * FROM manufacturers WHERE id = ?", (manufacturer_id,))
         updated_manufacturer = cursor.fetchone()
+        invalidate_manufacturer_index()
         
         return jsonify({
             'message': 'Manufacturer updated successfully',
@@ -5502,7 +5558,7 @@ def update_manufacturer_admin(current_user, manufacturer_id):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/manufacturers/<int:manufacturer_id>', methods=['DELETE'])
+@admin_bp.route('/api/admin/manufacturers/<int:manufacturer_id>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_manufacturer_admin(current_user, manufacturer_id):
@@ -5555,6 +5611,7 @@ def delete_manufacturer_admin(current_user, manufacturer_id):
         cursor.execute("DELETE FROM manufacturers WHERE id = ?", (manufacturer_id,))
         
         db.get_connection().commit()
+        invalidate_manufacturer_index()
         
         return jsonify({
             'message': f'Successfully deleted manufacturer "{manufacturer_name}" and all associated data',
@@ -5570,7 +5627,7 @@ def delete_manufacturer_admin(current_user, manufacturer_id):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/manufacturers', methods=['POST'])
+@admin_bp.route('/api/admin/manufacturers', methods=['POST'])
 @token_required
 @admin_required
 def create_manufacturer_admin(current_user):
@@ -5633,6 +5690,7 @@ def create_manufacturer_admin(current_user):
         # Get the created manufacturer with all data
         cursor.execute("SELECT * FROM manufacturers WHERE id = ?", (manufacturer_id,))
         created_manufacturer = cursor.fetchone()
+        invalidate_manufacturer_index()
         
         return jsonify({
             'message': f'Successfully created manufacturer "{manufacturer_name}"',
@@ -5655,7 +5713,7 @@ def create_manufacturer_admin(current_user):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/manufacturers/<int:manufacturer_id>/equipment-categories', methods=['GET'])
+@admin_bp.route('/api/admin/manufacturers/<int:manufacturer_id>/equipment-categories', methods=['GET'])
 @token_required
 @admin_required
 def get_manufacturer_equipment_categories(current_user, manufacturer_id):
@@ -5698,7 +5756,7 @@ def get_manufacturer_equipment_categories(current_user, manufacturer_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/manufacturers/<int:manufacturer_id>/equipment-categories', methods=['PUT'])
+@admin_bp.route('/api/admin/manufacturers/<int:manufacturer_id>/equipment-categories', methods=['PUT'])
 @token_required
 @admin_required
 def update_manufacturer_equipment_categories(current_user, manufacturer_id):
@@ -5744,6 +5802,7 @@ def update_manufacturer_equipment_categories(current_user, manufacturer_id):
             })
         
         db.get_connection().commit()
+        invalidate_manufacturer_index()
         
         return jsonify({
             'message': f'Successfully updated equipment categories for {manufacturer[0]}',
@@ -5757,7 +5816,7 @@ def update_manufacturer_equipment_categories(current_user, manufacturer_id):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/equipment-categories', methods=['GET'])
+@admin_bp.route('/api/admin/equipment-categories', methods=['GET'])
 @token_required
 @admin_required
 def get_available_equipment_categories(current_user):
@@ -5851,7 +5910,7 @@ def get_available_equipment_categories(current_user):
 
 # ===== BOW TYPE EQUIPMENT RULES ADMIN ENDPOINTS =====
 
-@app.route('/api/admin/bow-type-equipment-rules', methods=['GET'])
+@admin_bp.route('/api/admin/bow-type-equipment-rules', methods=['GET'])
 @token_required
 @admin_required
 def get_bow_type_equipment_rules(current_user):
@@ -5890,7 +5949,7 @@ def get_bow_type_equipment_rules(current_user):
         print(f"Error getting bow type equipment rules: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/bow-type-equipment-rules', methods=['PUT'])
+@admin_bp.route('/api/admin/bow-type-equipment-rules', methods=['PUT'])
 @token_required
 @admin_required
 def update_bow_type_equipment_rule(current_user):
@@ -5931,7 +5990,7 @@ def update_bow_type_equipment_rule(current_user):
         db.get_connection().rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/admin/bow-type-equipment-rules/reset', methods=['POST'])
+@admin_bp.route('/api/admin/bow-type-equipment-rules/reset', methods=['POST'])
 @token_required
 @admin_required
 def reset_bow_type_equipment_rules(current_user):
@@ -5991,7 +6050,7 @@ def reset_bow_type_equipment_rules(current_user):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/admin/bow-types', methods=['POST'])
+@admin_bp.route('/api/admin/bow-types', methods=['POST'])
 @token_required
 @admin_required
 def create_bow_type(current_user):
@@ -6071,7 +6130,7 @@ def create_bow_type(current_user):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/admin/bow-types/<bow_type>', methods=['DELETE'])
+@admin_bp.route('/api/admin/bow-types/<bow_type>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_bow_type(current_user, bow_type):
@@ -6118,7 +6177,7 @@ def delete_bow_type(current_user, bow_type):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/admin/bow-types/<bow_type>', methods=['PUT', 'OPTIONS'])
+@admin_bp.route('/api/admin/bow-types/<bow_type>', methods=['PUT', 'OPTIONS'])
 @token_required
 @admin_required
 def update_bow_type(current_user, bow_type):
@@ -6197,7 +6256,7 @@ def update_bow_type(current_user, bow_type):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/bow-types', methods=['GET'])
+@catalog_bp.route('/api/bow-types', methods=['GET'])
 def get_all_bow_types():
     """Get all available bow types from the bow_types table"""
     try:
@@ -6234,7 +6293,7 @@ def get_all_bow_types():
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/bow-types/<bow_type_name>', methods=['GET', 'OPTIONS'])
+@catalog_bp.route('/api/bow-types/<bow_type_name>', methods=['GET', 'OPTIONS'])
 def get_bow_type(bow_type_name):
     """Get a single bow type by name"""
     # Handle CORS preflight
@@ -6277,7 +6336,7 @@ def get_bow_type(bow_type_name):
 
 # ===== EQUIPMENT MANAGEMENT API ENDPOINTS =====
 
-@app.route('/api/equipment/categories', methods=['GET'])
+@catalog_bp.route('/api/equipment/categories', methods=['GET'])
 def get_equipment_categories():
     """Get equipment categories, optionally filtered by bow type"""
     try:
@@ -6314,7 +6373,7 @@ def get_equipment_categories():
         print(f"Error getting equipment categories: {e}")
         return jsonify({'error': 'Failed to get equipment categories'}), 500
 
-@app.route('/api/equipment/search', methods=['GET'])
+@catalog_bp.route('/api/equipment/search', methods=['GET'])
 def search_equipment():
     """Search equipment by category, manufacturer, or keywords"""
     try:
@@ -6372,7 +6431,7 @@ def search_equipment():
         print(f"Error searching equipment: {e}")
         return jsonify({'error': 'Failed to search equipment'}), 500
 
-@app.route('/api/equipment/form-schema/<category>', methods=['GET'])
+@catalog_bp.route('/api/equipment/form-schema/<category>', methods=['GET'])
 def get_equipment_form_schema(category):
     """Get form schema for a specific equipment category"""
     try:
@@ -6433,7 +6492,7 @@ def get_equipment_form_schema(category):
         print(f"Error getting form schema for {category}: {e}")
         return jsonify({'error': f'Failed to get form schema for {category}'}), 500
 
-@app.route('/api/equipment/manufacturers/suggest', methods=['GET'])
+@catalog_bp.route('/api/equipment/manufacturers/suggest', methods=['GET'])
 def suggest_equipment_manufacturers():
     """Get smart manufacturer suggestions for autocomplete with fuzzy matching"""
     try:
@@ -6452,25 +6511,10 @@ def suggest_equipment_manufacturers():
         except:
             pass  # Not authenticated, continue without pending manufacturers
         
-        # Use get_database() to get the correct arrow database connection
-        db = get_database()
-        if not db:
+        # Prebuilt suggestion index over all manufacturers (rebuilt when they change)
+        manufacturer_index = get_manufacturer_index()
+        if manufacturer_index is None:
             return jsonify({"error": "Database not available"}), 500
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        
-        # Get all manufacturers from database
-        cursor.execute('SELECT id, name, website_url, country FROM manufacturers ORDER BY name')
-        all_manufacturers = []
-        for row in cursor.fetchall():
-            all_manufacturers.append({
-                'id': row[0],
-                'name': row[1],
-                'website': row[2],
-                'country': row[3] or 'Unknown'
-            })
-        
-        conn.close()
         
         # Add user's pending manufacturers if authenticated
         pending_manufacturers = []
@@ -6507,13 +6551,9 @@ def suggest_equipment_manufacturers():
             except Exception as e:
                 print(f"Warning: Could not get pending manufacturers for user {current_user.get('id', 'unknown')}: {e}")
         
-        # Use smart manufacturer matching for suggestions
-        from manufacturer_matcher import ManufacturerMatcher
-        matcher = ManufacturerMatcher()
-        
         # Get intelligent suggestions from approved manufacturers
-        suggestions = matcher.get_manufacturer_suggestions(
-            query, all_manufacturers, category, limit // 2  # Leave room for pending manufacturers
+        suggestions = manufacturer_index.get_suggestions(
+            query, category, limit // 2  # Leave room for pending manufacturers
         )
         
         # Format approved manufacturers
@@ -6583,7 +6623,7 @@ def suggest_equipment_manufacturers():
             print(f"Fallback manufacturer suggestions also failed: {fallback_error}")
             return jsonify({'error': 'Failed to get manufacturer suggestions'}), 500
 
-@app.route('/api/equipment/models/suggest', methods=['GET'])
+@catalog_bp.route('/api/equipment/models/suggest', methods=['GET'])
 def suggest_equipment_models():
     """Get smart model name suggestions based on manufacturer and category"""
     try:
@@ -6611,7 +6651,7 @@ def suggest_equipment_models():
         print(f"Error getting model suggestions: {e}")
         return jsonify({'error': 'Failed to get model suggestions'}), 500
 
-@app.route('/api/admin/pending-manufacturers', methods=['GET'])
+@admin_bp.route('/api/admin/pending-manufacturers', methods=['GET'])
 @token_required
 def get_pending_manufacturers(current_user):
     """Get pending manufacturers for admin approval"""
@@ -6638,7 +6678,7 @@ def get_pending_manufacturers(current_user):
         print(f"Error getting pending manufacturers: {e}")
         return jsonify({'error': 'Failed to get pending manufacturers'}), 500
 
-@app.route('/api/admin/manufacturers/<int:pending_id>/approve', methods=['PUT'])
+@admin_bp.route('/api/admin/manufacturers/<int:pending_id>/approve', methods=['PUT'])
 @token_required
 def approve_manufacturer(current_user, pending_id):
     """Approve a pending manufacturer"""
@@ -6656,6 +6696,7 @@ def approve_manufacturer(current_user, pending_id):
         success = learning.approve_manufacturer(pending_id, admin_notes)
         
         if success:
+            invalidate_manufacturer_index()
             return jsonify({'message': 'Manufacturer approved successfully'}), 200
         else:
             return jsonify({'error': 'Failed to approve manufacturer'}), 400
@@ -6664,7 +6705,7 @@ def approve_manufacturer(current_user, pending_id):
         print(f"Error approving manufacturer: {e}")
         return jsonify({'error': 'Failed to approve manufacturer'}), 500
 
-@app.route('/api/admin/manufacturers/<int:pending_id>/reject', methods=['PUT'])
+@admin_bp.route('/api/admin/manufacturers/<int:pending_id>/reject', methods=['PUT'])
 @token_required
 def reject_manufacturer(current_user, pending_id):
     """Reject a pending manufacturer"""
@@ -6690,7 +6731,7 @@ def reject_manufacturer(current_user, pending_id):
         print(f"Error rejecting manufacturer: {e}")
         return jsonify({'error': 'Failed to reject manufacturer'}), 500
 
-@app.route('/api/admin/manufacturers/pending', methods=['GET'])
+@admin_bp.route('/api/admin/manufacturers/pending', methods=['GET'])
 @token_required
 def get_pending_manufacturers_list(current_user):
     """Get pending manufacturers for admin review"""
@@ -6716,7 +6757,7 @@ def get_pending_manufacturers_list(current_user):
         print(f"Error getting pending manufacturers: {e}")
         return jsonify({'error': 'Failed to get pending manufacturers'}), 500
 
-@app.route('/api/equipment/usage-analytics', methods=['GET'])
+@catalog_bp.route('/api/equipment/usage-analytics', methods=['GET'])
 @token_required
 def get_equipment_usage_analytics(current_user):
     """Get equipment usage analytics"""
@@ -6735,7 +6776,7 @@ def get_equipment_usage_analytics(current_user):
         print(f"Error getting usage analytics: {e}")
         return jsonify({'error': 'Failed to get usage analytics'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment', methods=['GET'])
 @token_required
 def get_bow_equipment(current_user, setup_id):
     """Get all equipment for a bow setup (supports both custom and pre-chosen equipment)"""
@@ -6869,7 +6910,7 @@ def get_bow_equipment(current_user, setup_id):
         print(f"Error getting bow equipment: {e}")
         return jsonify({'error': 'Failed to get bow equipment'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment', methods=['POST'])
 @token_required
 def add_bow_equipment(current_user, setup_id):
     """Add custom equipment to a bow setup"""
@@ -7036,7 +7077,7 @@ def add_bow_equipment(current_user, setup_id):
         print(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': f'Failed to add equipment: {str(e)}'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>', methods=['PUT'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>', methods=['PUT'])
 @token_required
 def update_bow_equipment(current_user, setup_id, equipment_id):
     """Update custom equipment configuration in a bow setup with change logging"""
@@ -7165,7 +7206,7 @@ def update_bow_equipment(current_user, setup_id, equipment_id):
         print(f"Error updating bow equipment: {e}")
         return jsonify({'error': 'Failed to update equipment'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>', methods=['DELETE'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>', methods=['DELETE'])
 @token_required
 def remove_bow_equipment(current_user, setup_id, equipment_id):
     """Soft delete equipment from a bow setup with enhanced tracking"""
@@ -7294,7 +7335,7 @@ def remove_bow_equipment(current_user, setup_id, equipment_id):
                 
         return jsonify({'error': 'Failed to remove equipment'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>/restore', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>/restore', methods=['POST'])
 @token_required
 def restore_bow_equipment(current_user, setup_id, equipment_id):
     """Restore previously deleted equipment to a bow setup"""
@@ -7361,7 +7402,7 @@ def restore_bow_equipment(current_user, setup_id, equipment_id):
         print(f"Error restoring bow equipment: {e}")
         return jsonify({'error': 'Failed to restore equipment'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment/deleted', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment/deleted', methods=['GET'])
 @token_required
 def get_deleted_equipment(current_user, setup_id):
     """Get list of deleted equipment for a bow setup that can be restored"""
@@ -7414,7 +7455,7 @@ def get_deleted_equipment(current_user, setup_id):
 
 # ===== CHANGE LOG API ENDPOINTS =====
 
-@app.route('/api/bow-setups/<int:setup_id>/change-log', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/change-log', methods=['GET'])
 @token_required
 def get_setup_change_log(current_user, setup_id):
     """Get change history for a bow setup"""
@@ -7445,7 +7486,7 @@ def get_setup_change_log(current_user, setup_id):
         print(f"Error getting setup change log: {e}")
         return jsonify({'error': 'Failed to get change log'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>/change-log', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/equipment/<int:equipment_id>/change-log', methods=['GET'])
 @token_required  
 def get_equipment_change_log(current_user, setup_id, equipment_id):
     """Get change history for specific equipment"""
@@ -7474,7 +7515,7 @@ def get_equipment_change_log(current_user, setup_id, equipment_id):
         print(f"Error getting equipment change log: {e}")
         return jsonify({'error': 'Failed to get equipment change log'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/change-log/stats', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/change-log/stats', methods=['GET'])
 @token_required
 def get_setup_change_stats(current_user, setup_id):
     """Get change statistics for a bow setup"""
@@ -7490,7 +7531,7 @@ def get_setup_change_stats(current_user, setup_id):
         print(f"Error getting change statistics: {e}")
         return jsonify({'error': 'Failed to get change statistics'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/change-log/add-note', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/change-log/add-note', methods=['POST'])
 @token_required
 def add_manual_change_note(current_user, setup_id):
     """Add a manual change note for a bow setup"""
@@ -7524,7 +7565,7 @@ def add_manual_change_note(current_user, setup_id):
 
 # ===== STANDALONE EQUIPMENT ENDPOINT =====
 
-@app.route('/api/equipment/<int:equipment_id>', methods=['GET'])
+@catalog_bp.route('/api/equipment/<int:equipment_id>', methods=['GET'])
 @token_required
 def get_equipment_by_id(current_user, equipment_id):
     """Get equipment details by ID (standalone endpoint for equipment detail pages)"""
@@ -7589,7 +7630,7 @@ def get_equipment_by_id(current_user, equipment_id):
                 pass
         return jsonify({'error': 'Failed to get equipment details'}), 500
 
-@app.route('/api/equipment/<int:equipment_id>', methods=['PATCH'])
+@catalog_bp.route('/api/equipment/<int:equipment_id>', methods=['PATCH'])
 @token_required
 def update_equipment_by_id(current_user, equipment_id):
     """Update equipment details by ID (standalone endpoint for equipment detail pages)"""
@@ -7696,7 +7737,7 @@ def update_equipment_by_id(current_user, equipment_id):
 
 # ===== GUIDE WALKTHROUGH API ENDPOINTS =====
 
-@app.route('/api/guides', methods=['GET'])
+@tuning_bp.route('/api/guides', methods=['GET'])
 def get_available_guides():
     """Get list of available guides for walkthrough"""
     guides = [
@@ -7736,7 +7777,7 @@ def get_available_guides():
     ]
     return jsonify({'guides': guides})
 
-@app.route('/api/guide-sessions', methods=['POST'])
+@tuning_bp.route('/api/guide-sessions', methods=['POST'])
 @token_required
 def start_guide_session(current_user):
     """Start a new guide walkthrough session"""
@@ -7786,7 +7827,7 @@ def start_guide_session(current_user):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/guide-sessions/<int:session_id>/steps', methods=['POST'])
+@tuning_bp.route('/api/guide-sessions/<int:session_id>/steps', methods=['POST'])
 @token_required
 def record_guide_step(current_user, session_id):
     """Record the result of a guide step"""
@@ -7840,7 +7881,7 @@ def record_guide_step(current_user, session_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/guide-sessions/<int:session_id>/complete', methods=['POST'])
+@tuning_bp.route('/api/guide-sessions/<int:session_id>/complete', methods=['POST'])
 @token_required
 def complete_guide_session(current_user, session_id):
     """Mark a guide session as completed"""
@@ -7880,7 +7921,7 @@ def complete_guide_session(current_user, session_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/guide-sessions/<int:session_id>/pause', methods=['POST'])
+@tuning_bp.route('/api/guide-sessions/<int:session_id>/pause', methods=['POST'])
 @token_required
 def pause_guide_session(current_user, session_id):
     """Pause a guide session"""
@@ -7924,7 +7965,7 @@ def pause_guide_session(current_user, session_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/guide-sessions/<int:session_id>/resume', methods=['POST'])
+@tuning_bp.route('/api/guide-sessions/<int:session_id>/resume', methods=['POST'])
 @token_required
 def resume_guide_session(current_user, session_id):
     """Resume a paused guide session"""
@@ -7965,7 +8006,7 @@ def resume_guide_session(current_user, session_id):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/guide-sessions', methods=['GET'])
+@tuning_bp.route('/api/guide-sessions', methods=['GET'])
 @token_required
 def get_guide_sessions(current_user):
     """Get user's guide session history"""
@@ -8005,7 +8046,7 @@ def get_guide_sessions(current_user):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/calculate-trajectory', methods=['POST'])
+@calculator_bp.route('/api/calculate-trajectory', methods=['POST'])
 @token_required
 def calculate_trajectory(current_user):
     """Calculate arrow trajectory for visualization"""
@@ -8168,7 +8209,7 @@ def generate_fallback_trajectory(arrow_speed_fps, max_range_yards):
     
     return trajectory_points
 
-@app.route('/api/guide-sessions/<int:session_id>', methods=['GET'])
+@tuning_bp.route('/api/guide-sessions/<int:session_id>', methods=['GET'])
 @token_required
 def get_guide_session_details(current_user, session_id):
     """Get detailed information about a guide session"""
@@ -8219,7 +8260,7 @@ def get_guide_session_details(current_user, session_id):
 # ENHANCED INTERACTIVE TUNING SYSTEM
 # ======================================
 
-@app.route('/api/tuning-guides/start', methods=['POST'])
+@tuning_bp.route('/api/tuning-guides/start', methods=['POST'])
 @token_required
 def start_enhanced_tuning_session(current_user):
     """Start enhanced tuning session with bow/arrow selection"""
@@ -8301,7 +8342,7 @@ def start_enhanced_tuning_session(current_user):
         if conn:
             conn.close()
 
-@app.route('/api/tuning-guides/<session_id>/record-test', methods=['POST'])
+@tuning_bp.route('/api/tuning-guides/<session_id>/record-test', methods=['POST'])
 @token_required
 def record_enhanced_tuning_test(current_user, session_id):
     """Record test result with intelligent recommendations"""
@@ -8422,7 +8463,7 @@ def record_enhanced_tuning_test(current_user, session_id):
         if conn:
             conn.close()
 
-@app.route('/api/arrows/<int:arrow_id>/tuning-history', methods=['GET'])
+@catalog_bp.route('/api/arrows/<int:arrow_id>/tuning-history', methods=['GET'])
 @token_required 
 def get_arrow_tuning_history(current_user, arrow_id):
     """Get complete tuning history for a specific arrow"""
@@ -8504,7 +8545,7 @@ def get_arrow_tuning_history(current_user, arrow_id):
         if conn:
             conn.close()
 
-@app.route('/api/arrows/<int:arrow_id>/tuning-summary', methods=['GET'])
+@catalog_bp.route('/api/arrows/<int:arrow_id>/tuning-summary', methods=['GET'])
 @token_required
 def get_arrow_tuning_summary(current_user, arrow_id):
     """Get tuning progress summary for an arrow"""
@@ -8591,7 +8632,7 @@ def get_arrow_tuning_summary(current_user, arrow_id):
         if conn:
             conn.close()
 
-@app.route('/api/tuning-history', methods=['POST'])
+@tuning_bp.route('/api/tuning-history', methods=['POST'])
 @token_required
 def record_tuning_adjustment(current_user):
     """Record a tuning adjustment to history"""
@@ -8646,7 +8687,7 @@ def record_tuning_adjustment(current_user):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning-history', methods=['GET'])
+@tuning_bp.route('/api/tuning-history', methods=['GET'])
 @token_required
 def get_tuning_history(current_user):
     """Get user's tuning adjustment history"""
@@ -8692,7 +8733,7 @@ def get_tuning_history(current_user):
             conn.close()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning-change-log', methods=['GET'])
+@tuning_bp.route('/api/tuning-change-log', methods=['GET'])
 @token_required
 def get_tuning_change_log(current_user):
     """Get comprehensive tuning test history from change log system"""
@@ -8727,7 +8768,7 @@ def get_tuning_change_log(current_user):
         print(f"❌ Error getting tuning change log: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/equipment-adjustments', methods=['GET'])
+@tuning_bp.route('/api/equipment-adjustments', methods=['GET'])
 @token_required
 def get_equipment_adjustments(current_user):
     """Get equipment adjustment history from change log system"""
@@ -8755,7 +8796,7 @@ def get_equipment_adjustments(current_user):
         print(f"❌ Error getting equipment adjustments: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/tuning-adjustment', methods=['POST'])
+@tuning_bp.route('/api/tuning-adjustment', methods=['POST'])
 @token_required
 def record_tuning_adjustment_enhanced(current_user):
     """Record a tuning adjustment using the enhanced change log system"""
@@ -8808,7 +8849,7 @@ def record_tuning_adjustment_enhanced(current_user):
 # Configuration and setup
 # ===== RETAILER ENHANCEMENT API ENDPOINTS =====
 
-@app.route('/api/arrows/<int:arrow_id>/retailer-data', methods=['GET'])
+@catalog_bp.route('/api/arrows/<int:arrow_id>/retailer-data', methods=['GET'])
 def get_arrow_retailer_data(arrow_id):
     """Get retailer data for a specific arrow"""
     try:
@@ -8837,7 +8878,7 @@ def get_arrow_retailer_data(arrow_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/<int:arrow_id>/enhance-retailer-data', methods=['POST'])
+@scraping_bp.route('/api/arrows/<int:arrow_id>/enhance-retailer-data', methods=['POST'])
 def enhance_arrow_retailer_data(arrow_id):
     """Enhance arrow with retailer data from specified URLs"""
     try:
@@ -8863,7 +8904,7 @@ def enhance_arrow_retailer_data(arrow_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/batch-enhance-retailer-data', methods=['POST'])
+@scraping_bp.route('/api/arrows/batch-enhance-retailer-data', methods=['POST'])
 def batch_enhance_retailer_data():
     """Batch enhance multiple arrows with retailer data"""
     try:
@@ -8889,7 +8930,7 @@ def batch_enhance_retailer_data():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/retailers', methods=['GET'])
+@catalog_bp.route('/api/retailers', methods=['GET'])
 def get_retailers():
     """Get list of supported retailers"""
     try:
@@ -8926,7 +8967,7 @@ def get_retailers():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/with-retailer-data', methods=['GET'])
+@catalog_bp.route('/api/arrows/with-retailer-data', methods=['GET'])
 def get_arrows_with_retailer_data():
     """Get arrows that have retailer enhancement data"""
     try:
@@ -8987,7 +9028,7 @@ def get_arrows_with_retailer_data():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/arrows/with-tuning-history', methods=['GET'])
+@catalog_bp.route('/api/arrows/with-tuning-history', methods=['GET'])
 @token_required
 def get_arrows_with_tuning_history(current_user):
     """Get arrows that have tuning history data from journal entries for the current user"""
@@ -9070,7 +9111,7 @@ def get_arrows_with_tuning_history(current_user):
         print(f"Error fetching arrows with tuning history: {e}")
         return jsonify({'error': 'Failed to fetch arrows with tuning history'}), 500
 
-@app.route('/api/debug/database', methods=['GET'])
+@system_bp.route('/api/debug/database', methods=['GET'])
 def debug_database():
     """Debug database access and wood arrow search"""
     try:
@@ -9098,7 +9139,7 @@ def debug_database():
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/upload/image', methods=['POST'])
+@system_bp.route('/api/upload/image', methods=['POST'])
 @token_required
 def upload_image(current_user):
     """Upload image to CDN and return URL"""
@@ -9234,166 +9275,343 @@ def upload_image(current_user):
 
 # Debug route removed
 
-@app.route('/api/admin/backup', methods=['POST'])
+def run_admin_backup(backup_name, current_user, compression=None, job=None):
+    """Create the unified database backup, upload it to the CDN and record it in backup_metadata"""
+    from backup_manager import BackupManager
+    from cdn_uploader import CDNUploader
+    from datetime import datetime
+    
+    # With unified database, we always backup the single database
+    include_arrow_db = True
+    include_user_db = False  # Not applicable with unified architecture
+    
+    # Create backup manager
+    backup_manager = BackupManager()
+    
+    # Create local backup
+    local_backup_path = backup_manager.create_backup(
+        backup_name=backup_name,
+        include_arrow_db=include_arrow_db,
+        include_user_db=include_user_db,
+        compression=compression,
+        progress=job.update_progress if job else None
+    )
+    
+    if not local_backup_path or not os.path.exists(local_backup_path):
+        raise Exception('Failed to create local backup')
+    
+    # Upload to CDN using centralized CDN backup manager
+    cdn_url = None
+    result = None
+    if job:
+        job.update_progress({'phase': 'uploading'})
+    try:
+        from cdn_backup_manager import CDNBackupManager
+        
+        cdn_manager = CDNBackupManager()
+        
+        # Create environment-aware backup filename
+        environment = os.getenv('FLASK_ENV', 'development')
+        backup_type = 'full'  # Always full backup with unified database
+        
+        # Generate structured filename: {env}_{type}_{timestamp}.tar.gz (or .tar.zst)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        archive_suffix = '.tar.zst' if local_backup_path.endswith('.tar.zst') else '.tar.gz'
+        structured_filename = f"{environment}_{backup_type}_{timestamp}{archive_suffix}"
+        
+        cdn_url = cdn_manager.upload_backup(local_backup_path, structured_filename)
+        
+        if cdn_url:
+            print(f"✅ Backup uploaded to CDN: {cdn_url}")
+            cdn_type = os.getenv('CDN_TYPE', 'bunnycdn')
+            result = {
+                'success': True,
+                'url': cdn_url,
+                'cdn_url': cdn_url,  # Add both keys for compatibility
+                'cdn_type': cdn_type,
+                'filename': structured_filename
+            }
+        else:
+            # Fallback to legacy CDN uploader
+            raise Exception("CDN backup manager upload failed")
+            
+    except Exception as e:
+        print(f"❌ CDN backup manager upload failed: {e}")
+        
+        # Fallback to legacy CDN uploader
+        try:
+            from cdn_uploader import CDNUploader
+            
+            cdn_type = os.getenv('CDN_TYPE', 'bunnycdn')
+            uploader = CDNUploader(cdn_type)
+            
+            # Upload backup to CDN using legacy method
+            result = uploader.upload_from_file(
+                local_backup_path,
+                manufacturer="backups",
+                model_name=backup_name,
+                image_type="backup"
+            )
+            
+            if result.get('success') and result.get('url'):
+                cdn_url = result['url']
+                # Ensure cdn_url key is present for consistency
+                result['cdn_url'] = cdn_url
+                result['cdn_type'] = os.getenv('CDN_TYPE', 'bunnycdn')
+                print(f"✅ Backup uploaded via legacy CDN uploader: {cdn_url}")
+            else:
+                print("❌ Legacy CDN uploader also failed")
+                result = {'success': False}
+                
+        except Exception as fallback_error:
+            print(f"❌ Both CDN methods failed: {fallback_error}")
+            result = {'success': False}
+    
+    # Make CDN upload optional - backup can succeed without CDN
+    if not result or not result.get('success'):
+        print("⚠️  CDN upload failed, but backup file created successfully locally")
+        result = {
+            'success': True,
+            'url': None,
+            'cdn_url': None,
+            'cdn_type': 'local',
+            'filename': backup_name,
+            'local_only': True
+        }
+    
+    # Get backup file size
+    backup_size = os.path.getsize(local_backup_path) / (1024 * 1024)  # MB
+    
+    # Store backup metadata in user database
+    # Using unified database - ArrowDatabase
+    db = get_database()
+    if not db:
+        raise Exception('Database not available')
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        INSERT INTO backup_metadata 
+        (backup_name, cdn_url, cdn_type, file_size_mb, include_arrow_db, include_user_db, 
+         created_by, local_path)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        backup_name, result['cdn_url'], result.get('cdn_type', 'unknown'), backup_size,
+        include_arrow_db, include_user_db, current_user['id'], local_backup_path
+    ))
+    
+    backup_id = cursor.lastrowid
+    conn.commit()
+    conn.close()
+    
+    return {
+        'success': True,
+        'message': f'Backup "{backup_name}" created and uploaded successfully',
+        'backup_id': backup_id,
+        'backup_name': backup_name,
+        'cdn_url': result['cdn_url'],
+        'cdn_type': result['cdn_type'],
+        'file_size_mb': backup_size,
+        'includes': {
+            'unified_database': True
+        },
+        'created_by': current_user['email'],
+        'local_path': local_backup_path
+    }
+
+@backup_bp.route('/api/admin/backup', methods=['POST'])
 @token_required
 @admin_required
 def create_backup(current_user):
-    """Create unified database backup and upload to CDN"""
+    """Start a unified database backup (background job by default) and upload it to CDN"""
     try:
-        from backup_manager import BackupManager
-        from cdn_uploader import CDNUploader
-        import tempfile
-        import uuid
+        from backup_engine import start_backup_job
         from datetime import datetime
         
         data = request.get_json() or {}
         backup_name = data.get('backup_name')
-        
-        # With unified database, we always backup the single database
-        include_arrow_db = True
-        include_user_db = False  # Not applicable with unified architecture
-        
-        # Create backup manager
-        backup_manager = BackupManager()
+        compression = data.get('compression')
         
         # Generate backup name if not provided
         if not backup_name:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"admin_backup_unified_{timestamp}"
         
-        # Create local backup
-        local_backup_path = backup_manager.create_backup(
-            backup_name=backup_name,
-            include_arrow_db=include_arrow_db,
-            include_user_db=include_user_db
-        )
+        if not data.get('background', True):
+            return jsonify(run_admin_backup(backup_name, current_user, compression))
         
-        if not local_backup_path or not os.path.exists(local_backup_path):
-            return jsonify({'error': 'Failed to create local backup'}), 500
+        # The job runs in its own process, so only the fields run_admin_backup reads are passed on
+        job = start_backup_job(backup_name, 'api:run_admin_backup', {
+            'backup_name': backup_name,
+            'current_user': {'id': current_user['id'], 'email': current_user['email']},
+            'compression': compression
+        })
+        return jsonify({
+            'success': True,
+            'message': f'Backup "{backup_name}" started',
+            'job_id': job.job_id,
+            'backup_name': backup_name,
+            'status_url': f'/api/admin/backup/jobs/{job.job_id}'
+        }), 202
         
-        # Upload to CDN using centralized CDN backup manager
-        cdn_url = None
-        result = None
-        try:
-            from cdn_backup_manager import CDNBackupManager
-            
-            cdn_manager = CDNBackupManager()
-            
-            # Create environment-aware backup filename
-            environment = os.getenv('FLASK_ENV', 'development')
-            backup_type = 'full'  # Always full backup with unified database
-            
-            # Generate structured filename: {env}_{type}_{timestamp}.tar.gz
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            structured_filename = f"{environment}_{backup_type}_{timestamp}.tar.gz"
-            
-            cdn_url = cdn_manager.upload_backup(local_backup_path, structured_filename)
-            
-            if cdn_url:
-                print(f"✅ Backup uploaded to CDN: {cdn_url}")
-                cdn_type = os.getenv('CDN_TYPE', 'bunnycdn')
-                result = {
-                    'success': True,
-                    'url': cdn_url,
-                    'cdn_url': cdn_url,  # Add both keys for compatibility
-                    'cdn_type': cdn_type,
-                    'filename': structured_filename
-                }
-            else:
-                # Fallback to legacy CDN uploader
-                raise Exception("CDN backup manager upload failed")
-                
-        except Exception as e:
-            print(f"❌ CDN backup manager upload failed: {e}")
-            
-            # Fallback to legacy CDN uploader
-            try:
-                from cdn_uploader import CDNUploader
-                
-                cdn_type = os.getenv('CDN_TYPE', 'bunnycdn')
-                uploader = CDNUploader(cdn_type)
-                
-                # Upload backup to CDN using legacy method
-                result = uploader.upload_from_file(
-                    local_backup_path,
-                    manufacturer="backups",
-                    model_name=backup_name,
-                    image_type="backup"
-                )
-                
-                if result.get('success') and result.get('url'):
-                    cdn_url = result['url']
-                    # Ensure cdn_url key is present for consistency
-                    result['cdn_url'] = cdn_url
-                    result['cdn_type'] = os.getenv('CDN_TYPE', 'bunnycdn')
-                    print(f"✅ Backup uploaded via legacy CDN uploader: {cdn_url}")
-                else:
-                    print("❌ Legacy CDN uploader also failed")
-                    result = {'success': False}
-                    
-            except Exception as fallback_error:
-                print(f"❌ Both CDN methods failed: {fallback_error}")
-                result = {'success': False}
+    except Exception as e:
+        print(f"Backup creation error: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': f'Backup creation failed: {str(e)}'}), 500
+
+@backup_bp.route('/api/admin/backup/jobs', methods=['GET'])
+@token_required
+@admin_required
+def list_backup_jobs_endpoint(current_user):
+    """Recent backup and snapshot jobs (shared by all API workers)"""
+    from backup_engine import list_backup_jobs
+    return jsonify({'jobs': list_backup_jobs()})
+
+@backup_bp.route('/api/admin/backup/jobs/<job_id>', methods=['GET'])
+@token_required
+@admin_required
+def get_backup_job_status(current_user, job_id):
+    """Progress of a backup job (phase, pages copied, percent) and its result once finished"""
+    from backup_engine import get_backup_job
+    job = get_backup_job(job_id)
+    if not job:
+        return jsonify({'error': 'Backup job not found'}), 404
+    return jsonify(job.to_dict())
+
+def run_admin_snapshot(snapshot_id, upload=True, job=None):
+    """Create an incremental snapshot of the unified database and upload its new chunks to the CDN"""
+    from backup_manager import BackupManager
+    
+    backup_manager = BackupManager()
+    manifest = backup_manager.create_snapshot(
+        snapshot_id=snapshot_id,
+        include_arrow_db=True,
+        include_user_db=False,  # Not applicable with unified architecture
+        progress=job.update_progress if job else None
+    )
+    
+    cdn_result = None
+    if upload:
+        if job:
+            job.update_progress({'phase': 'uploading'})
+        from cdn_backup_manager import CDNBackupManager
+        cdn_result = CDNBackupManager().upload_snapshot(backup_manager.snapshot_store(), manifest['snapshot_id'])
+        if not cdn_result:
+            print("⚠️  CDN upload failed, but snapshot created successfully locally")
+    
+    return {
+        'success': True,
+        'message': f'Snapshot "{manifest["snapshot_id"]}" created',
+        'snapshot_id': manifest['snapshot_id'],
+        'new_chunks': manifest['new_chunks'],
+        'reused_chunks': manifest['reused_chunks'],
+        'written_mb': manifest['bytes_written'] / (1024 * 1024),
+        'database_mb': manifest['logical_bytes'] / (1024 * 1024),
+        'cdn': cdn_result,
+        'local_only': cdn_result is None
+    }
+
+@backup_bp.route('/api/admin/backup/snapshots', methods=['POST'])
+@token_required
+@admin_required
+def create_backup_snapshot(current_user):
+    """Start an incremental snapshot (only changed chunks are stored and uploaded) as a background job"""
+    try:
+        from backup_engine import start_backup_job
+        from datetime import datetime
         
-        # Make CDN upload optional - backup can succeed without CDN
-        if not result or not result.get('success'):
-            print("⚠️  CDN upload failed, but backup file created successfully locally")
-            result = {
-                'success': True,
-                'url': None,
-                'cdn_url': None,
-                'cdn_type': 'local',
-                'filename': backup_name,
-                'local_only': True
-            }
+        from snapshot_store import valid_snapshot_id
         
-        # Get backup file size
-        backup_size = os.path.getsize(local_backup_path) / (1024 * 1024)  # MB
+        data = request.get_json() or {}
+        snapshot_id = data.get('snapshot_id') or f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        upload = data.get('upload', True)
         
-        # Store backup metadata in user database
-        # Using unified database - ArrowDatabase
-        db = get_database()
-        if not db:
-            return jsonify({"error": "Database not available"}), 500
-        conn = db.get_connection()
-        cursor = conn.cursor()
+        # The id becomes a manifest and staging file name
+        if not isinstance(snapshot_id, str) or not valid_snapshot_id(snapshot_id):
+            return jsonify({'error': 'Invalid snapshot id'}), 400
         
-        cursor.execute('''
-            INSERT INTO backup_metadata 
-            (backup_name, cdn_url, cdn_type, file_size_mb, include_arrow_db, include_user_db, 
-             created_by, local_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            backup_name, result['cdn_url'], result.get('cdn_type', 'unknown'), backup_size,
-            include_arrow_db, include_user_db, current_user['id'], local_backup_path
-        ))
+        if not data.get('background', True):
+            return jsonify(run_admin_snapshot(snapshot_id, upload))
         
-        backup_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        job = start_backup_job(snapshot_id, 'api:run_admin_snapshot', {'snapshot_id': snapshot_id, 'upload': upload})
+        return jsonify({
+            'success': True,
+            'message': f'Snapshot "{snapshot_id}" started',
+            'job_id': job.job_id,
+            'snapshot_id': snapshot_id,
+            'status_url': f'/api/admin/backup/jobs/{job.job_id}'
+        }), 202
+        
+    except Exception as e:
+        print(f"Snapshot creation error: {e}")
+        return jsonify({'error': f'Snapshot creation failed: {str(e)}'}), 500
+
+@backup_bp.route('/api/admin/backup/snapshots', methods=['GET'])
+@token_required
+@admin_required
+def list_backup_snapshots(current_user):
+    """Incremental snapshots in the local snapshot store, newest first"""
+    try:
+        from backup_manager import BackupManager
+        
+        store = BackupManager().snapshot_store()
+        return jsonify({
+            'snapshots': store.list_snapshots(),
+            'store': store.store_usage()
+        })
+        
+    except Exception as e:
+        print(f"Snapshot listing error: {e}")
+        return jsonify({'error': f'Failed to list snapshots: {str(e)}'}), 500
+
+@backup_bp.route('/api/admin/backup/snapshots/<snapshot_id>/restore', methods=['POST'])
+@token_required
+@admin_required
+def restore_backup_snapshot(current_user, snapshot_id):
+    """Restore the unified database from an incremental snapshot (missing chunks are fetched from the CDN)"""
+    try:
+        from backup_manager import BackupManager
+        from snapshot_store import valid_snapshot_id
+        
+        if not valid_snapshot_id(snapshot_id):
+            return jsonify({'error': 'Invalid snapshot id'}), 400
+        
+        backup_manager = BackupManager()
+        store = backup_manager.snapshot_store()
+        
+        manifest_missing = not store.manifest_path(snapshot_id).exists()
+        if manifest_missing or store.missing_chunks(store.manifest_chunks(store.load_manifest(snapshot_id))):
+            from cdn_backup_manager import CDNBackupManager
+            if not CDNBackupManager().download_snapshot(store, snapshot_id):
+                return jsonify({'error': 'Snapshot not found locally or on CDN'}), 404
+        
+        success = backup_manager.restore_snapshot(
+            snapshot_id,
+            restore_arrow_db=True,
+            restore_user_db=False,  # Not applicable with unified architecture
+            force=True  # Force restore in API mode
+        )
+        if not success:
+            return jsonify({'error': 'Snapshot restore failed'}), 500
         
         return jsonify({
             'success': True,
-            'message': f'Backup "{backup_name}" created and uploaded successfully',
-            'backup_id': backup_id,
-            'backup_name': backup_name,
-            'cdn_url': result['cdn_url'],
-            'cdn_type': result['cdn_type'],
-            'file_size_mb': backup_size,
-            'includes': {
+            'message': f'Successfully restored from snapshot "{snapshot_id}"',
+            'snapshot_id': snapshot_id,
+            'restored': {
                 'unified_database': True
             },
-            'created_by': current_user['email'],
-            'local_path': local_backup_path
+            'restored_by': current_user['email']
         })
         
     except Exception as e:
-        print(f"Backup creation error: {e}")
+        print(f"Snapshot restore error: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({'error': f'Backup creation failed: {str(e)}'}), 500
+        return jsonify({'error': f'Snapshot restore failed: {str(e)}'}), 500
 
-@app.route('/api/admin/backup-test-post', methods=['POST'])
+@backup_bp.route('/api/admin/backup-test-post', methods=['POST'])
 def backup_test_post():
     """Test POST route registration after create_backup function"""
     return jsonify({'message': 'POST route registration works', 'status': 'ok'})
@@ -9579,7 +9797,7 @@ def get_database_cdn_backups():
 
 # Re-added the list_backups function after accidentally removing all instances
 
-@app.route('/api/admin/backups', methods=['GET'])
+@backup_bp.route('/api/admin/backups', methods=['GET'])
 @token_required
 @admin_required
 def list_backups(current_user):
@@ -9655,7 +9873,7 @@ def list_backups(current_user):
         traceback.print_exc()
         return jsonify({'error': f'Failed to list backups: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/<int:backup_id>/restore', methods=['POST'])
+@backup_bp.route('/api/admin/backup/<int:backup_id>/restore', methods=['POST'])
 @token_required
 @admin_required
 def restore_backup_from_cdn(current_user, backup_id):
@@ -9699,7 +9917,8 @@ def restore_backup_from_cdn(current_user, backup_id):
         else:
             # Download from CDN
             temp_dir = tempfile.gettempdir()
-            backup_filename = f"restore_{backup_record['backup_name']}.tar.gz"
+            archive_suffix = '.tar.zst' if str(backup_record['cdn_url']).endswith('.tar.zst') else '.tar.gz'
+            backup_filename = f"restore_{backup_record['backup_name']}{archive_suffix}"
             backup_file_path = os.path.join(temp_dir, backup_filename)
             
             print(f"Downloading backup from CDN: {backup_record['cdn_url']}")
@@ -9759,7 +9978,7 @@ def restore_backup_from_cdn(current_user, backup_id):
         traceback.print_exc()
         return jsonify({'error': f'Backup restore failed: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/<int:backup_id>/download', methods=['GET'])
+@backup_bp.route('/api/admin/backup/<int:backup_id>/download', methods=['GET'])
 @token_required
 @admin_required
 def download_backup(current_user, backup_id):
@@ -9793,7 +10012,7 @@ def download_backup(current_user, backup_id):
     except Exception as e:
         return jsonify({'error': f'Failed to get backup download info: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/<backup_id>/restore', methods=['POST'])
+@backup_bp.route('/api/admin/backup/<backup_id>/restore', methods=['POST'])
 @token_required
 @admin_required
 def restore_backup_new_format(current_user, backup_id):
@@ -9864,7 +10083,7 @@ def restore_backup_new_format(current_user, backup_id):
         traceback.print_exc()
         return jsonify({'error': f'Backup restore failed: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/<backup_id>/download', methods=['GET'])
+@backup_bp.route('/api/admin/backup/<backup_id>/download', methods=['GET'])
 @token_required
 @admin_required
 def download_backup_new_format(current_user, backup_id):
@@ -9916,7 +10135,7 @@ def download_backup_new_format(current_user, backup_id):
         traceback.print_exc()
         return jsonify({'error': f'Failed to get backup download info: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/download-file', methods=['POST'])
+@backup_bp.route('/api/admin/backup/download-file', methods=['POST'])
 @token_required
 @admin_required
 def download_backup_file(current_user):
@@ -9944,7 +10163,7 @@ def download_backup_file(current_user):
         print(f"File download error: {e}")
         return jsonify({'error': f'Failed to download file: {str(e)}'}), 500
 
-@app.route('/api/admin/backup/<backup_id>', methods=['DELETE'])
+@backup_bp.route('/api/admin/backup/<backup_id>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_backup(current_user, backup_id):
@@ -10049,7 +10268,7 @@ def delete_database_backup(backup_id):
         if 'conn' in locals():
             conn.close()
 
-@app.route('/api/admin/backup/upload', methods=['POST'])
+@backup_bp.route('/api/admin/backup/upload', methods=['POST'])
 @token_required
 @admin_required
 def upload_backup_file(current_user):
@@ -10070,10 +10289,10 @@ def upload_backup_file(current_user):
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # Validate file extension - support both .tar.gz and .gz files
+        # Validate file extension - support .tar.gz, .gz and .tar.zst files
         filename_lower = file.filename.lower()
-        if not (filename_lower.endswith('.tar.gz') or filename_lower.endswith('.gz')):
-            return jsonify({'error': 'Invalid file format. Only .tar.gz and .gz files are supported'}), 400
+        if not filename_lower.endswith(('.tar.gz', '.gz', '.tar.zst')):
+            return jsonify({'error': 'Invalid file format. Only .tar.gz, .gz and .tar.zst files are supported'}), 400
         
         # With unified database, always restore the single database
         restore_arrow_db = True
@@ -10172,7 +10391,7 @@ def upload_backup_file(current_user):
         print(f"❌ Upload restore error: {e}")
         return jsonify({'error': f'Failed to restore from uploaded file: {str(e)}'}), 500
 
-@app.route('/api/admin/system-info', methods=['GET'])
+@admin_bp.route('/api/admin/system-info', methods=['GET'])
 @token_required
 @admin_required
 def get_system_info(current_user):
@@ -10323,7 +10542,7 @@ def get_system_info(current_user):
             }
         }), 500
 
-@app.route('/api/admin/batch-fill/preview', methods=['POST'])
+@admin_bp.route('/api/admin/batch-fill/preview', methods=['POST'])
 @token_required
 @admin_required
 def preview_batch_fill(current_user):
@@ -10439,7 +10658,7 @@ def preview_batch_fill(current_user):
     except Exception as e:
         return jsonify({'error': f'Failed to preview batch fill: {str(e)}'}), 500
 
-@app.route('/api/admin/batch-fill/execute', methods=['POST'])
+@admin_bp.route('/api/admin/batch-fill/execute', methods=['POST'])
 @token_required
 @admin_required
 def execute_batch_fill(current_user):
@@ -10520,7 +10739,7 @@ def execute_batch_fill(current_user):
     except Exception as e:
         return jsonify({'error': f'Failed to execute batch fill: {str(e)}'}), 500
 
-@app.route('/api/admin/manufacturers/<manufacturer>/length-stats', methods=['GET'])
+@admin_bp.route('/api/admin/manufacturers/<manufacturer>/length-stats', methods=['GET'])
 @token_required
 @admin_required
 def get_manufacturer_length_stats(current_user, manufacturer):
@@ -10573,7 +10792,7 @@ def get_manufacturer_length_stats(current_user, manufacturer):
     except Exception as e:
         return jsonify({'error': f'Failed to get manufacturer length stats: {str(e)}'}), 500
 
-@app.route('/api/admin/scrape-url', methods=['POST'])
+@scraping_bp.route('/api/admin/scrape-url', methods=['POST'])
 @token_required
 @admin_required
 def scrape_url_admin(current_user):
@@ -10909,7 +11128,7 @@ def scrape_url_admin(current_user):
     except Exception as e:
         return jsonify({'error': f'Failed to process scraping request: {str(e)}'}), 500
 
-@app.route('/api/admin/scrape-status/<task_id>', methods=['GET'])
+@scraping_bp.route('/api/admin/scrape-status/<task_id>', methods=['GET'])
 @token_required
 @admin_required
 def get_scrape_status(current_user, task_id):
@@ -10925,7 +11144,7 @@ def get_scrape_status(current_user, task_id):
 # SPINE DATA MANAGEMENT ENDPOINTS
 # ================================
 
-@app.route('/api/admin/spine-data/parameters', methods=['GET'])
+@admin_bp.route('/api/admin/spine-data/parameters', methods=['GET'])
 @token_required
 @admin_required
 def get_spine_calculation_parameters(current_user):
@@ -10951,7 +11170,7 @@ def get_spine_calculation_parameters(current_user):
         print(f"Error getting spine calculation parameters: {e}")
         return jsonify({'error': 'Failed to get spine calculation parameters'}), 500
 
-@app.route('/api/admin/spine-data/parameters/<parameter_group>/<parameter_name>', methods=['PUT'])
+@admin_bp.route('/api/admin/spine-data/parameters/<parameter_group>/<parameter_name>', methods=['PUT'])
 @token_required
 @admin_required
 def update_spine_calculation_parameter(current_user, parameter_group, parameter_name):
@@ -10994,7 +11213,7 @@ def update_spine_calculation_parameter(current_user, parameter_group, parameter_
         print(f"Error updating spine calculation parameter: {e}")
         return jsonify({'error': 'Failed to update parameter'}), 500
 
-@app.route('/api/admin/spine-data/materials', methods=['GET'])
+@admin_bp.route('/api/admin/spine-data/materials', methods=['GET'])
 @token_required
 @admin_required
 def get_spine_materials(current_user):
@@ -11010,7 +11229,7 @@ def get_spine_materials(current_user):
         print(f"Error getting spine materials: {e}")
         return jsonify({'error': 'Failed to get material properties'}), 500
 
-@app.route('/api/admin/spine-data/materials/<material_name>', methods=['PUT'])
+@admin_bp.route('/api/admin/spine-data/materials/<material_name>', methods=['PUT'])
 @token_required
 @admin_required
 def update_spine_material(current_user, material_name):
@@ -11066,7 +11285,7 @@ def update_spine_material(current_user, material_name):
         print(f"Error updating spine material: {e}")
         return jsonify({'error': 'Failed to update material'}), 500
 
-@app.route('/api/admin/spine-data/materials', methods=['POST'])
+@admin_bp.route('/api/admin/spine-data/materials', methods=['POST'])
 @token_required
 @admin_required
 def create_spine_material(current_user):
@@ -11115,7 +11334,7 @@ def create_spine_material(current_user):
         print(f"Error creating spine material: {e}")
         return jsonify({'error': 'Failed to create material'}), 500
 
-@app.route('/api/admin/spine-data/manufacturer-charts', methods=['GET'])
+@admin_bp.route('/api/admin/spine-data/manufacturer-charts', methods=['GET'])
 @token_required
 @admin_required
 def get_manufacturer_spine_charts(current_user):
@@ -11142,7 +11361,7 @@ def get_manufacturer_spine_charts(current_user):
         print(f"Error getting manufacturer spine charts: {e}")
         return jsonify({'error': 'Failed to get manufacturer spine charts'}), 500
 
-@app.route('/api/admin/spine-data/flight-problems', methods=['GET'])
+@admin_bp.route('/api/admin/spine-data/flight-problems', methods=['GET'])
 @token_required
 @admin_required
 def get_flight_problems(current_user):
@@ -11158,7 +11377,7 @@ def get_flight_problems(current_user):
         print(f"Error getting flight problems: {e}")
         return jsonify({'error': 'Failed to get flight problem diagnostics'}), 500
 
-@app.route('/api/admin/spine-data/test-calculation', methods=['POST'])
+@admin_bp.route('/api/admin/spine-data/test-calculation', methods=['POST'])
 @token_required
 @admin_required
 def test_spine_calculation(current_user):
@@ -11199,7 +11418,7 @@ def test_spine_calculation(current_user):
 # Enhanced Manufacturer Spine Chart API Endpoints
 # ==========================================
 
-@app.route('/api/calculator/manufacturers', methods=['GET'])
+@calculator_bp.route('/api/calculator/manufacturers', methods=['GET'])
 def get_spine_chart_manufacturers():
     """Get list of manufacturers with spine charts available"""
     try:
@@ -11235,7 +11454,7 @@ def get_spine_chart_manufacturers():
         print(f"Error getting spine chart manufacturers: {e}")
         return jsonify({'error': 'Failed to get manufacturers'}), 500
 
-@app.route('/api/calculator/manufacturers/<manufacturer>/charts', methods=['GET'])
+@calculator_bp.route('/api/calculator/manufacturers/<manufacturer>/charts', methods=['GET'])
 def get_manufacturer_charts_for_calculator(manufacturer):
     """Get spine charts for a specific manufacturer"""
     try:
@@ -11280,7 +11499,7 @@ def get_manufacturer_charts_for_calculator(manufacturer):
         print(f"Error getting charts for manufacturer {manufacturer}: {e}")
         return jsonify({'error': f'Failed to get charts for {manufacturer}'}), 500
 
-@app.route('/api/calculator/system-default', methods=['GET'])
+@calculator_bp.route('/api/calculator/system-default', methods=['GET'])
 def get_system_default_chart():
     """Get system default spine chart for calculator, with optional material preference"""
     try:
@@ -11368,7 +11587,7 @@ def get_system_default_chart():
         print(f"Error getting system default chart: {e}")
         return jsonify({'error': 'Failed to get system default chart'}), 500
 
-@app.route('/api/calculator/spine-recommendation-enhanced', methods=['POST'])
+@calculator_bp.route('/api/calculator/spine-recommendation-enhanced', methods=['POST'])
 def calculate_enhanced_spine_recommendation():
     """Enhanced spine calculation using manufacturer-specific charts"""
     try:
@@ -11418,7 +11637,7 @@ def calculate_enhanced_spine_recommendation():
         print(f"Error calculating enhanced spine recommendation: {e}")
         return jsonify({'error': 'Failed to calculate spine recommendation'}), 500
 
-@app.route('/api/calculator/convert-spine', methods=['POST'])
+@calculator_bp.route('/api/calculator/convert-spine', methods=['POST'])
 def convert_spine_values():
     """Convert spine values between different systems"""
     try:
@@ -11558,7 +11777,7 @@ def _get_all_spine_charts_data():
         'total_charts': len(manufacturer_charts) + len(custom_charts)
     }
 
-@app.route('/api/admin/spine-charts/list', methods=['GET'])
+@admin_bp.route('/api/admin/spine-charts/list', methods=['GET'])
 @token_required
 @admin_required
 def get_all_spine_charts_list(current_user):
@@ -11577,7 +11796,7 @@ def get_all_spine_charts_list(current_user):
         print(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': f'Failed to get spine charts: {str(e)}'}), 500
 
-@app.route('/api/admin/spine-charts/all', methods=['GET'])
+@admin_bp.route('/api/admin/spine-charts/all', methods=['GET'])
 @token_required
 @admin_required
 def get_all_spine_charts(current_user):
@@ -11591,7 +11810,7 @@ def get_all_spine_charts(current_user):
         print(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': f'Failed to get spine charts: {str(e)}'}), 500
 
-@app.route('/api/admin/spine-charts/custom', methods=['POST'])
+@admin_bp.route('/api/admin/spine-charts/custom', methods=['POST'])
 @token_required
 @admin_required
 def create_custom_spine_chart(current_user):
@@ -11639,7 +11858,7 @@ def create_custom_spine_chart(current_user):
         print(f"Error creating custom spine chart: {e}")
         return jsonify({'error': 'Failed to create custom spine chart'}), 500
 
-@app.route('/api/admin/spine-charts/custom/<int:chart_id>', methods=['PUT'])
+@admin_bp.route('/api/admin/spine-charts/custom/<int:chart_id>', methods=['PUT'])
 @token_required
 @admin_required
 def update_custom_spine_chart(current_user, chart_id):
@@ -11690,7 +11909,7 @@ def update_custom_spine_chart(current_user, chart_id):
         print(f"Error updating custom spine chart: {e}")
         return jsonify({'error': 'Failed to update custom spine chart'}), 500
 
-@app.route('/api/admin/spine-charts/custom/<int:chart_id>', methods=['DELETE'])
+@admin_bp.route('/api/admin/spine-charts/custom/<int:chart_id>', methods=['DELETE'])
 @token_required
 @admin_required
 def delete_custom_spine_chart(current_user, chart_id):
@@ -11723,7 +11942,7 @@ def delete_custom_spine_chart(current_user, chart_id):
         print(f"Error deleting custom spine chart: {e}")
         return jsonify({'error': 'Failed to delete custom spine chart'}), 500
 
-@app.route('/api/admin/spine-charts/manufacturer/<int:chart_id>/override', methods=['POST'])
+@admin_bp.route('/api/admin/spine-charts/manufacturer/<int:chart_id>/override', methods=['POST'])
 @token_required
 @admin_required
 def create_manufacturer_override(current_user, chart_id):
@@ -11779,7 +11998,7 @@ def create_manufacturer_override(current_user, chart_id):
         print(f"Error creating manufacturer override: {e}")
         return jsonify({'error': 'Failed to create manufacturer override'}), 500
 
-@app.route('/api/admin/spine-charts/system-settings', methods=['GET'])
+@admin_bp.route('/api/admin/spine-charts/system-settings', methods=['GET'])
 @token_required
 @admin_required
 def get_spine_system_settings(current_user):
@@ -11795,7 +12014,7 @@ def get_spine_system_settings(current_user):
         print(f"Error getting spine system settings: {e}")
         return jsonify({'error': 'Failed to get system settings'}), 500
 
-@app.route('/api/admin/spine-charts/system-settings/<setting_name>', methods=['PUT'])
+@admin_bp.route('/api/admin/spine-charts/system-settings/<setting_name>', methods=['PUT'])
 @token_required
 @admin_required
 def update_spine_system_setting(current_user, setting_name):
@@ -11822,7 +12041,7 @@ def update_spine_system_setting(current_user, setting_name):
         print(f"Error updating spine system setting: {e}")
         return jsonify({'error': 'Failed to update system setting'}), 500
 
-@app.route('/api/admin/spine-charts/<chart_type>/<int:chart_id>/set-default', methods=['POST'])
+@admin_bp.route('/api/admin/spine-charts/<chart_type>/<int:chart_id>/set-default', methods=['POST'])
 @token_required
 @admin_required
 def set_system_default_chart(current_user, chart_type, chart_id):
@@ -11846,7 +12065,7 @@ def set_system_default_chart(current_user, chart_type, chart_id):
         print(f"Error setting system default chart: {e}")
         return jsonify({'error': 'Failed to set system default chart'}), 500
 
-@app.route('/api/admin/spine-charts/<chart_type>/<int:chart_id>/duplicate', methods=['POST'])
+@admin_bp.route('/api/admin/spine-charts/<chart_type>/<int:chart_id>/duplicate', methods=['POST'])
 @token_required
 @admin_required
 def duplicate_spine_chart(current_user, chart_type, chart_id):
@@ -11885,7 +12104,7 @@ def duplicate_spine_chart(current_user, chart_type, chart_id):
 # Frontend-Compatible Spine Chart API Endpoints
 # These endpoints match what the frontend spine chart editor expects
 
-@app.route('/api/admin/spine-charts/manufacturers', methods=['GET'])
+@admin_bp.route('/api/admin/spine-charts/manufacturers', methods=['GET'])
 @token_required
 @admin_required
 def get_spine_chart_manufacturers_by_bow_type(current_user):
@@ -11927,7 +12146,7 @@ def get_spine_chart_manufacturers_by_bow_type(current_user):
         print(f"Error getting spine chart manufacturers: {e}")
         return jsonify({'error': 'Failed to get manufacturers'}), 500
 
-@app.route('/api/admin/spine-charts', methods=['GET', 'POST', 'DELETE'])
+@admin_bp.route('/api/admin/spine-charts', methods=['GET', 'POST', 'DELETE'])
 @token_required
 @admin_required
 def handle_spine_charts_crud(current_user):
@@ -12057,7 +12276,7 @@ def handle_spine_charts_crud(current_user):
         print(f"Error handling spine charts CRUD: {e}")
         return jsonify({'error': f'Failed to handle spine chart operation: {str(e)}'}), 500
 
-@app.route('/api/admin/spine-charts/export', methods=['GET'])
+@admin_bp.route('/api/admin/spine-charts/export', methods=['GET'])
 @token_required
 @admin_required
 def export_all_spine_charts(current_user):
@@ -12109,7 +12328,7 @@ def export_all_spine_charts(current_user):
 
 # Database Migration Management API Endpoints
 
-@app.route('/api/admin/migrations/status', methods=['GET'])
+@admin_bp.route('/api/admin/migrations/status', methods=['GET'])
 @token_required
 @admin_required
 def get_migration_status(current_user):
@@ -12411,7 +12630,7 @@ def get_migration_description(migration_version):
     
     return descriptions.get(migration_version, f'Migration {migration_version}')
 
-@app.route('/api/admin/migrations/run', methods=['POST'])
+@admin_bp.route('/api/admin/migrations/run', methods=['POST'])
 @token_required
 @admin_required
 def run_migrations(current_user):
@@ -12494,7 +12713,7 @@ def run_migrations(current_user):
         print(f"Error running migrations: {e}")
         return jsonify({'error': f'Failed to run migrations: {str(e)}'}), 500
 
-@app.route('/api/admin/migrations/history', methods=['GET'])
+@admin_bp.route('/api/admin/migrations/history', methods=['GET'])
 @token_required
 @admin_required
 def get_migration_history(current_user):
@@ -12551,7 +12770,7 @@ def get_migration_history(current_user):
         print(f"Error getting migration history: {e}")
         return jsonify({'error': 'Failed to get migration history'}), 500
 
-@app.route('/api/admin/migrations/<version>/details', methods=['GET'])
+@admin_bp.route('/api/admin/migrations/<version>/details', methods=['GET'])
 @token_required
 @admin_required
 def get_migration_details(current_user, version):
@@ -12579,7 +12798,7 @@ def get_migration_details(current_user, version):
         print(f"Error getting migration details: {e}")
         return jsonify({'error': 'Failed to get migration details'}), 500
 
-@app.route('/api/admin/migrations/validate', methods=['GET'])
+@admin_bp.route('/api/admin/migrations/validate', methods=['GET'])
 @token_required
 @admin_required
 def validate_migrations(current_user):
@@ -12604,7 +12823,7 @@ def validate_migrations(current_user):
         print(f"Error validating migrations: {e}")
         return jsonify({'error': 'Failed to validate migrations'}), 500
 
-@app.route('/api/admin/validate-arrows', methods=['GET'])
+@admin_bp.route('/api/admin/validate-arrows', methods=['GET'])
 @token_required
 @admin_required
 def validate_arrows_data(current_user):
@@ -12671,7 +12890,7 @@ def validate_arrows_data(current_user):
         print(f"Error validating arrow data: {e}")
         return jsonify({'error': f'Failed to validate arrow data: {str(e)}'}), 500
 
-@app.route('/api/admin/validate-arrows/sql-fix', methods=['GET'])
+@admin_bp.route('/api/admin/validate-arrows/sql-fix', methods=['GET'])
 @token_required
 @admin_required  
 def get_arrow_validation_sql_fix(current_user):
@@ -12705,7 +12924,7 @@ def get_arrow_validation_sql_fix(current_user):
         print(f"Error generating SQL fix script: {e}")
         return jsonify({'error': f'Failed to generate SQL fix script: {str(e)}'}), 500
 
-@app.route('/api/admin/validate-arrows/execute-fixes', methods=['POST'])
+@admin_bp.route('/api/admin/validate-arrows/execute-fixes', methods=['POST'])
 @token_required
 @admin_required
 def execute_arrow_validation_fixes(current_user):
@@ -12794,7 +13013,7 @@ def execute_arrow_validation_fixes(current_user):
         print(f"Error executing validation fixes: {e}")
         return jsonify({'error': f'Failed to execute validation fixes: {str(e)}'}), 500
 
-@app.route('/api/admin/execute-sql', methods=['POST'])
+@admin_bp.route('/api/admin/execute-sql', methods=['POST'])
 @token_required
 @admin_required
 def execute_individual_sql(current_user):
@@ -12841,12 +13060,20 @@ def execute_individual_sql(current_user):
         print(f"Error executing individual SQL: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-@app.route('/api/admin/validate-arrows/merge-duplicates', methods=['POST'])
+@admin_bp.route('/api/admin/validate-arrows/merge-duplicates', methods=['POST'])
 @token_required
 @admin_required
 def merge_duplicate_arrows(current_user):
-    """Merge all duplicate arrows with automatic backup"""
+    """Merge exact duplicate arrows (and admin-reviewed near-duplicate groups) with automatic backup"""
     try:
+        # Near-duplicates are only reported; merging them needs the reviewed arrow ID lists
+        options = request.get_json(silent=True) or {}
+        reviewed_groups = options.get('reviewed_groups') or []
+        if not isinstance(reviewed_groups, list) or not all(
+                isinstance(group, list) and all(isinstance(arrow_id, int) for arrow_id in group)
+                for group in reviewed_groups):
+            return jsonify({'error': 'reviewed_groups must be a list of arrow ID lists'}), 400
+        
         # Import required modules with production-compatible paths
         try:
             ArrowDataValidator = import_arrow_data_validator()
@@ -12879,7 +13106,11 @@ def merge_duplicate_arrows(current_user):
         
         # Execute merge operation
         validator = ArrowDataValidator(db_path)
-        merge_result = validator.merge_all_duplicates()
+        merge_result = validator.merge_all_duplicates(
+            include_near_duplicates=bool(options.get('include_near_duplicates', False)),
+            block_on_spine=bool(options.get('block_on_spine', True)),
+            reviewed_groups=reviewed_groups
+        )
         
         return jsonify({
             'success': True,
@@ -12887,6 +13118,7 @@ def merge_duplicate_arrows(current_user):
             'backup_name': backup_name,
             'merged_count': merge_result['merged_count'],
             'merge_operations': merge_result['merge_operations'],
+            'near_duplicate_groups': merge_result['near_duplicate_groups'],
             'errors': merge_result['errors'],
             'total_groups_processed': merge_result['total_groups_processed'],
             'execution_timestamp': datetime.now().isoformat()
@@ -12898,7 +13130,7 @@ def merge_duplicate_arrows(current_user):
 
 # Enhanced Arrow Validation System API Endpoints
 
-@app.route('/api/admin/validation/status', methods=['GET'])
+@admin_bp.route('/api/admin/validation/status', methods=['GET'])
 @token_required
 @admin_required
 def get_validation_status(current_user):
@@ -12916,9 +13148,9 @@ def get_validation_status(current_user):
         
         db_path = db.db_path if hasattr(db, 'db_path') else 'arrow_database.db'
         
-        # Quick validation run focusing on critical issues
+        # Incremental run: only arrows changed since the last completed run are revalidated
         validator = ArrowDataValidator(db_path)
-        report = validator.validate_all_data()
+        report = validator.validate_changed_data(triggered_by='status')
         
         # Categorize issues by severity
         critical_issues = [issue for issue in validator.validation_issues if issue.severity == 'critical']
@@ -12950,7 +13182,7 @@ def get_validation_status(current_user):
         print(f"Error getting validation status: {e}")
         return jsonify({'error': f'Failed to get validation status: {str(e)}'}), 500
 
-@app.route('/api/admin/validation/run', methods=['POST'])
+@admin_bp.route('/api/admin/validation/run', methods=['POST'])
 @token_required
 @admin_required
 def trigger_validation_run(current_user):
@@ -12968,13 +13200,19 @@ def trigger_validation_run(current_user):
         
         db_path = db.db_path if hasattr(db, 'db_path') else 'arrow_database.db'
         
-        # Run comprehensive validation
+        # Run comprehensive validation, or only revalidate changed arrows with mode=incremental
+        data = request.get_json(silent=True) or {}
+        mode = data.get('mode') or request.args.get('mode', 'full')
         validator = ArrowDataValidator(db_path)
-        report = validator.validate_all_data()
+        if mode == 'incremental':
+            report = validator.validate_changed_data(triggered_by='admin')
+        else:
+            report = validator.validate_all_data(triggered_by='admin')
         
         # Return detailed results
         return jsonify({
             'success': True,
+            'mode': mode if mode == 'incremental' else 'full',
             'validation_timestamp': datetime.now().isoformat(),
             'total_arrows': report.total_arrows,
             'total_issues': report.total_issues,
@@ -13008,7 +13246,7 @@ def trigger_validation_run(current_user):
         print(f"Error running validation: {e}")
         return jsonify({'error': f'Failed to run validation: {str(e)}'}), 500
 
-@app.route('/api/admin/validation/issues', methods=['GET'])
+@admin_bp.route('/api/admin/validation/issues', methods=['GET'])
 @token_required
 @admin_required
 def get_validation_issues(current_user):
@@ -13076,7 +13314,7 @@ def get_validation_issues(current_user):
         print(f"Error getting validation issues: {e}")
         return jsonify({'error': f'Failed to get validation issues: {str(e)}'}), 500
 
-@app.route('/api/admin/validation/fix/<int:issue_id>', methods=['POST'])
+@admin_bp.route('/api/admin/validation/fix/<int:issue_id>', methods=['POST'])
 @token_required
 @admin_required
 def apply_validation_fix(current_user, issue_id):
@@ -13134,7 +13372,7 @@ def apply_validation_fix(current_user, issue_id):
         print(f"Error applying validation fix: {e}")
         return jsonify({'error': f'Failed to apply fix: {str(e)}'}), 500
 
-@app.route('/api/admin/validation/mark-not-duplicate', methods=['POST'])
+@admin_bp.route('/api/admin/validation/mark-not-duplicate', methods=['POST'])
 @token_required
 @admin_required
 def mark_not_duplicate(current_user):
@@ -13198,7 +13436,7 @@ def mark_not_duplicate(current_user):
         print(f"Error marking not duplicate: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-@app.route('/api/admin/bulk-fix-visibility', methods=['POST'])
+@admin_bp.route('/api/admin/bulk-fix-visibility', methods=['POST'])
 @token_required
 @admin_required
 def bulk_fix_arrow_visibility(current_user):
@@ -13278,7 +13516,7 @@ def bulk_fix_arrow_visibility(current_user):
 
 # Database Health Management API Endpoints
 
-@app.route('/api/admin/database/health', methods=['GET'])
+@admin_bp.route('/api/admin/database/health', methods=['GET'])
 @token_required
 @admin_required
 def get_database_health(current_user):
@@ -13324,35 +13562,85 @@ def get_database_health(current_user):
         print(f"Error getting database health: {e}")
         return jsonify({'error': f'Failed to get database health: {str(e)}'}), 500
 
-@app.route('/api/admin/database/optimize', methods=['POST'])
+@admin_bp.route('/api/admin/database/optimize', methods=['POST'])
 @token_required
 @admin_required
 def optimize_database(current_user):
-    """Run database optimization operations"""
+    """Queue a maintenance run (incremental vacuum, targeted ANALYZE, PRAGMA optimize) in the background scheduler"""
     try:
-        from database_health_checker import DatabaseHealthChecker
+        scheduler = get_maintenance_scheduler()
+        if not scheduler:
+            return jsonify({'error': 'Database not available'}), 500
+        
+        status = scheduler.request_run()
+        
+        return jsonify({
+            'success': True,
+            'message': 'Database maintenance scheduled',
+            'planned': status['plan'],
+            'status_url': '/api/admin/database/maintenance'
+        }), 202
+    except Exception as e:
+        print(f"Error scheduling database optimization: {e}")
+        return jsonify({'error': f'Failed to schedule database optimization: {str(e)}'}), 500
+
+@admin_bp.route('/api/admin/database/maintenance', methods=['GET'])
+@token_required
+@admin_required
+def get_database_maintenance_status(current_user):
+    """Maintenance scheduler status: freelist/ANALYZE stats, planned steps, lease holder and recent steps"""
+    try:
+        scheduler = get_maintenance_scheduler()
+        if not scheduler:
+            return jsonify({'error': 'Database not available'}), 500
+        
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        return jsonify(scheduler.status(log_limit=limit)), 200
+    except Exception as e:
+        print(f"Error getting database maintenance status: {e}")
+        return jsonify({'error': f'Failed to get database maintenance status: {str(e)}'}), 500
+
+@admin_bp.route('/api/admin/database/query-benchmarks', methods=['GET'])
+@token_required
+@admin_required
+def get_query_benchmark_history(current_user):
+    """Get stored hot-query latency runs (p50/p95/p99 and plan fingerprints) for trend charts"""
+    try:
+        from query_benchmark import QueryBenchmark, ensure_benchmark_tables
         
-        # Find database path
         db = get_database()
         if not db:
             return jsonify({'error': 'Database not available'}), 500
         
-        db_path = db.db_path if hasattr(db, 'db_path') else 'arrow_database.db'
+        limit = min(request.args.get('limit', 20, type=int), 200)
         
-        # Run optimization
-        checker = DatabaseHealthChecker(db_path)
-        optimization_results = checker.run_database_optimization()
+        conn = db.get_connection()
+        try:
+            ensure_benchmark_tables(conn)
+            history = QueryBenchmark.history(conn, limit=limit)
+        finally:
+            conn.close()
         
-        return jsonify({
-            'success': True,
-            'message': 'Database optimization completed',
-            'results': optimization_results
-        }), 200
+        return jsonify(history), 200
+    except Exception as e:
+        print(f"Error getting query benchmark history: {e}")
+        return jsonify({'error': f'Failed to get query benchmark history: {str(e)}'}), 500
+
+@admin_bp.route('/api/admin/perf', methods=['GET'])
+@token_required
+@admin_required
+def get_performance_stats(current_user):
+    """Per-endpoint p50/p95, queries per request, slowest statements, spans and N+1 findings (all workers)"""
+    try:
+        if request.args.get('format') == 'prometheus':
+            return Response(perf_monitor.monitor.prometheus(), mimetype='text/plain; version=0.0.4')
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        return jsonify(perf_monitor.monitor.report(limit=limit)), 200
     except Exception as e:
-        print(f"Error optimizing database: {e}")
-        return jsonify({'error': f'Failed to optimize database: {str(e)}'}), 500
+        print(f"Error getting performance stats: {e}")
+        return jsonify({'error': f'Failed to get performance stats: {str(e)}'}), 500
 
-@app.route('/api/admin/database/schema-verify', methods=['GET'])
+@admin_bp.route('/api/admin/database/schema-verify', methods=['GET'])
 @token_required
 @admin_required
 def verify_database_schema(current_user):
@@ -13376,50 +13664,31 @@ def verify_database_schema(current_user):
         print(f"Error verifying database schema: {e}")
         return jsonify({'error': f'Failed to verify database schema: {str(e)}'}), 500
 
-@app.route('/api/admin/database/vacuum', methods=['POST'])
+@admin_bp.route('/api/admin/database/vacuum', methods=['POST'])
 @token_required
 @admin_required
 def vacuum_database(current_user):
-    """Run VACUUM command to reclaim space"""
+    """Reclaim free pages in the background (a database without incremental auto_vacuum is converted once)"""
     try:
-        # Find database path
-        db = get_database()
-        if not db:
+        scheduler = get_maintenance_scheduler()
+        if not scheduler:
             return jsonify({'error': 'Database not available'}), 500
         
-        import sqlite3
-        import time
-        from pathlib import Path
-        
-        db_path = db.db_path if hasattr(db, 'db_path') else 'arrow_database.db'
-        
-        # Get size before
-        size_before = Path(db_path).stat().st_size
-        
-        # Run VACUUM
-        start_time = time.time()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("VACUUM")
-        conn.close()
-        
-        # Get size after
-        size_after = Path(db_path).stat().st_size
-        execution_time = (time.time() - start_time) * 1000
-        
-        space_reclaimed_mb = (size_before - size_after) / (1024 * 1024)
+        status = scheduler.request_run(vacuum=True)
+        database = status['database']
+        converting = database['auto_vacuum'] != 'incremental'
         
         return jsonify({
             'success': True,
-            'message': 'Database VACUUM completed',
-            'execution_time_ms': round(execution_time, 2),
-            'space_reclaimed_mb': round(space_reclaimed_mb, 2),
-            'size_before_mb': round(size_before / (1024 * 1024), 2),
-            'size_after_mb': round(size_after / (1024 * 1024), 2)
-        }), 200
+            'message': ('Database conversion to incremental vacuum scheduled for the next quiet moment'
+                        if converting else 'Incremental vacuum scheduled'),
+            'reclaimable_mb': database['free_mb'],
+            'auto_vacuum': database['auto_vacuum'],
+            'status_url': '/api/admin/database/maintenance'
+        }), 202
     except Exception as e:
-        print(f"Error running VACUUM: {e}")
-        return jsonify({'error': f'Failed to run VACUUM: {str(e)}'}), 500
+        print(f"Error scheduling VACUUM: {e}")
+        return jsonify({'error': f'Failed to schedule VACUUM: {str(e)}'}), 500
 
 # Helper functions for enhanced spine calculations
 
@@ -13652,7 +13921,7 @@ def get_calculation_notes(bow_config, manufacturer_recommendation):
     
     return notes
 
-@app.route('/api/bow-setups/<int:setup_id>/change-log', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/change-log', methods=['GET'])
 @token_required
 def get_bow_setup_change_history(current_user, setup_id):
     """Get unified change history for a bow setup (arrows + equipment + setup)"""
@@ -13691,7 +13960,7 @@ def get_bow_setup_change_history(current_user, setup_id):
         print(f"Error getting change history: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/change-log/statistics', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/change-log/statistics', methods=['GET'])
 @token_required
 def get_bow_setup_change_statistics(current_user, setup_id):
     """Get change statistics for a bow setup"""
@@ -13713,7 +13982,7 @@ def get_bow_setup_change_statistics(current_user, setup_id):
 
 # ===== ACTIVE BOW SETUP API ENDPOINTS =====
 
-@app.route('/api/user/active-bow-setup', methods=['GET'])
+@users_bp.route('/api/user/active-bow-setup', methods=['GET'])
 @token_required
 def get_active_bow_setup(current_user):
     """Get user's currently active bow setup"""
@@ -13803,7 +14072,7 @@ def get_active_bow_setup(current_user):
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/user/active-bow-setup', methods=['PUT'])
+@users_bp.route('/api/user/active-bow-setup', methods=['PUT'])
 @token_required
 def set_active_bow_setup(current_user):
     """Set user's active bow setup"""
@@ -13852,7 +14121,7 @@ def set_active_bow_setup(current_user):
 
 # ===== GLOBAL CHANGE LOG API ENDPOINTS =====
 
-@app.route('/api/change-log/global', methods=['GET'])
+@setups_bp.route('/api/change-log/global', methods=['GET'])
 @token_required
 def get_global_change_log(current_user):
     """Get global change history across all user's bow setups"""
@@ -13943,7 +14212,7 @@ def get_global_change_log(current_user):
         print(f"Error getting global change log: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/change-log/global-statistics', methods=['GET'])
+@setups_bp.route('/api/change-log/global-statistics', methods=['GET'])
 @token_required
 def get_global_statistics(current_user):
     """Get global statistics across all user activities"""
@@ -14026,7 +14295,7 @@ def get_global_statistics(current_user):
 # Enhanced Performance Analysis API Endpoints
 # ==========================================
 
-@app.route('/api/calculator/enhanced-foc', methods=['POST'])
+@calculator_bp.route('/api/calculator/enhanced-foc', methods=['POST'])
 def calculate_enhanced_foc():
     """Calculate enhanced FOC with optimization recommendations and performance analysis"""
     try:
@@ -14063,7 +14332,7 @@ def calculate_enhanced_foc():
         print(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': 'Failed to calculate enhanced FOC analysis'}), 500
 
-@app.route('/api/calculator/ballistics', methods=['POST'])
+@calculator_bp.route('/api/calculator/ballistics', methods=['POST'])
 def calculate_ballistics():
     """Calculate comprehensive ballistics analysis including trajectory and performance metrics"""
     try:
@@ -14125,7 +14394,7 @@ def calculate_ballistics():
         print(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': 'Failed to calculate ballistics analysis'}), 500
 
-@app.route('/api/calculator/kinetic-energy', methods=['POST'])
+@calculator_bp.route('/api/calculator/kinetic-energy', methods=['POST'])
 def calculate_kinetic_energy():
     """Calculate kinetic energy and momentum at specified distances"""
     try:
@@ -14157,7 +14426,7 @@ def calculate_kinetic_energy():
         print(f"Error calculating kinetic energy: {e}")
         return jsonify({'error': 'Failed to calculate kinetic energy'}), 500
 
-@app.route('/api/calculator/penetration-analysis', methods=['POST'])
+@calculator_bp.route('/api/calculator/penetration-analysis', methods=['POST'])
 def calculate_penetration_analysis():
     """Calculate penetration potential based on kinetic energy and momentum"""
     try:
@@ -14205,7 +14474,7 @@ def calculate_penetration_analysis():
         print(f"Error calculating penetration analysis: {e}")
         return jsonify({'error': 'Failed to calculate penetration analysis'}), 500
 
-@app.route('/api/calculator/arrow-speed-estimate', methods=['POST'])
+@calculator_bp.route('/api/calculator/arrow-speed-estimate', methods=['POST'])
 def estimate_arrow_speed():
     """Enhanced arrow speed estimation with chronograph data and string material factors"""
     try:
@@ -14358,7 +14627,7 @@ def estimate_arrow_speed():
         print(f"Full traceback:\n{traceback.format_exc()}")
         return jsonify({'error': f'Failed to estimate arrow speed: {str(e)}'}), 500
 
-@app.route('/api/calculator/comprehensive-performance', methods=['POST'])
+@calculator_bp.route('/api/calculator/comprehensive-performance', methods=['POST'])
 def calculate_comprehensive_performance():
     """Calculate comprehensive arrow performance analysis combining FOC, ballistics, and penetration"""
     try:
@@ -14463,7 +14732,7 @@ def calculate_comprehensive_performance():
 # CHRONOGRAPH DATA API ENDPOINTS
 # ============================================================================
 
-@app.route('/api/chronograph-data', methods=['POST'])
+@setups_bp.route('/api/chronograph-data', methods=['POST'])
 @token_required
 def create_chronograph_data(current_user):
     """Create new chronograph data entry"""
@@ -14542,7 +14811,7 @@ def create_chronograph_data(current_user):
         print(f"Error creating chronograph data: {e}")
         return jsonify({'error': 'Failed to create chronograph data'}), 500
 
-@app.route('/api/chronograph-data/setup/<int:setup_id>', methods=['GET'])
+@setups_bp.route('/api/chronograph-data/setup/<int:setup_id>', methods=['GET'])
 @token_required
 def get_chronograph_data_for_setup(current_user, setup_id):
     """Get all chronograph data for a specific bow setup"""
@@ -14606,7 +14875,7 @@ def get_chronograph_data_for_setup(current_user, setup_id):
         print(f"Error getting chronograph data: {e}")
         return jsonify({'error': 'Failed to get chronograph data'}), 500
 
-@app.route('/api/chronograph-data/<int:data_id>', methods=['PUT'])
+@setups_bp.route('/api/chronograph-data/<int:data_id>', methods=['PUT'])
 @token_required
 def update_chronograph_data(current_user, data_id):
     """Update chronograph data entry"""
@@ -14645,7 +14914,7 @@ def update_chronograph_data(current_user, data_id):
         print(f"Error updating chronograph data: {e}")
         return jsonify({'error': 'Failed to update chronograph data'}), 500
 
-@app.route('/api/chronograph-data/<int:data_id>', methods=['DELETE'])
+@setups_bp.route('/api/chronograph-data/<int:data_id>', methods=['DELETE'])
 @token_required
 def delete_chronograph_data(current_user, data_id):
     """Delete chronograph data entry"""
@@ -14667,7 +14936,7 @@ def delete_chronograph_data(current_user, data_id):
         print(f"Error deleting chronograph data: {e}")
         return jsonify({'error': 'Failed to delete chronograph data'}), 500
 
-@app.route('/api/chronograph-data/arrow/<int:arrow_id>/estimate-speed', methods=['POST'])
+@setups_bp.route('/api/chronograph-data/arrow/<int:arrow_id>/estimate-speed', methods=['POST'])
 @token_required
 def estimate_speed_from_chronograph(current_user, arrow_id):
     """Estimate arrow speed for different weights using chronograph data"""
@@ -14780,7 +15049,7 @@ def get_improvement_areas(foc_result: dict, penetration_result: dict,
 # Journal System API Endpoints
 # ==========================================
 
-@app.route('/api/journal/entries', methods=['GET'])
+@journal_bp.route('/api/journal/entries', methods=['GET'])
 @token_required
 def get_journal_entries(current_user):
     """Get journal entries for current user with filtering options"""
@@ -14937,7 +15206,7 @@ def get_journal_entries(current_user):
         traceback.print_exc()
         return jsonify({'error': 'Failed to fetch journal entries'}), 500
 
-@app.route('/api/journal/entries', methods=['POST'])
+@journal_bp.route('/api/journal/entries', methods=['POST'])
 @token_required
 def create_journal_entry(current_user):
     """Create a new journal entry"""
@@ -15101,7 +15370,7 @@ def create_journal_entry(current_user):
             
         return jsonify({'error': 'Failed to create journal entry'}), 500
 
-@app.route('/api/journal/entries/<int:entry_id>', methods=['GET'])
+@journal_bp.route('/api/journal/entries/<int:entry_id>', methods=['GET'])
 @token_required
 def get_journal_entry(current_user, entry_id):
     """Get a specific journal entry with all related data"""
@@ -15213,7 +15482,7 @@ def get_journal_entry(current_user, entry_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to fetch journal entry'}), 500
 
-@app.route('/api/journal/entries/<int:entry_id>', methods=['PUT'])
+@journal_bp.route('/api/journal/entries/<int:entry_id>', methods=['PUT'])
 @token_required
 def update_journal_entry(current_user, entry_id):
     """Update an existing journal entry"""
@@ -15304,7 +15573,7 @@ def update_journal_entry(current_user, entry_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to update journal entry'}), 500
 
-@app.route('/api/journal/entries/<int:entry_id>', methods=['DELETE'])
+@journal_bp.route('/api/journal/entries/<int:entry_id>', methods=['DELETE'])
 @token_required
 def delete_journal_entry(current_user, entry_id):
     """Delete a journal entry and all related data"""
@@ -15336,7 +15605,7 @@ def delete_journal_entry(current_user, entry_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to delete journal entry'}), 500
 
-@app.route('/api/journal/search', methods=['GET'])
+@journal_bp.route('/api/journal/search', methods=['GET'])
 @token_required
 def search_journal_entries(current_user):
     """Full-text search journal entries"""
@@ -15416,7 +15685,7 @@ def search_journal_entries(current_user):
         traceback.print_exc()
         return jsonify({'error': 'Failed to search journal entries'}), 500
 
-@app.route('/api/journal/tags', methods=['GET'])
+@journal_bp.route('/api/journal/tags', methods=['GET'])
 @token_required
 def get_journal_tags(current_user):
     """Get all unique tags used by the current user"""
@@ -15450,7 +15719,7 @@ def get_journal_tags(current_user):
         print(f"Error fetching journal tags: {e}")
         return jsonify({'error': 'Failed to fetch tags'}), 500
 
-@app.route('/api/journal/entry-types', methods=['GET'])
+@journal_bp.route('/api/journal/entry-types', methods=['GET'])
 def get_journal_entry_types():
     """Get available journal entry types"""
     entry_types = [
@@ -15466,7 +15735,7 @@ def get_journal_entry_types():
     
     return jsonify({'entry_types': entry_types})
 
-@app.route('/api/journal/templates', methods=['GET'])
+@journal_bp.route('/api/journal/templates', methods=['GET'])
 @token_required
 def get_journal_templates(current_user):
     """Get available journal templates"""
@@ -15516,7 +15785,7 @@ def get_journal_templates(current_user):
             'error': 'Failed to load journal templates'
         }), 500
 
-@app.route('/api/journal/filter-presets', methods=['GET'])
+@journal_bp.route('/api/journal/filter-presets', methods=['GET'])
 @token_required
 def get_filter_presets(current_user):
     """Get user's filter presets"""
@@ -15556,7 +15825,7 @@ def get_filter_presets(current_user):
             'error': 'Failed to load filter presets'
         }), 500
 
-@app.route('/api/journal/filter-presets', methods=['POST'])
+@journal_bp.route('/api/journal/filter-presets', methods=['POST'])
 @token_required
 def create_filter_preset(current_user):
     """Create a new filter preset"""
@@ -15599,7 +15868,7 @@ def create_filter_preset(current_user):
             'error': 'Failed to create filter preset'
         }), 500
 
-@app.route('/api/change-log', methods=['GET'])
+@setups_bp.route('/api/change-log', methods=['GET'])
 @token_required
 def get_change_log_entries(current_user):
     """Get change log entries for the current user"""
@@ -15671,7 +15940,7 @@ def get_change_log_entries(current_user):
             'error': 'Failed to load change log entries'
         }), 500
 
-@app.route('/api/change-log', methods=['POST'])
+@setups_bp.route('/api/change-log', methods=['POST'])
 @token_required
 def create_change_log_entry(current_user):
     """Create a new change log entry"""
@@ -15731,7 +16000,7 @@ def create_change_log_entry(current_user):
             'error': 'Failed to create change log entry'
         }), 500
 
-@app.route('/api/journal/entries/from-change-log', methods=['POST'])
+@journal_bp.route('/api/journal/entries/from-change-log', methods=['POST'])
 @token_required
 def create_journal_entry_from_change_log(current_user):
     """Create a journal entry from a change log event with automatic linking"""
@@ -15911,7 +16180,7 @@ def create_journal_entry_from_change_log(current_user):
 
 # ===== TECHNICAL TUNING ENDPOINTS =====
 
-@app.route('/api/bow-setups/<int:setup_id>/tuning-configs', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/tuning-configs', methods=['GET'])
 @token_required
 def get_tuning_configs(current_user, setup_id):
     """Get all tuning configurations for a bow setup"""
@@ -15960,7 +16229,7 @@ def get_tuning_configs(current_user, setup_id):
         print(f"Error getting tuning configs: {e}")
         return jsonify({'error': 'Failed to get tuning configurations'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/tuning-configs', methods=['POST'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/tuning-configs', methods=['POST'])
 @token_required
 def create_tuning_config(current_user, setup_id):
     """Create a new tuning configuration"""
@@ -16048,7 +16317,7 @@ def create_tuning_config(current_user, setup_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to create tuning configuration'}), 500
 
-@app.route('/api/tuning-configs/<int:config_id>', methods=['GET'])
+@tuning_bp.route('/api/tuning-configs/<int:config_id>', methods=['GET'])
 @token_required
 def get_tuning_config(current_user, config_id):
     """Get a single tuning configuration with all values"""
@@ -16093,7 +16362,7 @@ def get_tuning_config(current_user, config_id):
         print(f"Error getting tuning config: {e}")
         return jsonify({'error': 'Failed to get tuning configuration'}), 500
 
-@app.route('/api/tuning-configs/<int:config_id>', methods=['PUT'])
+@tuning_bp.route('/api/tuning-configs/<int:config_id>', methods=['PUT'])
 @token_required
 def update_tuning_config(current_user, config_id):
     """Update a tuning configuration"""
@@ -16229,7 +16498,7 @@ def update_tuning_config(current_user, config_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to update tuning configuration'}), 500
 
-@app.route('/api/tuning-configs/<int:config_id>', methods=['DELETE'])
+@tuning_bp.route('/api/tuning-configs/<int:config_id>', methods=['DELETE'])
 @token_required
 def delete_tuning_config(current_user, config_id):
     """Delete a tuning configuration"""
@@ -16275,7 +16544,7 @@ def delete_tuning_config(current_user, config_id):
         print(f"Error deleting tuning config: {e}")
         return jsonify({'error': 'Failed to delete tuning configuration'}), 500
 
-@app.route('/api/tuning-configs/<int:config_id>/activate', methods=['POST'])
+@tuning_bp.route('/api/tuning-configs/<int:config_id>/activate', methods=['POST'])
 @token_required
 def activate_tuning_config(current_user, config_id):
     """Set a tuning configuration as active (deactivates others)"""
@@ -16345,7 +16614,7 @@ def activate_tuning_config(current_user, config_id):
         print(f"Error activating tuning config: {e}")
         return jsonify({'error': 'Failed to activate tuning configuration'}), 500
 
-@app.route('/api/tuning-configs/<int:config_id>/duplicate', methods=['POST'])
+@tuning_bp.route('/api/tuning-configs/<int:config_id>/duplicate', methods=['POST'])
 @token_required
 def duplicate_tuning_config(current_user, config_id):
     """Create a copy of a tuning configuration"""
@@ -16434,7 +16703,7 @@ def duplicate_tuning_config(current_user, config_id):
         traceback.print_exc()
         return jsonify({'error': 'Failed to duplicate tuning configuration'}), 500
 
-@app.route('/api/bow-setups/<int:setup_id>/tuning-history', methods=['GET'])
+@setups_bp.route('/api/bow-setups/<int:setup_id>/tuning-history', methods=['GET'])
 @token_required
 def get_bow_tuning_history(current_user, setup_id):
     """Get technical tuning change history for a bow setup"""
@@ -16510,6 +16779,34 @@ def clear_performance_cache():
     except Exception as e:
         print(f"⚠️ Error clearing performance cache: {e}")
 
+def create_app():
+    """Build the Flask app and register the domain blueprints"""
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'arrow-tuning-secret-key-change-in-production')
+
+    # Enable CORS in Flask (nginx CORS disabled to prevent duplicates)
+    CORS(app,
+         origins=CORS_ORIGINS,
+         methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
+         allow_headers=['Content-Type', 'Authorization'],
+         supports_credentials=True)
+
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
+
+    if perf_monitor.PERF_MONITORING_ENABLED:
+        app.before_request(begin_request_metrics)
+        app.after_request(record_response_status)
+        app.teardown_request(end_request_metrics)
+    app.before_request(note_database_activity)
+    app.register_error_handler(Exception, handle_error)
+    return app
+
+# Importing this module must stay cheap and must not open database connections or start
+# threads: gunicorn --preload imports it once in the master and forks the workers from it.
+# Heavy dependencies (scipy, google-auth, scrapers) are imported inside the code that needs them.
+app = create_app()
+
 if __name__ == '__main__':
     port = int(os.environ.get('API_PORT', 5000))
     print(f"🚀 Starting ArrowTuner API on port {port}")
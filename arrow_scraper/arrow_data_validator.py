@@ -9,12 +9,107 @@ import json
 import re
 import hashlib
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from unified_database import UnifiedDatabase
+from duplicate_detection import NearDuplicateDetector, variant_tokens
 from datetime import datetime
 
+# Categories whose checks can be scoped to a set of arrows in incremental runs
+# (Search Visibility samples randomly and is only refreshed by full runs)
+INCREMENTAL_CATEGORIES = (
+    'Critical Fields', 'Database Integrity', 'Material Standardization', 'Spine Data Quality',
+    'Manufacturer Integration', 'Data Field Formatting', 'Calculator Compatibility'
+)
+
+# Pairwise duplicate checks capped by a global LIMIT; a scoped query would see a different
+# window, so these are only refreshed by full runs
+FULL_RUN_DUPLICATE_FIELDS = ('identical_specifications',)
+
+# Rows fetched per batch by the single-pass streaming cursor
+STREAM_BATCH_SIZE = 1000
+
+# Realistic spine ranges by material: (min, max, label)
+SPINE_RANGES = {
+    'Wood': (25, 100, "25-100 lbs"),
+    'Carbon': (150, 2000, "150-2000"),
+    'Aluminum': (150, 3000, "150-3000"),
+}
+
+# Triggers appending to catalog_change_log; rows with arrow_id NULL are manufacturer-level changes
+CHANGE_LOG_TRIGGERS = {
+    'arrows': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NEW.id, NEW.manufacturer);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NEW.id, NEW.manufacturer); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) SELECT OLD.id, OLD.manufacturer "
+                  "WHERE OLD.id != NEW.id OR OLD.manufacturer IS NOT NEW.manufacturer;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (OLD.id, OLD.manufacturer);",
+    },
+    'spine_specifications': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT NEW.arrow_id, (SELECT manufacturer FROM arrows WHERE id = NEW.arrow_id);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT NEW.arrow_id, (SELECT manufacturer FROM arrows WHERE id = NEW.arrow_id); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT OLD.arrow_id, (SELECT manufacturer FROM arrows WHERE id = OLD.arrow_id) "
+                  "WHERE OLD.arrow_id IS NOT NEW.arrow_id;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT OLD.arrow_id, (SELECT manufacturer FROM arrows WHERE id = OLD.arrow_id);",
+    },
+    'manufacturers': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, NEW.name);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, NEW.name); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) SELECT NULL, OLD.name "
+                  "WHERE OLD.name IS NOT NEW.name;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, OLD.name);",
+    },
+}
+
+
+def ensure_arrow_change_tracking(conn: sqlite3.Connection):
+    """Create catalog_change_log, its triggers and the validation_runs watermark columns (idempotent)"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS catalog_change_log (
+            change_seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            arrow_id INTEGER,
+            manufacturer TEXT,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+
+    for table, events in CHANGE_LOG_TRIGGERS.items():
+        for event in events:
+            # Earlier triggers wrote into arrow_change_log, the setup arrow change history
+            cursor.execute(f"DROP TRIGGER IF EXISTS arrow_change_log_{table}_{event}")
+        if table not in existing_tables:
+            continue
+        for event, body in events.items():
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS catalog_change_log_{table}_{event}
+                AFTER {event.upper()} ON {table}
+                BEGIN
+                    {body}
+                END
+            """)
+
+    if 'validation_runs' in existing_tables:
+        cursor.execute("PRAGMA table_info(validation_runs)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'run_mode' not in columns:
+            cursor.execute("ALTER TABLE validation_runs ADD COLUMN run_mode TEXT DEFAULT 'full'")
+        if 'change_seq' not in columns:
+            cursor.execute("ALTER TABLE validation_runs ADD COLUMN change_seq INTEGER")
+        if 'arrows_revalidated' not in columns:
+            cursor.execute("ALTER TABLE validation_runs ADD COLUMN arrows_revalidated INTEGER")
+
+    conn.commit()
+
+
 @dataclass
 class ValidationIssue:
     """Single validation issue"""
@@ -42,6 +137,18 @@ class ValidationIssue:
         if self.sql_fix and not self.sql_fix.startswith('--'):
             self.auto_fixable = True
 
+@dataclass
+class ValidationRule:
+    """One check of the single-pass validation engine"""
+    name: str
+    category: str
+    level: str  # 'catalog' (runs once), 'arrow' (once per arrow) or 'spec' (once per spine specification)
+    check: Callable
+    column: Optional[str] = None  # Row-independent: check(value) runs once per distinct value, emit(row, verdict) builds issues
+    emit: Optional[Callable] = None
+    limit: Optional[int] = None  # Maximum issues reported per run
+    full_run_only: bool = False
+
 @dataclass
 class ValidationReport:
     """Complete validation report"""
@@ -66,6 +173,16 @@ class ArrowDataValidator:
         self.current_run_id = None
         self.validation_start_time = None
         
+        # Arrow ids revalidated by an incremental run (None = whole catalog); duplicate
+        # checks compare arrows within a manufacturer so they get the wider scope
+        self._scope_ids = None
+        self._duplicate_scope_ids = None
+        self.change_seq = None
+        self.last_report = None
+        
+        # Per-rule time (ms) and issue counts of the last run
+        self.rule_timings = {}
+        
         # Standard material categories for frontend compatibility
         self.standard_materials = {
             'Carbon', 'Carbon / Aluminum', 'Aluminum', 'Wood', 'Fiberglass'
@@ -101,10 +218,39 @@ class ArrowDataValidator:
     def validate_all_data(self, triggered_by: str = 'manual') -> ValidationReport:
         """Run comprehensive validation on all arrow data with database persistence"""
         print("🔍 Starting comprehensive arrow data validation...")
+        return self._run_validation(triggered_by)
+    
+    def validate_changed_data(self, triggered_by: str = 'manual') -> ValidationReport:
+        """
+        Revalidate only arrows and spine specifications changed since the last completed run.
+        Results are merged into validation_issues and the report (and health score) is built
+        from all unresolved persisted issues. Falls back to a full run when there is no baseline.
+        """
+        print("🔍 Starting incremental arrow data validation...")
+        
+        since_seq = None
+        try:
+            with self.db.get_connection() as conn:
+                ensure_arrow_change_tracking(conn)
+                cursor = conn.cursor()
+                cursor.execute("SELECT MAX(change_seq) FROM validation_runs")
+                since_seq = cursor.fetchone()[0]
+        except Exception as e:
+            print(f"⚠️  Change tracking unavailable: {e}")
+        
+        if since_seq is None:
+            print("ℹ️  No completed validation baseline, running full validation")
+            return self._run_validation(triggered_by)
+        
+        return self._run_validation(triggered_by, since_seq=since_seq)
+    
+    def _run_validation(self, triggered_by: str, since_seq: Optional[int] = None) -> ValidationReport:
+        """Run the validation categories over the whole catalog, or only changes after since_seq"""
+        incremental = since_seq is not None
         
         # Initialize validation run
         self.validation_start_time = time.time()
-        self._start_validation_run(triggered_by)
+        self._start_validation_run(triggered_by, 'incremental' if incremental else 'full')
         
         # Clear previous issues
         self.validation_issues = []
@@ -115,29 +261,39 @@ class ArrowDataValidator:
             cursor.execute('SELECT COUNT(*) FROM arrows')
             total_arrows = cursor.fetchone()[0]
             
-            print(f"📊 Analyzing {total_arrows} arrows in database...")
+            if incremental:
+                self._scope_ids, self._duplicate_scope_ids = self._load_change_scope(
+                    cursor, since_seq, self.change_seq or 0)
+                print(f"📊 Revalidating {len(self._scope_ids)} changed arrows of {total_arrows}...")
+            else:
+                print(f"📊 Analyzing {total_arrows} arrows in database...")
         
         try:
-            # Run all validation categories
-            self._validate_critical_fields()
-            self._validate_search_visibility()  # NEW: Critical for arrow 2508 type issues
-            self._validate_database_integrity()  # NEW: JOIN and architecture validation
-            self._validate_material_standardization()
-            self._validate_spine_data_quality()
-            self._validate_manufacturer_integration()
-            self._validate_duplicate_detection()
-            self._validate_data_field_formatting()
-            self._validate_calculator_compatibility()
+            # Run every registered rule in one pass over the catalog
+            self.rule_timings = {}
+            if not incremental or self._scope_ids:
+                self._run_rules()
             
             # Store issues in database
-            self._persist_validation_issues()
+            persisted = self._persist_validation_issues()
+            
+            if incremental and persisted:
+                # Report on everything still open, not just what this run looked at
+                found = len(self.validation_issues)
+                self.validation_issues = self._load_unresolved_issues()
+                print(f"🔁 {found} issues on changed arrows, {len(self.validation_issues)} open in total")
             
             # Generate comprehensive report
             report = self._generate_validation_report(total_arrows)
+            report.summary_stats['rule_timings'] = self.rule_timings
+            if not persisted:
+                report.summary_stats['persist_error'] = True
             
-            # Complete validation run record
-            self._complete_validation_run(report, total_arrows)
+            # Complete validation run record; without persisted issues the run cannot become the
+            # baseline, or the changes it looked at would never be rechecked
+            self._complete_validation_run(report, total_arrows, completed=persisted)
             
+            self.last_report = report
             print(f"✅ Validation complete: {report.total_issues} issues found")
             return report
             
@@ -156,76 +312,549 @@ class ArrowDataValidator:
                 fix_recommendations=[],
                 calculator_impact={}
             )
-            self._complete_validation_run(report, total_arrows)
+            self._complete_validation_run(report, total_arrows, completed=False)
             raise
+        finally:
+            self._scope_ids = None
+            self._duplicate_scope_ids = None
+    
+    def _load_change_scope(self, cursor, since_seq: int, until_seq: int) -> Tuple[set, set]:
+        """
+        Resolve catalog_change_log entries in (since_seq, until_seq] to the arrow ids to revalidate,
+        plus the wider duplicate-detection scope (every arrow of an affected manufacturer)
+        """
+        cursor.execute('''
+            SELECT arrow_id, manufacturer FROM catalog_change_log
+            WHERE change_seq > ? AND change_seq <= ?
+        ''', (since_seq, until_seq))
+        
+        arrow_ids = set()
+        manufacturers = set()
+        changed_manufacturers = set()
+        for row in cursor.fetchall():
+            if row[0] is not None:
+                arrow_ids.add(row[0])
+            elif row[1]:
+                changed_manufacturers.add(row[1])
+            if row[1]:
+                manufacturers.add(row[1])
+        
+        # Manufacturer rows (active status, renames) affect every arrow of that manufacturer
+        if changed_manufacturers:
+            cursor.execute('SELECT id FROM arrows WHERE manufacturer IN (SELECT value FROM json_each(?))',
+                           (json.dumps(sorted(changed_manufacturers)),))
+            arrow_ids.update(row[0] for row in cursor.fetchall())
+        
+        duplicate_ids = set(arrow_ids)
+        if manufacturers:
+            manufacturer_keys = sorted({name.strip().lower() for name in manufacturers})
+            cursor.execute('''
+                SELECT id FROM arrows
+                WHERE LOWER(TRIM(manufacturer)) IN (SELECT value FROM json_each(?))
+            ''', (json.dumps(manufacturer_keys),))
+            duplicate_ids.update(row[0] for row in cursor.fetchall())
+        
+        return arrow_ids, duplicate_ids
+    
+    def _scope(self, column: str, duplicates: bool = False) -> Tuple[str, tuple]:
+        """SQL filter restricting column to the incremental scope ('' for full runs)"""
+        ids = self._duplicate_scope_ids if duplicates else self._scope_ids
+        if ids is None:
+            return '', ()
+        return f' AND {column} IN (SELECT value FROM json_each(?))', (json.dumps(sorted(ids)),)
+    
+    # ========================================
+    # SINGLE-PASS RULE ENGINE
+    # ========================================
     
-    def _validate_critical_fields(self):
-        """Validate critical required fields"""
-        print("🔍 Validating critical fields...")
+    def _build_rules(self) -> List[ValidationRule]:
+        """Rule registry: every check of a validation run, catalog-level first"""
+        return [
+            # Catalog-level checks (set-based queries, run once)
+            ValidationRule('manufacturers_table', 'Database Integrity', 'catalog', self._check_manufacturers_table),
+            ValidationRule('search_visibility', 'Search Visibility', 'catalog', self._validate_search_visibility,
+                           full_run_only=True),
+            ValidationRule('search_performance', 'Database Integrity', 'catalog', self._check_search_performance,
+                           full_run_only=True),
+            ValidationRule('orphaned_spine_specs', 'Database Integrity', 'catalog', self._check_orphaned_specs),
+            ValidationRule('duplicate_detection', 'Duplicate Detection', 'catalog', self._validate_duplicate_detection),
+            
+            # Arrow rows (once per arrow)
+            ValidationRule('missing_manufacturer', 'Critical Fields', 'arrow', self._rule_missing_manufacturer),
+            ValidationRule('missing_model_name', 'Critical Fields', 'arrow', self._rule_missing_model_name),
+            ValidationRule('no_spine_specifications', 'Critical Fields', 'arrow', self._rule_no_spine_specifications),
+            ValidationRule('arrow_without_spines', 'Database Integrity', 'arrow', self._rule_arrow_without_spines,
+                           limit=10),
+            ValidationRule('material_standardization', 'Material Standardization', 'arrow',
+                           self._check_material_standard, column='material', emit=self._emit_material_standard),
+            ValidationRule('unknown_manufacturer', 'Manufacturer Integration', 'arrow', self._rule_unknown_manufacturer),
+            ValidationRule('inactive_manufacturer', 'Manufacturer Integration', 'arrow', self._rule_inactive_manufacturer),
+            ValidationRule('calculator_material', 'Calculator Compatibility', 'arrow',
+                           self._check_calculator_material, column='material', emit=self._emit_calculator_material),
+            
+            # Spine specification rows
+            ValidationRule('invalid_spine', 'Spine Data Quality', 'spec',
+                           self._check_invalid_spine, column='spine', emit=self._emit_invalid_spine),
+            ValidationRule('spine_range', 'Spine Data Quality', 'spec', self._rule_spine_range),
+            ValidationRule('length_options_format', 'Data Field Formatting', 'spec',
+                           self._length_options_issues, column='length_options', emit=self._emit_length_options),
+            ValidationRule('outer_diameter_format', 'Data Field Formatting', 'spec',
+                           self._check_outer_diameter, column='outer_diameter', emit=self._emit_outer_diameter),
+            ValidationRule('gpi_weight_format', 'Data Field Formatting', 'spec',
+                           self._check_gpi_weight, column='gpi_weight', emit=self._emit_gpi_weight),
+            ValidationRule('length_options_json', 'Calculator Compatibility', 'spec',
+                           self._check_length_options_json, column='length_options',
+                           emit=self._emit_length_options_json),
+        ]
+    
+    def _run_rules(self):
+        """
+        Run every registered rule: catalog-level rules once, then a single streaming pass over
+        arrows LEFT JOIN spine_specifications feeding the arrow and spine specification rules
+        """
+        incremental = self._scope_ids is not None
+        rules = [rule for rule in self._build_rules() if not (incremental and rule.full_run_only)]
+        self.rule_timings = {rule.name: {'category': rule.category, 'ms': 0.0, 'issues': 0} for rule in rules}
+        
+        for rule in rules:
+            if rule.level != 'catalog':
+                continue
+            before = len(self.validation_issues)
+            started = time.perf_counter()
+            rule.check()
+            self._record_rule(rule, started, len(self.validation_issues) - before)
         
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Check for missing manufacturer
-            cursor.execute('''
-                SELECT id, manufacturer, model_name 
-                FROM arrows 
-                WHERE manufacturer IS NULL OR manufacturer = '' OR trim(manufacturer) = ''
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Critical Fields",
-                    severity="critical",
-                    arrow_id=row['id'],
-                    manufacturer=row['manufacturer'] or 'NULL',
-                    model_name=row['model_name'] or 'NULL',
-                    field="manufacturer",
-                    issue="Missing or empty manufacturer",
-                    current_value=row['manufacturer'],
-                    suggested_fix="Add manufacturer name or mark as 'Unknown'",
-                    sql_fix=f"UPDATE arrows SET manufacturer = 'Unknown' WHERE id = {row['id']};"
-                ))
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='manufacturers'")
+            has_manufacturers_table = cursor.fetchone() is not None
+            if not has_manufacturers_table:
+                # Reported by manufacturers_table; nothing to join against
+                rules = [rule for rule in rules if rule.category != 'Manufacturer Integration']
             
-            # Check for missing model_name
-            cursor.execute('''
-                SELECT id, manufacturer, model_name 
-                FROM arrows 
-                WHERE model_name IS NULL OR model_name = '' OR trim(model_name) = ''
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Critical Fields",
-                    severity="critical",
-                    arrow_id=row['id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'NULL',
-                    field="model_name",
-                    issue="Missing or empty model name",
-                    current_value=row['model_name'],
-                    suggested_fix="Add model name or mark as 'Unnamed Model'",
-                    sql_fix=f"UPDATE arrows SET model_name = 'Unnamed Model' WHERE id = {row['id']};"
-                ))
+            arrow_rules = [rule for rule in rules if rule.level == 'arrow']
+            spec_rules = [rule for rule in rules if rule.level == 'spec']
+            caches = {rule.name: {} for rule in arrow_rules + spec_rules if rule.column}
             
-            # Check arrows without spine specifications
-            cursor.execute('''
-                SELECT a.id, a.manufacturer, a.model_name
+            manufacturer_join = ('LEFT JOIN manufacturers m ON a.manufacturer = m.name'
+                                 if has_manufacturers_table else '')
+            manufacturer_columns = ('m.name AS manufacturer_name, m.is_active AS manufacturer_active'
+                                    if has_manufacturers_table else
+                                    'NULL AS manufacturer_name, NULL AS manufacturer_active')
+            scope_sql, scope_params = self._scope('a.id')
+            
+            started = time.perf_counter()
+            cursor.execute(f'''
+                SELECT a.id AS arrow_id, a.manufacturer, a.model_name, a.material,
+                       {manufacturer_columns},
+                       ss.id AS spec_id, ss.spine, ss.outer_diameter, ss.gpi_weight, ss.length_options
                 FROM arrows a
-                LEFT JOIN spine_specifications ss ON a.id = ss.arrow_id
-                WHERE ss.arrow_id IS NULL
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Critical Fields",
-                    severity="critical",
-                    arrow_id=row['id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'Unknown',
-                    field="spine_specifications",
-                    issue="No spine specifications available",
-                    current_value="NULL",
-                    suggested_fix="Add spine specifications or remove arrow",
-                    sql_fix=f"DELETE FROM arrows WHERE id = {row['id']}; -- Remove arrow without spine data"
-                ))
+                {manufacturer_join}
+                LEFT JOIN spine_specifications ss ON ss.arrow_id = a.id
+                WHERE 1 = 1{scope_sql}
+                ORDER BY a.id, ss.id
+            ''', scope_params)
+            scan_seconds = time.perf_counter() - started
+            
+            last_arrow_id = None
+            rows_scanned = 0
+            while True:
+                started = time.perf_counter()
+                rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+                scan_seconds += time.perf_counter() - started
+                if not rows:
+                    break
+                rows_scanned += len(rows)
+                
+                # Joined rows repeat the arrow columns once per spine specification
+                arrow_rows = []
+                spec_rows = []
+                for row in rows:
+                    if row['arrow_id'] != last_arrow_id:
+                        arrow_rows.append(row)
+                        last_arrow_id = row['arrow_id']
+                    if row['spec_id'] is not None:
+                        spec_rows.append(row)
+                
+                for rule in arrow_rules:
+                    self._apply_rule(rule, arrow_rows, caches.get(rule.name))
+                for rule in spec_rules:
+                    self._apply_rule(rule, spec_rows, caches.get(rule.name))
+        
+        self.rule_timings['catalog_scan'] = {'category': None, 'ms': round(scan_seconds * 1000, 2),
+                                             'issues': 0, 'rows': rows_scanned}
+        
+        print("⏱️  Rule timings:")
+        for name, timing in sorted(self.rule_timings.items(), key=lambda item: -item[1]['ms']):
+            print(f"   {name:<28} {timing['ms']:9.2f}ms  {timing['issues']:6d} issues")
+    
+    def _apply_rule(self, rule: ValidationRule, rows: List[sqlite3.Row], cache: Optional[Dict]):
+        """Evaluate one rule over a batch of rows and record its issues and time"""
+        timing = self.rule_timings[rule.name]
+        if rule.limit is not None and timing['issues'] >= rule.limit:
+            return
+        
+        started = time.perf_counter()
+        issues = []
+        if rule.column:
+            # Row-independent check: evaluated once per distinct column value
+            for row in rows:
+                value = row[rule.column]
+                if value not in cache:
+                    cache[value] = rule.check(value)
+                verdict = cache[value]
+                if verdict:
+                    issues.extend(rule.emit(row, verdict))
+        else:
+            for row in rows:
+                found = rule.check(row)
+                if found:
+                    issues.extend(found)
+        
+        if rule.limit is not None:
+            issues = issues[:rule.limit - timing['issues']]
+        self.validation_issues.extend(issues)
+        self._record_rule(rule, started, len(issues))
+    
+    def _record_rule(self, rule: ValidationRule, started: float, issue_count: int):
+        timing = self.rule_timings[rule.name]
+        timing['ms'] = round(timing['ms'] + (time.perf_counter() - started) * 1000, 2)
+        timing['issues'] += issue_count
+    
+    @staticmethod
+    def _is_blank(value) -> bool:
+        """NULL, '' or only spaces (SQLite trim semantics)"""
+        return value is None or (isinstance(value, str) and value.strip(' ') == '')
+    
+    @staticmethod
+    def _outside_range(value, low: float, high: float) -> bool:
+        """Range check with SQLite comparison semantics: NULL never matches, text sorts above numbers"""
+        if value is None:
+            return False
+        if isinstance(value, (int, float)):
+            return value < low or value > high
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return True
+        return number < low or number > high
+    
+    # Arrow rules
+    
+    def _rule_missing_manufacturer(self, row) -> List[ValidationIssue]:
+        if not self._is_blank(row['manufacturer']):
+            return []
+        return [ValidationIssue(
+            category="Critical Fields",
+            severity="critical",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'NULL',
+            model_name=row['model_name'] or 'NULL',
+            field="manufacturer",
+            issue="Missing or empty manufacturer",
+            current_value=row['manufacturer'],
+            suggested_fix="Add manufacturer name or mark as 'Unknown'",
+            sql_fix=f"UPDATE arrows SET manufacturer = 'Unknown' WHERE id = {row['arrow_id']};"
+        )]
+    
+    def _rule_missing_model_name(self, row) -> List[ValidationIssue]:
+        if not self._is_blank(row['model_name']):
+            return []
+        return [ValidationIssue(
+            category="Critical Fields",
+            severity="critical",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'NULL',
+            field="model_name",
+            issue="Missing or empty model name",
+            current_value=row['model_name'],
+            suggested_fix="Add model name or mark as 'Unnamed Model'",
+            sql_fix=f"UPDATE arrows SET model_name = 'Unnamed Model' WHERE id = {row['arrow_id']};"
+        )]
+    
+    def _rule_no_spine_specifications(self, row) -> List[ValidationIssue]:
+        if row['spec_id'] is not None:
+            return []
+        return [ValidationIssue(
+            category="Critical Fields",
+            severity="critical",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="spine_specifications",
+            issue="No spine specifications available",
+            current_value="NULL",
+            suggested_fix="Add spine specifications or remove arrow",
+            sql_fix=f"DELETE FROM arrows WHERE id = {row['arrow_id']}; -- Remove arrow without spine data"
+        )]
+    
+    def _rule_arrow_without_spines(self, row) -> List[ValidationIssue]:
+        if row['spec_id'] is not None:
+            return []
+        return [ValidationIssue(
+            category="Database Integrity",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="spine_specifications",
+            issue="Arrow has no spine specifications",
+            current_value="No spine data",
+            suggested_fix="Add spine specifications or remove arrow",
+            sql_fix=f"DELETE FROM arrows WHERE id = {row['arrow_id']}; -- Remove arrow without spine data"
+        )]
+    
+    def _check_material_standard(self, material) -> Optional[Tuple[str, Optional[str]]]:
+        if not material or material.strip() == '':
+            return ('missing', None)
+        if material not in self.standard_materials:
+            suggested_material = self._suggest_material_mapping(material)
+            if suggested_material != material:
+                return ('non_standard', suggested_material)
+        return None
+    
+    def _emit_material_standard(self, row, verdict) -> List[ValidationIssue]:
+        material = row['material']
+        kind, suggested_material = verdict
+        if kind == 'missing':
+            # Missing material
+            return [ValidationIssue(
+                category="Material Standardization",
+                severity="warning",
+                arrow_id=row['arrow_id'],
+                manufacturer=row['manufacturer'] or 'Unknown',
+                model_name=row['model_name'] or 'Unknown',
+                field="material",
+                issue="Missing material specification",
+                current_value=material,
+                suggested_fix="Set to 'Carbon' (most common default)",
+                sql_fix=f"UPDATE arrows SET material = 'Carbon' WHERE id = {row['arrow_id']};"
+            )]
+        # Non-standard material that needs mapping
+        return [ValidationIssue(
+            category="Material Standardization",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="material",
+            issue=f"Non-standard material: '{material}'",
+            current_value=material,
+            suggested_fix=f"Map to standard material: '{suggested_material}'",
+            sql_fix=f"UPDATE arrows SET material = '{suggested_material}' WHERE material = '{material}';"
+        )]
+    
+    def _rule_unknown_manufacturer(self, row) -> List[ValidationIssue]:
+        if row['manufacturer_name'] is not None:
+            return []
+        return [ValidationIssue(
+            category="Manufacturer Integration",
+            severity="critical",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="manufacturer",
+            issue="References non-existent manufacturer",
+            current_value=row['manufacturer'],
+            suggested_fix="Create manufacturer entry or update manufacturer name",
+            sql_fix=f"INSERT INTO manufacturers (name, is_active) VALUES ('{row['manufacturer']}', 1);"
+        )]
+    
+    def _rule_inactive_manufacturer(self, row) -> List[ValidationIssue]:
+        # Arrows from inactive manufacturers (for info)
+        if row['manufacturer_name'] is None or row['manufacturer_active'] != 0:
+            return []
+        return [ValidationIssue(
+            category="Manufacturer Integration",
+            severity="info",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="manufacturer_active_status",
+            issue="Arrow from inactive manufacturer (hidden from calculator)",
+            current_value="inactive",
+            suggested_fix="Reactivate manufacturer or migrate arrows",
+            sql_fix=f"UPDATE manufacturers SET is_active = 1 WHERE name = '{row['manufacturer']}';"
+        )]
+    
+    def _check_calculator_material(self, material) -> Optional[str]:
+        # Check if materials can be properly mapped for frontend
+        if material and material.lower() not in {m.lower() for m in self.standard_materials}:
+            return self._suggest_material_mapping(material)
+        return None
+    
+    def _emit_calculator_material(self, row, suggested) -> List[ValidationIssue]:
+        db_material = row['material']
+        return [ValidationIssue(
+            category="Calculator Compatibility",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="material",
+            issue=f"Material '{db_material}' not in standard frontend categories",
+            current_value=db_material,
+            suggested_fix=f"Map to standard material: '{suggested}'",
+            sql_fix=f"UPDATE arrows SET material = '{suggested}' WHERE material = '{db_material}';"
+        )]
+    
+    # Spine specification rules
+    
+    def _check_invalid_spine(self, spine) -> bool:
+        return spine is None or spine == '' or spine == 0 or spine == '0'
+    
+    def _emit_invalid_spine(self, row, verdict) -> List[ValidationIssue]:
+        return [ValidationIssue(
+            category="Spine Data Quality",
+            severity="critical",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="spine",
+            issue="Invalid or missing spine value",
+            current_value=row['spine'],
+            suggested_fix="Remove invalid spine specification",
+            sql_fix=f"DELETE FROM spine_specifications WHERE id = {row['spec_id']};"
+        )]
+    
+    def _rule_spine_range(self, row) -> List[ValidationIssue]:
+        # Realistic spine ranges depend on the arrow material
+        material = row['material']
+        if material not in SPINE_RANGES:
+            return []
+        low, high, spine_range = SPINE_RANGES[material]
+        if not self._outside_range(row['spine'], low, high):
+            return []
+        return [ValidationIssue(
+            category="Spine Data Quality",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="spine",
+            issue=f"Spine value {row['spine']} outside realistic range for {material} arrows ({spine_range})",
+            current_value=row['spine'],
+            suggested_fix=f"Verify spine value is correct for {material} material",
+            sql_fix=f"-- Manual review required for spine_specifications.id = {row['spec_id']}"
+        )]
+    
+    def _length_options_issues(self, length_options) -> List[str]:
+        """Formatting problems in one length_options value that could break calculator logic"""
+        if length_options is None or length_options == '':
+            return []
+        length_options = str(length_options)
+        
+        # Check for malformed length values
+        issues_found = []
+        
+        try:
+            # Try to parse as JSON first
+            if length_options.startswith('[') or length_options.startswith('{'):
+                parsed = json.loads(length_options)
+                if isinstance(parsed, list):
+                    for i, length in enumerate(parsed):
+                        if isinstance(length, str):
+                            # Check for European decimal notation like "33,5" or "29,13"
+                            if self._has_european_decimal_comma(length):
+                                issues_found.append(f"European decimal comma notation at index {i}: '{length}' (should use period: '{length.replace(',', '.')}')")
+                            # Check for problematic patterns like "31, 5" within a single string element  
+                            elif ',' in length and not self._is_valid_single_length_with_comma(length):
+                                issues_found.append(f"Malformed length value at index {i}: '{length}' (contains problematic comma)")
+                            elif not self._is_valid_length_format(length):
+                                issues_found.append(f"Invalid length format at index {i}: '{length}'")
+                        elif isinstance(length, (int, float)):
+                            # Numeric values should be reasonable (6-36 inches typically)
+                            if length < 6 or length > 36:
+                                issues_found.append(f"Unrealistic length value: {length}")
+            else:
+                # Handle non-JSON formats - check for "31, 5" type patterns
+                if self._has_problematic_comma_pattern(length_options):
+                    issues_found.append(f"Problematic comma pattern detected: '{length_options}'")
+                elif ',' in length_options and not self._is_valid_comma_separated_lengths(length_options):
+                    issues_found.append(f"Malformed comma-separated values: '{length_options}'")
+                elif not self._is_valid_length_format(length_options):
+                    issues_found.append(f"Invalid length format: '{length_options}'")
+                    
+        except (json.JSONDecodeError, ValueError) as e:
+            issues_found.append(f"JSON parsing error: {str(e)}")
+        
+        return issues_found
+    
+    def _emit_length_options(self, row, issues_found) -> List[ValidationIssue]:
+        # Report all issues found for this specification
+        return [ValidationIssue(
+            category="Data Field Formatting",
+            severity="critical",  # These break calculator logic
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="length_options",
+            issue=issue_desc,
+            current_value=row['length_options'],
+            suggested_fix="Fix formatting to valid JSON array or clean string format",
+            sql_fix=self._generate_length_options_sql_fix(row['spec_id'], row['length_options'], issue_desc)
+        ) for issue_desc in issues_found]
+    
+    def _check_outer_diameter(self, diameter) -> bool:
+        return diameter is not None and not self._is_valid_diameter_numeric(diameter)
+    
+    def _emit_outer_diameter(self, row, verdict) -> List[ValidationIssue]:
+        diameter = row['outer_diameter']
+        return [ValidationIssue(
+            category="Data Field Formatting",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="outer_diameter",
+            issue=f"Invalid outer diameter value: '{diameter}'",
+            current_value=diameter,
+            suggested_fix="Should be numeric value: 0.15-0.7 inches or 4.0-18.0 mm",
+            sql_fix=f"-- UPDATE spine_specifications SET outer_diameter = corrected_value WHERE id = {row['spec_id']};"
+        )]
+    
+    def _check_gpi_weight(self, weight) -> bool:
+        return weight is not None and not self._is_valid_weight_numeric(weight)
+    
+    def _emit_gpi_weight(self, row, verdict) -> List[ValidationIssue]:
+        weight = row['gpi_weight']
+        return [ValidationIssue(
+            category="Data Field Formatting",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="gpi_weight",
+            issue=f"Invalid gpi weight value: '{weight}'",
+            current_value=weight,
+            suggested_fix="Should be numeric value between 1.0-50.0 gpi",
+            sql_fix=f"-- UPDATE spine_specifications SET gpi_weight = corrected_value WHERE id = {row['spec_id']};"
+        )]
+    
+    def _check_length_options_json(self, length_options) -> bool:
+        if not length_options:
+            return False
+        try:
+            json.loads(length_options)
+        except (json.JSONDecodeError, TypeError):
+            return True
+        return False
+    
+    def _emit_length_options_json(self, row, verdict) -> List[ValidationIssue]:
+        return [ValidationIssue(
+            category="Calculator Compatibility",
+            severity="warning",
+            arrow_id=row['arrow_id'],
+            manufacturer=row['manufacturer'] or 'Unknown',
+            model_name=row['model_name'] or 'Unknown',
+            field="length_options",
+            issue="Invalid JSON format in length_options",
+            current_value=row['length_options'],
+            suggested_fix="Fix JSON formatting or set to NULL",
+            sql_fix=f"UPDATE spine_specifications SET length_options = NULL WHERE id = {row['spec_id']};"
+        )]
     
     def _validate_search_visibility(self):
         """Validate that arrows appear in search results - Critical for arrow 2508 type issues"""
@@ -248,12 +877,18 @@ class ArrowDataValidator:
             sample_arrows = cursor.fetchall()
             
             search_failures = 0
+            # The searches do not depend on the sampled arrow, so each runs at most once per pass
+            search_results = None
+            unlimited_ids = None
+            manufacturer_ids = {}
             for arrow in sample_arrows:
                 # Test if arrow appears in basic search
                 try:
                     # Use the database's search method directly
-                    search_results = self.db.search_arrows(limit=1000)  # Get many results
-                    arrow_found = any(result['id'] == arrow['id'] for result in search_results)
+                    if search_results is None:
+                        search_results = self.db.search_arrows(limit=1000)  # Get many results
+                        search_ids = {result['id'] for result in search_results}
+                    arrow_found = arrow['id'] in search_ids
                     
                     # If no results at all, this indicates database path/connection issues
                     if len(search_results) == 0:
@@ -276,8 +911,10 @@ class ArrowDataValidator:
                         search_failures += 1
                         
                         # Check if arrow appears in unlimited search (test if it's a limit issue)
-                        unlimited_results = self.db.search_arrows(limit=10000, include_inactive=True)
-                        arrow_in_unlimited = any(result['id'] == arrow['id'] for result in unlimited_results)
+                        if unlimited_ids is None:
+                            unlimited_ids = {result['id'] for result in
+                                             self.db.search_arrows(limit=10000, include_inactive=True)}
+                        arrow_in_unlimited = arrow['id'] in unlimited_ids
                         
                         if arrow_in_unlimited:
                             # Arrow exists but is beyond normal search limits due to ordering
@@ -351,8 +988,11 @@ class ArrowDataValidator:
                         
                         # Also test specific manufacturer search
                         if arrow['manufacturer']:
-                            mfr_results = self.db.search_arrows(manufacturer=arrow['manufacturer'], limit=1000)
-                            mfr_found = any(result['id'] == arrow['id'] for result in mfr_results)
+                            if arrow['manufacturer'] not in manufacturer_ids:
+                                manufacturer_ids[arrow['manufacturer']] = {
+                                    result['id'] for result in
+                                    self.db.search_arrows(manufacturer=arrow['manufacturer'], limit=1000)}
+                            mfr_found = arrow['id'] in manufacturer_ids[arrow['manufacturer']]
                             if not mfr_found:
                                 # Check manufacturer status for specific search issues
                                 if has_manufacturers_table:
@@ -404,8 +1044,8 @@ class ArrowDataValidator:
             else:
                 print("✅ All sampled arrows are search-visible")
     
-    def _validate_database_integrity(self):
-        """Validate database JOIN integrity and architecture consistency"""
+    def _check_manufacturers_table(self):
+        """Validate database architecture consistency"""
         print("🔍 Validating database integrity and architecture...")
         
         with self.db.get_connection() as conn:
@@ -429,15 +1069,21 @@ class ArrowDataValidator:
                     suggested_fix="Create manufacturers table or use ArrowDatabase consistently",
                     sql_fix="CREATE TABLE manufacturers (id INTEGER PRIMARY KEY, name TEXT UNIQUE, is_active BOOLEAN DEFAULT TRUE);"
                 ))
+    
+    def _check_orphaned_specs(self):
+        """Spine specifications whose arrow no longer exists"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
             
             # Check for orphaned spine specifications
-            cursor.execute('''
+            scope_sql, scope_params = self._scope('ss.arrow_id')
+            cursor.execute(f'''
                 SELECT ss.id, ss.arrow_id 
                 FROM spine_specifications ss 
                 LEFT JOIN arrows a ON ss.arrow_id = a.id 
-                WHERE a.id IS NULL
+                WHERE a.id IS NULL{scope_sql}
                 LIMIT 10
-            ''')
+            ''', scope_params)
             orphaned_specs = cursor.fetchall()
             
             for spec in orphaned_specs:
@@ -453,224 +1099,40 @@ class ArrowDataValidator:
                     suggested_fix="Remove orphaned spine specification",
                     sql_fix=f"DELETE FROM spine_specifications WHERE id = {spec['id']};"
                 ))
+    
+    def _check_search_performance(self):
+        """Database search performance (system-level, full runs only)"""
+        try:
+            start_time = time.time()
+            test_results = self.db.search_arrows(limit=100)
+            search_time = (time.time() - start_time) * 1000  # milliseconds
             
-            # Check for arrows without spine specifications
-            cursor.execute('''
-                SELECT a.id, a.manufacturer, a.model_name 
-                FROM arrows a 
-                LEFT JOIN spine_specifications ss ON a.id = ss.arrow_id 
-                WHERE ss.id IS NULL
-                LIMIT 10
-            ''')
-            arrows_without_spines = cursor.fetchall()
-            
-            for arrow in arrows_without_spines:
+            if search_time > 1000:  # More than 1 second is concerning
                 self.validation_issues.append(ValidationIssue(
                     category="Database Integrity",
                     severity="warning",
-                    arrow_id=arrow['id'],
-                    manufacturer=arrow['manufacturer'] or 'Unknown',
-                    model_name=arrow['model_name'] or 'Unknown',
-                    field="spine_specifications",
-                    issue="Arrow has no spine specifications",
-                    current_value="No spine data",
-                    suggested_fix="Add spine specifications or remove arrow",
-                    sql_fix=f"DELETE FROM arrows WHERE id = {arrow['id']}; -- Remove arrow without spine data"
-                ))
-            
-            # Test actual database search performance
-            try:
-                import time
-                start_time = time.time()
-                test_results = self.db.search_arrows(limit=100)
-                search_time = (time.time() - start_time) * 1000  # milliseconds
-                
-                if search_time > 1000:  # More than 1 second is concerning
-                    self.validation_issues.append(ValidationIssue(
-                        category="Database Integrity",
-                        severity="warning",
-                        arrow_id=0,
-                        manufacturer="SYSTEM",
-                        model_name="PERFORMANCE",
-                        field="search_performance",
-                        issue=f"Slow search performance: {search_time:.0f}ms",
-                        current_value=f"{search_time:.0f}ms",
-                        suggested_fix="Optimize database indexes or query structure",
-                        sql_fix="CREATE INDEX IF NOT EXISTS idx_arrows_search ON arrows(manufacturer, material, arrow_type);"
-                    ))
-            except Exception as e:
-                self.validation_issues.append(ValidationIssue(
-                    category="Database Integrity",
-                    severity="critical",
                     arrow_id=0,
                     manufacturer="SYSTEM",
-                    model_name="SEARCH_ENGINE",
-                    field="search_method",
-                    issue=f"Database search method completely failed: {str(e)}",
-                    current_value="Search broken",
-                    suggested_fix="Fix database architecture or search implementation",
-                    sql_fix=None
-                ))
-    
-    def _validate_material_standardization(self):
-        """Validate and suggest material standardization"""
-        print("🔍 Validating material standardization...")
-        
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get all unique materials
-            cursor.execute('SELECT DISTINCT material, COUNT(*) as count FROM arrows GROUP BY material ORDER BY count DESC')
-            materials = cursor.fetchall()
-            
-            for material_row in materials:
-                material = material_row['material']
-                count = material_row['count']
-                
-                if not material or material.strip() == '':
-                    # Missing material
-                    cursor.execute('SELECT id, manufacturer, model_name FROM arrows WHERE material IS NULL OR material = "" OR trim(material) = ""')
-                    for row in cursor.fetchall():
-                        self.validation_issues.append(ValidationIssue(
-                            category="Material Standardization",
-                            severity="warning",
-                            arrow_id=row['id'],
-                            manufacturer=row['manufacturer'] or 'Unknown',
-                            model_name=row['model_name'] or 'Unknown',
-                            field="material",
-                            issue="Missing material specification",
-                            current_value=material,
-                            suggested_fix="Set to 'Carbon' (most common default)",
-                            sql_fix=f"UPDATE arrows SET material = 'Carbon' WHERE id = {row['id']};"
-                        ))
-                elif material not in self.standard_materials:
-                    # Non-standard material that needs mapping
-                    suggested_material = self._suggest_material_mapping(material)
-                    if suggested_material != material:
-                        cursor.execute('SELECT id, manufacturer, model_name FROM arrows WHERE material = ?', (material,))
-                        for row in cursor.fetchall():
-                            self.validation_issues.append(ValidationIssue(
-                                category="Material Standardization",
-                                severity="warning",
-                                arrow_id=row['id'],
-                                manufacturer=row['manufacturer'] or 'Unknown',
-                                model_name=row['model_name'] or 'Unknown',
-                                field="material",
-                                issue=f"Non-standard material: '{material}'",
-                                current_value=material,
-                                suggested_fix=f"Map to standard material: '{suggested_material}'",
-                                sql_fix=f"UPDATE arrows SET material = '{suggested_material}' WHERE material = '{material}';"
-                            ))
-    
-    def _validate_spine_data_quality(self):
-        """Validate spine data quality and ranges"""
-        print("🔍 Validating spine data quality...")
-        
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Check for invalid spine values
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.spine, a.material
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE ss.spine IS NULL OR ss.spine = '' OR ss.spine = 0
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Spine Data Quality",
-                    severity="critical",
-                    arrow_id=row['arrow_id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'Unknown',
-                    field="spine",
-                    issue="Invalid or missing spine value",
-                    current_value=row['spine'],
-                    suggested_fix="Remove invalid spine specification",
-                    sql_fix=f"DELETE FROM spine_specifications WHERE id = {row['id']};"
-                ))
-            
-            # Check for unrealistic spine ranges
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.spine, a.material
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE 
-                    (a.material = 'Wood' AND (ss.spine < 25 OR ss.spine > 100)) OR
-                    (a.material = 'Carbon' AND (ss.spine < 150 OR ss.spine > 2000)) OR
-                    (a.material = 'Aluminum' AND (ss.spine < 150 OR ss.spine > 3000))
-            ''')
-            for row in cursor.fetchall():
-                material = row['material'] or 'Unknown'
-                if material == 'Wood':
-                    spine_range = "25-100 lbs"
-                elif material == 'Carbon':
-                    spine_range = "150-2000"
-                elif material == 'Aluminum':
-                    spine_range = "150-3000"
-                else:
-                    spine_range = "150-2000 (default)"
-                self.validation_issues.append(ValidationIssue(
-                    category="Spine Data Quality",
-                    severity="warning",
-                    arrow_id=row['arrow_id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'Unknown',
-                    field="spine",
-                    issue=f"Spine value {row['spine']} outside realistic range for {material} arrows ({spine_range})",
-                    current_value=row['spine'],
-                    suggested_fix=f"Verify spine value is correct for {material} material",
-                    sql_fix=f"-- Manual review required for spine_specifications.id = {row['id']}"
-                ))
-    
-    def _validate_manufacturer_integration(self):
-        """Validate manufacturer integration and active status"""
-        print("🔍 Validating manufacturer integration...")
-        
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Check arrows referencing non-existent manufacturers
-            cursor.execute('''
-                SELECT a.id, a.manufacturer, a.model_name
-                FROM arrows a
-                LEFT JOIN manufacturers m ON a.manufacturer = m.name
-                WHERE m.name IS NULL
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Manufacturer Integration",
-                    severity="critical",
-                    arrow_id=row['id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'Unknown',
-                    field="manufacturer",
-                    issue="References non-existent manufacturer",
-                    current_value=row['manufacturer'],
-                    suggested_fix="Create manufacturer entry or update manufacturer name",
-                    sql_fix=f"INSERT INTO manufacturers (name, is_active) VALUES ('{row['manufacturer']}', 1);"
-                ))
-            
-            # Check arrows from inactive manufacturers (for info)
-            cursor.execute('''
-                SELECT a.id, a.manufacturer, a.model_name, m.is_active
-                FROM arrows a
-                JOIN manufacturers m ON a.manufacturer = m.name
-                WHERE m.is_active = 0
-            ''')
-            for row in cursor.fetchall():
-                self.validation_issues.append(ValidationIssue(
-                    category="Manufacturer Integration",
-                    severity="info",
-                    arrow_id=row['id'],
-                    manufacturer=row['manufacturer'] or 'Unknown',
-                    model_name=row['model_name'] or 'Unknown',
-                    field="manufacturer_active_status",
-                    issue="Arrow from inactive manufacturer (hidden from calculator)",
-                    current_value="inactive",
-                    suggested_fix="Reactivate manufacturer or migrate arrows",
-                    sql_fix=f"UPDATE manufacturers SET is_active = 1 WHERE name = '{row['manufacturer']}';"
+                    model_name="PERFORMANCE",
+                    field="search_performance",
+                    issue=f"Slow search performance: {search_time:.0f}ms",
+                    current_value=f"{search_time:.0f}ms",
+                    suggested_fix="Optimize database indexes or query structure",
+                    sql_fix="CREATE INDEX IF NOT EXISTS idx_arrows_search ON arrows(manufacturer, material, arrow_type);"
                 ))
+        except Exception as e:
+            self.validation_issues.append(ValidationIssue(
+                category="Database Integrity",
+                severity="critical",
+                arrow_id=0,
+                manufacturer="SYSTEM",
+                model_name="SEARCH_ENGINE",
+                field="search_method",
+                issue=f"Database search method completely failed: {str(e)}",
+                current_value="Search broken",
+                suggested_fix="Fix database architecture or search implementation",
+                sql_fix=None
+            ))
     
     def _validate_duplicate_detection(self):
         """Detect duplicate arrow entries and spine specifications, excluding user-marked false positives"""
@@ -693,19 +1155,23 @@ class ArrowDataValidator:
                 )
             ''')
             
+            # Incremental runs look at every arrow of the changed manufacturers; the capped
+            # identical-specifications check (4) only runs in full validation
+            scope_sql, scope_params = self._scope('id', duplicates=True)
+            
             # 1. Detect duplicate arrows (same manufacturer + model_name), excluding marked false positives
-            cursor.execute('''
+            cursor.execute(f'''
                 SELECT manufacturer, model_name, COUNT(*) as count, GROUP_CONCAT(id) as arrow_ids
                 FROM arrows 
                 WHERE manufacturer IS NOT NULL AND model_name IS NOT NULL
                   AND id NOT IN (
                       SELECT arrow_id FROM duplicate_exclusions 
                       WHERE field = 'duplicate_arrow'
-                  )
+                  ){scope_sql}
                 GROUP BY LOWER(TRIM(manufacturer)), LOWER(TRIM(model_name))
                 HAVING COUNT(*) > 1
                 ORDER BY count DESC
-            ''')
+            ''', scope_params)
             
             for row in cursor.fetchall():
                 arrow_ids = row['arrow_ids'].split(',')
@@ -725,7 +1191,8 @@ class ArrowDataValidator:
                     ))
             
             # 2. Detect duplicate spine specifications for same arrow, excluding marked false positives
-            cursor.execute('''
+            scope_sql, scope_params = self._scope('ss.arrow_id', duplicates=True)
+            cursor.execute(f'''
                 SELECT ss.arrow_id, a.manufacturer, a.model_name, ss.spine, COUNT(*) as count, 
                        GROUP_CONCAT(ss.id) as spine_ids
                 FROM spine_specifications ss
@@ -733,11 +1200,11 @@ class ArrowDataValidator:
                 WHERE ss.arrow_id NOT IN (
                     SELECT arrow_id FROM duplicate_exclusions 
                     WHERE field = 'duplicate_spine_spec'
-                )
+                ){scope_sql}
                 GROUP BY ss.arrow_id, ss.spine
                 HAVING COUNT(*) > 1
                 ORDER BY count DESC
-            ''')
+            ''', scope_params)
             
             for row in cursor.fetchall():
                 spine_ids = row['spine_ids'].split(',')
@@ -756,44 +1223,44 @@ class ArrowDataValidator:
                         sql_fix=f"DELETE FROM spine_specifications WHERE id = {spine_id};"
                     ))
             
-            # 3. Detect near-duplicate arrows (similar names, fuzzy matching), excluding marked false positives
-            cursor.execute('''
-                SELECT a1.id as id1, a1.manufacturer as man1, a1.model_name as model1,
-                       a2.id as id2, a2.manufacturer as man2, a2.model_name as model2
-                FROM arrows a1
-                JOIN arrows a2 ON a1.id < a2.id
-                WHERE LOWER(TRIM(a1.manufacturer)) = LOWER(TRIM(a2.manufacturer))
-                  AND (
-                    -- Very similar model names (minor differences)
-                    LOWER(REPLACE(REPLACE(a1.model_name, ' ', ''), '-', '')) = 
-                    LOWER(REPLACE(REPLACE(a2.model_name, ' ', ''), '-', ''))
-                    OR
-                    -- One model name contains the other
-                    (LENGTH(a1.model_name) > 3 AND LENGTH(a2.model_name) > 3 AND
-                     (LOWER(a1.model_name) LIKE '%' || LOWER(a2.model_name) || '%' OR
-                      LOWER(a2.model_name) LIKE '%' || LOWER(a1.model_name) || '%'))
-                  )
-                  -- Exclude pairs marked as not duplicates
-                  AND a2.id NOT IN (
-                      SELECT arrow_id FROM duplicate_exclusions 
-                      WHERE field = 'near_duplicate'
-                  )
-                LIMIT 50
-            ''')
+            # 3. Detect near-duplicate arrows (MinHash/LSH candidates within each manufacturer,
+            #    verified by normalized name similarity), excluding marked false positives
+            scope_sql, scope_params = self._scope('id', duplicates=True)
+            cursor.execute(f'''
+                SELECT id, manufacturer, model_name
+                FROM arrows
+                WHERE manufacturer IS NOT NULL AND model_name IS NOT NULL{scope_sql}
+                ORDER BY id
+            ''', scope_params)
+            arrows = cursor.fetchall()
             
-            for row in cursor.fetchall():
+            cursor.execute("SELECT arrow_id FROM duplicate_exclusions WHERE field = 'near_duplicate'")
+            excluded_ids = {row['arrow_id'] for row in cursor.fetchall()}
+            
+            detector = NearDuplicateDetector()
+            for i, j, _ in detector.similar_pairs(arrows):
+                first, second = arrows[i], arrows[j]
+                # Same name after trimming/lower-casing is already reported as duplicate_arrow
+                if second['id'] in excluded_ids or \
+                        first['model_name'].strip().lower() == second['model_name'].strip().lower():
+                    continue
                 self.validation_issues.append(ValidationIssue(
                     category="Duplicate Detection",
                     severity="info",
-                    arrow_id=row['id2'],
-                    manufacturer=row['man2'],
-                    model_name=row['model2'],
+                    arrow_id=second['id'],
+                    manufacturer=second['manufacturer'],
+                    model_name=second['model_name'],
                     field="near_duplicate",
-                    issue=f"Potential duplicate of Arrow ID {row['id1']} ({row['model1']})",
-                    current_value=f"Similar to: {row['model1']}",
+                    issue=f"Potential duplicate of Arrow ID {first['id']} ({first['model_name']})",
+                    current_value=f"Similar to: {first['model_name']}",
                     suggested_fix="Review and merge if truly duplicate",
-                    sql_fix=f"-- Potential duplicate: Compare Arrow {row['id1']} vs {row['id2']}"
+                    sql_fix=f"-- Potential duplicate: Compare Arrow {first['id']} vs {second['id']}"
                 ))
+            print(f"   Near-duplicates: {detector.stats['verified_pairs']} similar pairs from "
+                  f"{detector.stats['candidate_pairs']} candidates ({detector.stats['arrows']} arrows)")
+            
+            if self._scope_ids is not None:
+                return
             
             # 4. Detect arrows with identical specifications but different IDs
             cursor.execute('''
@@ -826,124 +1293,6 @@ class ArrowDataValidator:
                     sql_fix=f"-- Review: Arrow {row['arrow1']} vs {row['arrow2']} have identical specs"
                 ))
     
-    def _validate_data_field_formatting(self):
-        """Validate data field formatting that could break calculator logic"""
-        print("🔍 Validating data field formatting...")
-        
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Validate length_options formatting in spine_specifications
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.length_options
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE ss.length_options IS NOT NULL AND ss.length_options != ''
-            ''')
-            
-            for row in cursor.fetchall():
-                length_options = row['length_options']
-                arrow_id = row['arrow_id']
-                manufacturer = row['manufacturer'] or 'Unknown'
-                model_name = row['model_name'] or 'Unknown'
-                
-                # Check for malformed length values
-                issues_found = []
-                
-                try:
-                    # Try to parse as JSON first
-                    if length_options.startswith('[') or length_options.startswith('{'):
-                        parsed = json.loads(length_options)
-                        if isinstance(parsed, list):
-                            for i, length in enumerate(parsed):
-                                if isinstance(length, str):
-                                    # Check for European decimal notation like "33,5" or "29,13"
-                                    if self._has_european_decimal_comma(length):
-                                        issues_found.append(f"European decimal comma notation at index {i}: '{length}' (should use period: '{length.replace(',', '.')}')")
-                                    # Check for problematic patterns like "31, 5" within a single string element  
-                                    elif ',' in length and not self._is_valid_single_length_with_comma(length):
-                                        issues_found.append(f"Malformed length value at index {i}: '{length}' (contains problematic comma)")
-                                    elif not self._is_valid_length_format(length):
-                                        issues_found.append(f"Invalid length format at index {i}: '{length}'")
-                                elif isinstance(length, (int, float)):
-                                    # Numeric values should be reasonable (6-36 inches typically)
-                                    if length < 6 or length > 36:
-                                        issues_found.append(f"Unrealistic length value: {length}")
-                    else:
-                        # Handle non-JSON formats - check for "31, 5" type patterns
-                        if self._has_problematic_comma_pattern(length_options):
-                            issues_found.append(f"Problematic comma pattern detected: '{length_options}'")
-                        elif ',' in length_options and not self._is_valid_comma_separated_lengths(length_options):
-                            issues_found.append(f"Malformed comma-separated values: '{length_options}'")
-                        elif not self._is_valid_length_format(length_options):
-                            issues_found.append(f"Invalid length format: '{length_options}'")
-                            
-                except (json.JSONDecodeError, ValueError) as e:
-                    issues_found.append(f"JSON parsing error: {str(e)}")
-                
-                # Report all issues found for this arrow
-                for issue_desc in issues_found:
-                    self.validation_issues.append(ValidationIssue(
-                        category="Data Field Formatting",
-                        severity="critical",  # These break calculator logic
-                        arrow_id=arrow_id,
-                        manufacturer=manufacturer,
-                        model_name=model_name,
-                        field="length_options",
-                        issue=issue_desc,
-                        current_value=length_options,
-                        suggested_fix="Fix formatting to valid JSON array or clean string format",
-                        sql_fix=self._generate_length_options_sql_fix(row['id'], length_options, issue_desc)
-                    ))
-            
-            # Validate diameter formatting in spine_specifications table
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.outer_diameter
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE ss.outer_diameter IS NOT NULL
-            ''')
-            
-            for row in cursor.fetchall():
-                diameter = row['outer_diameter']
-                if not self._is_valid_diameter_numeric(diameter):
-                    self.validation_issues.append(ValidationIssue(
-                        category="Data Field Formatting",
-                        severity="warning",
-                        arrow_id=row['arrow_id'],
-                        manufacturer=row['manufacturer'] or 'Unknown',
-                        model_name=row['model_name'] or 'Unknown',
-                        field="outer_diameter",
-                        issue=f"Invalid outer diameter value: '{diameter}'",
-                        current_value=diameter,
-                        suggested_fix="Should be numeric value: 0.15-0.7 inches or 4.0-18.0 mm",
-                        sql_fix=f"-- UPDATE spine_specifications SET outer_diameter = corrected_value WHERE id = {row['id']};"
-                    ))
-            
-            # Validate weight formatting in spine_specifications table
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.gpi_weight
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE ss.gpi_weight IS NOT NULL
-            ''')
-            
-            for row in cursor.fetchall():
-                weight = row['gpi_weight']
-                if not self._is_valid_weight_numeric(weight):
-                    self.validation_issues.append(ValidationIssue(
-                        category="Data Field Formatting",
-                        severity="warning",
-                        arrow_id=row['arrow_id'],
-                        manufacturer=row['manufacturer'] or 'Unknown',
-                        model_name=row['model_name'] or 'Unknown',
-                        field="gpi_weight",
-                        issue=f"Invalid gpi weight value: '{weight}'",
-                        current_value=weight,
-                        suggested_fix="Should be numeric value between 1.0-50.0 gpi",
-                        sql_fix=f"-- UPDATE spine_specifications SET gpi_weight = corrected_value WHERE id = {row['id']};"
-                    ))
-    
     def _is_valid_length_format(self, length_str: str) -> bool:
         """Check if length string is in valid format"""
         if not length_str:
@@ -1105,64 +1454,6 @@ class ArrowDataValidator:
         except (ValueError, TypeError):
             return False
     
-    def _validate_calculator_compatibility(self):
-        """Test compatibility with calculator filtering logic"""
-        print("🔍 Validating calculator compatibility...")
-        
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Test material filtering compatibility
-            cursor.execute('SELECT DISTINCT material FROM arrows WHERE material IS NOT NULL')
-            db_materials = [row['material'] for row in cursor.fetchall()]
-            
-            # Check if materials can be properly mapped for frontend
-            frontend_materials = {'carbon', 'aluminum', 'carbon-aluminum', 'wood', 'fiberglass'}
-            
-            for db_material in db_materials:
-                if db_material and db_material.lower() not in [m.lower() for m in self.standard_materials]:
-                    # Find arrows with problematic materials
-                    cursor.execute('SELECT id, manufacturer, model_name FROM arrows WHERE material = ?', (db_material,))
-                    for row in cursor.fetchall():
-                        suggested = self._suggest_material_mapping(db_material)
-                        self.validation_issues.append(ValidationIssue(
-                            category="Calculator Compatibility",
-                            severity="warning",
-                            arrow_id=row['id'],
-                            manufacturer=row['manufacturer'] or 'Unknown',
-                            model_name=row['model_name'] or 'Unknown',
-                            field="material",
-                            issue=f"Material '{db_material}' not in standard frontend categories",
-                            current_value=db_material,
-                            suggested_fix=f"Map to standard material: '{suggested}'",
-                            sql_fix=f"UPDATE arrows SET material = '{suggested}' WHERE material = '{db_material}';"
-                        ))
-            
-            # Check JSON field formatting in spine_specifications
-            cursor.execute('''
-                SELECT ss.id, ss.arrow_id, a.manufacturer, a.model_name, ss.length_options
-                FROM spine_specifications ss
-                JOIN arrows a ON ss.arrow_id = a.id
-                WHERE ss.length_options IS NOT NULL AND ss.length_options != ''
-            ''')
-            for row in cursor.fetchall():
-                try:
-                    if row['length_options']:
-                        json.loads(row['length_options'])
-                except (json.JSONDecodeError, TypeError):
-                    self.validation_issues.append(ValidationIssue(
-                        category="Calculator Compatibility",
-                        severity="warning",
-                        arrow_id=row['arrow_id'],
-                        manufacturer=row['manufacturer'] or 'Unknown',
-                        model_name=row['model_name'] or 'Unknown',
-                        field="length_options",
-                        issue="Invalid JSON format in length_options",
-                        current_value=row['length_options'],
-                        suggested_fix="Fix JSON formatting or set to NULL",
-                        sql_fix=f"UPDATE spine_specifications SET length_options = NULL WHERE id = {row['id']};"
-                    ))
-    
     def _suggest_material_mapping(self, material: str) -> str:
         """Suggest standard material mapping"""
         if not material:
@@ -1304,13 +1595,28 @@ class ArrowDataValidator:
             'estimated_calculator_accuracy': max(0, 100 - (hidden_arrows * 2))  # Rough estimate
         }
     
-    def merge_all_duplicates(self) -> Dict[str, Any]:
-        """Merge all duplicate arrows while preserving spine specifications"""
+    def merge_all_duplicates(self, include_near_duplicates: bool = False, block_on_spine: bool = True,
+                             reviewed_groups: Optional[List[List[int]]] = None) -> Dict[str, Any]:
+        """
+        Merge all duplicate arrows while preserving spine specifications
+        
+        Near-duplicates are never merged automatically: similar names are often different
+        products (Superdrive 23/25/27, Velocity and Velocity XT). They are only reported, and
+        an admin merges the groups they confirmed by passing their IDs as reviewed_groups.
+        
+        Args:
+            include_near_duplicates: Also report near-duplicate groups (similar normalized model
+                names, see duplicate_detection.py) left after the exact groups
+            block_on_spine: Reported near-duplicates must share at least one spine value
+            reviewed_groups: Admin-reviewed lists of arrow IDs to merge (same manufacturer);
+                the lowest ID is kept
+        """
         print("🔄 Starting merge all duplicates operation...")
         
         merged_count = 0
         errors = []
         merge_operations = []
+        near_duplicate_groups = []
         
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
@@ -1325,67 +1631,58 @@ class ArrowDataValidator:
                 ORDER BY count DESC
             ''')
             
-            duplicate_groups = cursor.fetchall()
+            duplicate_groups = [(group['manufacturer'], group['model_name'],
+                                 [int(id_str) for id_str in group['arrow_ids'].split(',')])
+                                for group in cursor.fetchall()]
             
-            for group in duplicate_groups:
-                try:
-                    arrow_ids = [int(id_str) for id_str in group['arrow_ids'].split(',')]
-                    primary_arrow_id = arrow_ids[0]  # Keep the first arrow as primary
-                    duplicate_ids = arrow_ids[1:]    # Merge others into primary
-                    
-                    print(f"🔄 Merging {group['manufacturer']} {group['model_name']}: keeping ID {primary_arrow_id}, merging {duplicate_ids}")
-                    
-                    # Move all spine specifications from duplicates to primary arrow
-                    for dup_id in duplicate_ids:
-                        # Check if moving spine specs would create duplicates
-                        cursor.execute('''
-                            SELECT spine FROM spine_specifications 
-                            WHERE arrow_id = ? AND spine IN (
-                                SELECT spine FROM spine_specifications WHERE arrow_id = ?
-                            )
-                        ''', (dup_id, primary_arrow_id))
-                        
-                        conflicting_spines = cursor.fetchall()
-                        
-                        if conflicting_spines:
-                            # Delete conflicting spine specs from duplicate arrow
-                            conflicting_spine_values = [str(row['spine']) for row in conflicting_spines]
-                            spine_list = "','".join(conflicting_spine_values)
-                            cursor.execute(f'''
-                                DELETE FROM spine_specifications 
-                                WHERE arrow_id = {dup_id} AND spine IN ('{spine_list}')
-                            ''')
-                            print(f"  ⚠️  Removed {len(conflicting_spines)} conflicting spine specs from duplicate")
-                        
-                        # Move remaining spine specifications to primary arrow
-                        cursor.execute('''
-                            UPDATE spine_specifications 
-                            SET arrow_id = ? 
-                            WHERE arrow_id = ?
-                        ''', (primary_arrow_id, dup_id))
-                        
-                        moved_specs = cursor.rowcount
-                        if moved_specs > 0:
-                            print(f"  ✅ Moved {moved_specs} spine specifications to primary arrow")
-                    
-                    # Delete duplicate arrow entries
-                    for dup_id in duplicate_ids:
-                        cursor.execute('DELETE FROM arrows WHERE id = ?', (dup_id,))
-                    
-                    merge_operations.append({
-                        'manufacturer': group['manufacturer'],
-                        'model_name': group['model_name'],
-                        'primary_arrow_id': primary_arrow_id,
-                        'merged_arrow_ids': duplicate_ids,
-                        'duplicate_count': len(duplicate_ids)
+            groups_processed = len(duplicate_groups)
+            for manufacturer, model_name, arrow_ids in duplicate_groups:
+                if self._merge_arrow_group(cursor, manufacturer, model_name, arrow_ids, merge_operations, errors):
+                    merged_count += len(arrow_ids) - 1
+            
+            for group_ids in reviewed_groups or []:
+                arrow_ids = sorted({int(arrow_id) for arrow_id in group_ids})
+                if len(arrow_ids) < 2:
+                    errors.append(f"Reviewed group {group_ids} needs at least two arrow IDs")
+                    continue
+                placeholders = ','.join('?' * len(arrow_ids))
+                cursor.execute(f'''
+                    SELECT id, manufacturer, model_name FROM arrows WHERE id IN ({placeholders}) ORDER BY id
+                ''', arrow_ids)
+                rows = cursor.fetchall()
+                if len(rows) != len(arrow_ids):
+                    missing = sorted(set(arrow_ids) - {row['id'] for row in rows})
+                    errors.append(f"Reviewed group {arrow_ids}: arrows {missing} not found")
+                    continue
+                if len({(row['manufacturer'] or '').strip().lower() for row in rows}) > 1:
+                    errors.append(f"Reviewed group {arrow_ids} spans several manufacturers")
+                    continue
+                if self._merge_arrow_group(cursor, rows[0]['manufacturer'], rows[0]['model_name'],
+                                           arrow_ids, merge_operations, errors, match_type='reviewed_near_duplicate'):
+                    merged_count += len(arrow_ids) - 1
+                groups_processed += 1
+            
+            if include_near_duplicates:
+                cursor.execute('''
+                    SELECT a.id, a.manufacturer, a.model_name, GROUP_CONCAT(ss.spine) as spines
+                    FROM arrows a
+                    LEFT JOIN spine_specifications ss ON ss.arrow_id = a.id
+                    WHERE a.manufacturer IS NOT NULL AND a.model_name IS NOT NULL
+                    GROUP BY a.id
+                    ORDER BY a.id
+                ''')
+                arrows = cursor.fetchall()
+                for group in NearDuplicateDetector(block_on_spine=block_on_spine).duplicate_groups(arrows):
+                    members = [arrows[index] for index, _ in group]
+                    near_duplicate_groups.append({
+                        'manufacturer': members[0]['manufacturer'],
+                        'arrow_ids': [arrow['id'] for arrow in members],
+                        'model_names': [arrow['model_name'] for arrow in members],
+                        'similarity_scores': [round(similarity, 3) for _, similarity in group],
+                        # Differing numbers or suffixes (23 vs 25, XT, XXL) usually mean different products
+                        'variant_mismatch': len({variant_tokens(arrow['model_name']) for arrow in members}) > 1
                     })
-                    
-                    merged_count += len(duplicate_ids)
-                    
-                except Exception as e:
-                    error_msg = f"Failed to merge {group['manufacturer']} {group['model_name']}: {str(e)}"
-                    errors.append(error_msg)
-                    print(f"❌ {error_msg}")
+                print(f"🔍 Found {len(near_duplicate_groups)} near-duplicate groups for review (not merged)")
             
             conn.commit()
         
@@ -1395,10 +1692,65 @@ class ArrowDataValidator:
             'success': True,
             'merged_count': merged_count,
             'merge_operations': merge_operations,
+            'near_duplicate_groups': near_duplicate_groups,
             'errors': errors,
-            'total_groups_processed': len(duplicate_groups)
+            'total_groups_processed': groups_processed
         }
     
+    def _merge_arrow_group(self, cursor, manufacturer: str, model_name: str, arrow_ids: List[int],
+                           merge_operations: List[Dict[str, Any]], errors: List[str],
+                           match_type: str = 'exact') -> bool:
+        """Merge arrow_ids[1:] into arrow_ids[0], moving non-conflicting spine specifications"""
+        try:
+            primary_arrow_id = arrow_ids[0]  # Keep the first arrow as primary
+            duplicate_ids = arrow_ids[1:]    # Merge others into primary
+            
+            print(f"🔄 Merging {manufacturer} {model_name}: keeping ID {primary_arrow_id}, merging {duplicate_ids}")
+            
+            # Move all spine specifications from duplicates to primary arrow
+            for dup_id in duplicate_ids:
+                # Delete spine specs that would duplicate one of the primary arrow's spines
+                cursor.execute('''
+                    DELETE FROM spine_specifications 
+                    WHERE arrow_id = ? AND spine IN (
+                        SELECT spine FROM spine_specifications WHERE arrow_id = ?
+                    )
+                ''', (dup_id, primary_arrow_id))
+                
+                if cursor.rowcount > 0:
+                    print(f"  ⚠️  Removed {cursor.rowcount} conflicting spine specs from duplicate")
+                
+                # Move remaining spine specifications to primary arrow
+                cursor.execute('''
+                    UPDATE spine_specifications 
+                    SET arrow_id = ? 
+                    WHERE arrow_id = ?
+                ''', (primary_arrow_id, dup_id))
+                
+                moved_specs = cursor.rowcount
+                if moved_specs > 0:
+                    print(f"  ✅ Moved {moved_specs} spine specifications to primary arrow")
+            
+            # Delete duplicate arrow entries
+            for dup_id in duplicate_ids:
+                cursor.execute('DELETE FROM arrows WHERE id = ?', (dup_id,))
+            
+            merge_operations.append({
+                'manufacturer': manufacturer,
+                'model_name': model_name,
+                'primary_arrow_id': primary_arrow_id,
+                'merged_arrow_ids': duplicate_ids,
+                'duplicate_count': len(duplicate_ids),
+                'match_type': match_type
+            })
+            return True
+            
+        except Exception as e:
+            error_msg = f"Failed to merge {manufacturer} {model_name}: {str(e)}"
+            errors.append(error_msg)
+            print(f"❌ {error_msg}")
+            return False
+    
     def get_sql_fix_script(self) -> str:
         """Generate comprehensive SQL script to fix all issues"""
         
@@ -1440,7 +1792,8 @@ class ArrowDataValidator:
         if not self.validation_issues:
             return "✅ No validation issues found - database is in excellent condition!"
         
-        report = self.validate_all_data()
+        # Summarize the run that just happened instead of validating again
+        report = self.last_report or self.validate_all_data()
         
         summary = f"""
 🔍 ARROW DATA VALIDATION REPORT
@@ -1487,12 +1840,25 @@ class ArrowDataValidator:
     # DATABASE PERSISTENCE METHODS
     # ========================================
     
-    def _start_validation_run(self, triggered_by: str = 'manual'):
+    def _start_validation_run(self, triggered_by: str = 'manual', run_mode: str = 'full'):
         """Start a new validation run record in database"""
         try:
             with self.db.get_connection() as conn:
+                # Changes after the captured sequence are left for the next run
+                try:
+                    ensure_arrow_change_tracking(conn)
+                except Exception as e:
+                    print(f"⚠️  Could not set up arrow change tracking: {e}")
+                
                 cursor = conn.cursor()
                 
+                try:
+                    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'catalog_change_log'")
+                    row = cursor.fetchone()
+                    self.change_seq = row[0] if row else 0
+                except sqlite3.Error:
+                    self.change_seq = None
+                
                 # Get current database version (from migration table if available)
                 try:
                     cursor.execute("SELECT version FROM schema_migrations ORDER BY version DESC LIMIT 1")
@@ -1503,22 +1869,25 @@ class ArrowDataValidator:
                 # Insert new validation run
                 cursor.execute("""
                     INSERT INTO validation_runs 
-                    (run_timestamp, triggered_by, validation_version, database_version)
-                    VALUES (datetime('now'), ?, '2.0', ?)
-                """, (triggered_by, db_version))
+                    (run_timestamp, triggered_by, validation_version, database_version, run_mode)
+                    VALUES (datetime('now'), ?, '2.0', ?, ?)
+                """, (triggered_by, db_version, run_mode))
                 
                 self.current_run_id = cursor.lastrowid
                 conn.commit()
-                print(f"📊 Started validation run #{self.current_run_id}")
+                print(f"📊 Started {run_mode} validation run #{self.current_run_id}")
                 
         except Exception as e:
             print(f"⚠️  Could not start validation run record: {e}")
             self.current_run_id = None
     
-    def _persist_validation_issues(self):
-        """Store validation issues in database with deduplication"""
-        if not self.current_run_id or not self.validation_issues:
-            return
+    def _persist_validation_issues(self) -> bool:
+        """
+        Merge this run's issues into validation_issues: upsert found issues, resolve the ones no longer found.
+        Returns False when nothing could be stored.
+        """
+        if not self.current_run_id:
+            return False
         
         try:
             with self.db.get_connection() as conn:
@@ -1527,19 +1896,22 @@ class ArrowDataValidator:
                 for issue in self.validation_issues:
                     # Check if this issue already exists (by hash)
                     cursor.execute("""
-                        SELECT id, occurrence_count FROM validation_issues 
-                        WHERE issue_hash = ? AND is_resolved = FALSE
+                        SELECT id FROM validation_issues 
+                        WHERE issue_hash = ?
                     """, (issue.issue_hash,))
                     
                     existing = cursor.fetchone()
                     
                     if existing:
-                        # Update existing issue
+                        # Update existing issue, reopening it if it had been resolved
                         cursor.execute("""
                             UPDATE validation_issues 
                             SET occurrence_count = occurrence_count + 1,
                                 last_seen = datetime('now'),
-                                run_id = ?
+                                run_id = ?,
+                                is_resolved = FALSE,
+                                resolved_at = NULL,
+                                resolved_by = NULL
                             WHERE id = ?
                         """, (self.current_run_id, existing[0]))
                     else:
@@ -1557,20 +1929,89 @@ class ArrowDataValidator:
                             issue.sql_fix, issue.auto_fixable
                         ))
                 
+                resolved = self._resolve_stale_issues(cursor)
+                
                 conn.commit()
-                print(f"💾 Persisted {len(self.validation_issues)} validation issues")
+                print(f"💾 Persisted {len(self.validation_issues)} validation issues, {resolved} no longer found")
+                return True
                 
         except Exception as e:
             print(f"⚠️  Could not persist validation issues: {e}")
+            return False
     
-    def _complete_validation_run(self, report: ValidationReport, total_arrows: int):
-        """Complete validation run record with final statistics"""
+    def _resolve_stale_issues(self, cursor) -> int:
+        """Mark open issues inside this run's scope that were not found again as resolved"""
+        found_hashes = {issue.issue_hash for issue in self.validation_issues}
+        
+        if self._scope_ids is None:
+            cursor.execute("SELECT id, issue_hash FROM validation_issues WHERE is_resolved = FALSE")
+        else:
+            # Issues of deleted arrows are resolved whatever check reported them
+            scope_ids = json.dumps(sorted(self._scope_ids))
+            cursor.execute(f"""
+                SELECT id, issue_hash FROM validation_issues
+                WHERE is_resolved = FALSE AND (
+                    (category = 'Duplicate Detection'
+                     AND field NOT IN ({','.join('?' * len(FULL_RUN_DUPLICATE_FIELDS))})
+                     AND arrow_id IN (SELECT value FROM json_each(?)))
+                    OR (category IN ({','.join('?' * len(INCREMENTAL_CATEGORIES))})
+                        AND arrow_id IN (SELECT value FROM json_each(?)))
+                    OR (arrow_id IN (SELECT value FROM json_each(?))
+                        AND arrow_id NOT IN (SELECT id FROM arrows))
+                )
+            """, (*FULL_RUN_DUPLICATE_FIELDS, json.dumps(sorted(self._duplicate_scope_ids)),
+                  *INCREMENTAL_CATEGORIES, scope_ids, scope_ids))
+        
+        stale = [(row[0],) for row in cursor.fetchall() if row[1] not in found_hashes]
+        cursor.executemany("""
+            UPDATE validation_issues
+            SET is_resolved = TRUE, resolved_at = datetime('now'), resolved_by = 'validation'
+            WHERE id = ?
+        """, stale)
+        return len(stale)
+    
+    def _load_unresolved_issues(self) -> List[ValidationIssue]:
+        """All open persisted issues as ValidationIssue objects"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT issue_hash, category, severity, arrow_id, manufacturer, model_name, field,
+                       issue_description, current_value, suggested_fix, sql_fix
+                FROM validation_issues
+                WHERE is_resolved = FALSE
+                ORDER BY id
+            """)
+            return [
+                ValidationIssue(
+                    category=row['category'],
+                    severity=row['severity'],
+                    arrow_id=row['arrow_id'],
+                    manufacturer=row['manufacturer'],
+                    model_name=row['model_name'],
+                    field=row['field'],
+                    issue=row['issue_description'],
+                    current_value=row['current_value'],
+                    suggested_fix=row['suggested_fix'],
+                    sql_fix=row['sql_fix'],
+                    issue_hash=row['issue_hash']
+                )
+                for row in cursor.fetchall()
+            ]
+    
+    def _complete_validation_run(self, report: ValidationReport, total_arrows: int, completed: bool = True):
+        """
+        Complete validation run record with final statistics. Only a completed run records its
+        change_seq (the next incremental baseline) and clears the change log up to it.
+        """
         if not self.current_run_id:
             return
         
         try:
             run_duration_ms = int((time.time() - self.validation_start_time) * 1000)
             health_score = self._calculate_health_score(report, total_arrows)
+            # Only a completed run becomes the baseline for the next incremental run
+            change_seq = self.change_seq if completed else None
+            arrows_revalidated = total_arrows if self._scope_ids is None else len(self._scope_ids)
             
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
@@ -1583,16 +2024,26 @@ class ArrowDataValidator:
                         info_issues = ?,
                         health_score = ?,
                         run_duration_ms = ?,
-                        total_arrows_checked = ?
+                        total_arrows_checked = ?,
+                        change_seq = ?,
+                        arrows_revalidated = ?
                     WHERE id = ?
                 """, (
                     report.total_issues, report.critical_issues, report.warning_issues,
                     report.info_issues, health_score, run_duration_ms, total_arrows,
-                    self.current_run_id
+                    change_seq, arrows_revalidated, self.current_run_id
                 ))
                 
+                # Changes up to the new baseline are no longer needed
+                if change_seq is not None:
+                    cursor.execute("DELETE FROM catalog_change_log WHERE change_seq <= ?", (change_seq,))
+                
                 conn.commit()
-                print(f"✅ Completed validation run #{self.current_run_id} (Health Score: {health_score:.1f}%)")
+                if completed:
+                    print(f"✅ Completed validation run #{self.current_run_id} (Health Score: {health_score:.1f}%)")
+                else:
+                    print(f"⚠️  Validation run #{self.current_run_id} recorded as incomplete; "
+                          f"its changes stay queued for the next run")
                 
         except Exception as e:
             print(f"⚠️  Could not complete validation run record: {e}")
@@ -1795,14 +2246,18 @@ if __name__ == "__main__":
     import sys
     
     # Allow specifying database path
-    db_path = sys.argv[1] if len(sys.argv) > 1 else None
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    db_path = args[0] if args else None
     
     print("🏹 Arrow Data Validation Engine")
     print("=" * 50)
     
     try:
         validator = ArrowDataValidator(db_path)
-        report = validator.validate_all_data()
+        if '--incremental' in sys.argv:
+            report = validator.validate_changed_data()
+        else:
+            report = validator.validate_all_data()
         
         # Print summary
         print(validator.get_validation_summary())
@@ -1810,7 +2265,7 @@ if __name__ == "__main__":
         # Offer to generate SQL fix script
         if report.total_issues > 0:
             print(f"\n💾 SQL Fix Script Available")
-            print(f"Run with --generate-sql to create fix script")
+            print(f"Run with --generate-sql to create fix script (--incremental revalidates only changed arrows)")
             
             if len(sys.argv) > 1 and '--generate-sql' in sys.argv:
                 sql_script = validator.get_sql_fix_script()
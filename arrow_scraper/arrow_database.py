@@ -12,6 +12,11 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import re
 import threading
+import itertools
+
+from json_stream import ArrowExportStream, JSONStreamError
+from user_cache import invalidate_user
+import perf_monitor
 try:
     from models import classify_diameter, DiameterCategory
 except ImportError:
@@ -188,8 +193,14 @@ class ArrowDatabase:
     
     def get_connection(self):
         """Get thread-local database connection"""
+        if getattr(self.local, 'conn', None) is not None:
+            try:
+                self.local.conn.total_changes
+            except sqlite3.ProgrammingError:
+                # Many API handlers close the connection they were handed; reopen it
+                self.local.conn = None
         if not hasattr(self.local, 'conn') or self.local.conn is None:
-            self.local.conn = sqlite3.connect(
+            self.local.conn = perf_monitor.connect(
                 self.db_path, 
                 check_same_thread=False,  # Allow connection sharing across threads
                 timeout=30.0  # 30 second timeout for database locks
@@ -352,18 +363,22 @@ class ArrowDatabase:
         
         for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # Stream arrows one at a time instead of loading the whole file
+                stream = ArrowExportStream(json_file, required_keys=('manufacturer', 'total_arrows'))
+                arrows = iter(stream)
+                first_arrow = next(arrows, None)
                 
                 # Skip files with no arrows or invalid structure
-                if not data.get('arrows'):
+                if first_arrow is None:
                     print(f"  ⏭️  Skipping {json_file.name}: No arrows found")
                     continue
                 
-                if data.get('total_arrows', 0) == 0:
+                if stream.header.get('total_arrows', 0) == 0:
+                    stream.close()
                     print(f"  ⏭️  Skipping {json_file.name}: Empty file")
                     continue
                 
+                data = dict(stream.header, arrows=itertools.chain([first_arrow], arrows))
                 arrows_added, specs_added = self._process_json_data(data)
                 total_arrows += arrows_added
                 total_specs += specs_added
@@ -373,7 +388,7 @@ class ArrowDatabase:
                 else:
                     print(f"  ⚠️  {json_file.name}: No valid arrows to import")
                 
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, JSONStreamError) as e:
                 print(f"  ❌ Invalid JSON in {json_file.name}: {e}")
                 continue
             except Exception as e:
@@ -916,6 +931,7 @@ class ArrowDatabase:
         cursor = conn.cursor()
         cursor.execute(f'UPDATE users SET {set_clause} WHERE id = ?', values)
         conn.commit()
+        invalidate_user(user_id)
         return cursor.rowcount > 0
     
     def set_admin_status(self, user_id: int, is_admin: bool = True) -> bool:
@@ -935,6 +951,7 @@ class ArrowDatabase:
             # Delete user (CASCADE will handle related data)
             cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
             conn.commit()
+            invalidate_user(user_id)
             
             return cursor.rowcount > 0
         except Exception as e:
@@ -12,7 +12,8 @@ import math
 # Import our custom modules
 from unified_database import UnifiedDatabase
 from spine_calculator import SpineCalculator, BowConfiguration, BowType
-from spine_service import spine_service
+from spine_service import get_spine_service
+from perf_monitor import timed
 
 class MatchCriteria(Enum):
     """Criteria for ranking arrow matches"""
@@ -92,6 +93,7 @@ class ArrowMatchingEngine:
             MatchCriteria.FOC_TARGET: 0.15          # FOC optimization
         }
     
+    @timed('matching.find_matching_arrows')
     def find_matching_arrows(self, request: MatchRequest) -> List[ArrowMatch]:
         """
         Find arrows that match the specified bow configuration and preferences
@@ -107,7 +109,7 @@ class ArrowMatchingEngine:
         print(f"   Material preference: {request.material_preference}")
         
         # Calculate required spine using unified service
-        spine_result = spine_service.calculate_spine(
+        spine_result = get_spine_service().calculate_spine(
             draw_weight=request.bow_config.draw_weight,
             arrow_length=request.arrow_length,
             point_weight=request.point_weight,
@@ -334,6 +336,7 @@ class ArrowMatchingEngine:
         
         return final_matches
     
+    @timed('matching.score_candidate')
     def _create_arrow_match(self, arrow_details: Dict[str, Any], optimal_spine: float, 
                           spine_range: Dict[str, float], request: MatchRequest) -> Optional[ArrowMatch]:
         """Create an ArrowMatch from database arrow details"""
@@ -699,6 +702,7 @@ class ArrowMatchingEngine:
         first_pref = preferred_manufacturers[0]
         return manufacturer_mapping.get(first_pref, first_pref)
     
+    @timed('matching.arrow_details')
     def _get_arrow_details_with_spine_specs(self, arrow_id: int) -> Optional[Dict[str, Any]]:
         """Get arrow details from UnifiedDatabase and convert to ArrowDatabase format"""
         arrow_data = self.db.get_arrow_by_id(arrow_id, include_inactive=True)
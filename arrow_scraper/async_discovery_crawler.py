@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Async Discovery Crawler
+Breadth-first link crawler used by URLDiscovery: a frontier queue, a hashed seen-set
+(or bloom filter for very large sites), depth limit, per-domain concurrency and a
+page/time budget so discovering a manufacturer's product URLs takes seconds.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; ArrowScraperBot/1.0; +info@arrowscraper.com)'
+
+# Link handler: (url, link_element, tag, depth) -> (category to record or None, follow link?)
+LinkHandler = Callable[[str, Any, Optional[str], int], Tuple[Optional[str], bool]]
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form used for de-duplication: no fragment, lowercase host, no trailing slash"""
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, '', parsed.query, ''))
+
+
+def _url_digest(url: str) -> bytes:
+    return hashlib.blake2b(normalize_url(url).encode('utf-8'), digest_size=8).digest()
+
+
+class HashedSeenSet:
+    """Seen-set of 8-byte URL digests: O(1) membership, far smaller than storing full URLs"""
+
+    def __init__(self):
+        self._digests = set()
+
+    def add(self, url: str) -> bool:
+        """Add a URL; returns False if it was already seen"""
+        digest = _url_digest(url)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return _url_digest(url) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class BloomSeenSet:
+    """Fixed-memory bloom filter for very large sites (small false-positive rate, never false negatives)"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, url: str):
+        digest = hashlib.blake2b(normalize_url(url).encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, url: str) -> bool:
+        positions = self._positions(url)
+        if all(self._bits[p >> 3] & (1 << (p & 7)) for p in positions):
+            return False
+        for p in positions:
+            self._bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(url))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+@dataclass
+class CrawlStats:
+    """Counters for one crawl run"""
+    pages_fetched: int = 0
+    pages_failed: int = 0
+    links_seen: int = 0
+    urls_found: int = 0
+    max_depth_reached: int = 0
+    elapsed_seconds: float = 0.0
+    stopped_by: str = "frontier_exhausted"
+
+
+@dataclass
+class CrawlResult:
+    """Categorized URLs plus run statistics"""
+    discovered: Dict[str, List[str]] = field(default_factory=dict)
+    stats: CrawlStats = field(default_factory=CrawlStats)
+
+
+class AsyncDiscoveryCrawler:
+    """Breadth-first async crawler with per-domain concurrency and page/time budgets"""
+
+    def __init__(self, max_depth: int = 2, per_domain_concurrency: int = 4,
+                 max_pages: int = 200, max_seconds: float = 30.0, max_urls: Optional[int] = None,
+                 timeout: int = 10, same_domain: bool = True, bloom_capacity: Optional[int] = None,
+                 user_agent: str = DEFAULT_USER_AGENT):
+        self.max_depth = max_depth
+        self.per_domain_concurrency = per_domain_concurrency
+        self.max_pages = max_pages
+        self.max_seconds = max_seconds
+        self.max_urls = max_urls
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.same_domain = same_domain
+        self.bloom_capacity = bloom_capacity
+        self.headers = {'User-Agent': user_agent}
+
+    def _new_seen_set(self):
+        return BloomSeenSet(self.bloom_capacity) if self.bloom_capacity else HashedSeenSet()
+
+    async def _fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> Optional[str]:
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    if response.status != 200 or 'html' not in response.headers.get('Content-Type', 'text/html'):
+                        return None
+                    return await response.text(errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e:
+                print(f"   ⚠️  Error crawling {url}: {str(e)[:80]}")
+                return None
+
+    async def crawl(self, seeds: Iterable[Tuple[str, Optional[str]]], handle_link: LinkHandler,
+                    already_seen: Iterable[str] = ()) -> CrawlResult:
+        """
+        Crawl breadth-first from (url, tag) seeds. handle_link decides for every new link which
+        category it belongs to (if any) and whether it should be expanded further.
+        """
+        result = CrawlResult()
+        stats = result.stats
+        seen = self._new_seen_set()
+        for url in already_seen:
+            seen.add(url)
+
+        frontier: asyncio.Queue = asyncio.Queue()
+        allowed_domains = set()
+        for url, tag in seeds:
+            seen.add(url)
+            allowed_domains.add(urlparse(url).netloc.lower())
+            frontier.put_nowait((url, tag, 0))
+
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        started = time.perf_counter()
+        stop = asyncio.Event()
+        in_flight = 0
+
+        def budget_exhausted() -> Optional[str]:
+            if stats.pages_fetched + stats.pages_failed >= self.max_pages:
+                return "page_budget"
+            if time.perf_counter() - started >= self.max_seconds:
+                return "time_budget"
+            if self.max_urls is not None and stats.urls_found >= self.max_urls:
+                return "url_budget"
+            return None
+
+        def parse_links(html: str) -> List[Any]:
+            # HTML parsing is the CPU-heavy part, keep it off the event loop
+            return BeautifulSoup(html, 'html.parser').find_all('a', href=True)
+
+        def process_links(page_url: str, links: List[Any], tag: Optional[str], depth: int) -> List[Tuple[str, Optional[str]]]:
+            """Categorize the links of one page and return the ones to expand"""
+            to_follow = []
+            for link in links:
+                full_url = urljoin(page_url, link['href']).split('#', 1)[0]
+                if not full_url.startswith('http'):
+                    continue
+                if self.same_domain and urlparse(full_url).netloc.lower() not in allowed_domains:
+                    continue
+                stats.links_seen += 1
+                if not seen.add(full_url):
+                    continue
+
+                category, follow = handle_link(full_url, link, tag, depth + 1)
+                if category:
+                    result.discovered.setdefault(category, []).append(full_url)
+                    stats.urls_found += 1
+                    if self.max_urls is not None and stats.urls_found >= self.max_urls:
+                        break
+                if follow and depth + 1 < self.max_depth:
+                    to_follow.append((full_url, category or tag))
+            return to_follow
+
+        async def worker(session: aiohttp.ClientSession):
+            nonlocal in_flight
+            while not stop.is_set():
+                try:
+                    url, tag, depth = await asyncio.wait_for(frontier.get(), timeout=0.2)
+                except asyncio.TimeoutError:
+                    if in_flight == 0 and frontier.empty():
+                        stop.set()
+                    continue
+
+                in_flight += 1
+                try:
+                    reason = budget_exhausted()
+                    if reason:
+                        stats.stopped_by = reason
+                        stop.set()
+                        continue
+
+                    domain = urlparse(url).netloc.lower()
+                    if domain not in semaphores:
+                        semaphores[domain] = asyncio.Semaphore(self.per_domain_concurrency)
+                    html = await self._fetch(session, semaphores[domain], url)
+                    if html is None:
+                        stats.pages_failed += 1
+                        continue
+
+                    stats.pages_fetched += 1
+                    stats.max_depth_reached = max(stats.max_depth_reached, depth)
+                    links = await asyncio.to_thread(parse_links, html)
+                    for next_url, next_tag in process_links(url, links, tag, depth):
+                        frontier.put_nowait((next_url, next_tag, depth + 1))
+                finally:
+                    in_flight -= 1
+                    frontier.task_done()
+
+        worker_count = max(1, self.per_domain_concurrency * max(1, len(allowed_domains)))
+        async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(worker_count)]
+            try:
+                await asyncio.wait_for(asyncio.gather(*workers), timeout=self.max_seconds + self.timeout.total)
+            except asyncio.TimeoutError:
+                stats.stopped_by = "time_budget"
+                for task in workers:
+                    task.cancel()
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        return result
+
+
+def run_crawl(crawler: AsyncDiscoveryCrawler, seeds, handle_link: LinkHandler, already_seen: Iterable[str] = ()) -> CrawlResult:
+    """Run a crawl from synchronous code (also safe when called inside a running event loop)"""
+    coroutine = crawler.crawl(seeds, handle_link, already_seen)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Async DeepSeek Client for Arrow Extraction
+Bounded-concurrency chat client with retries, exponential backoff and a per-run token budget
+"""
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional
+
+import aiohttp
+
+DEEPSEEK_CHAT_URL = "https://api.deepseek.com/v1/chat/completions"
+
+# HTTP status codes that are worth retrying (rate limit + transient server errors)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Rough characters-per-token ratio for English/German spec pages
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for packing and budget checks"""
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class TokenBudgetExceeded(Exception):
+    """Raised when a request would exceed the configured per-run token budget"""
+    pass
+
+
+@dataclass
+class LLMUsageStats:
+    """Token and request accounting for one manufacturer (or usage key)"""
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    pages: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.tokens_in + self.tokens_out
+
+
+@dataclass
+class TokenBudget:
+    """Per-run token budget shared by all requests of a client"""
+    limit: Optional[int] = None
+    used: int = 0
+    reserved: int = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.limit is None:
+            return None
+        return max(0, self.limit - self.used - self.reserved)
+
+    def can_spend(self, tokens: int) -> bool:
+        return self.limit is None or tokens <= self.remaining
+
+
+class AsyncDeepSeekClient:
+    """Async DeepSeek chat client with bounded concurrency and backoff"""
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "deepseek-chat",
+                 max_concurrency: int = 4, max_retries: int = 5,
+                 base_delay: float = 1.0, max_delay: float = 30.0,
+                 token_budget: Optional[int] = None, timeout: int = 90,
+                 base_url: str = DEEPSEEK_CHAT_URL):
+        self.api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
+        if not self.api_key:
+            raise ValueError("DeepSeek API key is required")
+
+        self.model = model
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.budget = TokenBudget(limit=token_budget)
+        self.usage: Dict[str, LLMUsageStats] = {}
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._budget_lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _stats_for(self, usage_key: Optional[str]) -> LLMUsageStats:
+        key = usage_key or "default"
+        if key not in self.usage:
+            self.usage[key] = LLMUsageStats()
+        return self.usage[key]
+
+    def record_pages(self, usage_key: Optional[str], pages: int = 1):
+        """Count pages handled outside chat(), e.g. one long page split over several chunk requests"""
+        self._stats_for(usage_key).pages += pages
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter, honouring Retry-After when provided"""
+        if retry_after:
+            try:
+                return min(self.max_delay, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def _reserve_budget(self, tokens: int):
+        async with self._budget_lock:
+            if not self.budget.can_spend(tokens):
+                raise TokenBudgetExceeded(
+                    f"Request needs ~{tokens} tokens but only {self.budget.remaining} remain in budget"
+                )
+            self.budget.reserved += tokens
+
+    async def _settle_budget(self, reserved: int, actual: int):
+        async with self._budget_lock:
+            self.budget.reserved -= reserved
+            self.budget.used += actual
+
+    async def chat(self, prompt: str, system: Optional[str] = None, max_tokens: int = 4000,
+                   temperature: float = 0.1, usage_key: Optional[str] = None,
+                   pages: int = 1) -> Optional[str]:
+        """Send one chat completion; returns the message content or None on failure"""
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
+        stats = self._stats_for(usage_key)
+        estimated = estimate_tokens(prompt) + estimate_tokens(system or "") + max_tokens
+        await self._reserve_budget(estimated)
+
+        actual_tokens = 0
+        try:
+            async with self._semaphore:
+                session = await self._ensure_session()
+                for attempt in range(self.max_retries + 1):
+                    started = time.perf_counter()
+                    try:
+                        async with session.post(self.base_url, json=payload) as response:
+                            if response.status == 200:
+                                data = await response.json()
+                                stats.requests += 1
+                                stats.pages += pages
+                                stats.elapsed_seconds += time.perf_counter() - started
+
+                                usage = data.get('usage') or {}
+                                tokens_in = usage.get('prompt_tokens', estimated - max_tokens)
+                                content = data['choices'][0]['message']['content'].strip()
+                                tokens_out = usage.get('completion_tokens', estimate_tokens(content))
+                                stats.tokens_in += tokens_in
+                                stats.tokens_out += tokens_out
+                                actual_tokens = tokens_in + tokens_out
+                                return content
+
+                            if response.status in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                                delay = self._backoff_delay(attempt, response.headers.get('Retry-After'))
+                                stats.retries += 1
+                                print(f"⏳ DeepSeek {response.status}, retrying in {delay:.1f}s "
+                                      f"(attempt {attempt + 1}/{self.max_retries})")
+                                await asyncio.sleep(delay)
+                                continue
+
+                            body = await response.text()
+                            print(f"⚠️  DeepSeek API error {response.status}: {body[:100]}")
+                            break
+
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        if attempt < self.max_retries:
+                            delay = self._backoff_delay(attempt)
+                            stats.retries += 1
+                            print(f"⏳ DeepSeek request failed ({str(e)[:60]}), retrying in {delay:.1f}s")
+                            await asyncio.sleep(delay)
+                            continue
+                        print(f"⚠️  DeepSeek API request failed: {str(e)[:100]}")
+                        break
+
+                stats.failures += 1
+                return None
+        finally:
+            await self._settle_budget(estimated, actual_tokens)
+
+    def get_usage_report(self) -> Dict[str, Any]:
+        """Tokens in/out and requests per manufacturer plus run totals"""
+        report = {
+            "by_manufacturer": {key: dict(asdict(stats), total_tokens=stats.total_tokens)
+                                for key, stats in self.usage.items()},
+            "totals": {
+                "requests": sum(s.requests for s in self.usage.values()),
+                "retries": sum(s.retries for s in self.usage.values()),
+                "failures": sum(s.failures for s in self.usage.values()),
+                "tokens_in": sum(s.tokens_in for s in self.usage.values()),
+                "tokens_out": sum(s.tokens_out for s in self.usage.values()),
+                "pages": sum(s.pages for s in self.usage.values()),
+            },
+            "budget": {
+                "limit": self.budget.limit,
+                "used": self.budget.used,
+                "remaining": self.budget.remaining,
+            }
+        }
+        return report
+
+    def print_usage_report(self):
+        """Print a per-manufacturer usage summary"""
+        report = self.get_usage_report()
+        print("\n📊 LLM Usage Report")
+        print("-" * 60)
+        for key, stats in report["by_manufacturer"].items():
+            print(f"   {key}: {stats['requests']} requests ({stats['pages']} pages), "
+                  f"{stats['tokens_in']} in / {stats['tokens_out']} out, "
+                  f"{stats['retries']} retries, {stats['failures']} failures")
+        totals = report["totals"]
+        print(f"   TOTAL: {totals['requests']} requests, {totals['tokens_in']} in / {totals['tokens_out']} out")
+        if report["budget"]["limit"] is not None:
+            print(f"   Budget: {report['budget']['used']}/{report['budget']['limit']} tokens used")
+
+
+def split_into_chunks(content: str, max_tokens: int, overlap_lines: int = 3) -> List[str]:
+    """Split long page content on line boundaries into chunks of at most max_tokens"""
+    if estimate_tokens(content) <= max_tokens:
+        return [content]
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    lines = content.split('\n')
+    chunks = []
+    current: List[str] = []
+    current_len = 0
+
+    for line in lines:
+        # Hard-wrap pathological single lines (minified HTML etc.)
+        while len(line) > max_chars:
+            if current:
+                chunks.append('\n'.join(current))
+                current, current_len = [], 0
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+
+        if current_len + len(line) + 1 > max_chars and current:
+            chunks.append('\n'.join(current))
+            # Keep a little context so table headers carry over to the next chunk
+            current = current[-overlap_lines:] if overlap_lines else []
+            current_len = sum(len(l) + 1 for l in current)
+
+        current.append(line)
+        current_len += len(line) + 1
+
+    if current:
+        chunks.append('\n'.join(current))
+
+    return chunks
+
+
+def pack_pages(pages: List[Dict[str, Any]], max_tokens: int, max_pages_per_request: int = 5) -> List[List[Dict[str, Any]]]:
+    """Greedily pack short pages into request groups that fit max_tokens"""
+    groups: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+
+    for page in pages:
+        tokens = estimate_tokens(page.get('content', ''))
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_pages_per_request):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(page)
+        current_tokens += tokens
+
+    if current:
+        groups.append(current)
+
+    return groups
@@ -3,10 +3,6 @@ import os
 import jwt
 from functools import wraps
 from flask import request, jsonify
-from google.oauth2 import id_token
-from google.auth.transport import requests
-import httplib2 # For making HTTP requests
-import json # For parsing JSON responses
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -23,6 +19,7 @@ for env_path in env_paths:
         break
 
 from unified_database import UnifiedDatabase
+from user_cache import get_user_cache
 
 def token_required(f):
     @wraps(f)
@@ -38,9 +35,10 @@ def token_required(f):
             return jsonify({"message": "Token is missing!"}), 401
 
         try:
-            data = jwt.decode(token, os.environ.get("SECRET_KEY", 'arrow-tuning-secret-key-change-in-production'), algorithms=["HS256"])
-            db = UnifiedDatabase()
-            current_user = db.get_user_by_id(data["user_id"])
+            # Decoded tokens and user rows are cached per worker; user writes invalidate them
+            user_cache = get_user_cache()
+            data = user_cache.decode_token(token, os.environ.get("SECRET_KEY", 'arrow-tuning-secret-key-change-in-production'))
+            current_user = user_cache.get_user(data["user_id"])
             if not current_user:
                 return jsonify({"message": "User not found!", "hint": "Please log in again."}), 401
             
@@ -62,10 +60,12 @@ def token_required(f):
 
     return decorated
 
-from google.auth.transport import requests as google_requests
-import requests as req
-
 def get_user_from_google_token(authorization_code):
+    # google-auth and requests are only needed at login; importing them here keeps worker start-up fast
+    from google.oauth2 import id_token
+    from google.auth.transport import requests as google_requests
+    import requests as req
+
     try:
         client_id = os.environ.get("NUXT_PUBLIC_GOOGLE_CLIENT_ID")
         client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
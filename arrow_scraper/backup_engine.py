@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+"""
+Streaming Backup Engine
+Copies SQLite databases with the online backup API a few pages at a time (sleeping between
+steps so writers are never starved) and writes them straight into a gzip or zstd compressed
+tar archive. Small databases are staged in memory and serialized into the archive (Python 3.11+);
+larger ones, and every database on older interpreters, go through a single staging file next to
+the archive instead of a temp directory copy.
+Row counts in the metadata come from sqlite_stat1 / MAX(rowid) instead of COUNT(*) scans.
+
+In WAL mode the copy runs inside one read transaction: it sees a fixed snapshot while writers
+keep committing. In rollback-journal mode each step takes the read lock only briefly, and
+MAX_BACKUP_RESTARTS bounds how often concurrent writes can restart the copy.
+
+Backups started through start_backup_job() run in a separate process and report progress through
+a status file every API worker can read (see BackupJob).
+consistent_copy() is also used by the incremental snapshot store (snapshot_store.py).
+"""
+
+import importlib
+import io
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Pages copied per backup step (256 x 4KB pages = 1MB) and pause between steps
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+
+# Writes from other connections make the backup API start over; after this many restarts (or
+# steps that make no progress) the copy is finished inside one read transaction, which holds off
+# writers in rollback-journal mode
+MAX_BACKUP_RESTARTS = 3
+
+# Databases up to this size are staged in memory rather than in a staging file
+MEMORY_STAGING_LIMIT_MB = 64
+
+# Connection.serialize() needs Python 3.11+; older interpreters always use the staging file
+SERIALIZE_AVAILABLE = hasattr(sqlite3.Connection, 'serialize')
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+ARCHIVE_SUFFIXES = {
+    'gzip': '.tar.gz',
+    'zstd': '.tar.zst',
+}
+
+# Finished jobs kept for the progress endpoint
+MAX_FINISHED_JOBS = 20
+
+# Job status files: progress is written at most this often, the runner process heartbeats on its
+# own, and an unfinished job without a heartbeat for JOB_STALE_SECONDS is reported as failed
+JOB_WRITE_INTERVAL = 0.5
+JOB_HEARTBEAT_INTERVAL = 5.0
+JOB_STALE_SECONDS = 60.0
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{12}')
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def resolve_compression(compression: Optional[str] = None) -> str:
+    """Requested (or BACKUP_COMPRESSION) compression, falling back to gzip without zstandard"""
+    compression = (compression or os.environ.get('BACKUP_COMPRESSION') or 'gzip').lower()
+    if compression in ('zst', 'zstandard'):
+        compression = 'zstd'
+    if compression not in ARCHIVE_SUFFIXES:
+        raise ValueError(f"Unsupported backup compression: {compression}")
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        print("⚠️  zstandard not installed, using gzip for backup")
+        compression = 'gzip'
+    return compression
+
+
+def archive_stem(path) -> str:
+    """Backup name of an archive file (without .tar.gz / .tar.zst / .gz)"""
+    name = Path(path).name
+    for suffix in ('.tar.gz', '.tar.zst', '.gz'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+@contextmanager
+def open_archive_writer(path: Path, compression: str) -> Iterator[tarfile.TarFile]:
+    """Tar writer compressing into path as members are added"""
+    if compression == 'zstd':
+        with open(path, 'wb') as raw:
+            writer = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+            try:
+                with tarfile.open(fileobj=writer, mode='w|') as tar:
+                    yield tar
+            finally:
+                writer.close()
+    else:
+        with tarfile.open(path, 'w:gz', compresslevel=GZIP_LEVEL) as tar:
+            yield tar
+
+
+@contextmanager
+def open_archive_reader(path) -> Iterator[tarfile.TarFile]:
+    """Tar reader for .tar.gz, CDN-style .gz and .tar.zst backups (zstd archives are stream-only)"""
+    path = Path(path)
+    if path.name.endswith('.tar.zst'):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read .tar.zst backups")
+        with open(path, 'rb') as raw:
+            with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                with tarfile.open(fileobj=reader, mode='r|') as tar:
+                    yield tar
+    elif path.name.endswith('.gz'):
+        with tarfile.open(path, 'r:gz') as tar:
+            yield tar
+    else:
+        raise ValueError(f"Unsupported backup format: {path.name}")
+
+
+def read_archive_metadata(path) -> Dict[str, Any]:
+    """backup_metadata.json of an archive; streaming backups store it as the first member"""
+    with open_archive_reader(path) as tar:
+        for member in tar:
+            if member.name == 'backup_metadata.json':
+                return json.load(tar.extractfile(member))
+    return {}
+
+
+def cheap_table_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Per-table row counts without scanning tables: sqlite_stat1 (kept by ANALYZE /
+    PRAGMA optimize) when it covers the table, otherwise MAX(rowid), which is an upper bound.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+    tables = [row[0] for row in cursor.fetchall()]
+
+    analyzed: Dict[str, int] = {}
+    try:
+        cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+        for table, stat in cursor.fetchall():
+            try:
+                analyzed[table] = max(analyzed.get(table, 0), int(str(stat).split()[0]))
+            except (ValueError, IndexError):
+                continue
+    except sqlite3.Error:
+        pass
+
+    counts: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    for table in tables:
+        if table in analyzed:
+            counts[table], sources[table] = analyzed[table], 'sqlite_stat1'
+            continue
+        try:
+            cursor.execute(f"SELECT MAX(rowid) FROM [{table}]")
+            counts[table], sources[table] = cursor.fetchone()[0] or 0, 'max_rowid'
+        except sqlite3.Error:
+            # WITHOUT ROWID tables have no cheap estimate
+            counts[table], sources[table] = "unknown", 'unknown'
+    return {"table_count": len(tables), "tables": counts, "row_count_sources": sources}
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+class StreamingBackupEngine:
+    """Stepwise online backup of SQLite databases into one compressed archive"""
+
+    def __init__(self, pages_per_step: int = BACKUP_PAGES_PER_STEP, step_sleep: float = BACKUP_STEP_SLEEP,
+                 memory_staging_limit_mb: float = MEMORY_STAGING_LIMIT_MB,
+                 progress: Optional[ProgressCallback] = None):
+        """
+        Args:
+            pages_per_step: Pages copied per sqlite3_backup_step call
+            step_sleep: Seconds slept between steps; the source is unlocked while sleeping
+            memory_staging_limit_mb: Databases up to this size are staged in memory
+            progress: Called with a progress dict after every step
+        """
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self.memory_staging_limit = memory_staging_limit_mb * 1024 * 1024
+        self.progress = progress
+
+    def _report(self, **state):
+        if self.progress:
+            self.progress(state)
+
+    def create_archive(self, archive_path: Path, databases: List[Tuple[str, Path, str]],
+                       metadata: Dict[str, Any], compression: str = 'gzip') -> Dict[str, Any]:
+        """
+        Write metadata and a consistent copy of every database into archive_path
+
+        Args:
+            archive_path: Final archive path; written as <archive>.partial and renamed when complete
+            databases: (archive member name, database path, metadata stats key) triples
+            metadata: Backup metadata; the stats of each database are added under its key
+            compression: 'gzip' or 'zstd'
+
+        Returns:
+            The metadata written to the archive
+        """
+        archive_path = Path(archive_path)
+        partial_path = archive_path.with_name(archive_path.name + '.partial')
+        started = time.perf_counter()
+
+        # Metadata goes first so listings can stop after one member; stats are cheap estimates
+        for _, db_path, stats_key in databases:
+            metadata[stats_key] = self.database_stats(db_path)
+        metadata["compression"] = compression
+
+        total_pages = sum(self._page_count(db_path) for _, db_path, _ in databases)
+        self._report(phase='starting', pages_total=total_pages, pages_done=0, percent=0.0)
+
+        try:
+            with open_archive_writer(partial_path, compression) as tar:
+                payload = json.dumps(metadata, indent=2).encode('utf-8')
+                info = tarfile.TarInfo('backup_metadata.json')
+                info.size = len(payload)
+                info.mtime = int(time.time())
+                tar.addfile(info, io.BytesIO(payload))
+
+                pages_before = 0
+                for member_name, db_path, _ in databases:
+                    pages_before += self._add_database(tar, member_name, Path(db_path), archive_path,
+                                                       pages_before, total_pages)
+            os.replace(partial_path, archive_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        elapsed = time.perf_counter() - started
+        self._report(phase='completed', pages_total=total_pages, pages_done=total_pages, percent=100.0,
+                     bytes_written=archive_path.stat().st_size, elapsed_seconds=round(elapsed, 2))
+        return metadata
+
+    def database_stats(self, db_path: Path) -> Dict[str, Any]:
+        try:
+            conn = sqlite3.connect(f"file:{Path(db_path).resolve()}?mode=ro", uri=True)
+            try:
+                stats = cheap_table_stats(conn)
+            finally:
+                conn.close()
+            stats["file_size_mb"] = Path(db_path).stat().st_size / (1024 * 1024)
+            return stats
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    def _page_count(db_path: Path) -> int:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            conn.close()
+
+    def _add_database(self, tar: tarfile.TarFile, member_name: str, db_path: Path, archive_path: Path,
+                      pages_before: int, total_pages: int) -> int:
+        """Back up one database into the archive; returns its page count"""
+        staging_path = archive_path.with_name(f"{archive_path.name}.{member_name}.staging")
+        with self.consistent_copy(db_path, staging_path, member_name, pages_before, total_pages) as (copy, size, pages):
+            self._report(phase='compressing', database=member_name)
+            info = tarfile.TarInfo(member_name)
+            info.mtime = int(time.time())
+            info.size = size
+            tar.addfile(info, copy)
+            return pages
+
+    @contextmanager
+    def consistent_copy(self, db_path: Path, staging_path: Path, label: str, pages_before: int = 0,
+                        total_pages: int = 0) -> Iterator[Tuple[BinaryIO, int, int]]:
+        """
+        Stepwise online backup of one database, yielding (readable copy, size in bytes, page count)
+
+        Databases up to memory_staging_limit are copied into memory and serialized (Python 3.11+);
+        larger ones are copied into staging_path, which is removed again afterwards.
+        """
+        db_path = Path(db_path)
+        source = sqlite3.connect(db_path)
+        staging_file = None
+        try:
+            page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            page_count = source.execute("PRAGMA page_count").fetchone()[0]
+            in_memory = SERIALIZE_AVAILABLE and page_size * page_count <= self.memory_staging_limit
+            if in_memory:
+                target = sqlite3.connect(':memory:')
+            else:
+                staging_file = Path(staging_path)
+                staging_file.unlink(missing_ok=True)
+                target = sqlite3.connect(staging_file)
+
+            restarts = [0]
+            last_done = [0]
+            steps = [0]
+            copied_pages = [page_count]
+            # Holding a read transaction pins the snapshot: WAL writers are unaffected, so do it from
+            # the start there; in rollback-journal mode only after repeated restarts
+            wal = source.execute("PRAGMA journal_mode").fetchone()[0].lower() == 'wal'
+            hold_snapshot = [wal]
+
+            def max_steps(pages):
+                # Backstop against restarts that slip past the progress check
+                return (MAX_BACKUP_RESTARTS + 1) * (-(-pages // self.pages_per_step)) + 1
+
+            def on_step(status, remaining, pages):
+                done = pages - remaining
+                steps[0] += 1
+                if done <= last_done[0]:
+                    # The source was written by another connection and the backup API started over.
+                    # In rollback-journal mode a write between every step restarts it at the same
+                    # page count, so progress that does not advance counts as a restart too.
+                    restarts[0] += 1
+                if not hold_snapshot[0] and (restarts[0] > MAX_BACKUP_RESTARTS or
+                                             steps[0] > max_steps(pages)):
+                    raise _BackupRestarted()
+                last_done[0] = done
+                copied_pages[0] = pages
+                grand_total = max(total_pages, pages_before + pages)
+                self._report(phase='copying', database=label, pages_done=pages_before + done,
+                             pages_total=grand_total, restarts=restarts[0],
+                             percent=round((pages_before + done) * 100.0 / grand_total, 1) if grand_total else 100.0)
+                # Pausing only helps writers when they can commit between steps
+                if remaining and self.step_sleep and (wal or not hold_snapshot[0]):
+                    time.sleep(self.step_sleep)
+
+            try:
+                while True:
+                    if hold_snapshot[0]:
+                        source.execute("BEGIN")
+                        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                    try:
+                        source.backup(target, pages=self.pages_per_step, progress=on_step)
+                        break
+                    except _BackupRestarted:
+                        print(f"   ⚠️  {db_path.name} changed {restarts[0]} times during backup, "
+                              f"finishing in one read transaction")
+                        hold_snapshot[0] = True
+                        last_done[0] = 0
+                        steps[0] = 0
+                    finally:
+                        if source.in_transaction:
+                            source.rollback()
+                source.close()
+                print(f"   ✅ Database copied: {db_path.name} ({copied_pages[0]} pages"
+                      f"{', restarted ' + str(restarts[0]) + 'x' if restarts[0] else ''})")
+                if in_memory:
+                    data = target.serialize()
+                    yield io.BytesIO(data), len(data), copied_pages[0]
+                else:
+                    target.close()
+                    with open(staging_file, 'rb') as staged:
+                        yield staged, staging_file.stat().st_size, copied_pages[0]
+            finally:
+                target.close()
+        finally:
+            source.close()
+            if staging_file is not None:
+                staging_file.unlink(missing_ok=True)
+
+
+class BackupJob:
+    """
+    A backup running in its own process, with its state in a status file under jobs_dir()
+
+    Every API worker reads the same file, so a progress poll can land on any worker, and the
+    job keeps running when the worker that started it is recycled.
+    """
+
+    def __init__(self, backup_name: str, target: str = '', kwargs: Optional[Dict[str, Any]] = None,
+                 job_id: Optional[str] = None):
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.backup_name = backup_name
+        self.target = target
+        self.kwargs = kwargs or {}
+        self.status = 'queued'
+        self.progress: Dict[str, Any] = {'phase': 'queued', 'percent': 0.0}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now().isoformat()
+        self.finished_at: Optional[str] = None
+        self.pid: Optional[int] = None
+        self.heartbeat_at = time.time()
+        self._saved_at = 0.0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return jobs_dir() / f"{self.job_id}.json"
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'failed')
+
+    @classmethod
+    def load(cls, job_id: str) -> Optional['BackupJob']:
+        if not JOB_ID_PATTERN.fullmatch(job_id or ''):
+            return None
+        try:
+            state = json.loads((jobs_dir() / f"{job_id}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        job = cls(state.get('backup_name', ''), state.get('target', ''), state.get('kwargs'), job_id=job_id)
+        for key in ('status', 'progress', 'result', 'error', 'created_at', 'finished_at', 'pid', 'heartbeat_at'):
+            if key in state:
+                setattr(job, key, state[key])
+        return job
+
+    def save(self):
+        """Write the status file atomically (tmp file + rename) so readers never see a partial file"""
+        # Serialized so a heartbeat write can never land after (and undo) the final status write
+        with self._save_lock:
+            with self._lock:
+                state = {**self.to_dict(), 'target': self.target, 'kwargs': self.kwargs,
+                         'pid': self.pid, 'heartbeat_at': self.heartbeat_at}
+                self._saved_at = time.monotonic()
+            path = self.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(state, default=str))
+            os.replace(tmp, path)
+
+    def update_progress(self, state: Dict[str, Any]):
+        with self._lock:
+            phase_changed = state.get('phase', self.progress.get('phase')) != self.progress.get('phase')
+            self.progress = {**self.progress, **state}
+            self.heartbeat_at = time.time()
+            due = phase_changed or time.monotonic() - self._saved_at >= JOB_WRITE_INTERVAL
+        # Progress arrives once per backup step; the status file is rewritten at most every JOB_WRITE_INTERVAL
+        if due:
+            self.save()
+
+    def check_orphaned(self) -> bool:
+        """Mark an unfinished job failed when its process is gone or stopped sending heartbeats"""
+        if self.finished:
+            return False
+        stale = time.time() - float(self.heartbeat_at or 0) > JOB_STALE_SECONDS
+        if not stale and not (self.pid and not _process_alive(self.pid)):
+            return False
+        # The runner may have written its final status after this copy was loaded
+        current = BackupJob.load(self.job_id)
+        if current is None:
+            return False
+        if current.finished:
+            self.status, self.result, self.error = current.status, current.result, current.error
+            self.finished_at = current.finished_at
+            return False
+        self.status = 'failed'
+        self.error = self.error or 'Backup process exited before the job finished'
+        self.finished_at = datetime.now().isoformat()
+        try:
+            self.save()
+        except OSError as e:
+            print(f"⚠️ Could not update backup job {self.job_id}: {e}")
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'backup_name': self.backup_name,
+            'status': self.status,
+            'progress': dict(self.progress),
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+        }
+
+
+def jobs_dir() -> Path:
+    """Directory holding the job status files, shared by all API workers"""
+    configured = os.environ.get('BACKUP_JOBS_DIR')
+    if configured:
+        return Path(configured)
+    for base in (os.environ.get('BACKUP_DIR'), '/app/backups', './backups'):
+        if base and Path(base).is_dir():
+            return Path(base) / 'jobs'
+    return Path(tempfile.gettempdir()) / 'arrowtuner_backup_jobs'
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+# Runner processes started by this worker; polled so finished ones do not linger as zombies
+_children: List[subprocess.Popen] = []
+
+
+def _reap_children():
+    _children[:] = [child for child in _children if child.poll() is None]
+
+
+def _prune_finished_jobs():
+    jobs = [job for job in (BackupJob.load(path.stem) for path in jobs_dir().glob('*.json')) if job]
+    finished = sorted((job for job in jobs if job.finished), key=lambda job: job.created_at)
+    for old in finished[:max(0, len(finished) - MAX_FINISHED_JOBS + 1)]:
+        old.path.unlink(missing_ok=True)
+
+
+def start_backup_job(backup_name: str, target: str, kwargs: Dict[str, Any]) -> BackupJob:
+    """
+    Run target ('module:function') in a separate process as target(**kwargs, job=job). The function
+    reports progress through job.update_progress and returns the result dict shown once the job has
+    completed; kwargs must be JSON serializable.
+    """
+    _reap_children()
+    try:
+        _prune_finished_jobs()
+    except OSError as e:
+        print(f"⚠️ Could not prune old backup jobs: {e}")
+    job = BackupJob(backup_name, target, kwargs)
+    job.save()
+    try:
+        # A new session keeps the runner out of the worker's process group, so recycling the
+        # worker (gunicorn --max-requests) does not take the backup down with it
+        child = subprocess.Popen([sys.executable, str(Path(__file__).resolve()), 'run-job', job.job_id],
+                                 cwd=str(Path(__file__).resolve().parent), start_new_session=True)
+    except OSError as e:
+        job.status = 'failed'
+        job.error = f'Could not start backup process: {e}'
+        job.finished_at = datetime.now().isoformat()
+        job.save()
+        raise
+    _children.append(child)
+    return job
+
+
+def run_job(job_id: str) -> int:
+    """Entry point of the runner process started by start_backup_job()"""
+    job = BackupJob.load(job_id)
+    if job is None:
+        print(f"❌ Backup job {job_id} not found in {jobs_dir()}")
+        return 1
+    job.pid = os.getpid()
+    job.status = 'running'
+    job.heartbeat_at = time.time()
+    job.save()
+
+    stop = threading.Event()
+
+    def heartbeat():
+        # Keeps the job alive for pollers while a single step (compression, upload) takes a while
+        while not stop.wait(JOB_HEARTBEAT_INTERVAL):
+            job.heartbeat_at = time.time()
+            job.save()
+
+    threading.Thread(target=heartbeat, name=f"backup-{job_id}-heartbeat", daemon=True).start()
+    try:
+        module_name, function_name = job.target.split(':', 1)
+        work = getattr(importlib.import_module(module_name), function_name)
+        result = work(**job.kwargs, job=job)
+        with job._lock:
+            job.result = result
+            job.status = 'completed'
+    except Exception as e:
+        print(f"❌ Backup job {job_id} failed: {e}")
+        with job._lock:
+            job.error = str(e)
+            job.status = 'failed'
+    finally:
+        stop.set()
+        job.finished_at = datetime.now().isoformat()
+        job.heartbeat_at = time.time()
+        job.save()
+    return 0 if job.status == 'completed' else 1
+
+
+def get_backup_job(job_id: str) -> Optional[BackupJob]:
+    _reap_children()
+    job = BackupJob.load(job_id)
+    if job:
+        job.check_orphaned()
+    return job
+
+
+def list_backup_jobs() -> List[Dict[str, Any]]:
+    _reap_children()
+    jobs = [job for job in (BackupJob.load(path.stem) for path in jobs_dir().glob('*.json')) if job]
+    for job in jobs:
+        job.check_orphaned()
+    return [job.to_dict() for job in sorted(jobs, key=lambda j: j.created_at, reverse=True)]
+
+
+def _check_copy(db_path: Path, label: str) -> bool:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+    finally:
+        conn.close()
+    if rows != 2000 or integrity != 'ok':
+        print(f"❌ Backup self-check failed ({label}): {rows} rows, integrity {integrity}")
+        return False
+    print(f"✅ Backup self-check passed ({label})")
+    return True
+
+
+def self_check() -> int:
+    """
+    Back up and read back a small database through both staging paths (memory when the
+    interpreter supports serialize(), staging file always), as an archive and as an incremental
+    snapshot. Run on the production image at build time, so an interpreter-specific failure shows
+    up there instead of in the first admin backup.
+    """
+    from snapshot_store import SnapshotStore
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+        db_path = work_dir / 'check.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, payload TEXT)")
+        conn.executemany("INSERT INTO items (payload) VALUES (?)", [(f"row {i}" * 20,) for i in range(2000)])
+        conn.commit()
+        conn.close()
+
+        modes = [('file', 0)] + ([('memory', MEMORY_STAGING_LIMIT_MB)] if SERIALIZE_AVAILABLE else [])
+        for mode, staging_limit_mb in modes:
+            engine = StreamingBackupEngine(memory_staging_limit_mb=staging_limit_mb)
+
+            archive_path = work_dir / f'check_{mode}.tar.gz'
+            engine.create_archive(archive_path, [('check.db', db_path, 'check_stats')], {}, 'gzip')
+            restored = work_dir / f'archive_{mode}.db'
+            with open_archive_reader(archive_path) as tar:
+                for member in tar:
+                    if member.name == 'check.db':
+                        restored.write_bytes(tar.extractfile(member).read())
+            if not _check_copy(restored, f'archive, {mode} staging'):
+                return 1
+
+            store = SnapshotStore(work_dir / 'snapshots', engine=engine)
+            store.create_snapshot([('check.db', db_path)], f'check_{mode}')
+            restored = work_dir / f'snapshot_{mode}.db'
+            store.restore_snapshot(f'check_{mode}', {'check.db': restored})
+            if not _check_copy(restored, f'snapshot, {mode} staging'):
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == 'run-job':
+        sys.exit(run_job(sys.argv[2]))
+    if len(sys.argv) == 2 and sys.argv[1] == 'self-check':
+        sys.exit(self_check())
+    print("Usage: backup_engine.py run-job <job_id> | self-check")
+    sys.exit(2)
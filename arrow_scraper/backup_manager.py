@@ -7,14 +7,16 @@ Provides comprehensive backup and restore functionality for ArrowTuner databases
 import os
 import sys
 import shutil
-import sqlite3
 import argparse
 import json
 import tarfile
-import gzip
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backup_engine import (ARCHIVE_SUFFIXES, StreamingBackupEngine, archive_stem, open_archive_reader,
+                           read_archive_metadata, resolve_compression)
+from snapshot_store import SnapshotStore
 
 class BackupManager:
     """Manages database backups and restores for ArrowTuner system"""
@@ -39,7 +41,7 @@ class BackupManager:
         self.arrow_db_path = Path(self._resolve_arrow_db_path())
         self.user_db_path = Path(self._resolve_user_db_path())
         
-        print(f"🗄️  Backup Manager initialized")
+        print("🗄️  Backup Manager initialized")
         print(f"   Backup directory: {self.backup_dir}")
         print(f"   Arrow database: {self.arrow_db_path}")
         print(f"   User database: {self.user_db_path}")
@@ -104,67 +106,50 @@ class BackupManager:
         # Default to local development location
         return './databases/user_data.db'
     
-    def create_backup(self, backup_name: Optional[str] = None, include_arrow_db: bool = True, include_user_db: bool = True) -> str:
-        """Create a complete backup of the database system"""
+    def create_backup(self, backup_name: Optional[str] = None, include_arrow_db: bool = True, include_user_db: bool = True,
+                      compression: Optional[str] = None, progress: Optional[Callable[[Dict], None]] = None) -> str:
+        """
+        Create a complete backup of the database system
+
+        Databases are copied with the stepwise online backup API and streamed into the archive
+        (see backup_engine.py); compression is 'gzip' (default, .tar.gz) or 'zstd' (.tar.zst),
+        and progress receives the engine's progress dicts.
+        """
         
         if not backup_name:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"archerytools_backup_{timestamp}"
         
-        backup_path = self.backup_dir / f"{backup_name}.tar.gz"
-        temp_dir = self.backup_dir / f"temp_{backup_name}"
+        compression = resolve_compression(compression)
+        backup_path = self.backup_dir / f"{backup_name}{ARCHIVE_SUFFIXES[compression]}"
         
         try:
-            # Create temporary directory for backup preparation
-            temp_dir.mkdir(exist_ok=True)
-            
             print(f"🗜️  Creating backup: {backup_name}")
             
             # Create backup metadata
             metadata = {
                 "backup_name": backup_name,
                 "created_at": datetime.now().isoformat(),
-                "version": "1.0.0",
+                "version": "1.1.0",
                 "includes": {
                     "arrow_database": include_arrow_db,
                     "user_database": include_user_db
                 }
             }
             
-            # Backup arrow database
+            databases = []
             if include_arrow_db and self.arrow_db_path.exists():
-                print(f"📊 Backing up arrow database...")
-                arrow_backup_path = temp_dir / "arrow_database.db"
-                self._create_db_backup(self.arrow_db_path, arrow_backup_path)
-                
-                # Get database statistics for metadata
-                metadata["arrow_db_stats"] = self._get_db_stats(self.arrow_db_path)
-            
-            # Backup user database
+                print("📊 Backing up arrow database...")
+                databases.append(("arrow_database.db", self.arrow_db_path, "arrow_db_stats"))
             if include_user_db and self.user_db_path.exists():
-                print(f"👤 Backing up user database...")
-                user_backup_path = temp_dir / "user_data.db"
-                self._create_db_backup(self.user_db_path, user_backup_path)
-                
-                # Get database statistics for metadata
-                metadata["user_db_stats"] = self._get_db_stats(self.user_db_path)
-            
-            # Save metadata
-            metadata_path = temp_dir / "backup_metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+                print("👤 Backing up user database...")
+                databases.append(("user_data.db", self.user_db_path, "user_db_stats"))
             
-            # Create compressed tar archive
-            print(f"🗜️  Compressing backup...")
-            with tarfile.open(backup_path, "w:gz") as tar:
-                for file_path in temp_dir.iterdir():
-                    tar.add(file_path, arcname=file_path.name)
-            
-            # Cleanup temporary directory
-            shutil.rmtree(temp_dir)
+            engine = StreamingBackupEngine(progress=progress)
+            engine.create_archive(backup_path, databases, metadata, compression)
             
             backup_size = backup_path.stat().st_size / (1024 * 1024)  # MB
-            print(f"✅ Backup created successfully!")
+            print("✅ Backup created successfully!")
             print(f"   File: {backup_path}")
             print(f"   Size: {backup_size:.2f} MB")
             
@@ -172,11 +157,6 @@ class BackupManager:
             
         except Exception as e:
             print(f"❌ Backup failed: {e}")
-            # Cleanup on failure
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            if backup_path.exists():
-                backup_path.unlink()
             raise
     
     def restore_backup(self, backup_path: str, restore_arrow_db: bool = True, restore_user_db: bool = True, force: bool = False) -> bool:
@@ -190,23 +170,15 @@ class BackupManager:
         temp_dir = self.backup_dir / f"restore_temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         try:
-            # Extract backup - support both .tar.gz and .gz files
+            # Extract backup - supports .tar.gz, CDN .gz and .tar.zst files
             print(f"📦 Extracting backup: {backup_file.name}")
-            temp_dir.mkdir(exist_ok=True)
-            
-            if backup_file.name.endswith('.tar.gz'):
-                # Standard tar.gz format
-                with tarfile.open(backup_file, "r:gz") as tar:
-                    tar.extractall(temp_dir)
-            elif backup_file.name.endswith('.gz'):
-                # CDN .gz format - extract as gzipped tar
-                import gzip
-                with gzip.open(backup_file, 'rb') as gz_file:
-                    with tarfile.open(fileobj=gz_file, mode='r') as tar:
-                        tar.extractall(temp_dir)
-            else:
+            if not backup_file.name.endswith(('.gz', '.tar.zst')):
                 print(f"❌ Unsupported backup format: {backup_file.name}")
                 return False
+            temp_dir.mkdir(exist_ok=True)
+            
+            with open_archive_reader(backup_file) as tar:
+                tar.extractall(temp_dir)
             
             # Load metadata
             metadata_path = temp_dir / "backup_metadata.json"
@@ -221,7 +193,7 @@ class BackupManager:
             
             # Confirm restore if not forced
             if not force:
-                print(f"\n⚠️  This will overwrite existing databases!")
+                print("\n⚠️  This will overwrite existing databases!")
                 if restore_arrow_db:
                     print(f"   Arrow database: {self.arrow_db_path}")
                 if restore_user_db:
@@ -236,24 +208,24 @@ class BackupManager:
             if restore_arrow_db:
                 arrow_backup = temp_dir / "arrow_database.db"
                 if arrow_backup.exists():
-                    print(f"📊 Restoring arrow database...")
+                    print("📊 Restoring arrow database...")
                     self._restore_db_backup(arrow_backup, self.arrow_db_path)
                 else:
-                    print(f"⚠️  Arrow database not found in backup")
+                    print("⚠️  Arrow database not found in backup")
             
             # Restore user database
             if restore_user_db:
                 user_backup = temp_dir / "user_data.db"
                 if user_backup.exists():
-                    print(f"👤 Restoring user database...")
+                    print("👤 Restoring user database...")
                     self._restore_db_backup(user_backup, self.user_db_path)
                 else:
-                    print(f"⚠️  User database not found in backup")
+                    print("⚠️  User database not found in backup")
             
             # Cleanup
             shutil.rmtree(temp_dir)
             
-            print(f"✅ Restore completed successfully!")
+            print("✅ Restore completed successfully!")
             return True
             
         except Exception as e:
@@ -263,51 +235,25 @@ class BackupManager:
             return False
     
     def list_backups(self) -> List[Dict]:
-        """List all available backups - supports both .tar.gz and .gz files"""
+        """List all available backups - supports .tar.gz, .gz and .tar.zst files"""
         backups = []
         
-        # Look for both .tar.gz and .gz files
-        backup_patterns = ["*.tar.gz", "*.gz"]
+        backup_patterns = ["*.tar.gz", "*.gz", "*.tar.zst"]
         for pattern in backup_patterns:
             for backup_file in self.backup_dir.glob(pattern):
                 try:
                     # Skip .tar.gz files when processing .gz pattern to avoid duplicates
                     if pattern == "*.gz" and backup_file.name.endswith('.tar.gz'):
                         continue
-                        
-                    # Try to extract metadata
-                    temp_dir = self.backup_dir / f"list_temp_{backup_file.stem}"
-                    temp_dir.mkdir(exist_ok=True)
                     
-                    # Handle both .tar.gz and .gz formats
-                    if backup_file.name.endswith('.tar.gz'):
-                        # Standard tar.gz format
-                        with tarfile.open(backup_file, "r:gz") as tar:
-                            try:
-                                metadata_member = tar.getmember("backup_metadata.json")
-                                metadata_file = tar.extractfile(metadata_member)
-                                metadata = json.load(metadata_file)
-                            except:
-                                metadata = {}
-                    elif backup_file.name.endswith('.gz'):
-                        # CDN .gz format
-                        with gzip.open(backup_file, 'rb') as gz_file:
-                            with tarfile.open(fileobj=gz_file, mode='r') as tar:
-                                try:
-                                    metadata_member = tar.getmember("backup_metadata.json")
-                                    metadata_file = tar.extractfile(metadata_member)
-                                    metadata = json.load(metadata_file)
-                                except:
-                                    metadata = {}
-                    else:
-                        continue  # Skip unsupported formats
+                    # Streaming backups store the metadata first, so only one member is decompressed
+                    try:
+                        metadata = read_archive_metadata(backup_file)
+                    except (tarfile.TarError, json.JSONDecodeError, EOFError, OSError):
+                        metadata = {}
                     
-                    # Extract clean backup name (remove both .tar.gz and .gz extensions)
-                    clean_name = backup_file.name
-                    if clean_name.endswith('.tar.gz'):
-                        clean_name = clean_name[:-7]  # Remove .tar.gz
-                    elif clean_name.endswith('.gz'):
-                        clean_name = clean_name[:-3]  # Remove .gz
+                    # Extract clean backup name (remove .tar.gz, .tar.zst and .gz extensions)
+                    clean_name = archive_stem(backup_file)
                     
                     # Generate consistent ID for local backups (hash of filename)
                     import hashlib
@@ -327,9 +273,6 @@ class BackupManager:
                     }
                     backups.append(backup_info)
                     
-                    # Cleanup
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    
                 except Exception as e:
                     print(f"⚠️  Could not read backup {backup_file.name}: {e}")
         
@@ -346,25 +289,24 @@ class BackupManager:
         try:
             print(f"🔍 Verifying backup: {backup_file.name}")
             
-            # Support both .tar.gz and .gz files
-            members = []
-            tar_obj = None
-            
-            if backup_file.name.endswith('.tar.gz'):
-                # Standard tar.gz format
-                tar_obj = tarfile.open(backup_file, "r:gz")
-                members = tar_obj.getnames()
-                print(f"📁 Archive contains {len(members)} files")
-            elif backup_file.name.endswith('.gz'):
-                # CDN .gz format - verify as gzipped tar
-                gz_file = gzip.open(backup_file, 'rb')
-                tar_obj = tarfile.open(fileobj=gz_file, mode='r')
-                members = tar_obj.getnames()
-                print(f"📁 Archive contains {len(members)} files")
-            else:
+            # Supports .tar.gz, CDN .gz and .tar.zst files (read in one streaming pass)
+            if not backup_file.name.endswith(('.gz', '.tar.zst')):
                 print(f"❌ Unsupported backup format: {backup_file.name}")
                 return False
             
+            members = []
+            metadata = None
+            metadata_error = None
+            with open_archive_reader(backup_file) as tar:
+                for member in tar:
+                    members.append(member.name)
+                    if member.name == "backup_metadata.json":
+                        try:
+                            metadata = json.load(tar.extractfile(member))
+                        except Exception as e:
+                            metadata_error = e
+            print(f"📁 Archive contains {len(members)} files")
+            
             # Verify expected files
             expected_files = ["backup_metadata.json"]
             missing_files = []
@@ -376,20 +318,11 @@ class BackupManager:
             if missing_files:
                 print(f"⚠️  Missing files: {', '.join(missing_files)}")
             
-            # Try to extract and verify metadata
-            try:
-                metadata_member = tar_obj.getmember("backup_metadata.json")
-                metadata_file = tar_obj.extractfile(metadata_member)
-                metadata = json.load(metadata_file)
+            if metadata is not None:
                 print(f"📋 Backup created: {metadata.get('created_at', 'Unknown')}")
                 print(f"📋 Includes: {metadata.get('includes', {})}")
-            except Exception as e:
-                print(f"⚠️  Could not read metadata: {e}")
-            finally:
-                if tar_obj:
-                    tar_obj.close()
-                if 'gz_file' in locals():
-                    gz_file.close()
+            elif metadata_error is not None:
+                print(f"⚠️  Could not read metadata: {metadata_error}")
             
             # Verify database files if present
             for db_file in ["arrow_database.db", "user_data.db"]:
@@ -397,7 +330,7 @@ class BackupManager:
                     print(f"✅ Found {db_file}")
                     # TODO: Could add SQLite integrity check here
                 
-            print(f"✅ Backup verification completed")
+            print("✅ Backup verification completed")
             return True
             
         except Exception as e:
@@ -430,22 +363,75 @@ class BackupManager:
         print(f"✅ Cleanup completed: removed {removed_count} backups")
         return removed_count
     
-    def _create_db_backup(self, source_db: Path, backup_db: Path):
-        """Create a backup of a SQLite database using SQLite's backup API"""
-        
-        # Ensure parent directory exists
-        backup_db.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Use SQLite's backup API for consistent backup
-        source_conn = sqlite3.connect(source_db)
-        backup_conn = sqlite3.connect(backup_db)
-        
+    def snapshot_store(self, progress: Optional[Callable[[Dict], None]] = None) -> SnapshotStore:
+        """Incremental snapshot store in <backup_dir>/snapshots"""
+        return SnapshotStore(self.backup_dir / "snapshots", engine=StreamingBackupEngine(progress=progress))
+    
+    def _snapshot_databases(self, include_arrow_db: bool = True, include_user_db: bool = True) -> List[Tuple[str, Path]]:
+        databases = []
+        if include_arrow_db and self.arrow_db_path.exists():
+            databases.append(("arrow_database.db", self.arrow_db_path))
+        if include_user_db and self.user_db_path.exists():
+            databases.append(("user_data.db", self.user_db_path))
+        return databases
+    
+    def create_snapshot(self, snapshot_id: Optional[str] = None, include_arrow_db: bool = True, include_user_db: bool = True,
+                        progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Create an incremental snapshot: only database chunks that changed since earlier
+        snapshots are stored (see snapshot_store.py). Returns the snapshot manifest.
+        """
+        databases = self._snapshot_databases(include_arrow_db, include_user_db)
+        if not databases:
+            raise FileNotFoundError("No databases found to snapshot")
+        
+        print(f"📸 Creating snapshot of {', '.join(name for name, _ in databases)}")
+        return self.snapshot_store(progress).create_snapshot(databases, snapshot_id, metadata={
+            "includes": {
+                "arrow_database": any(name == "arrow_database.db" for name, _ in databases),
+                "user_database": any(name == "user_data.db" for name, _ in databases)
+            }
+        })
+    
+    def list_snapshots(self) -> List[Dict]:
+        """List incremental snapshots, newest first"""
+        return self.snapshot_store().list_snapshots()
+    
+    def restore_snapshot(self, snapshot_id: str, restore_arrow_db: bool = True, restore_user_db: bool = True, force: bool = False) -> bool:
+        """Restore databases from an incremental snapshot"""
+        store = self.snapshot_store()
         try:
-            source_conn.backup(backup_conn)
-            print(f"   ✅ Database copied: {source_db.name}")
-        finally:
-            source_conn.close()
-            backup_conn.close()
+            manifest = store.load_manifest(snapshot_id)
+            print(f"📋 Snapshot created: {manifest.get('created_at', 'Unknown')}")
+            
+            targets = {}
+            if restore_arrow_db:
+                targets["arrow_database.db"] = self.arrow_db_path
+            if restore_user_db:
+                targets["user_data.db"] = self.user_db_path
+            
+            if not force:
+                print("\n⚠️  This will overwrite existing databases!")
+                for name, target in targets.items():
+                    if name in manifest.get("databases", {}):
+                        print(f"   {name}: {target}")
+                
+                response = input("Continue? (y/N): ").lower().strip()
+                if response != 'y':
+                    print("❌ Restore cancelled")
+                    return False
+            
+            restored = store.restore_snapshot(snapshot_id, targets)
+            if not restored:
+                print(f"❌ Snapshot {snapshot_id} contains none of the requested databases")
+                return False
+            
+            print("✅ Restore completed successfully!")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Snapshot restore failed: {e}")
+            return False
     
     def _restore_db_backup(self, backup_db: Path, target_db: Path):
         """Restore a SQLite database from backup"""
@@ -462,38 +448,6 @@ class BackupManager:
         # Copy the backup to target location
         shutil.copy2(backup_db, target_db)
         print(f"   ✅ Database restored: {target_db.name}")
-    
-    def _get_db_stats(self, db_path: Path) -> Dict:
-        """Get basic statistics from a database"""
-        
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Get table list
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            stats = {
-                "file_size_mb": db_path.stat().st_size / (1024 * 1024),
-                "table_count": len(tables),
-                "tables": {}
-            }
-            
-            # Get row counts for each table
-            for table in tables:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM [{table}]")
-                    count = cursor.fetchone()[0]
-                    stats["tables"][table] = count
-                except:
-                    stats["tables"][table] = "unknown"
-            
-            conn.close()
-            return stats
-            
-        except Exception as e:
-            return {"error": str(e)}
 
 
 def main():
@@ -505,6 +459,7 @@ def main():
     backup_parser.add_argument('--name', help='Backup name (auto-generated if not provided)')
     backup_parser.add_argument('--arrow-db-only', action='store_true', help='Backup only arrow database')
     backup_parser.add_argument('--user-db-only', action='store_true', help='Backup only user database')
+    backup_parser.add_argument('--compression', choices=['gzip', 'zstd'], help='Archive compression (default: BACKUP_COMPRESSION or gzip)')
     backup_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
     
     # Restore backup command
@@ -529,6 +484,29 @@ def main():
     cleanup_parser.add_argument('--keep', type=int, default=10, help='Number of backups to keep')
     cleanup_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
     
+    # Incremental snapshot commands
+    snapshot_parser = subparsers.add_parser('snapshot', help='Create an incremental snapshot (only changed chunks are stored)')
+    snapshot_parser.add_argument('--name', help='Snapshot name (auto-generated if not provided)')
+    snapshot_parser.add_argument('--arrow-db-only', action='store_true', help='Snapshot only arrow database')
+    snapshot_parser.add_argument('--user-db-only', action='store_true', help='Snapshot only user database')
+    snapshot_parser.add_argument('--upload', action='store_true', help='Upload new chunks and the manifest to the CDN')
+    snapshot_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
+    
+    snapshots_parser = subparsers.add_parser('snapshots', help='List incremental snapshots')
+    snapshots_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
+    
+    restore_snapshot_parser = subparsers.add_parser('restore-snapshot', help='Restore from an incremental snapshot')
+    restore_snapshot_parser.add_argument('snapshot_id', help='Snapshot name')
+    restore_snapshot_parser.add_argument('--arrow-db-only', action='store_true', help='Restore only arrow database')
+    restore_snapshot_parser.add_argument('--user-db-only', action='store_true', help='Restore only user database')
+    restore_snapshot_parser.add_argument('--from-cdn', action='store_true', help='Download the manifest and missing chunks from the CDN first')
+    restore_snapshot_parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+    restore_snapshot_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
+    
+    prune_parser = subparsers.add_parser('prune-snapshots', help='Remove old snapshots and unreferenced chunks')
+    prune_parser.add_argument('--keep', type=int, default=48, help='Number of snapshots to keep')
+    prune_parser.add_argument('--backup-dir', default='/app/backups', help='Backup directory')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -545,7 +523,8 @@ def main():
         backup_path = backup_manager.create_backup(
             backup_name=args.name,
             include_arrow_db=include_arrow,
-            include_user_db=include_user
+            include_user_db=include_user,
+            compression=args.compression
         )
         print(f"\n🎉 Backup created: {backup_path}")
         
@@ -561,9 +540,9 @@ def main():
         )
         
         if success:
-            print(f"\n🎉 Restore completed successfully!")
+            print("\n🎉 Restore completed successfully!")
         else:
-            print(f"\n❌ Restore failed!")
+            print("\n❌ Restore failed!")
             sys.exit(1)
         
     elif args.command == 'list':
@@ -593,14 +572,68 @@ def main():
         success = backup_manager.verify_backup(args.backup_file)
         
         if success:
-            print(f"\n✅ Backup verification passed!")
+            print("\n✅ Backup verification passed!")
         else:
-            print(f"\n❌ Backup verification failed!")
+            print("\n❌ Backup verification failed!")
             sys.exit(1)
         
     elif args.command == 'cleanup':
         removed_count = backup_manager.cleanup_old_backups(args.keep)
         print(f"\n🎉 Cleanup completed: removed {removed_count} old backups")
+        
+    elif args.command == 'snapshot':
+        manifest = backup_manager.create_snapshot(
+            snapshot_id=args.name,
+            include_arrow_db=not args.user_db_only,
+            include_user_db=not args.arrow_db_only
+        )
+        if args.upload:
+            from cdn_backup_manager import CDNBackupManager
+            if not CDNBackupManager().upload_snapshot(backup_manager.snapshot_store(), manifest['snapshot_id']):
+                sys.exit(1)
+        print(f"\n🎉 Snapshot created: {manifest['snapshot_id']}")
+        
+    elif args.command == 'snapshots':
+        snapshots = backup_manager.list_snapshots()
+        
+        if not snapshots:
+            print("📸 No snapshots found")
+            return
+        
+        usage = backup_manager.snapshot_store().store_usage()
+        print(f"\n📸 Found {len(snapshots)} snapshots ({usage['chunks']} chunks, {usage['size_mb']:.2f} MB on disk):")
+        print("-" * 80)
+        
+        for snapshot in snapshots:
+            print(f"Name: {snapshot['snapshot_id']}")
+            print(f"Created: {snapshot['created_at']}")
+            for name, database in snapshot['databases'].items():
+                print(f"{name}: {database['size_mb']:.2f} MB in {database['chunks']} chunks")
+            print(f"New chunks: {snapshot['new_chunks']} ({snapshot['written_mb']:.2f} MB), reused: {snapshot['reused_chunks']}")
+            print("-" * 80)
+        
+    elif args.command == 'restore-snapshot':
+        if args.from_cdn:
+            from cdn_backup_manager import CDNBackupManager
+            if not CDNBackupManager().download_snapshot(backup_manager.snapshot_store(), args.snapshot_id):
+                sys.exit(1)
+        
+        success = backup_manager.restore_snapshot(
+            snapshot_id=args.snapshot_id,
+            restore_arrow_db=not args.user_db_only,
+            restore_user_db=not args.arrow_db_only,
+            force=args.force
+        )
+        
+        if success:
+            print("\n🎉 Restore completed successfully!")
+        else:
+            print("\n❌ Restore failed!")
+            sys.exit(1)
+        
+    elif args.command == 'prune-snapshots':
+        result = backup_manager.snapshot_store().prune(args.keep)
+        print(f"\n🎉 Prune completed: removed {result['snapshots_removed']} snapshots, {result['chunks_removed']} chunks")
 
 
 if __name__ == "__main__":
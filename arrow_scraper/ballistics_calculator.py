@@ -9,6 +9,8 @@ from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from perf_monitor import timed
+
 class ArrowType(Enum):
     """Arrow types for ballistics calculations"""
     TARGET = "target"
@@ -108,6 +110,7 @@ class BallisticsCalculator:
             ArrowType.THREE_D: 0.38  # Optimized for accuracy
         }
     
+    @timed('ballistics.enhanced_trajectory')
     def calculate_enhanced_trajectory(self, arrow_speed_fps: float, arrow_weight_grains: float,
                            arrow_diameter_inches: float, arrow_type: ArrowType,
                            environmental: EnvironmentalConditions,
@@ -143,6 +146,7 @@ class BallisticsCalculator:
         
         return trajectory_result
     
+    @timed('ballistics.compare_points')
     def compare_field_point_vs_broadhead(self, arrow_speed_fps: float, arrow_weight_grains: float,
                                         arrow_diameter_inches: float, arrow_type: ArrowType,
                                         environmental: EnvironmentalConditions,
@@ -188,6 +192,7 @@ class BallisticsCalculator:
             "practical_notes": self._get_practical_broadhead_notes(broadhead_specs, comparison_analysis)
         }
     
+    @timed('ballistics.trajectory')
     def calculate_trajectory(self, arrow_speed_fps: float, arrow_weight_grains: float,
                            arrow_diameter_inches: float, arrow_type: ArrowType,
                            environmental: EnvironmentalConditions,
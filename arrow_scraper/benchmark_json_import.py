@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: json.load vs streaming import of a large arrow export
+Generates a synthetic export (100MB by default) and reports wall time and peak Python
+heap (tracemalloc) for parsing the whole file, streaming it, and a full streamed import.
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from database_import_manager import DatabaseImportManager
+from json_stream import iter_arrows
+
+
+def write_synthetic_export(path: Path, target_mb: int) -> int:
+    """Write {"manufacturer": ..., "arrows": [...]} until the file reaches target_mb"""
+    target_bytes = target_mb * 1024 * 1024
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"manufacturer": "Benchmark Arrows", "scraping_date": "2025-01-01T00:00:00", "arrows": [\n')
+        while f.tell() < target_bytes:
+            arrow = {
+                "model_name": f"Benchmark Shaft {count:07d}",
+                "material": "Carbon",
+                "arrow_type": "target",
+                "description": "Synthetic arrow used to benchmark streaming imports. " * 4,
+                "source_url": f"https://example.com/arrows/{count}",
+                "primary_image_url": f"https://example.com/images/{count}.jpg",
+                "spine_specifications": [
+                    {"spine": spine, "outer_diameter": 0.295, "inner_diameter": 0.246,
+                     "gpi_weight": round(6.0 + spine / 200, 2), "length_options": [28, 29, 30, 31, 32]}
+                    for spine in (250, 300, 350, 400, 500, 600)
+                ]
+            }
+            f.write((',\n' if count else '') + json.dumps(arrow))
+            count += 1
+        f.write('\n], "total_arrows": %d}\n' % count)
+    return count
+
+
+def create_schema(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE arrows (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, manufacturer TEXT NOT NULL, model_name TEXT NOT NULL,
+            material TEXT, arrow_type TEXT, description TEXT, image_url TEXT, source_url TEXT,
+            created_at TEXT
+        );
+        CREATE INDEX idx_arrows_manufacturer ON arrows (manufacturer, model_name);
+        CREATE TABLE spine_specifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, arrow_id INTEGER, spine TEXT, outer_diameter REAL,
+            inner_diameter REAL, gpi_weight REAL, length_options TEXT
+        );
+        CREATE INDEX idx_specs_arrow ON spine_specifications (arrow_id);
+    """)
+    conn.close()
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"   {label:<28} {elapsed:8.2f}s   peak {peak / 1024 / 1024:8.1f} MB   ({result})")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming JSON import")
+    parser.add_argument("--size-mb", type=int, default=100, help="Size of the synthetic export")
+    parser.add_argument("--skip-import", action="store_true", help="Only benchmark parsing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        export = tmp / "benchmark_arrows.json"
+        print(f"📝 Writing {args.size_mb}MB synthetic export...")
+        count = write_synthetic_export(export, args.size_mb)
+        print(f"   {count} arrows, {export.stat().st_size / 1024 / 1024:.1f} MB")
+
+        print("📊 Results:")
+
+        def full_load():
+            with open(export, 'r', encoding='utf-8') as f:
+                return f"{len(json.load(f)['arrows'])} arrows"
+
+        def stream_only():
+            return f"{sum(1 for _ in iter_arrows(export))} arrows"
+
+        measure("json.load", full_load)
+        measure("streaming parse", stream_only)
+
+        if not args.skip_import:
+            db_path = tmp / "benchmark.db"
+            create_schema(db_path)
+            manager = DatabaseImportManager(str(db_path), str(tmp))
+
+            def streamed_import():
+                return f"{manager.import_arrow_data(manager.stream_json_data(export))} arrows imported"
+
+            measure("streamed import", streamed_import)
+            measure("streamed re-import", streamed_import)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark: equipment model typeahead with 100k learned models
+Fills a temporary database with synthetic equipment_models rows (one hot manufacturer/category
+holding a large share), then compares per-keystroke latency of the previous SQL query
+(fresh connection, LIKE '%q%', julianday relevance per row) with ModelSuggestionIndex, checks
+both return the same models, and times learning an entry synchronously vs. queued.
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from model_suggestion_index import ModelSuggestionIndex
+
+CATEGORIES = ['Sight', 'String', 'Stabilizer', 'Arrow Rest', 'Weight', 'Scope', 'Plunger',
+              'Release', 'compound_bows', 'recurve_risers']
+WORDS = ['pro', 'elite', 'hunter', 'target', 'carbon', 'micro', 'max', 'ultra', 'tour', 'x',
+         'series', 'lite', 'hd', 'custom', 'field', 'sport', 'apex', 'vector', 'nova', 'titan']
+
+OLD_SUGGESTION_SQL = '''
+    SELECT model_name, usage_count, last_used,
+           (usage_count * 0.7 +
+            (julianday('now') - julianday(last_used)) * -0.3) as relevance_score
+    FROM equipment_models
+    WHERE LOWER(manufacturer_name) = LOWER(?) AND category_name = ?
+'''
+
+
+def create_database(db_path: Path, models: int, hot_share: float, seed: int):
+    """equipment_models / equipment_usage_stats as created by migration 020, filled with models rows"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+        CREATE TABLE equipment_models (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            manufacturer_name TEXT NOT NULL, model_name TEXT NOT NULL, category_name TEXT NOT NULL,
+            usage_count INTEGER DEFAULT 1, last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP, created_by_user_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(manufacturer_name, model_name, category_name)
+        );
+        CREATE TABLE equipment_usage_stats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            manufacturer_name TEXT NOT NULL, model_name TEXT NOT NULL, category_name TEXT NOT NULL,
+            monthly_usage INTEGER DEFAULT 0, total_usage INTEGER DEFAULT 0,
+            period_start DATE NOT NULL, period_end DATE NOT NULL,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(manufacturer_name, model_name, category_name, period_start)
+        );
+        CREATE INDEX idx_equipment_models_manufacturer ON equipment_models(manufacturer_name);
+        CREATE INDEX idx_equipment_models_category ON equipment_models(category_name);
+        CREATE INDEX idx_equipment_models_usage ON equipment_models(usage_count DESC);
+        CREATE INDEX idx_equipment_models_last_used ON equipment_models(last_used DESC);
+    ''')
+    start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=400)
+    rows = []
+    for i in range(models):
+        if rng.random() < hot_share:
+            manufacturer, category = 'Hot Archery', 'Sight'
+        else:
+            manufacturer, category = f"Maker {rng.randrange(300):03d}", rng.choice(CATEGORIES)
+        name = ' '.join(rng.sample(WORDS, rng.randint(1, 3))).title() + f" {i:06d}"
+        # 293s apart: no two rows reach the same relevance score, so ties cannot reorder results
+        last_used = (start + timedelta(seconds=i * 293)).strftime('%Y-%m-%d %H:%M:%S')
+        rows.append((manufacturer, name, category, int(rng.paretovariate(1.2)), last_used))
+    conn.executemany('''
+        INSERT INTO equipment_models (manufacturer_name, model_name, category_name, usage_count, last_used)
+        VALUES (?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+    return rows
+
+
+def old_suggestions(db_path: Path, manufacturer: str, category: str, query: str, limit: int):
+    """The query get_model_suggestions used to run on every keystroke"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        sql, params = OLD_SUGGESTION_SQL, [manufacturer, category]
+        if query:
+            sql += ' AND LOWER(model_name) LIKE LOWER(?)'
+            params.append(f'%{query}%')
+        sql += ' ORDER BY relevance_score DESC, usage_count DESC LIMIT ?'
+        params.append(limit)
+        return [row['model_name'] for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def old_learn(db_path: Path, manufacturer: str, model: str, category: str, user_id: int):
+    """Synchronous equipment_models upsert + count read-back, as learn_equipment_entry did"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('''
+            INSERT OR REPLACE INTO equipment_models
+            (manufacturer_name, model_name, category_name, usage_count, last_used, created_by_user_id, first_seen)
+            VALUES (?, ?, ?,
+                    COALESCE((SELECT usage_count FROM equipment_models
+                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), 0) + 1,
+                    CURRENT_TIMESTAMP, ?,
+                    COALESCE((SELECT first_seen FROM equipment_models
+                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), CURRENT_TIMESTAMP))
+        ''', (manufacturer, model, category, manufacturer, model, category, user_id,
+              manufacturer, model, category))
+        conn.execute('SELECT usage_count FROM equipment_models WHERE manufacturer_name = ? AND model_name = ? '
+                     'AND category_name = ?', (manufacturer, model, category)).fetchone()
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+    return f"p50 {pick(0.5):7.3f}ms   p95 {pick(0.95):7.3f}ms   max {samples[-1] * 1000:7.3f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark equipment model typeahead")
+    parser.add_argument("--models", type=int, default=100_000, help="Learned models in the database")
+    parser.add_argument("--hot-share", type=float, default=0.2, help="Share of models in the hot bucket")
+    parser.add_argument("--queries", type=int, default=2000, help="Keystrokes to time")
+    parser.add_argument("--learns", type=int, default=500, help="Learned entries to time")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "benchmark.db"
+        print(f"📝 Creating {args.models} learned models...")
+        rows = create_database(db_path, args.models, args.hot_share, args.seed)
+
+        index = ModelSuggestionIndex(str(db_path))
+        started = time.perf_counter()
+        index.load()
+        print(f"   Index load: {time.perf_counter() - started:.2f}s")
+
+        # Typeahead keystrokes: growing prefixes of real names, half of them in the hot bucket
+        keystrokes = []
+        while len(keystrokes) < args.queries:
+            manufacturer, name, category = rng.choice(rows)[:3]
+            if rng.random() < 0.5:
+                manufacturer, category = 'Hot Archery', 'Sight'
+                name = rng.choice(WORDS) + ' ' + f"{rng.randrange(args.models):06d}"
+            word = name.lower() if rng.random() < 0.3 else rng.choice(name.lower().split())
+            keystrokes.extend((manufacturer, category, word[:length]) for length in range(0, len(word) + 1))
+        keystrokes = keystrokes[:args.queries]
+
+        old_times, new_times, mismatches = [], [], 0
+        for manufacturer, category, query in keystrokes:
+            started = time.perf_counter()
+            expected = old_suggestions(db_path, manufacturer, category, query, 10)
+            old_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            actual = [s['model_name'] for s in index.suggestions(manufacturer, category, query, 10)]
+            new_times.append(time.perf_counter() - started)
+            mismatches += actual != expected
+
+        print(f"📊 Suggestions ({len(keystrokes)} keystrokes, limit 10):")
+        print(f"   SQL LIKE        {percentiles(old_times)}")
+        print(f"   Index           {percentiles(new_times)}")
+        print(f"   Result mismatches: {mismatches}")
+
+        learns = [rng.choice(rows)[:3] for _ in range(args.learns)]
+        old_learn_times, new_learn_times = [], []
+        for manufacturer, model, category in learns:
+            started = time.perf_counter()
+            old_learn(db_path, manufacturer, model, category, 1)
+            old_learn_times.append(time.perf_counter() - started)
+        index.load()
+        for manufacturer, model, category in learns:
+            started = time.perf_counter()
+            index.record_usage(manufacturer, model, category, 1)
+            new_learn_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        written = index.flush()
+        flush_time = time.perf_counter() - started
+        index.close()
+
+        print(f"📊 Learning ({args.learns} entries):")
+        print(f"   Synchronous     {percentiles(old_learn_times)}")
+        print(f"   Queued          {percentiles(new_learn_times)}")
+        print(f"   Batched write: {written} models in {flush_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot
+Exports the arrow catalog (arrows, spine specifications, manufacturer status) to a compact,
+versioned columnar file that is memory-mapped read-only, so every gunicorn worker shares the
+same pages instead of re-querying SQLite to warm up, and analytics scripts can scan it offline.
+
+File layout: 8-byte magic, 8-byte header length, JSON header, then 8-byte aligned column
+blocks. Numeric columns are raw int64/float64 arrays (NULL = INT_NULL / NaN); text columns are
+dictionary encoded (int32 codes, -1 = NULL, plus uint64 offsets into a UTF-8 blob).
+"""
+
+import json
+import logging
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+MAGIC = b"ACSNAP01"
+FORMAT_VERSION = 1
+INT_NULL = -(2 ** 63)
+
+# Columns exported when present in the database (older schemas lack some of them)
+SNAPSHOT_COLUMNS = {
+    "arrows": ["id", "manufacturer", "model_name", "material", "carbon_content", "arrow_type",
+               "description", "image_url", "source_url"],
+    "spine_specifications": ["id", "arrow_id", "spine", "outer_diameter", "inner_diameter",
+                             "gpi_weight", "diameter_category", "length_options"],
+    "manufacturers": ["id", "name", "is_active", "country", "website_url"],
+}
+
+# Writes to these tables bump catalog_version (triggers from migrations 066 and 071).
+# manufacturer_equipment_categories is not in the snapshot, but the manufacturer suggestion
+# index (manufacturer_matcher.py) follows the version too
+CATALOG_TABLES = ("arrows", "spine_specifications", "manufacturers", "manufacturer_equipment_categories")
+
+logger = logging.getLogger(__name__)
+
+
+def get_catalog_version(conn: sqlite3.Connection) -> Optional[int]:
+    """Current catalog version, or None when version tracking is not installed"""
+    try:
+        row = conn.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def _column_type(values: Sequence[Any]) -> str:
+    kinds = {type(v) for v in values if v is not None}
+    if kinds and kinds <= {int, bool}:
+        return "i8"
+    if kinds and kinds <= {int, float, bool}:
+        return "f8"
+    return "str"
+
+
+def _encode_column(values: Sequence[Any]):
+    """Return (type, {block name: bytes}, extra header fields) for one column"""
+    column_type = _column_type(values)
+    if column_type == "i8":
+        return column_type, {"values": array("q", (INT_NULL if v is None else int(v) for v in values)).tobytes()}, {}
+    if column_type == "f8":
+        return column_type, {"values": array("d", (math.nan if v is None else float(v) for v in values)).tobytes()}, {}
+
+    dictionary: Dict[str, int] = {}
+    codes = array("i")
+    for value in values:
+        if value is None:
+            codes.append(-1)
+            continue
+        text = value if isinstance(value, str) else str(value)
+        code = dictionary.get(text)
+        if code is None:
+            code = dictionary[text] = len(dictionary)
+        codes.append(code)
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for text in dictionary:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    return "str", {"codes": codes.tobytes(), "offsets": offsets.tobytes(), "data": bytes(blob)}, {"distinct": len(dictionary)}
+
+
+def export_catalog_snapshot(db_path, snapshot_path, catalog_version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Write a snapshot of the catalog tables
+
+    Args:
+        db_path: Arrow database
+        snapshot_path: Output file (written to a temp file and renamed into place)
+        catalog_version: Version to record (read from the database when omitted)
+
+    Returns:
+        The snapshot header
+    """
+    started = time.perf_counter()
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        # One read transaction so the version and the rows belong together
+        conn.execute("BEGIN")
+        if catalog_version is None:
+            catalog_version = get_catalog_version(conn)
+        existing_tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+        header: Dict[str, Any] = {
+            "format": FORMAT_VERSION, "catalog_version": catalog_version,
+            "created_at": datetime.now().isoformat(), "byteorder": sys.byteorder, "tables": {}
+        }
+        blocks: List[bytes] = []
+        offset = 0
+        for table, wanted in SNAPSHOT_COLUMNS.items():
+            if table not in existing_tables:
+                continue
+            available = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            columns = [c for c in wanted if c in available]
+            rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id").fetchall()
+            table_header = {"rows": len(rows), "columns": {}}
+            for index, column in enumerate(columns):
+                column_type, column_blocks, extra = _encode_column([row[index] for row in rows])
+                column_header = dict(extra, type=column_type)
+                for name, data in column_blocks.items():
+                    column_header[name] = [offset, len(data)]
+                    padding = -len(data) % 8
+                    blocks.append(data + b"\0" * padding)
+                    offset += len(data) + padding
+                table_header["columns"][column] = column_header
+            header["tables"][table] = table_header
+        conn.rollback()
+    finally:
+        conn.close()
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-len(header_bytes) % 8)
+    snapshot_path = Path(snapshot_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = snapshot_path.with_name(f".{snapshot_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, snapshot_path)
+
+    logger.info(f"📦 Catalog snapshot v{catalog_version} written to {snapshot_path} "
+                f"({snapshot_path.stat().st_size / 1024:.0f} KB in {time.perf_counter() - started:.2f}s)")
+    return header
+
+
+class StringColumn:
+    """Dictionary-encoded text column backed by the mapped file"""
+
+    def __init__(self, codes: memoryview, offsets: memoryview, data: memoryview):
+        self.codes = codes
+        self._offsets = offsets
+        self._data = data
+        self._values: Optional[List[str]] = None
+
+    @property
+    def values(self) -> List[str]:
+        """Distinct values, decoded on first use"""
+        if self._values is None:
+            offsets, data = self._offsets, self._data
+            self._values = [bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8") for i in range(len(offsets) - 1)]
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        code = self.codes[index]
+        return None if code < 0 else self.values[code]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        values = self.values
+        for code in self.codes:
+            yield None if code < 0 else values[code]
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view of a catalog snapshot file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:8] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a catalog snapshot: {self.path}")
+        header_length = struct.unpack("<Q", self._mm[8:16])[0]
+        self.header = json.loads(self._mm[16:16 + header_length])
+        if self.header.get("format") != FORMAT_VERSION or self.header.get("byteorder") != sys.byteorder:
+            self._mm.close()
+            raise ValueError(f"Incompatible catalog snapshot: {self.path}")
+        self._data_start = 16 + header_length
+        self._view = memoryview(self._mm)
+        self._columns: Dict[tuple, Any] = {}
+
+    @property
+    def catalog_version(self) -> Optional[int]:
+        return self.header.get("catalog_version")
+
+    @property
+    def tables(self) -> List[str]:
+        return list(self.header["tables"])
+
+    def num_rows(self, table: str) -> int:
+        return self.header["tables"].get(table, {}).get("rows", 0)
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self.header["tables"].get(table, {}).get("columns", {})
+
+    def _block(self, spec, fmt: str) -> memoryview:
+        offset, length = spec
+        start = self._data_start + offset
+        return self._view[start:start + length].cast(fmt)
+
+    def column(self, table: str, column: str):
+        """Zero-copy column: memoryview of int64/float64 values, or a StringColumn"""
+        key = (table, column)
+        if key not in self._columns:
+            spec = self.header["tables"][table]["columns"][column]
+            if spec["type"] == "i8":
+                self._columns[key] = self._block(spec["values"], "q")
+            elif spec["type"] == "f8":
+                self._columns[key] = self._block(spec["values"], "d")
+            else:
+                self._columns[key] = StringColumn(self._block(spec["codes"], "i"),
+                                                  self._block(spec["offsets"], "Q"),
+                                                  self._block(spec["data"], "B"))
+        return self._columns[key]
+
+    def values(self, table: str, column: str) -> Iterator[Any]:
+        """Column values as Python objects with NULLs restored to None"""
+        data = self.column(table, column)
+        if isinstance(data, StringColumn):
+            yield from data
+        elif data.format == "q":
+            for value in data:
+                yield None if value == INT_NULL else value
+        else:
+            for value in data:
+                yield None if math.isnan(value) else value
+
+    def rows(self, table: str, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate rows as dicts (all exported columns by default)"""
+        if table not in self.header["tables"]:
+            return
+        columns = list(columns or self.header["tables"][table]["columns"])
+        for row in zip(*(self.values(table, column) for column in columns)):
+            yield dict(zip(columns, row))
+
+    def value_counts(self, table: str, column: str) -> Dict[Any, int]:
+        """Non-NULL value -> row count, sorted by value (like GROUP BY ... ORDER BY value)"""
+        if not self.has_column(table, column):
+            return {}
+        counts: Dict[Any, int] = {}
+        data = self.column(table, column)
+        if isinstance(data, StringColumn):
+            per_code: Dict[int, int] = {}
+            for code in data.codes:
+                if code >= 0:
+                    per_code[code] = per_code.get(code, 0) + 1
+            values = data.values
+            counts = {values[code]: count for code, count in per_code.items()}
+        else:
+            for value in self.values(table, column):
+                if value is not None:
+                    counts[value] = counts.get(value, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def _range(self, column: str, low_key: str, high_key: str) -> Dict[str, Any]:
+        values = [v for v in self.values("spine_specifications", column) if v is not None] \
+            if self.has_column("spine_specifications", column) else []
+        return {low_key: min(values) if values else None, high_key: max(values) if values else None}
+
+    def statistics(self) -> Dict[str, Any]:
+        """Same shape as ArrowDatabase.get_statistics, computed from the snapshot"""
+        arrow_manufacturer: Dict[int, Optional[str]] = dict(zip(self.values("arrows", "id"),
+                                                                self.values("arrows", "manufacturer")))
+        arrow_counts: Dict[Optional[str], int] = {}
+        for manufacturer in arrow_manufacturer.values():
+            arrow_counts[manufacturer] = arrow_counts.get(manufacturer, 0) + 1
+        spec_counts = {manufacturer: 0 for manufacturer in arrow_counts}
+        if self.num_rows("spine_specifications"):
+            for arrow_id in self.values("spine_specifications", "arrow_id"):
+                if arrow_id in arrow_manufacturer:
+                    spec_counts[arrow_manufacturer[arrow_id]] += 1
+
+        manufacturers = [{"manufacturer": m, "arrow_count": count, "spec_count": spec_counts[m]}
+                         for m, count in sorted(arrow_counts.items(), key=lambda item: -item[1])]
+
+        diameter_categories = [{"diameter_category": category, "count": count}
+                               for category, count in sorted(self.value_counts("spine_specifications", "diameter_category").items(),
+                                                             key=lambda item: -item[1])]
+        return {
+            "total_arrows": self.num_rows("arrows"),
+            "total_specifications": self.num_rows("spine_specifications"),
+            "total_manufacturers": len(manufacturers),
+            "manufacturers": manufacturers,
+            "spine_range": self._range("spine", "min_spine", "max_spine"),
+            "gpi_range": self._range("gpi_weight", "min_gpi", "max_gpi"),
+            "diameter_range": self._range("outer_diameter", "min_diameter", "max_diameter"),
+            "diameter_categories": diameter_categories
+        }
+
+    def close(self):
+        self._columns.clear()
+        self._view.release()
+        self._mm.close()
+
+
+class CatalogSnapshotManager:
+    """Keeps a snapshot in sync with the catalog version and hands out the mapped copy"""
+
+    def __init__(self, db_path, snapshot_dir=None, check_interval: float = 5.0):
+        """
+        Args:
+            db_path: Arrow database
+            snapshot_dir: Where snapshots are kept (default: catalog_snapshots/ next to the database)
+            check_interval: Seconds between catalog version checks
+        """
+        self.db_path = Path(db_path)
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else self.db_path.parent / "catalog_snapshots"
+        self.check_interval = check_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._checked_at = -math.inf
+        self._untracked_logged = False
+        self._lock = threading.Lock()
+
+    def snapshot_path(self, version: int) -> Path:
+        return self.snapshot_dir / f"catalog-v{version}.snap"
+
+    def get_catalog_version(self) -> Optional[int]:
+        """Read-only: migration 066 installs the counter and its triggers"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return get_catalog_version(conn)
+        finally:
+            conn.close()
+
+    def export(self, version: Optional[int] = None) -> Path:
+        """Write the snapshot for the current (or given) version and prune older ones"""
+        version = self.get_catalog_version() if version is None else version
+        if version is None:
+            raise RuntimeError("catalog version tracking is not installed (run migration 066)")
+        path = self.snapshot_path(version)
+        export_catalog_snapshot(self.db_path, path, version)
+        for old in self.snapshot_dir.glob("catalog-v*.snap"):
+            if old != path:
+                # Workers still mapping the old file keep their pages until they remap
+                old.unlink(missing_ok=True)
+        return path
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """Mapped snapshot for the current catalog version, regenerated when the catalog changed"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at < self.check_interval:
+                return self._snapshot
+            self._checked_at = now
+            try:
+                version = self.get_catalog_version()
+                if version is None:
+                    # Without the counter a snapshot could go stale unnoticed: callers query SQLite
+                    if not self._untracked_logged:
+                        logger.warning("Catalog snapshot disabled: catalog version tracking is not installed")
+                        self._untracked_logged = True
+                    return None
+                if self._snapshot is not None and self._snapshot.catalog_version == version:
+                    return self._snapshot
+
+                path = self.snapshot_path(version)
+                if not path.exists():
+                    path = self.export(version)
+                snapshot = CatalogSnapshot(path)
+            except Exception as e:
+                logger.warning(f"Catalog snapshot unavailable: {e}")
+                return self._snapshot
+
+            previous, self._snapshot = self._snapshot, snapshot
+            if previous is not None:
+                try:
+                    previous.close()
+                except BufferError:
+                    # Still referenced by a caller; the mapping is released when it is collected
+                    pass
+            return snapshot
+
+
+def main():
+    """Export a catalog snapshot or show what is in one"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Arrow catalog snapshot")
+    parser.add_argument("--database", default=os.environ.get("ARROW_DATABASE_PATH", "arrow_database.db"))
+    parser.add_argument("--snapshot-dir", default=None, help="Snapshot directory (default: next to database)")
+    parser.add_argument("--show", action="store_true", help="Print statistics from the current snapshot")
+    args = parser.parse_args()
+
+    manager = CatalogSnapshotManager(args.database, args.snapshot_dir)
+    if not args.show:
+        path = manager.export()
+        print(f"✅ Wrote {path} ({path.stat().st_size / 1024:.0f} KB)")
+    snapshot = manager.current()
+    if snapshot is None:
+        print("❌ No catalog snapshot available")
+        return
+    stats = snapshot.statistics()
+    print(f"📦 Catalog v{snapshot.catalog_version}: {stats['total_arrows']} arrows, "
+          f"{stats['total_specifications']} spine specs, {stats['total_manufacturers']} manufacturers")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ from datetime import datetime, timezone
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# Remote folder of incremental snapshots (chunks/ and manifests/ below it)
+SNAPSHOT_CDN_PATH = "arrows/backups/snapshots/"
+
 @dataclass
 class BackupInfo:
     """Standardized backup information across all CDN providers"""
@@ -91,7 +94,7 @@ class BunnyCDNProvider(CDNProvider):
                 
                 for file_info in files:
                     filename = file_info.get('ObjectName', '')
-                    if filename.endswith('.tar.gz') or filename.endswith('.gz'):
+                    if filename.endswith(('.tar.gz', '.gz', '.tar.zst')):
                         backup_info = self._parse_backup_file_info(file_info, backup_path)
                         if backup_info:
                             backups.append(backup_info)
@@ -338,11 +341,81 @@ class CDNBackupManager:
             print(f"❌ Failed to upload backup to CDN: {e}")
             return None
     
+    def upload_snapshot(self, store, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Upload an incremental snapshot: only chunks not uploaded before, then its manifest
+
+        Chunks go to SNAPSHOT_CDN_PATH/chunks/<hash> and manifests to SNAPSHOT_CDN_PATH/manifests/.
+        Uploaded hashes are remembered per provider in the snapshot store, so an hourly snapshot
+        only sends the chunks that changed since the last one.
+        """
+        if not self.primary_provider:
+            print("❌ No primary CDN provider configured")
+            return None
+
+        cdn_type = os.getenv('CDN_TYPE', 'bunnycdn')
+        ledger_path = store.store_dir / f"cdn_uploaded_{cdn_type}.txt"
+        uploaded = set(ledger_path.read_text().split()) if ledger_path.exists() else set()
+
+        try:
+            manifest = store.load_manifest(snapshot_id)
+            pending = [digest for digest in store.manifest_chunks(manifest) if digest not in uploaded]
+            uploaded_bytes = 0
+            with open(ledger_path, 'a') as ledger:
+                for digest in pending:
+                    chunk_path = store.chunk_path(digest)
+                    self.primary_provider.upload_backup(str(chunk_path), f"{SNAPSHOT_CDN_PATH}chunks/")
+                    uploaded_bytes += chunk_path.stat().st_size
+                    # Recorded one by one so an interrupted upload resumes where it stopped
+                    ledger.write(digest + "\n")
+                    ledger.flush()
+
+            manifest_url = self.primary_provider.upload_backup(str(store.manifest_path(snapshot_id)),
+                                                               f"{SNAPSHOT_CDN_PATH}manifests/")
+            print(f"✅ Snapshot {snapshot_id} uploaded: {len(pending)} new chunks "
+                  f"({uploaded_bytes / (1024 * 1024):.2f} MB)")
+            return {
+                'manifest_url': manifest_url,
+                'cdn_type': cdn_type,
+                'chunks_uploaded': len(pending),
+                'uploaded_mb': uploaded_bytes / (1024 * 1024),
+            }
+
+        except Exception as e:
+            print(f"❌ Failed to upload snapshot to CDN: {e}")
+            return None
+
+    def download_snapshot(self, store, snapshot_id: str) -> bool:
+        """Fetch a snapshot manifest and the chunks the local store is missing from the primary CDN"""
+        if not self.primary_provider:
+            print("❌ No primary CDN provider configured")
+            return False
+
+        try:
+            if not store.manifest_path(snapshot_id).exists():
+                url = self.primary_provider.get_backup_url(f"{snapshot_id}.json", f"{SNAPSHOT_CDN_PATH}manifests/")
+                response = requests.get(url, timeout=60)
+                response.raise_for_status()
+                store.save_manifest(response.json())
+
+            missing = store.missing_chunks(store.manifest_chunks(store.load_manifest(snapshot_id)))
+            print(f"📥 Downloading {len(missing)} missing chunks for snapshot {snapshot_id}")
+            for digest in missing:
+                url = self.primary_provider.get_backup_url(digest, f"{SNAPSHOT_CDN_PATH}chunks/")
+                response = requests.get(url, timeout=60)
+                response.raise_for_status()
+                store.import_chunk(digest, response.content)
+            return True
+
+        except Exception as e:
+            print(f"❌ Failed to download snapshot from CDN: {e}")
+            return False
+
     def _extract_backup_metadata(self, filename: str) -> Dict[str, Any]:
         """Extract metadata from backup filename"""
         # Default metadata
         metadata = {
-            'display_name': filename.replace('.tar.gz', '').replace('.gz', ''),
+            'display_name': filename.replace('.tar.gz', '').replace('.tar.zst', '').replace('.gz', ''),
             'environment': 'unknown',
             'backup_type': 'full',
             'include_arrow_db': True,
@@ -5,9 +5,11 @@ Uploads scraped images to CDN services for better performance and storage optimi
 """
 
 import os
-import time
+import json
 import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
@@ -41,12 +43,56 @@ try:
 except ImportError:
     S3_AVAILABLE = False
 
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+
+def file_sha256(file_path: str) -> str:
+    """Content hash used to recognise files already uploaded"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class UploadManifest:
+    """Local JSON manifest of uploaded file hashes per CDN, so re-runs skip files already present"""
+    
+    def __init__(self, manifest_path: str = "./data/cdn_manifest.json"):
+        self.manifest_path = Path(manifest_path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.entries = {}
+    
+    def _key(self, cdn_type: str, content_hash: str, image_type: str) -> str:
+        return f"{cdn_type}:{image_type}:{content_hash}"
+    
+    def get(self, cdn_type: str, content_hash: str, image_type: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(self._key(cdn_type, content_hash, image_type))
+    
+    def put(self, cdn_type: str, content_hash: str, image_type: str, result: Dict[str, Any]):
+        with self._lock:
+            self.entries[self._key(cdn_type, content_hash, image_type)] = result
+    
+    def save(self):
+        with self._lock:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1)
+            tmp_path.replace(self.manifest_path)
+
 class CDNUploader:
     """Upload images to CDN services with fallback options"""
     
-    def __init__(self, cdn_type: str = "cloudinary"):
+    def __init__(self, cdn_type: str = "cloudinary", manifest_path: str = None):
         self.cdn_type = cdn_type.lower()
         self.logger = self._setup_logging()
+        self.manifest = UploadManifest(manifest_path or os.getenv('CDN_MANIFEST_PATH', './data/cdn_manifest.json'))
         
         # Initialize CDN client based on type
         if self.cdn_type == "cloudinary":
@@ -473,30 +519,53 @@ class CDNUploader:
         }
         return extensions.get(content_type, 'jpg')
     
+    def upload_if_new(self, file_path: str, manufacturer: str, model_name: str,
+                      image_type: str = "primary") -> Optional[Dict[str, Any]]:
+        """Upload a file unless the manifest shows identical content already on this CDN"""
+        content_hash = file_sha256(file_path)
+        existing = self.manifest.get(self.cdn_type, content_hash, image_type)
+        if existing:
+            return dict(existing, skipped=True)
+        
+        # Content-addressed id so the same bytes never land on the CDN under two names
+        result = self.upload_from_file(file_path, manufacturer, model_name, f"{image_type}_{content_hash[:12]}")
+        if result:
+            result['content_hash'] = content_hash
+            self.manifest.put(self.cdn_type, content_hash, image_type, result)
+        return result
+    
+    def upload_many(self, files: List[tuple], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Upload (file_path, manufacturer, model_name, image_type) tuples in parallel; order is preserved"""
+        if not files:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda args: self.upload_if_new(*args), files))
+        
+        self.manifest.save()
+        skipped = sum(1 for r in results if r and r.get('skipped'))
+        failed = sum(1 for r in results if not r)
+        self.logger.info(f"Uploaded {len(results) - skipped - failed} files, "
+                         f"skipped {skipped} already present, {failed} failed")
+        return results
+    
     def batch_upload_from_directory(self, directory_path: str, 
-                                  manufacturer: str) -> List[Dict[str, Any]]:
-        """Upload all images from a directory"""
+                                  manufacturer: str, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """Upload all images from a directory, plus their pre-sized variants"""
         directory = Path(directory_path)
-        results = []
+        files = []
         
         for image_file in directory.glob('*'):
-            if image_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
+            if image_file.suffix.lower() in IMAGE_EXTENSIONS:
                 # Extract model name from filename
                 model_name = image_file.stem.replace('_', ' ').replace('-', ' ')
+                files.append((str(image_file), manufacturer, model_name, "primary"))
                 
-                result = self.upload_from_file(
-                    str(image_file), 
-                    manufacturer, 
-                    model_name
-                )
-                
-                if result:
-                    results.append(result)
-                
-                # Rate limiting
-                time.sleep(0.1)
+                # WebP variants generated at ingest (variants/<size>/<stem>.webp)
+                for variant in directory.glob(f"variants/*/{image_file.stem}.webp"):
+                    files.append((str(variant), manufacturer, model_name, variant.parent.name))
         
-        return results
+        return [result for result in self.upload_many(files, max_workers=max_workers) if result]
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -12,6 +12,9 @@ from dataclasses import dataclass
 import re
 import threading
 
+import perf_monitor
+from perf_monitor import timed
+
 @dataclass
 class CompatibilityRule:
     """Represents a compatibility rule"""
@@ -44,7 +47,7 @@ class CompatibilityEngine:
     def get_connection(self):
         """Get thread-local database connection"""
         if not hasattr(self.local, 'conn') or self.local.conn is None:
-            self.local.conn = sqlite3.connect(
+            self.local.conn = perf_monitor.connect(
                 self.db_path, 
                 check_same_thread=False,
                 timeout=30.0
@@ -202,6 +205,7 @@ class CompatibilityEngine:
                 self.rules[category] = []
             self.rules[category].extend(rules)
     
+    @timed('compatibility.check')
     def check_compatibility(self, arrow_id: int, component_id: int) -> CompatibilityResult:
         """Check compatibility between arrow and component"""
         try:
@@ -488,6 +492,7 @@ class CompatibilityEngine:
         results.sort(key=lambda x: x.score, reverse=True)
         return results
     
+    @timed('compatibility.compatible_components')
     def get_compatible_components(self, arrow_id: int, 
                                  category: str = None) -> List[Dict[str, Any]]:
         """Get all compatible components for an arrow"""
@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import threading
 
+import perf_monitor
+
 class ComponentDatabase:
     """Database extension for managing arrow components and compatibility"""
     
@@ -26,7 +28,7 @@ class ComponentDatabase:
     def get_connection(self):
         """Get thread-local database connection"""
         if not hasattr(self.local, 'conn') or self.local.conn is None:
-            self.local.conn = sqlite3.connect(
+            self.local.conn = perf_monitor.connect(
                 self.db_path, 
                 check_same_thread=False,
                 timeout=30.0
@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 
 from arrow_database import ArrowDatabase
 from enhance_database_schema import enhance_database_schema
+from sitemap_stream import SitemapState, iter_sitemap_entries
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,16 +39,19 @@ class SitemapProduct:
 class ComprehensiveSitemapScraper:
     """Comprehensive scraper that uses crawl4ai venv and sitemap data"""
     
-    def __init__(self, db_path: str = "arrow_database.db"):
+    def __init__(self, db_path: str = "arrow_database.db", sitemap_path: Optional[str] = None,
+                 only_changed: bool = True):
         self.db = ArrowDatabase(db_path)
-        self.sitemap_path = Path(__file__).parent.parent / "docs" / "sitemap_komponentensuche.json"
+        # Local JSON/XML(.gz) file or sitemap URL, sitemap indexes are followed
+        self.sitemap_path = sitemap_path or Path(__file__).parent.parent / "docs" / "sitemap_komponentensuche.json"
         self.crawl4ai_path = Path(__file__).parent.parent / "crawl4ai"
+        self.sitemap_state = SitemapState()
         
         # Ensure enhanced schema exists
         enhance_database_schema(db_path)
         
-        # Load sitemap data
-        self.sitemap_data = self._load_sitemap()
+        # Load sitemap data (only new/changed URLs unless a full pass is requested)
+        self.sitemap_data = self._load_sitemap(only_changed=only_changed)
         
         # Manufacturer mapping for better matching
         self.manufacturer_mapping = {
@@ -78,16 +82,19 @@ class ComprehensiveSitemapScraper:
             'carbon_impact': 'Carbon Impact'
         }
     
-    def _load_sitemap(self) -> List[Dict]:
-        """Load sitemap data from JSON file"""
+    def _load_sitemap(self, only_changed: bool = True) -> List[Dict]:
+        """Stream sitemap entries; with only_changed, keep URLs that are new or changed since the last scrape"""
         try:
-            if not self.sitemap_path.exists():
+            source = str(self.sitemap_path)
+            if not source.startswith('http') and not Path(source).exists():
                 logger.error(f"Sitemap file not found: {self.sitemap_path}")
                 return []
             
-            with open(self.sitemap_path, 'r', encoding='utf-8') as f:
-                sitemap_data = json.load(f)
+            entries = self.sitemap_state.iter_changed(source) if only_changed else iter_sitemap_entries(source)
+            sitemap_data = [{'loc': entry.loc, 'lastmod': entry.lastmod} for entry in entries]
             
+            if only_changed:
+                self.sitemap_state.print_report()
             logger.info(f"✅ Loaded sitemap with {len(sitemap_data)} URLs")
             return sitemap_data
             
@@ -489,6 +496,9 @@ if __name__ == "__main__":
                 model_name = scraped_item.get('model_name', '')
                 source_url = scraped_item.get('source_url', '')
                 
+                if source_url:
+                    self.sitemap_state.mark_scraped(source_url, scraped_item)
+                
                 if not manufacturer or not model_name:
                     results['errors'].append(f"Missing manufacturer or model for {source_url}")
                     continue
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 import re
 
 @dataclass
@@ -21,12 +21,13 @@ class ContentPattern:
     pattern_type: str  # 'table', 'specs', 'list', etc.
     start_marker: str  # Text that indicates where data starts
     end_marker: str    # Text that indicates where data ends
-    content_slice: Tuple[int, int]  # (start_pos, end_pos) relative positions
+    content_slice: Tuple[int, int]  # Legacy (start_pos, end_pos) offsets, superseded by selectors
     extraction_method: str  # 'text', 'vision', 'knowledge'
     success_count: int = 1
     last_used: str = ""
     confidence_score: float = 1.0
     sample_content: str = ""  # First 200 chars for pattern matching
+    selectors: List[str] = field(default_factory=list)  # Content reducer block selectors, e.g. 'table:spine|gpi'
 
 class ContentPatternLearner:
     """Learns and applies content extraction patterns for faster scraping"""
@@ -81,12 +82,18 @@ class ContentPatternLearner:
         return hashlib.md5(key.encode()).hexdigest()[:16]
     
     def learn_successful_pattern(self, url: str, content: str, manufacturer: str, 
-                                extraction_method: str, extracted_data: List[Any]):
+                                extraction_method: str, extracted_data: List[Any],
+                                selectors: Optional[List[str]] = None):
         """Learn from a successful extraction"""
         if not extracted_data:
             return
             
         domain = urlparse(url).netloc
+        
+        # Block selectors from the content reducer are position-independent, prefer them over offsets
+        if selectors:
+            self._learn_block_selectors(domain, manufacturer, extraction_method, selectors)
+            return
         content_lower = content.lower()
         
         # Detect pattern type and markers
@@ -175,8 +182,46 @@ class ContentPatternLearner:
         
         return None
     
+    def _learn_block_selectors(self, domain: str, manufacturer: str, extraction_method: str, selectors: List[str]):
+        """Record the reducer block selectors that produced a successful extraction"""
+        pattern_id = self.generate_pattern_id(domain, manufacturer, 'block_selectors')
+        
+        if pattern_id in self.patterns:
+            pattern = self.patterns[pattern_id]
+            pattern.success_count += 1
+            pattern.last_used = datetime.now().isoformat()
+            pattern.confidence_score = min(1.0, pattern.confidence_score + 0.1)
+            # Most recently successful selectors first, capped to keep boosts targeted
+            merged = list(selectors) + [s for s in pattern.selectors if s not in selectors]
+            pattern.selectors = merged[:10]
+            print(f"📈 Updated block selectors for {domain} (uses: {pattern.success_count})")
+        else:
+            self.patterns[pattern_id] = ContentPattern(
+                domain=domain,
+                manufacturer=manufacturer,
+                pattern_type='block_selectors',
+                start_marker='',
+                end_marker='',
+                content_slice=(0, 0),
+                extraction_method=extraction_method,
+                success_count=1,
+                last_used=datetime.now().isoformat(),
+                confidence_score=1.0,
+                selectors=list(selectors)[:10]
+            )
+            print(f"🧠 Learned block selectors for {domain}: {', '.join(selectors[:3])}")
+            self.save_patterns()
+    
+    def get_block_selectors(self, url: str, manufacturer: str) -> List[str]:
+        """Get learned content reducer selectors for a domain/manufacturer"""
+        domain = urlparse(url).netloc
+        pattern = self.patterns.get(self.generate_pattern_id(domain, manufacturer, 'block_selectors'))
+        if pattern and pattern.confidence_score > 0.5:
+            return list(pattern.selectors)
+        return []
+    
     def get_optimized_content_slice(self, url: str, content: str, manufacturer: str) -> Optional[Tuple[str, int, int]]:
-        """Get optimized content slice based on learned patterns"""
+        """Get optimized content slice based on learned offset patterns (legacy, see ContentReducer)"""
         domain = urlparse(url).netloc
         content_lower = content.lower()
         
@@ -185,7 +230,8 @@ class ContentPatternLearner:
             pattern for pattern in self.patterns.values()
             if pattern.domain == domain and 
             pattern.manufacturer.lower() == manufacturer.lower() and
-            pattern.confidence_score > 0.5
+            pattern.confidence_score > 0.5 and
+            pattern.pattern_type != 'block_selectors'
         ]
         
         if not matching_patterns:
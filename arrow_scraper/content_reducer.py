@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Token-Budgeted Content Reducer for LLM Extraction
+Parses a crawled page into blocks (tables, spec lists, headings, paragraphs), scores each
+block for specification density and greedily packs the best blocks into a token budget
+"""
+
+import json
+import re
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from urllib.parse import urlparse
+
+from async_llm_client import estimate_tokens
+
+# Keywords that mark specification content (English, German, Italian, French)
+SPEC_KEYWORDS = [
+    'spine', 'gpi', 'grain', 'grains', 'grani', 'diameter', 'durchmesser', 'diametro',
+    'outer', 'inner', 'o.d.', 'i.d.', 'weight', 'gewicht', 'peso', 'poids',
+    'straightness', 'rundlaufgenauigkeit', 'tolerance', 'toleranz', 'length', 'länge',
+    'lunghezza', 'zoll', 'specification', 'specifications', 'technische daten', 'specs',
+    'carbon', 'material', 'nock', 'insert', 'point'
+]
+
+UNIT_PATTERN = re.compile(r'\d\s*(?:mm|cm|in\b|inch|"|gr\b|grain|gpi|zoll|grani|g\b|%)', re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)?')
+SPINE_PATTERN = re.compile(r'\b(?:[2-9]\d{2}|1[0-8]\d{2})\b')
+DIAMETER_PATTERN = re.compile(r'(?:\b0)?[.,][1-4]\d{2}\b')
+LINK_PATTERN = re.compile(r'\]\([^)]*\)|<a\s', re.IGNORECASE)
+NAV_WORDS = ['menu', 'login', 'cart', 'checkout', 'warenkorb', 'anmelden', 'newsletter',
+             'cookie', 'privacy', 'datenschutz', 'impressum', 'footer', 'subscribe']
+
+HTML_TABLE_PATTERN = re.compile(r'<table\b.*?</table>', re.IGNORECASE | re.DOTALL)
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+@dataclass
+class ContentBlock:
+    """A contiguous block of page content"""
+    kind: str  # 'table', 'spec_list', 'list', 'heading', 'paragraph'
+    text: str
+    index: int
+    heading: str = ""  # Nearest preceding heading text
+    score: float = 0.0
+    tokens: int = 0
+
+    def selector(self) -> str:
+        """Stable, position-independent selector describing this block"""
+        if self.kind == 'table':
+            header = self.text.strip().split('\n', 1)[0].lower()
+            cells = [c.strip() for c in re.split(r'[|\t]', HTML_TAG_PATTERN.sub(' ', header)) if c.strip()]
+            words = [w for w in cells if any(k in w for k in SPEC_KEYWORDS)][:4]
+            return f"table:{'|'.join(words)}" if words else "table:"
+        if self.heading:
+            return f"heading:{normalize_heading(self.heading)}"
+        return f"{self.kind}:"
+
+
+@dataclass
+class ReductionResult:
+    """Reduced content plus accounting"""
+    content: str
+    original_tokens: int
+    reduced_tokens: int
+    blocks_total: int
+    blocks_selected: int
+    selectors: List[str] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.original_tokens - self.reduced_tokens)
+
+    @property
+    def reduction_ratio(self) -> float:
+        if not self.original_tokens:
+            return 0.0
+        return self.tokens_saved / self.original_tokens
+
+
+def normalize_heading(text: str) -> str:
+    """Normalize a heading for use as a learned selector"""
+    text = HTML_TAG_PATTERN.sub(' ', text)
+    text = re.sub(r'[#*_:\[\]()]+', ' ', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()[:60]
+
+
+class ContentReducer:
+    """Selects the most specification-dense blocks of a page within a token budget"""
+
+    def __init__(self, token_budget: int = 3000, min_score: float = 0.5, selector_boost: float = 3.0):
+        self.token_budget = token_budget
+        self.min_score = min_score
+        self.selector_boost = selector_boost
+
+    def parse_blocks(self, content: str) -> List[ContentBlock]:
+        """Split markdown (or raw HTML) content into typed blocks"""
+        if not content:
+            return []
+
+        # Raw HTML: lift tables out as their own blocks, strip tags from the rest
+        if '<table' in content.lower():
+            blocks: List[ContentBlock] = []
+            last_end = 0
+            for match in HTML_TABLE_PATTERN.finditer(content):
+                blocks.extend(self._parse_markdown(HTML_TAG_PATTERN.sub('\n', content[last_end:match.start()]), len(blocks)))
+                table_text = re.sub(r'</t[dh]>', ' | ', match.group(), flags=re.IGNORECASE)
+                table_text = re.sub(r'</tr>', '\n', table_text, flags=re.IGNORECASE)
+                table_text = re.sub(r'[ \t]+', ' ', HTML_TAG_PATTERN.sub('', table_text))
+                table_text = '\n'.join(line.strip() for line in table_text.split('\n') if line.strip())
+                heading = blocks[-1].heading if blocks else ""
+                blocks.append(ContentBlock('table', table_text, len(blocks), heading=heading))
+                last_end = match.end()
+            blocks.extend(self._parse_markdown(HTML_TAG_PATTERN.sub('\n', content[last_end:]), len(blocks)))
+            return blocks
+
+        return self._parse_markdown(content, 0)
+
+    def _parse_markdown(self, content: str, start_index: int) -> List[ContentBlock]:
+        blocks: List[ContentBlock] = []
+        current_kind: Optional[str] = None
+        current_lines: List[str] = []
+        current_heading = ""
+
+        def flush():
+            nonlocal current_kind, current_lines
+            if current_lines and current_kind:
+                text = '\n'.join(current_lines).strip()
+                if text:
+                    blocks.append(ContentBlock(current_kind, text, start_index + len(blocks), heading=current_heading))
+            current_kind, current_lines = None, []
+
+        for raw_line in content.split('\n'):
+            line = raw_line.rstrip()
+            stripped = line.strip()
+
+            if not stripped:
+                # Blank lines end paragraphs; tables and lists tolerate a single gap
+                if current_kind == 'paragraph':
+                    flush()
+                continue
+
+            if stripped.startswith('#'):
+                flush()
+                current_heading = stripped.lstrip('#').strip()
+                blocks.append(ContentBlock('heading', stripped, start_index + len(blocks), heading=current_heading))
+                continue
+
+            if stripped.startswith('|') or stripped.count('|') >= 2 or '\t' in stripped:
+                kind = 'table'
+            elif re.match(r'^([-*•+]|\d+[.)])\s+', stripped):
+                kind = 'list'
+            else:
+                kind = 'paragraph'
+
+            if kind != current_kind:
+                flush()
+                current_kind = kind
+            current_lines.append(line)
+
+        flush()
+
+        # Lists dense with spec terms are promoted to spec lists
+        for block in blocks:
+            if block.kind == 'list' and self._keyword_hits(block.text.lower()) >= 2:
+                block.kind = 'spec_list'
+        return blocks
+
+    @staticmethod
+    def _keyword_hits(text_lower: str) -> int:
+        return sum(1 for keyword in SPEC_KEYWORDS if keyword in text_lower)
+
+    def score_block(self, block: ContentBlock, learned_selectors: Optional[List[str]] = None) -> float:
+        """Score a block for specification density"""
+        text = block.text
+        text_lower = text.lower()
+        length = max(len(text), 1)
+
+        if block.kind == 'heading':
+            # Headings are cheap context; they only matter if they introduce spec data
+            return 1.0 if self._keyword_hits(text_lower) else 0.1
+
+        numbers = len(NUMBER_PATTERN.findall(text))
+        units = len(UNIT_PATTERN.findall(text))
+        spines = len(SPINE_PATTERN.findall(text))
+        diameters = len(DIAMETER_PATTERN.findall(text))
+        keywords = self._keyword_hits(text_lower)
+
+        # Per-100-character density so long boilerplate doesn't win on volume
+        density = (numbers * 0.5 + units * 1.5 + spines * 1.0 + diameters * 1.5) * 100 / length
+        score = density + keywords * 1.0
+
+        if block.kind == 'table':
+            score *= 2.0
+        elif block.kind == 'spec_list':
+            score *= 1.5
+
+        # Navigation/boilerplate penalties
+        links = len(LINK_PATTERN.findall(text))
+        if links:
+            score /= (1 + links * 0.5)
+        if any(word in text_lower for word in NAV_WORDS) and numbers < 3:
+            score *= 0.2
+
+        if learned_selectors and block.selector() in learned_selectors:
+            score *= self.selector_boost
+
+        return round(score, 3)
+
+    def reduce(self, content: str, token_budget: Optional[int] = None,
+               learned_selectors: Optional[List[str]] = None) -> ReductionResult:
+        """Greedily pack the highest-scoring blocks into the token budget, in document order"""
+        budget = token_budget or self.token_budget
+        original_tokens = estimate_tokens(content)
+        blocks = self.parse_blocks(content)
+
+        if original_tokens <= budget or not blocks:
+            return ReductionResult(content, original_tokens, original_tokens, len(blocks), len(blocks))
+
+        for block in blocks:
+            block.tokens = estimate_tokens(block.text)
+            block.score = self.score_block(block, learned_selectors)
+
+        headings = {b.index: b for b in blocks if b.kind == 'heading'}
+        heading_for = {}
+        last_heading = None
+        for block in blocks:
+            if block.kind == 'heading':
+                last_heading = block.index
+            else:
+                heading_for[block.index] = last_heading
+
+        candidates = sorted((b for b in blocks if b.kind != 'heading' and b.score >= self.min_score),
+                            key=lambda b: b.score, reverse=True)
+
+        selected: Dict[int, ContentBlock] = {}
+        used = 0
+
+        # The page title usually carries the model name, always keep it
+        title = next((b for b in blocks if b.kind == 'heading' and re.match(r'^#\s', b.text)), None)
+        if title and title.tokens < budget // 10:
+            selected[title.index] = title
+            used += title.tokens
+
+        for block in candidates:
+            cost = block.tokens
+            heading_index = heading_for.get(block.index)
+            needs_heading = heading_index is not None and heading_index not in selected
+            if needs_heading:
+                cost += headings[heading_index].tokens or estimate_tokens(headings[heading_index].text)
+
+            if used + cost > budget:
+                # A single oversized spec table is still worth sending, cut at row boundaries
+                if block.kind == 'table' and not any(b.kind != 'heading' for b in selected.values()):
+                    block = self._truncate_block(block, budget - used)
+                    selected[block.index] = block
+                    used += block.tokens
+                continue
+
+            selected[block.index] = block
+            used += block.tokens
+            if needs_heading:
+                selected[heading_index] = headings[heading_index]
+                used += estimate_tokens(headings[heading_index].text)
+
+        if not any(b.kind != 'heading' for b in selected.values()):
+            # Nothing scored high enough: fall back to the densest prefix of the page
+            fallback = content[:budget * 4]
+            return ReductionResult(fallback, original_tokens, estimate_tokens(fallback), len(blocks), 0)
+
+        ordered = [selected[i] for i in sorted(selected)]
+        reduced = '\n\n'.join(block.text for block in ordered)
+        selectors = sorted({b.selector() for b in ordered if b.kind != 'heading' and b.score >= self.min_score * 4})
+
+        return ReductionResult(
+            content=reduced,
+            original_tokens=original_tokens,
+            reduced_tokens=estimate_tokens(reduced),
+            blocks_total=len(blocks),
+            blocks_selected=len(ordered),
+            selectors=selectors
+        )
+
+    @staticmethod
+    def _truncate_block(block: ContentBlock, budget: int) -> ContentBlock:
+        lines = block.text.split('\n')
+        kept, used = [], 0
+        for line in lines:
+            line_tokens = estimate_tokens(line) + 1
+            if used + line_tokens > budget:
+                break
+            kept.append(line)
+            used += line_tokens
+        text = '\n'.join(kept)
+        return ContentBlock(block.kind, text, block.index, block.heading, block.score, estimate_tokens(text))
+
+
+# ---------------------------------------------------------------------------
+# Recorded corpus: pages + the arrows extracted from them, for offline evaluation
+# ---------------------------------------------------------------------------
+
+def record_corpus_page(corpus_dir: str, url: str, manufacturer: str, content: str, arrows: List[Any]):
+    """Save a crawled page and its extraction result for later reducer evaluation"""
+    if not arrows:
+        return
+
+    expected = []
+    for arrow in arrows:
+        data = arrow.dict() if hasattr(arrow, 'dict') else dict(arrow)
+        specs = data.get('spine_specifications') or []
+        expected.append({
+            'model_name': data.get('model_name'),
+            'spines': [s.get('spine') for s in specs if isinstance(s, dict)] or data.get('spine_options', []),
+            'gpi': [s.get('gpi_weight') for s in specs if isinstance(s, dict)],
+        })
+
+    path = Path(corpus_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r'[^a-z0-9]+', '_', f"{urlparse(url).netloc}{urlparse(url).path}".lower()).strip('_')[:120]
+    with open(path / f"{slug}.json", 'w', encoding='utf-8') as f:
+        json.dump({
+            'url': url,
+            'manufacturer': manufacturer,
+            'recorded_at': datetime.now().isoformat(),
+            'content': content,
+            'expected': expected
+        }, f, indent=2, ensure_ascii=False)
+
+
+def _value_present(value: Any, text: str) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float):
+        candidates = {f"{value:g}", f"{value:.1f}", f"{value:.2f}"}
+        candidates |= {c.replace('.', ',') for c in candidates}
+        return any(c in text for c in candidates)
+    return str(value) in text
+
+
+def evaluate_corpus(corpus_dir: str, token_budget: int = 3000, learner=None) -> Dict[str, Any]:
+    """
+    Measure tokens saved and spec retention on the recorded corpus.
+    Accuracy is the share of previously extracted spine/GPI values that survive reduction,
+    i.e. the upper bound on what the LLM can still extract from the reduced content.
+    """
+    reducer = ContentReducer(token_budget=token_budget)
+    pages = []
+
+    for page_file in sorted(Path(corpus_dir).glob('*.json')):
+        try:
+            with open(page_file, 'r', encoding='utf-8') as f:
+                page = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️  Skipping {page_file.name}: {e}")
+            continue
+
+        selectors = learner.get_block_selectors(page['url'], page.get('manufacturer', '')) if learner else None
+        result = reducer.reduce(page.get('content', ''), learned_selectors=selectors)
+
+        expected_values = []
+        for arrow in page.get('expected', []):
+            expected_values.extend(arrow.get('spines') or [])
+            expected_values.extend(v for v in (arrow.get('gpi') or []) if v is not None)
+        retained = sum(1 for value in expected_values if _value_present(value, result.content))
+
+        pages.append({
+            'url': page['url'],
+            'original_tokens': result.original_tokens,
+            'reduced_tokens': result.reduced_tokens,
+            'tokens_saved': result.tokens_saved,
+            'expected_values': len(expected_values),
+            'retained_values': retained,
+            'accuracy': retained / len(expected_values) if expected_values else 1.0
+        })
+
+    total_original = sum(p['original_tokens'] for p in pages)
+    total_reduced = sum(p['reduced_tokens'] for p in pages)
+    total_expected = sum(p['expected_values'] for p in pages)
+    total_retained = sum(p['retained_values'] for p in pages)
+
+    return {
+        'pages': pages,
+        'summary': {
+            'page_count': len(pages),
+            'token_budget': token_budget,
+            'original_tokens': total_original,
+            'reduced_tokens': total_reduced,
+            'tokens_saved': total_original - total_reduced,
+            'avg_tokens_saved_per_page': (total_original - total_reduced) / len(pages) if pages else 0,
+            'spec_retention_accuracy': total_retained / total_expected if total_expected else 1.0
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the content reducer on a recorded page corpus")
+    parser.add_argument("corpus_dir", help="Directory of recorded pages (see record_corpus_page)")
+    parser.add_argument("--budget", type=int, default=3000, help="Token budget per page")
+    parser.add_argument("--use-learned", action="store_true", help="Apply learned per-domain selectors")
+    args = parser.parse_args()
+
+    learner = None
+    if args.use_learned:
+        from content_pattern_learner import ContentPatternLearner
+        learner = ContentPatternLearner()
+
+    report = evaluate_corpus(args.corpus_dir, args.budget, learner)
+    for page in report['pages']:
+        print(f"   {page['url'][:70]}: {page['original_tokens']} → {page['reduced_tokens']} tokens, "
+              f"{page['retained_values']}/{page['expected_values']} spec values kept")
+
+    summary = report['summary']
+    print(f"\n📊 Reducer evaluation ({summary['page_count']} pages, budget {summary['token_budget']})")
+    print(f"   Tokens: {summary['original_tokens']} → {summary['reduced_tokens']} "
+          f"(avg {summary['avg_tokens_saved_per_page']:.0f} saved per page)")
+    print(f"   Spec retention accuracy: {summary['spec_retention_accuracy']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import shutil
-import difflib
-import re
+
+from duplicate_detection import NearDuplicateDetector, model_name_similarity, normalize_model_name
 
 # Setup logging
 logging.basicConfig(
@@ -39,43 +39,11 @@ class DatabaseCleaner:
     
     def normalize_model_name(self, model_name: str) -> str:
         """Normalize model name for better comparison"""
-        if not model_name:
-            return ""
-        
-        # Convert to lowercase
-        normalized = model_name.lower().strip()
-        
-        # Remove common prefixes/suffixes that might cause false negatives
-        # Remove trademark symbols and other special characters
-        normalized = re.sub(r'[™®©]', '', normalized)
-        
-        # Normalize spacing and punctuation
-        normalized = re.sub(r'[_\-\s]+', ' ', normalized)
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        
-        # Remove common archery terms that add noise
-        noise_words = ['arrow', 'shaft', 'hunting', 'target', 'carbon', 'aluminum', 'wood']
-        words = normalized.split()
-        words = [word for word in words if word not in noise_words]
-        
-        return ' '.join(words).strip()
+        return normalize_model_name(model_name)
     
     def calculate_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity score between two model names"""
-        norm1 = self.normalize_model_name(name1)
-        norm2 = self.normalize_model_name(name2)
-        
-        if not norm1 or not norm2:
-            return 0.0
-        
-        # Use SequenceMatcher for similarity calculation
-        similarity = difflib.SequenceMatcher(None, norm1, norm2).ratio()
-        
-        # Boost score for exact matches after normalization
-        if norm1 == norm2:
-            similarity = 1.0
-        
-        return similarity
+        return model_name_similarity(name1, name2)
     
     def are_similar_arrows(self, arrow1: Dict[str, Any], arrow2: Dict[str, Any]) -> Tuple[bool, float]:
         """
@@ -346,8 +314,14 @@ class DatabaseCleaner:
         
         return {'arrows_merged': arrows_merged}
     
-    def find_duplicates(self, use_fuzzy: bool = True, manufacturer_filter: str = None) -> List[Dict[str, Any]]:
-        """Find potential duplicate arrows using fuzzy matching on model names"""
+    def find_duplicates(self, use_fuzzy: bool = True, manufacturer_filter: str = None,
+                        block_on_spine: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find potential duplicate arrows using fuzzy matching on model names
+        
+        With block_on_spine, fuzzy matches also need at least one spine value in common
+        (arrows without spine specifications still match on name alone).
+        """
         cursor = self.conn.cursor()
         
         if not use_fuzzy:
@@ -390,72 +364,50 @@ class DatabaseCleaner:
         
         # Get all arrows for fuzzy comparison
         query = '''
-            SELECT id, manufacturer, model_name, material, arrow_type
-            FROM arrows 
+            SELECT a.id, a.manufacturer, a.model_name, a.material, a.arrow_type,
+                   GROUP_CONCAT(ss.spine) as spines
+            FROM arrows a
+            LEFT JOIN spine_specifications ss ON ss.arrow_id = a.id
         '''
         params = []
         
         if manufacturer_filter:
-            query += ' WHERE LOWER(manufacturer) = LOWER(?)'
+            query += ' WHERE LOWER(a.manufacturer) = LOWER(?)'
             params.append(manufacturer_filter)
         
-        query += ' ORDER BY manufacturer, model_name'
+        query += ' GROUP BY a.id ORDER BY a.manufacturer, a.model_name'
         
         cursor.execute(query, params)
         all_arrows = [dict(row) for row in cursor.fetchall()]
         
-        # Group arrows by manufacturer first (for efficiency)
-        manufacturer_groups = {}
-        for arrow in all_arrows:
-            mfr = arrow['manufacturer'].lower()
-            if mfr not in manufacturer_groups:
-                manufacturer_groups[mfr] = []
-            manufacturer_groups[mfr].append(arrow)
-        
+        # MinHash/LSH blocking per manufacturer; only candidate pairs are compared
+        detector = NearDuplicateDetector(self.similarity_threshold, block_on_spine=block_on_spine)
         duplicate_groups = []
-        processed_ids = set()
-        
-        # For each manufacturer, find similar arrows
-        for manufacturer, arrows in manufacturer_groups.items():
-            for i, arrow1 in enumerate(arrows):
-                if arrow1['id'] in processed_ids:
-                    continue
-                
-                # Find all similar arrows to this one
-                similar_group = [arrow1]
-                similarity_scores = [1.0]  # Self-similarity is 1.0
-                
-                for j, arrow2 in enumerate(arrows[i+1:], i+1):
-                    if arrow2['id'] in processed_ids:
-                        continue
-                    
-                    is_similar, similarity = self.are_similar_arrows(arrow1, arrow2)
-                    if is_similar:
-                        similar_group.append(arrow2)
-                        similarity_scores.append(similarity)
-                        processed_ids.add(arrow2['id'])
-                
-                # If we found duplicates, add to results
-                if len(similar_group) > 1:
-                    processed_ids.add(arrow1['id'])
-                    
-                    duplicate_groups.append({
-                        'manufacturer': arrow1['manufacturer'],
-                        'model_name': arrow1['model_name'],  # Use first arrow's name as representative
-                        'count': len(similar_group),
-                        'arrow_ids': [arrow['id'] for arrow in similar_group],
-                        'materials': [arrow['material'] for arrow in similar_group],
-                        'arrow_types': [arrow['arrow_type'] for arrow in similar_group],
-                        'model_names': [arrow['model_name'] for arrow in similar_group],
-                        'similarity_scores': similarity_scores,
-                        'match_type': 'fuzzy'
-                    })
+        for group in detector.duplicate_groups(all_arrows):
+            similar_group = [all_arrows[index] for index, _ in group]
+            arrow1 = similar_group[0]
+            duplicate_groups.append({
+                'manufacturer': arrow1['manufacturer'],
+                'model_name': arrow1['model_name'],  # Use first arrow's name as representative
+                'count': len(similar_group),
+                'arrow_ids': [arrow['id'] for arrow in similar_group],
+                'materials': [arrow['material'] for arrow in similar_group],
+                'arrow_types': [arrow['arrow_type'] for arrow in similar_group],
+                'model_names': [arrow['model_name'] for arrow in similar_group],
+                'similarity_scores': [similarity for _, similarity in group],
+                'match_type': 'fuzzy'
+            })
         
+        logger.info(f"Fuzzy duplicate search: {detector.stats['arrows']} arrows, "
+                    f"{detector.stats['candidate_pairs']} candidate pairs compared, "
+                    f"{detector.stats['verified_pairs']} similar pairs")
         return duplicate_groups
     
-    def clean_duplicate_arrows(self, dry_run: bool = False, use_fuzzy: bool = True, manufacturer_filter: str = None) -> Dict[str, int]:
+    def clean_duplicate_arrows(self, dry_run: bool = False, use_fuzzy: bool = True, manufacturer_filter: str = None,
+                               block_on_spine: bool = False) -> Dict[str, int]:
         """Remove duplicate arrows, keeping the one with most spine specifications"""
-        duplicates = self.find_duplicates(use_fuzzy=use_fuzzy, manufacturer_filter=manufacturer_filter)
+        duplicates = self.find_duplicates(use_fuzzy=use_fuzzy, manufacturer_filter=manufacturer_filter,
+                                          block_on_spine=block_on_spine)
         
         if not duplicates:
             logger.info("No duplicate arrows found")
@@ -812,6 +764,9 @@ Examples:
   python database_cleaner.py --find-duplicates --similarity-threshold 0.75
   python database_cleaner.py --clean-duplicates --similarity-threshold 0.90
   
+  # Only treat fuzzy matches as duplicates when they share a spine value
+  python database_cleaner.py --find-duplicates --block-on-spine
+  
   # Find duplicates within a specific manufacturer only
   python database_cleaner.py --find-duplicates --manufacturer-filter "Easton Archery"
   python database_cleaner.py --clean-duplicates --manufacturer-filter "Gold Tip"
@@ -872,6 +827,8 @@ Examples:
                       help='Use exact matching instead of fuzzy matching for duplicates')
     parser.add_argument('--similarity-threshold', type=float, default=0.85,
                       help='Similarity threshold for fuzzy matching (0.0-1.0, default: 0.85)')
+    parser.add_argument('--block-on-spine', action='store_true',
+                      help='Fuzzy matches must also share at least one spine value')
     parser.add_argument('--manufacturer-filter', metavar='MANUFACTURER',
                       help='Only find duplicates within the specified manufacturer')
     
@@ -969,7 +926,8 @@ Examples:
         
         elif args.find_duplicates:
             use_fuzzy = not args.exact_match
-            duplicates = cleaner.find_duplicates(use_fuzzy=use_fuzzy, manufacturer_filter=args.manufacturer_filter)
+            duplicates = cleaner.find_duplicates(use_fuzzy=use_fuzzy, manufacturer_filter=args.manufacturer_filter,
+                                                 block_on_spine=args.block_on_spine)
             if duplicates:
                 print(f"\n" + "="*80)
                 print("POTENTIAL DUPLICATE ARROWS")
@@ -1005,7 +963,8 @@ Examples:
         
         elif args.clean_duplicates:
             use_fuzzy = not args.exact_match
-            result = cleaner.clean_duplicate_arrows(args.dry_run, use_fuzzy=use_fuzzy, manufacturer_filter=args.manufacturer_filter)
+            result = cleaner.clean_duplicate_arrows(args.dry_run, use_fuzzy=use_fuzzy, manufacturer_filter=args.manufacturer_filter,
+                                                    block_on_spine=args.block_on_spine)
             print(f"\nDuplicate cleaning completed:")
             print(f"  Duplicates removed: {result['duplicates_removed']}")
         
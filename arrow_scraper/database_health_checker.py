@@ -12,7 +12,14 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from query_benchmark import QueryBenchmark, benchmark_database
+from maintenance_scheduler import MaintenanceScheduler
+
+# Benchmark iterations per hot query during a health check
+HEALTH_CHECK_BENCHMARK_ITERATIONS = 20
+HEALTH_CHECK_BENCHMARK_WARMUP = 3
 
 @dataclass
 class TableStats:
@@ -45,6 +52,9 @@ class DatabaseHealthReport:
     user_table_count: int
     arrow_table_count: int
     consolidation_status: str  # "completed", "pending", "not_applicable"
+    # Full hot-query benchmark run (percentiles, plan fingerprints, regressions) and its trend
+    query_benchmark: Dict[str, Any] = field(default_factory=dict)
+    query_history: Dict[str, Any] = field(default_factory=dict)
 
 class DatabaseHealthChecker:
     """Comprehensive database health analysis and maintenance"""
@@ -217,7 +227,8 @@ class DatabaseHealthChecker:
             # Run all health checks
             integrity_status = self._check_integrity(conn)
             table_stats = self._analyze_tables(conn)
-            query_performance = self._test_query_performance(conn)
+            query_benchmark = self._run_query_benchmark(conn)
+            query_performance = self._test_query_performance(query_benchmark)
             storage_analysis = self._analyze_storage(conn)
             
             # Calculate overall performance score
@@ -227,7 +238,7 @@ class DatabaseHealthChecker:
             
             # Generate recommendations
             recommendations = self._generate_recommendations(
-                integrity_status, table_stats, query_performance, storage_analysis
+                integrity_status, table_stats, query_performance, storage_analysis, query_benchmark
             )
             
             # Get database statistics
@@ -238,6 +249,11 @@ class DatabaseHealthChecker:
             # Get architecture information
             arch_info = self._get_database_architecture_info()
             
+            try:
+                query_history = QueryBenchmark.history(conn)
+            except sqlite3.Error:
+                query_history = {}
+            
             conn.close()
             
             report = DatabaseHealthReport(
@@ -256,7 +272,9 @@ class DatabaseHealthChecker:
                 database_architecture=arch_info['database_architecture'],
                 user_table_count=arch_info['user_table_count'],
                 arrow_table_count=arch_info['arrow_table_count'],
-                consolidation_status=arch_info['consolidation_status']
+                consolidation_status=arch_info['consolidation_status'],
+                query_benchmark=query_benchmark,
+                query_history=query_history
             )
             
             print(f"✅ Health check completed - Score: {performance_score}/100")
@@ -360,29 +378,23 @@ class DatabaseHealthChecker:
             
         return table_stats
     
-    def _test_query_performance(self, conn: sqlite3.Connection) -> Dict[str, float]:
-        """Test common query performance"""
+    def _run_query_benchmark(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Replay the API's hot queries (see query_benchmark.py) and store the run for trends"""
+        try:
+            return benchmark_database(conn, HEALTH_CHECK_BENCHMARK_ITERATIONS, HEALTH_CHECK_BENCHMARK_WARMUP,
+                                      triggered_by='health_check')
+        except Exception as e:
+            print(f"⚠️  Query benchmark failed: {e}")
+            return {'results': {}, 'error': str(e)}
+    
+    def _test_query_performance(self, query_benchmark: Dict[str, Any]) -> Dict[str, float]:
+        """p95 latency (ms) per benchmarked hot query; -1 marks a failed query"""
         performance_tests = {}
-        cursor = conn.cursor()
-        
-        test_queries = {
-            'simple_select': "SELECT COUNT(*) FROM arrows",
-            'join_query': "SELECT COUNT(*) FROM arrows a LEFT JOIN spine_specifications s ON a.id = s.arrow_id",
-            'complex_filter': "SELECT COUNT(*) FROM arrows WHERE manufacturer LIKE '%Easton%'",
-            'index_scan': "SELECT COUNT(*) FROM sqlite_master"
-        }
-        
-        for test_name, query in test_queries.items():
-            try:
-                start_time = time.time()
-                cursor.execute(query)
-                cursor.fetchall()
-                execution_time = (time.time() - start_time) * 1000  # ms
-                performance_tests[test_name] = round(execution_time, 2)
-            except Exception as e:
-                performance_tests[test_name] = -1  # Error indicator
-                print(f"⚠️  Performance test {test_name} failed: {e}")
-        
+        for name, result in query_benchmark.get('results', {}).items():
+            if result.get('status') == 'ok':
+                performance_tests[name] = result['p95_ms']
+            elif result.get('status') == 'error':
+                performance_tests[name] = -1  # Error indicator
         return performance_tests
     
     def _analyze_storage(self, conn: sqlite3.Connection) -> Dict[str, Any]:
@@ -467,7 +479,8 @@ class DatabaseHealthChecker:
         return max(0, min(100, score))
     
     def _generate_recommendations(self, integrity_status: str, table_stats: List[TableStats],
-                                query_performance: Dict[str, float], storage_analysis: Dict[str, Any]) -> List[str]:
+                                query_performance: Dict[str, float], storage_analysis: Dict[str, Any],
+                                query_benchmark: Optional[Dict[str, Any]] = None) -> List[str]:
         """Generate maintenance recommendations"""
         recommendations = []
         
@@ -480,10 +493,19 @@ class DatabaseHealthChecker:
         if slow_queries:
             recommendations.append(f"⚡ Optimize slow queries: {', '.join(slow_queries)}")
         
+        benchmark_results = (query_benchmark or {}).get('results', {})
+        regressed = [name for name, result in benchmark_results.items() if result.get('regression')]
+        if regressed:
+            recommendations.append(f"📉 Query latency regressed against recent runs: {', '.join(regressed)}")
+        
+        plan_changes = [name for name, result in benchmark_results.items() if result.get('plan_changed')]
+        if plan_changes:
+            recommendations.append(f"🔀 Query plans changed since the last run: {', '.join(plan_changes)} - check indexes")
+        
         # Storage issues
         fragmentation = storage_analysis.get('fragmentation_percent', 0)
         if fragmentation > 20:
-            recommendations.append("🗜️  High fragmentation detected - run VACUUM to reclaim space")
+            recommendations.append("🗜️  High fragmentation detected - run VACUUM (scheduled in the background) to reclaim space")
         
         efficiency = storage_analysis.get('efficiency_percent', 100)
         if efficiency < 85:
@@ -500,7 +522,7 @@ class DatabaseHealthChecker:
         
         # Maintenance recommendations
         if not self._get_last_maintenance_time():
-            recommendations.append("🔧 No recent maintenance detected - schedule regular optimization")
+            recommendations.append("🔧 No recent maintenance detected - check the maintenance scheduler (DB_MAINTENANCE_ENABLED)")
         
         # General health
         if not recommendations:
@@ -509,13 +531,23 @@ class DatabaseHealthChecker:
         return recommendations
     
     def _get_last_maintenance_time(self) -> Optional[str]:
-        """Get timestamp of last maintenance operation"""
-        # This would typically check a maintenance log table
-        # For now, return None to indicate no maintenance tracking
-        return None
+        """Get timestamp of last maintenance operation (from the maintenance scheduler's log)"""
+        try:
+            conn = sqlite3.connect(self.database_path)
+            try:
+                row = conn.execute("SELECT MAX(started_at) FROM database_maintenance_log").fetchone()
+                return row[0] if row else None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
     
-    def run_database_optimization(self) -> Dict[str, Any]:
-        """Run database optimization operations"""
+    def run_database_optimization(self, vacuum: bool = False, max_seconds: float = 60.0) -> Dict[str, Any]:
+        """
+        Run pending maintenance now in bounded steps (incremental vacuum, targeted ANALYZE,
+        PRAGMA optimize) instead of a blocking VACUUM/ANALYZE/REINDEX. vacuum=True converts a
+        database without incremental auto_vacuum first (one full VACUUM).
+        """
         results = {
             'operations_performed': [],
             'time_taken_ms': 0,
@@ -526,52 +558,20 @@ class DatabaseHealthChecker:
         start_time = time.time()
         
         try:
-            conn = sqlite3.connect(self.database_path)
-            cursor = conn.cursor()
-            
-            # Get size before optimization
             size_before = Path(self.database_path).stat().st_size
             
-            print("🔧 Running database optimization...")
-            
-            # VACUUM - reclaim unused space
-            try:
-                print("   Running VACUUM...")
-                cursor.execute("VACUUM;")
-                results['operations_performed'].append('VACUUM')
-                print("   ✅ VACUUM completed")
-            except Exception as e:
-                results['errors'].append(f"VACUUM failed: {str(e)}")
-                print(f"   ❌ VACUUM failed: {e}")
-            
-            # ANALYZE - update table statistics
-            try:
-                print("   Running ANALYZE...")
-                cursor.execute("ANALYZE;")
-                results['operations_performed'].append('ANALYZE')
-                print("   ✅ ANALYZE completed")
-            except Exception as e:
-                results['errors'].append(f"ANALYZE failed: {str(e)}")
-                print(f"   ❌ ANALYZE failed: {e}")
-            
-            # REINDEX - rebuild indexes
-            try:
-                print("   Running REINDEX...")
-                cursor.execute("REINDEX;")
-                results['operations_performed'].append('REINDEX')
-                print("   ✅ REINDEX completed")
-            except Exception as e:
-                results['errors'].append(f"REINDEX failed: {str(e)}")
-                print(f"   ❌ REINDEX failed: {e}")
-            
-            conn.close()
+            print("🔧 Running database maintenance...")
+            steps = MaintenanceScheduler(self.database_path).run_pending(vacuum=vacuum, max_seconds=max_seconds)
+            for step in steps:
+                operation = step['operation'].upper() + (f" {step['target']}" if step['target'] else '')
+                results['operations_performed'].append(operation)
+                print(f"   ✅ {operation} ({step['duration_ms']}ms)")
             
-            # Calculate results
             size_after = Path(self.database_path).stat().st_size
             results['space_reclaimed_mb'] = round((size_before - size_after) / (1024 * 1024), 2)
             results['time_taken_ms'] = round((time.time() - start_time) * 1000, 2)
             
-            print(f"✅ Optimization completed in {results['time_taken_ms']}ms")
+            print(f"✅ Maintenance completed in {results['time_taken_ms']}ms")
             if results['space_reclaimed_mb'] > 0:
                 print(f"   💾 Reclaimed {results['space_reclaimed_mb']} MB of space")
             
@@ -806,7 +806,9 @@ def run_health_check(database_path: str = None) -> Dict[str, Any]:
         'database_architecture': report.database_architecture,
         'user_table_count': report.user_table_count,
         'arrow_table_count': report.arrow_table_count,
-        'consolidation_status': report.consolidation_status
+        'consolidation_status': report.consolidation_status,
+        'query_benchmark': report.query_benchmark,
+        'query_history': report.query_history
     }
 
 # For testing
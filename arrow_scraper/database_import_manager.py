@@ -12,6 +12,17 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
 import logging
+import time
+
+from json_stream import ArrowExportStream
+from import_pipeline import (ParallelImportPipeline, arrow_content_hash, classify_diameter,
+                             normalize_arrow, normalize_material)
+
+# Max host parameters per IN (...) lookup, stays under SQLITE_MAX_VARIABLE_NUMBER on old builds
+SQL_CHUNK_SIZE = 500
+
+# Arrows hashed and written per executemany round while streaming a file
+IMPORT_BATCH_SIZE = 500
 
 class DatabaseImportManager:
     """Manages importing arrow data from JSON files to SQLite database"""
@@ -28,6 +39,9 @@ class DatabaseImportManager:
         self.processed_data_dir = Path(processed_data_dir)
         self.logger = logging.getLogger(__name__)
         
+        # Inserted/updated/unchanged counts of the most recent import_arrow_data call
+        self.last_import_stats: Dict[str, Any] = {}
+        
         # Set up logging
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         
@@ -39,6 +53,7 @@ class DatabaseImportManager:
             List of tuples (file_path, modification_time, manufacturer_name)
         """
         json_files = []
+        self._file_stats = {}
         
         if not self.processed_data_dir.exists():
             self.logger.warning(f"Processed data directory does not exist: {self.processed_data_dir}")
@@ -48,8 +63,10 @@ class DatabaseImportManager:
         for json_file in self.processed_data_dir.glob("*.json"):
             if json_file.is_file():
                 try:
-                    # Get modification time
-                    mod_time = datetime.fromtimestamp(json_file.stat().st_mtime)
+                    # Get modification time (one stat per file, reused by the import manifest)
+                    file_stat = json_file.stat()
+                    mod_time = datetime.fromtimestamp(file_stat.st_mtime)
+                    self._file_stats[json_file.name] = (file_stat.st_size, file_stat.st_mtime_ns)
                     
                     # Extract manufacturer name from filename
                     # Pattern: Manufacturer_Name_type_YYYYMMDD_HHMMSS.json
@@ -162,6 +179,33 @@ class DatabaseImportManager:
             self.logger.error(f"Error loading JSON file {json_file}: {e}")
             return None
     
+    def stream_json_data(self, json_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Open a JSON file for streaming import
+        
+        Same validation as load_json_data, but "arrows" is an iterator that parses one
+        arrow at a time, so peak memory does not grow with the file size.
+        
+        Args:
+            json_file: Path to JSON file
+            
+        Returns:
+            Header fields plus an "arrows" iterator, or None if invalid
+        """
+        try:
+            stream = ArrowExportStream(json_file)
+            
+            if "manufacturer" not in stream.header or not stream.has_array:
+                stream.close()
+                self.logger.warning(f"Missing required fields in {json_file}")
+                return None
+            
+            return dict(stream.header, arrows=iter(stream))
+            
+        except Exception as e:
+            self.logger.error(f"Error loading JSON file {json_file}: {e}")
+            return None
+    
     def get_data_hash(self, data: Dict[str, Any]) -> str:
         """
         Generate hash of arrow data for comparison
@@ -196,6 +240,28 @@ class DatabaseImportManager:
         data_str = json.dumps(hash_data, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
     
+    def get_arrow_hash(self, arrow: Dict[str, Any]) -> str:
+        """
+        Generate hash of a single arrow's imported fields
+        
+        Args:
+            arrow: One arrow entry from a JSON file
+            
+        Returns:
+            SHA256 hash of the arrow
+        """
+        return arrow_content_hash(arrow)
+    
+    def _ensure_import_state_table(self, cursor: sqlite3.Cursor):
+        """Per-arrow content hash of the last import, keyed by the (stable) arrow id"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS arrow_import_hashes (
+                arrow_id INTEGER PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                imported_at TEXT
+            )
+        """)
+    
     def clear_manufacturer_data(self, manufacturer: str):
         """
         Clear existing data for a manufacturer from database
@@ -233,116 +299,376 @@ class DatabaseImportManager:
         except Exception as e:
             self.logger.error(f"Error clearing manufacturer data for {manufacturer}: {e}")
     
-    def import_arrow_data(self, data: Dict[str, Any]) -> int:
+    def import_arrow_data(self, data: Dict[str, Any], force_update: bool = False) -> int:
         """
-        Import arrow data into database
+        Upsert arrow data into database, keeping arrow ids stable
+        
+        Arrows are matched by (manufacturer, model_name); only arrows whose content hash
+        changed are rewritten, in batches of IMPORT_BATCH_SIZE with executemany inside one
+        transaction. data["arrows"] may be any iterable (e.g. stream_json_data), so arrows
+        are never all held in memory at once.
         
         Args:
             data: Arrow data from JSON file
+            force_update: Rewrite every arrow even if its content hash is unchanged
             
         Returns:
-            Number of arrows imported
+            Number of arrows imported (inserted + updated + unchanged)
         """
         if not data or "arrows" not in data:
             return 0
         
         manufacturer = data.get("manufacturer", "Unknown")
-        arrows_imported = 0
+        started = time.perf_counter()
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0,
+                 "specs_inserted": 0, "specs_updated": 0, "specs_deleted": 0, "not_in_source": 0}
+        seen_models = set()
         
         try:
             conn = sqlite3.connect(self.database_path)
             cursor = conn.cursor()
+            self._ensure_import_state_table(cursor)
             
-            for arrow in data["arrows"]:
-                try:
-                    # Insert arrow
-                    cursor.execute("""
-                        INSERT INTO arrows (
-                            manufacturer, model_name, material, arrow_type, 
-                            description, source_url, image_url,
-                            created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        manufacturer,
-                        arrow.get("model_name", ""),
-                        self._normalize_material(arrow.get("material")),
-                        arrow.get("arrow_type", "target"),
-                        arrow.get("description", ""),
-                        arrow.get("source_url", ""),
-                        arrow.get("primary_image_url", ""),
-                        datetime.now().isoformat()
-                    ))
-                    
-                    arrow_id = cursor.lastrowid
-                    
-                    # Insert spine specifications
-                    spine_specs = arrow.get("spine_specifications", [])
-                    for spec in spine_specs:
-                        if isinstance(spec, dict) and "spine" in spec:
-                            cursor.execute("""
-                                INSERT INTO spine_specifications (
-                                    arrow_id, spine, outer_diameter, inner_diameter,
-                                    gpi_weight, length_options
-                                ) VALUES (?, ?, ?, ?, ?, ?)
-                            """, (
-                                arrow_id,
-                                spec.get("spine"),
-                                spec.get("outer_diameter"),
-                                spec.get("inner_diameter"),
-                                spec.get("gpi_weight"),
-                                json.dumps(spec.get("length_options")) if spec.get("length_options") else None
-                            ))
-                    
-                    arrows_imported += 1
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error importing arrow {arrow.get('model_name', 'Unknown')}: {e}")
+            gpi_required, has_diameter_category = self._spec_columns(cursor)
+            existing = self._load_existing_arrows(cursor, manufacturer)
+            existing_models = set(existing)
+            
+            now = datetime.now().isoformat()
+            with conn:
+                # Within a batch the last occurrence of a model wins; a repeat in a later
+                # batch simply updates the row written earlier
+                batch: Dict[str, Tuple[Dict[str, Any], str]] = {}
+                for arrow in data["arrows"]:
+                    model_name = (arrow.get("model_name") or "").strip() if isinstance(arrow, dict) else ""
+                    if not model_name:
+                        stats["skipped"] += 1
+                        continue
+                    batch[model_name] = (normalize_arrow(arrow), self.get_arrow_hash(arrow))
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        self._write_arrow_batch(cursor, manufacturer, batch, existing, seen_models,
+                                                gpi_required, force_update, now, stats, has_diameter_category)
+                        batch = {}
+                self._write_arrow_batch(cursor, manufacturer, batch, existing, seen_models,
+                                        gpi_required, force_update, now, stats, has_diameter_category)
+            stats["not_in_source"] = len(existing_models - seen_models)
             
-            conn.commit()
             conn.close()
             
         except Exception as e:
             self.logger.error(f"Database error during import: {e}")
+            self.last_import_stats = dict(stats, error=str(e))
+            return 0
+        
+        elapsed = time.perf_counter() - started
+        stats["seconds"] = round(elapsed, 3)
+        stats["arrows_per_second"] = round(len(seen_models) / elapsed, 1) if elapsed > 0 else None
+        self.last_import_stats = stats
         
-        return arrows_imported
+        self.logger.info(f"   {manufacturer}: {stats['inserted']} inserted, {stats['updated']} updated, "
+                         f"{stats['unchanged']} unchanged ({stats['arrows_per_second']} arrows/s)")
+        if stats["not_in_source"]:
+            self.logger.info(f"   {manufacturer}: {stats['not_in_source']} arrows in database but not in source file (kept)")
+        
+        return stats["inserted"] + stats["updated"] + stats["unchanged"]
+    
+    def _spec_columns(self, cursor: sqlite3.Cursor) -> Tuple[bool, bool]:
+        """(gpi_weight is NOT NULL, diameter_category column exists) for spine_specifications"""
+        columns = {row[1]: row[3] for row in cursor.execute("PRAGMA table_info(spine_specifications)")}
+        return bool(columns.get("gpi_weight")), "diameter_category" in columns
+    
+    def _load_existing_arrows(self, cursor: sqlite3.Cursor, manufacturer: str) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Model name -> (arrow id, last imported content hash); the oldest row per model keeps its id"""
+        existing: Dict[str, Tuple[int, Optional[str]]] = {}
+        for arrow_id, model_name, content_hash in cursor.execute("""
+            SELECT a.id, a.model_name, h.content_hash FROM arrows a
+            LEFT JOIN arrow_import_hashes h ON h.arrow_id = a.id
+            WHERE a.manufacturer = ? ORDER BY a.id
+        """, (manufacturer,)):
+            existing.setdefault(model_name, (arrow_id, content_hash))
+        return existing
+    
+    def _write_arrow_batch(self, cursor: sqlite3.Cursor, manufacturer: str,
+                           batch: Dict[str, Tuple[Dict[str, Any], str]],
+                           existing: Dict[str, Tuple[int, Optional[str]]], seen_models: set,
+                           gpi_required: bool, force_update: bool, now: str, stats: Dict[str, Any],
+                           has_diameter_category: bool = False):
+        """Write one batch of (normalized arrow, content hash) by model name with executemany"""
+        if not batch:
+            return
+        
+        new_rows, update_rows, changed = [], [], []
+        for model_name, (arrow, content_hash) in batch.items():
+            # Counts are per distinct model, repeats across batches are not counted twice
+            counted = model_name not in seen_models
+            seen_models.add(model_name)
+            values = (
+                arrow.get("material"),
+                arrow.get("arrow_type", "target"),
+                arrow.get("description", ""),
+                arrow.get("source_url", ""),
+                arrow.get("primary_image_url", "")
+            )
+            if model_name in existing:
+                arrow_id, old_hash = existing[model_name]
+                if old_hash == content_hash and not force_update:
+                    stats["unchanged"] += counted
+                    continue
+                update_rows.append(values + (arrow_id,))
+                stats["updated"] += counted
+            else:
+                new_rows.append((manufacturer, model_name) + values + (now,))
+                stats["inserted"] += counted
+            changed.append(model_name)
+        
+        cursor.executemany("""
+            UPDATE arrows SET material = ?, arrow_type = ?, description = ?,
+                source_url = ?, image_url = ?
+            WHERE id = ?
+        """, update_rows)
+        cursor.executemany("""
+            INSERT INTO arrows (
+                manufacturer, model_name, material, arrow_type, 
+                description, source_url, image_url,
+                created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, new_rows)
+        
+        # Resolve ids of the freshly inserted arrows (only this batch's models)
+        new_models = [row[1] for row in new_rows]
+        for i in range(0, len(new_models), SQL_CHUNK_SIZE):
+            chunk = new_models[i:i + SQL_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            for arrow_id, model_name in cursor.execute(f"""
+                SELECT id, model_name FROM arrows
+                WHERE manufacturer = ? AND model_name IN ({placeholders}) ORDER BY id
+            """, [manufacturer] + chunk).fetchall():
+                existing.setdefault(model_name, (arrow_id, None))
+        
+        changed_ids = {existing[model_name][0]: model_name for model_name in changed}
+        self._upsert_spine_specifications(cursor, changed_ids, batch, gpi_required, stats, has_diameter_category)
+        
+        cursor.executemany("""
+            INSERT OR REPLACE INTO arrow_import_hashes (arrow_id, content_hash, imported_at)
+            VALUES (?, ?, ?)
+        """, [(arrow_id, batch[model_name][1], now) for arrow_id, model_name in changed_ids.items()])
+        for arrow_id, model_name in changed_ids.items():
+            existing[model_name] = (arrow_id, batch[model_name][1])
+    
+    def _upsert_spine_specifications(self, cursor: sqlite3.Cursor, changed_ids: Dict[int, str],
+                                     incoming: Dict[str, Tuple[Dict[str, Any], str]],
+                                     gpi_required: bool, stats: Dict[str, Any],
+                                     has_diameter_category: bool = False):
+        """Update specs matched by (arrow_id, spine), insert new spines and drop spines no longer listed"""
+        if not changed_ids:
+            return
+        
+        existing_specs: Dict[Tuple[int, str], int] = {}
+        arrow_ids = list(changed_ids)
+        for i in range(0, len(arrow_ids), SQL_CHUNK_SIZE):
+            chunk = arrow_ids[i:i + SQL_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            for spec_id, arrow_id, spine in cursor.execute(f"""
+                SELECT id, arrow_id, spine FROM spine_specifications WHERE arrow_id IN ({placeholders}) ORDER BY id
+            """, chunk).fetchall():
+                existing_specs.setdefault((arrow_id, str(spine)), spec_id)
+        
+        spec_inserts, spec_updates, keep = [], [], set()
+        for arrow_id, model_name in changed_ids.items():
+            arrow = incoming[model_name][0]
+            for spec in arrow.get("spine_specifications", []) or []:
+                if not isinstance(spec, dict) or spec.get("spine") is None:
+                    continue
+                if gpi_required and spec.get("gpi_weight") is None:
+                    continue
+                values = (
+                    spec.get("spine"),
+                    spec.get("outer_diameter"),
+                    spec.get("inner_diameter"),
+                    spec.get("gpi_weight"),
+                    json.dumps(spec.get("length_options")) if spec.get("length_options") else None
+                )
+                if has_diameter_category:
+                    values += (spec.get("diameter_category"),)
+                key = (arrow_id, str(spec.get("spine")))
+                if key in keep:
+                    continue
+                keep.add(key)
+                if key in existing_specs:
+                    spec_updates.append(values + (existing_specs[key],))
+                else:
+                    spec_inserts.append((arrow_id,) + values)
+        
+        spec_deletes = [(spec_id,) for key, spec_id in existing_specs.items() if key not in keep]
+        
+        category_set = ", diameter_category = COALESCE(?, diameter_category)" if has_diameter_category else ""
+        category_column = ", diameter_category" if has_diameter_category else ""
+        cursor.executemany(f"""
+            UPDATE spine_specifications SET spine = ?, outer_diameter = ?, inner_diameter = ?,
+                gpi_weight = ?, length_options = ?{category_set}
+            WHERE id = ?
+        """, spec_updates)
+        cursor.executemany(f"""
+            INSERT INTO spine_specifications (
+                arrow_id, spine, outer_diameter, inner_diameter,
+                gpi_weight, length_options{category_column}
+            ) VALUES (?, ?, ?, ?, ?, ?{", ?" if has_diameter_category else ""})
+        """, spec_inserts)
+        cursor.executemany("DELETE FROM spine_specifications WHERE id = ?", spec_deletes)
+        
+        stats["specs_inserted"] += len(spec_inserts)
+        stats["specs_updated"] += len(spec_updates)
+        stats["specs_deleted"] += len(spec_deletes)
     
     def _normalize_material(self, material: Optional[str]) -> str:
         """Normalize material string to standard format"""
-        if not material:
-            return "Carbon"
-        
-        material_lower = material.lower()
-        
-        if "wood" in material_lower or "cedar" in material_lower:
-            return "Wood"
-        elif "aluminum" in material_lower and "carbon" in material_lower:
-            return "Carbon / Aluminum"
-        elif "aluminum" in material_lower or "alloy" in material_lower:
-            return "Aluminum"
-        else:
-            return "Carbon"
+        return normalize_material(material)
     
     def _classify_diameter(self, inner_diameter: Optional[float], outer_diameter: Optional[float]) -> str:
         """Classify arrow diameter into category"""
-        diameter = inner_diameter or outer_diameter
-        
-        if not diameter:
-            return "Standard target"
-        
-        if diameter < 0.200:
-            return "Ultra-thin"
-        elif diameter < 0.220:
-            return "Thin"
-        elif diameter < 0.250:
-            return "Small hunting"
-        elif diameter < 0.270:
-            return "Standard target"
-        elif diameter < 0.320:
-            return "Standard hunting"
-        elif diameter < 0.360:
-            return "Large hunting"
-        else:
-            return "Heavy hunting"
+        return classify_diameter(inner_diameter, outer_diameter)
+    
+    def _ensure_manifest_table(self, cursor: sqlite3.Cursor):
+        """One row per processed JSON file: what was seen and what its import did"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS import_manifest (
+                file_name TEXT PRIMARY KEY,
+                manufacturer TEXT,
+                file_size INTEGER,
+                file_mtime_ns INTEGER,
+                content_hash TEXT,
+                status TEXT,
+                arrows_imported INTEGER DEFAULT 0,
+                arrows_inserted INTEGER DEFAULT 0,
+                arrows_updated INTEGER DEFAULT 0,
+                arrows_unchanged INTEGER DEFAULT 0,
+                error TEXT,
+                imported_at TEXT
+            )
+        """)
+    
+    def get_import_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the import manifest
+        
+        Returns:
+            Dictionary of file name -> manifest row
+        """
+        if not os.path.exists(self.database_path):
+            return {}
+        try:
+            conn = sqlite3.connect(self.database_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            self._ensure_manifest_table(cursor)
+            manifest = {row["file_name"]: dict(row) for row in cursor.execute("SELECT * FROM import_manifest")}
+            conn.close()
+            return manifest
+        except Exception as e:
+            self.logger.warning(f"Could not read import manifest: {e}")
+            return {}
+    
+    def get_file_hash(self, json_file: Path) -> str:
+        """SHA256 of a file's bytes, read in chunks"""
+        digest = hashlib.sha256()
+        with open(json_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _file_stat(self, json_file: Path) -> Tuple[int, int]:
+        cached = getattr(self, '_file_stats', {}).get(json_file.name)
+        if cached:
+            return cached
+        file_stat = json_file.stat()
+        return file_stat.st_size, file_stat.st_mtime_ns
+    
+    def get_changed_files(self, selected_files: Dict[str, Tuple[Path, datetime]],
+                          manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        Find selected files that are new or changed since their last successful import
+        
+        Size and mtime come from the stat done in get_json_files; a file is only hashed when
+        those differ, and a touched-but-identical file just refreshes its manifest entry.
+        
+        Returns:
+            Dictionary of file name -> content hash (None if not computed) for changed files
+        """
+        changed = {}
+        for json_file, _ in selected_files.values():
+            entry = manifest.get(json_file.name)
+            size, mtime_ns = self._file_stat(json_file)
+            
+            if entry and entry["status"] == "imported" and entry["file_size"] == size and entry["file_mtime_ns"] == mtime_ns:
+                continue
+            
+            content_hash = self.get_file_hash(json_file) if entry else None
+            if entry and entry["status"] == "imported" and entry["content_hash"] == content_hash:
+                self._record_manifest(json_file, entry["manufacturer"], content_hash, "imported",
+                                      {"arrows_imported": entry["arrows_imported"]}, touch_only=True)
+                continue
+            
+            changed[json_file.name] = content_hash
+        return changed
+    
+    def _record_manifest(self, json_file: Path, manufacturer: str, content_hash: Optional[str], status: str,
+                         stats: Dict[str, Any], error: Optional[str] = None, touch_only: bool = False):
+        """Store a file's stat, hash and import result in the manifest"""
+        size, mtime_ns = self._file_stat(json_file)
+        try:
+            conn = sqlite3.connect(self.database_path)
+            cursor = conn.cursor()
+            self._ensure_manifest_table(cursor)
+            if touch_only:
+                cursor.execute("""
+                    UPDATE import_manifest SET file_size = ?, file_mtime_ns = ? WHERE file_name = ?
+                """, (size, mtime_ns, json_file.name))
+            else:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO import_manifest (
+                        file_name, manufacturer, file_size, file_mtime_ns, content_hash, status,
+                        arrows_imported, arrows_inserted, arrows_updated, arrows_unchanged, error, imported_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    json_file.name, manufacturer, size, mtime_ns, content_hash, status,
+                    stats.get("arrows_imported", 0), stats.get("inserted", 0), stats.get("updated", 0),
+                    stats.get("unchanged", 0), error, datetime.now().isoformat()
+                ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            self.logger.warning(f"Could not update import manifest for {json_file.name}: {e}")
+    
+    def _database_has_arrows(self) -> bool:
+        """Cheap emptiness check (no full table count)"""
+        try:
+            conn = sqlite3.connect(self.database_path)
+            row = conn.execute("SELECT 1 FROM arrows LIMIT 1").fetchone()
+            conn.close()
+            return row is not None
+        except sqlite3.Error:
+            return False
+    
+    def select_import_files(self, json_files: List[Tuple[Path, datetime, str]]) -> Dict[str, Tuple[Path, datetime]]:
+        """
+        Pick the newest non-learn file per manufacturer, decided from file names and stat data only
+        
+        Returns:
+            Dictionary of manufacturer -> (file_path, modification_time)
+        """
+        manufacturer_files = {}
+        learn_files = 0
+        for json_file, mod_time, manufacturer in json_files:
+            # Skip learn files - they're for pattern learning, not production data
+            if "_learn_" in json_file.name:
+                learn_files += 1
+                continue
+            
+            if manufacturer not in manufacturer_files or mod_time > manufacturer_files[manufacturer][1]:
+                manufacturer_files[manufacturer] = (json_file, mod_time)
+        
+        if learn_files:
+            self.logger.info(f"Skipping {learn_files} learn files (pattern learning data)")
+        return manufacturer_files
     
     def check_for_updates(self) -> Dict[str, Any]:
         """
@@ -354,19 +680,21 @@ class DatabaseImportManager:
         self.logger.info("🔍 Checking for database updates...")
         
         json_files = self.get_json_files()
-        db_metadata = self.get_database_metadata()
+        database_exists = os.path.exists(self.database_path)
         
         update_info = {
             "needs_update": False,
+            "only_changed": True,
             "reason": "",
             "json_files_found": len(json_files),
-            "database_exists": db_metadata["exists"],
-            "database_arrow_count": db_metadata["arrow_count"],
+            "database_exists": database_exists,
+            "changed_files": [],
             "recommendations": []
         }
         
-        if not db_metadata["exists"]:
+        if not database_exists:
             update_info["needs_update"] = True
+            update_info["only_changed"] = False
             update_info["reason"] = "Database does not exist"
             update_info["recommendations"].append("Create new database from JSON files")
             
@@ -374,31 +702,40 @@ class DatabaseImportManager:
             update_info["reason"] = "No JSON files found in processed directory"
             update_info["recommendations"].append("No updates needed - no source data available")
             
-        elif db_metadata["arrow_count"] == 0:
+        elif not self._database_has_arrows():
             update_info["needs_update"] = True
+            update_info["only_changed"] = False
             update_info["reason"] = "Database exists but is empty"
             update_info["recommendations"].append("Import all JSON files to populate database")
             
         else:
-            # Check if any JSON files are newer than database
-            newest_json = max(json_files, key=lambda x: x[1])[1] if json_files else None
+            # Compare the current per-manufacturer files against the import manifest
+            selected = self.select_import_files(json_files)
+            changed = self.get_changed_files(selected, self.get_import_manifest())
+            update_info["changed_files"] = sorted(changed)
             
-            if newest_json and db_metadata["last_modified"] and newest_json > db_metadata["last_modified"]:
+            if changed:
                 update_info["needs_update"] = True
-                update_info["reason"] = f"JSON files newer than database (newest: {newest_json}, db: {db_metadata['last_modified']})"
-                update_info["recommendations"].append("Update database with newer JSON data")
+                update_info["reason"] = f"{len(changed)} new or changed JSON files: {', '.join(sorted(changed)[:5])}"
+                update_info["recommendations"].append("Import new or changed JSON files")
             else:
-                update_info["reason"] = "Database appears up to date"
+                update_info["reason"] = "All current JSON files match the import manifest"
                 update_info["recommendations"].append("No updates needed")
         
         return update_info
     
-    def import_all_json_files(self, force_update: bool = False) -> Dict[str, Any]:
+    def import_all_json_files(self, force_update: bool = False, only_changed: bool = False,
+                              workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Import all JSON files to database
         
+        With more than one file, files are parsed and normalized in a process pool and
+        written by a single writer thread (see import_pipeline.ParallelImportPipeline).
+        
         Args:
-            force_update: If True, clear existing data before import
+            force_update: If True, rewrite every arrow even when its content hash is unchanged
+            only_changed: If True, skip files the import manifest shows as already imported
+            workers: Process pool size (default: CPU count; 1 imports serially in-process)
             
         Returns:
             Import results summary
@@ -413,6 +750,10 @@ class DatabaseImportManager:
                 "success": True,
                 "files_processed": 0,
                 "arrows_imported": 0,
+                "arrows_inserted": 0,
+                "arrows_updated": 0,
+                "arrows_unchanged": 0,
+                "files_skipped": 0,
                 "manufacturers_updated": 0,
                 "errors": []
             }
@@ -421,49 +762,81 @@ class DatabaseImportManager:
             "success": True,
             "files_processed": 0,
             "arrows_imported": 0,
+            "arrows_inserted": 0,
+            "arrows_updated": 0,
+            "arrows_unchanged": 0,
+            "files_skipped": 0,
             "manufacturers_updated": set(),
             "errors": []
         }
+        started = time.perf_counter()
         
         # Process each manufacturer (prefer update files over learn files)
-        manufacturer_files = {}
-        for json_file, mod_time, manufacturer in json_files:
-            file_type = "learn" if "_learn_" in json_file.name else "update"
-            
-            # Skip learn files - they're for pattern learning, not production data
-            if file_type == "learn":
-                self.logger.info(f"Skipping learn file: {json_file.name} (pattern learning data)")
-                continue
-            
-            if manufacturer not in manufacturer_files or mod_time > manufacturer_files[manufacturer][1]:
-                manufacturer_files[manufacturer] = (json_file, mod_time)
+        manufacturer_files = self.select_import_files(json_files)
+        
+        changed_hashes: Dict[str, Optional[str]] = {}
+        if only_changed and not force_update:
+            changed_hashes = self.get_changed_files(manufacturer_files, self.get_import_manifest())
+            results["files_skipped"] = len(manufacturer_files) - len(changed_hashes)
+            manufacturer_files = {m: f for m, f in manufacturer_files.items() if f[0].name in changed_hashes}
+            if results["files_skipped"]:
+                self.logger.info(f"Skipping {results['files_skipped']} files unchanged since last import")
         
         self.logger.info(f"Found {len(manufacturer_files)} manufacturers to import: {list(manufacturer_files.keys())}")
         
+        pipeline_stats: Optional[Dict[str, Dict[str, Any]]] = None
+        workers = workers or os.cpu_count() or 1
+        if len(manufacturer_files) > 1 and workers > 1:
+            try:
+                pipeline = ParallelImportPipeline(self, workers)
+                pipeline_stats = pipeline.run({f[0].name: f[0] for f in manufacturer_files.values()}, force_update)
+            except Exception as e:
+                # e.g. process pools unavailable in a restricted container
+                self.logger.warning(f"Parallel import unavailable ({e}), importing serially")
+        
         for manufacturer, (json_file, mod_time) in manufacturer_files.items():
             try:
                 self.logger.info(f"📋 Processing {manufacturer} from {json_file.name}")
                 
-                # Load JSON data
-                data = self.load_json_data(json_file)
-                if not data:
-                    results["errors"].append(f"Failed to load {json_file}")
-                    continue
+                content_hash = changed_hashes.get(json_file.name) or self.get_file_hash(json_file)
                 
-                # Clear existing data for this manufacturer if force_update or new data
-                if force_update:
-                    self.clear_manufacturer_data(manufacturer)
-                
-                # Import arrow data
-                imported_count = self.import_arrow_data(data)
+                if pipeline_stats is not None:
+                    import_stats = pipeline_stats.get(json_file.name, {"error": "No result from import pipeline"})
+                    if import_stats.get("load_error"):
+                        self.logger.warning(f"Could not read {json_file}: {import_stats['error']}")
+                        results["errors"].append(f"Failed to load {json_file}")
+                        self._record_manifest(json_file, manufacturer, content_hash, "failed", {}, error="Failed to load JSON")
+                        continue
+                    imported_count = (import_stats.get("inserted", 0) + import_stats.get("updated", 0)
+                                      + import_stats.get("unchanged", 0))
+                else:
+                    # Stream JSON data (arrows are parsed while they are written)
+                    data = self.stream_json_data(json_file)
+                    if not data:
+                        results["errors"].append(f"Failed to load {json_file}")
+                        self._record_manifest(json_file, manufacturer, content_hash, "failed", {}, error="Failed to load JSON")
+                        continue
+                    
+                    # Upsert arrow data (ids stay stable, unchanged arrows are skipped)
+                    imported_count = self.import_arrow_data(data, force_update=force_update)
+                    import_stats = self.last_import_stats
                 
                 if imported_count > 0:
                     results["arrows_imported"] += imported_count
-                    results["manufacturers_updated"].add(manufacturer)
+                    results["arrows_inserted"] += import_stats.get("inserted", 0)
+                    results["arrows_updated"] += import_stats.get("updated", 0)
+                    results["arrows_unchanged"] += import_stats.get("unchanged", 0)
+                    if import_stats.get("inserted") or import_stats.get("updated"):
+                        results["manufacturers_updated"].add(manufacturer)
                     self.logger.info(f"✅ Imported {imported_count} arrows for {manufacturer}")
                 else:
                     self.logger.warning(f"⚠️  No arrows imported for {manufacturer}")
                 
+                failed = "error" in import_stats
+                self._record_manifest(json_file, manufacturer, content_hash,
+                                      "failed" if failed else "imported",
+                                      dict(import_stats, arrows_imported=imported_count),
+                                      error=import_stats.get("error"))
                 results["files_processed"] += 1
                 
             except Exception as e:
@@ -474,10 +847,16 @@ class DatabaseImportManager:
         
         # Convert set to count for final results
         results["manufacturers_updated"] = len(results["manufacturers_updated"])
+        elapsed = time.perf_counter() - started
+        results["seconds"] = round(elapsed, 3)
+        results["arrows_per_second"] = round(results["arrows_imported"] / elapsed, 1) if elapsed > 0 else None
         
         self.logger.info(f"🎯 Import complete: {results['files_processed']} files, "
-                        f"{results['arrows_imported']} arrows, "
-                        f"{results['manufacturers_updated']} manufacturers")
+                        f"{results['arrows_imported']} arrows "
+                        f"({results['arrows_inserted']} inserted, {results['arrows_updated']} updated, "
+                        f"{results['arrows_unchanged']} unchanged), "
+                        f"{results['manufacturers_updated']} manufacturers, "
+                        f"{results['arrows_per_second']} arrows/s")
         
         if results["errors"]:
             self.logger.warning(f"⚠️  {len(results['errors'])} errors occurred during import")
@@ -500,8 +879,9 @@ class DatabaseImportManager:
             if update_info["needs_update"]:
                 self.logger.info(f"📥 Database update needed: {update_info['reason']}")
                 
-                # Run import
-                results = self.import_all_json_files(force_update=True)
+                # Run import: only files the manifest marks as new/changed (unless the database is empty),
+                # hash-based upsert writes only new or changed arrows and keeps ids stable
+                results = self.import_all_json_files(only_changed=update_info["only_changed"])
                 
                 if results["success"]:
                     self.logger.info("✅ Database import completed successfully")
@@ -525,9 +905,10 @@ def main():
     parser = argparse.ArgumentParser(description="Database Import Manager")
     parser.add_argument("--check", action="store_true", help="Check for updates only")
     parser.add_argument("--import-all", action="store_true", help="Import all JSON files")
-    parser.add_argument("--force", action="store_true", help="Force update (clear existing data)")
+    parser.add_argument("--force", action="store_true", help="Force update (rewrite unchanged arrows too)")
     parser.add_argument("--database", default="arrow_database.db", help="Database path")
     parser.add_argument("--data-dir", default="data/processed", help="Processed data directory")
+    parser.add_argument("--workers", type=int, default=None, help="Parse/normalize processes (1 = serial)")
     
     args = parser.parse_args()
     
@@ -536,8 +917,9 @@ def main():
     if args.check:
         update_info = manager.check_for_updates()
         print(f"Database exists: {update_info['database_exists']}")
-        print(f"Arrow count: {update_info['database_arrow_count']}")
+        print(f"Arrow count: {manager.get_database_metadata()['arrow_count']}")
         print(f"JSON files found: {update_info['json_files_found']}")
+        print(f"Changed files: {len(update_info['changed_files'])}")
         print(f"Needs update: {update_info['needs_update']}")
         print(f"Reason: {update_info['reason']}")
         print("Recommendations:")
@@ -545,10 +927,13 @@ def main():
             print(f"  - {rec}")
     
     elif args.import_all or args.force:
-        results = manager.import_all_json_files(force_update=args.force)
+        results = manager.import_all_json_files(force_update=args.force, workers=args.workers)
         print(f"Success: {results['success']}")
         print(f"Files processed: {results['files_processed']}")
-        print(f"Arrows imported: {results['arrows_imported']}")
+        print(f"Arrows imported: {results['arrows_imported']} "
+              f"({results['arrows_inserted']} inserted, {results['arrows_updated']} updated, "
+              f"{results['arrows_unchanged']} unchanged)")
+        print(f"Throughput: {results['arrows_per_second']} arrows/s")
         print(f"Manufacturers updated: {results['manufacturers_updated']}")
         if results['errors']:
             print("Errors:")
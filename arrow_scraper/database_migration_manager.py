@@ -16,6 +16,12 @@ from abc import ABC, abstractmethod
 import importlib.util
 import sys
 
+# Discovery cache: per migration file (keyed by mtime/size, then content hash) the metadata
+# discover_migrations needs, so unchanged modules are only imported when they have to run.
+# Bump DISCOVERY_CACHE_VERSION when the cached fields or how they are derived change.
+DISCOVERY_CACHE_VERSION = 1
+DISCOVERY_CACHE_FILE = ".discovery_cache.json"
+
 class MigrationError(Exception):
     """Exception raised for migration-related errors"""
     pass
@@ -48,16 +54,51 @@ class BaseMigration(ABC):
         migration_content = f"{self.version}:{self.description}:{str(self.dependencies)}"
         return hashlib.md5(migration_content.encode()).hexdigest()
 
+class CachedMigration(BaseMigration):
+    """Migration known from the discovery cache; its module is only imported to run it"""
+    
+    def __init__(self, manager: 'DatabaseMigrationManager', file_path: Path, entry: Dict[str, Any]):
+        super().__init__()
+        self.version = entry['version']
+        self.description = entry['description']
+        self.dependencies = entry['dependencies']
+        self.environments = entry['environments']
+        if entry.get('target_database') is not None:
+            self.target_database = entry['target_database']
+        self.file_path = file_path
+        self._checksum = entry['checksum']
+        self._manager = manager
+        self._migration: Optional[BaseMigration] = None
+    
+    def _load(self) -> BaseMigration:
+        if self._migration is None:
+            migration = self._manager._load_migration_file(self.file_path)
+            if migration is None:
+                raise MigrationError(f"Migration {self.version} could not be loaded from {self.file_path}")
+            self._migration = migration
+        return self._migration
+    
+    def up(self, db_path: str, environment: str) -> bool:
+        return self._load().up(db_path, environment)
+    
+    def down(self, db_path: str, environment: str) -> bool:
+        return self._load().down(db_path, environment)
+    
+    def get_checksum(self) -> str:
+        return self._checksum
+
 class DatabaseMigrationManager:
     """Manages database migrations with versioning and environment awareness"""
     
-    def __init__(self, database_path: str = "arrow_database.db", migrations_dir: str = "migrations"):
+    def __init__(self, database_path: str = "arrow_database.db", migrations_dir: str = "migrations",
+                 use_discovery_cache: bool = True):
         """
         Initialize the migration manager
         
         Args:
             database_path: Path to the SQLite database
             migrations_dir: Directory containing migration files
+            use_discovery_cache: Reuse cached migration metadata instead of importing every module
         """
         # Set up logging first
         self.logger = logging.getLogger(__name__)
@@ -66,6 +107,10 @@ class DatabaseMigrationManager:
         # Now initialize other attributes
         self.database_path = self._resolve_database_path(database_path)
         self.migrations_dir = Path(migrations_dir)
+        self.use_discovery_cache = (use_discovery_cache and
+                                    os.environ.get('MIGRATION_DISCOVERY_CACHE', 'true').lower() != 'false')
+        self.discovery_cache_path = Path(os.environ.get('MIGRATION_DISCOVERY_CACHE_PATH') or
+                                         self.migrations_dir / DISCOVERY_CACHE_FILE)
         self.environment = self._detect_environment()
         self.database_type = self._detect_database_type(self.database_path)
         
@@ -193,88 +238,138 @@ class DatabaseMigrationManager:
             self.logger.warning(f"Migrations directory does not exist: {self.migrations_dir}")
             return migrations
         
+        cache = self._read_discovery_cache() if self.use_discovery_cache else {}
+        entries = {}
+        imported = 0
+        
         # Look for Python migration files
         for migration_file in self.migrations_dir.glob("*.py"):
             if migration_file.name.startswith("__"):
                 continue
-                
+            
             try:
-                # Load migration module
-                spec = importlib.util.spec_from_file_location(migration_file.stem, migration_file)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                migration_found = False
-                
-                # Method 1: Look for BaseMigration subclass (class-based migrations 001-011)
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, BaseMigration) and 
-                        attr != BaseMigration):
-                        
-                        migration = attr()
-                        if migration.version:
+                stat = migration_file.stat()
+                entry = cache.get(migration_file.name)
+                if entry and (entry['mtime_ns'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+                    entries[migration_file.name] = entry
+                else:
+                    content_hash = hashlib.sha256(migration_file.read_bytes()).hexdigest()
+                    if entry and entry['sha256'] == content_hash:
+                        # Touched but unchanged (e.g. fresh checkout): keep the metadata
+                        entries[migration_file.name] = {**entry, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+                    else:
+                        migration = self._load_migration_file(migration_file)
+                        imported += 1
+                        entries[migration_file.name] = self._discovery_cache_entry(migration, stat, content_hash)
+                        if migration is not None:
                             migrations[migration.version] = migration
-                            migration_found = True
-                            break
-                
-                # Method 1b: Look for migration instance (instantiated migrations like 018-022)
-                if not migration_found and hasattr(module, 'migration'):
-                    migration_instance = getattr(module, 'migration')
-                    if isinstance(migration_instance, BaseMigration) and migration_instance.version:
-                        migrations[migration_instance.version] = migration_instance
-                        migration_found = True
-                
-                # Method 2: Look for plain Migration class (standalone migrations 012+)
-                if not migration_found and hasattr(module, 'Migration'):
-                    migration_class = getattr(module, 'Migration')
-                    if isinstance(migration_class, type):
-                        migration_instance = migration_class()
-                        if hasattr(migration_instance, 'version') and migration_instance.version:
-                            # Create wrapper to make it compatible with BaseMigration interface
-                            wrapper = self._create_migration_wrapper(migration_instance, module, migration_file)
-                            migrations[str(migration_instance.version).zfill(3)] = wrapper
-                            migration_found = True
-                
-                # Method 3: Look for standalone up/down functions (function-based migrations)
-                if not migration_found and hasattr(module, 'up') and hasattr(module, 'down'):
-                    # Extract version from filename (e.g., "013_equipment_change_logging.py" -> "013")
-                    version_match = migration_file.stem.split('_')[0]
-                    if version_match.isdigit():
-                        # Create wrapper to make it compatible with BaseMigration interface
-                        wrapper = self._create_function_wrapper(module, migration_file, version_match)
-                        migrations[version_match] = wrapper
-                        migration_found = True
-                
-                # Method 4: Look for migrate_up/migrate_down functions (cursor-based migrations)
-                if not migration_found and hasattr(module, 'migrate_up') and hasattr(module, 'migrate_down'):
-                    # Extract version from filename (e.g., "019_add_chronograph_data.py" -> "019")
-                    version_match = migration_file.stem.split('_')[0]
-                    if version_match.isdigit():
-                        # Create wrapper to make it compatible with BaseMigration interface
-                        wrapper = self._create_cursor_migration_wrapper(module, migration_file, version_match)
-                        migrations[version_match] = wrapper
-                        migration_found = True
-                
-                # Method 5: Look for run_migration function (legacy function-based migrations)
-                if not migration_found and hasattr(module, 'run_migration'):
-                    # Extract version from filename (e.g., "013_equipment_change_logging.py" -> "013")
-                    version_match = migration_file.stem.split('_')[0]
-                    if version_match.isdigit():
-                        # Create wrapper to make it compatible with BaseMigration interface
-                        wrapper = self._create_run_migration_wrapper(module, migration_file, version_match)
-                        migrations[version_match] = wrapper
-                        migration_found = True
+                        continue
                 
-                if not migration_found:
-                    self.logger.warning(f"⚠️  No migration class or functions found in {migration_file}")
+                entry = entries[migration_file.name]
+                if entry['version'] is not None:
+                    migrations[entry['version']] = CachedMigration(self, migration_file, entry)
                             
             except Exception as e:
                 self.logger.error(f"❌ Failed to load migration {migration_file}: {e}")
         
+        if self.use_discovery_cache and entries != cache:
+            self._write_discovery_cache(entries)
+        if imported:
+            self.logger.debug(f"📦 Imported {imported} migration modules, {len(entries) - imported} from cache")
+        
         return migrations
     
+    def _load_migration_file(self, migration_file: Path) -> Optional[BaseMigration]:
+        """Import one migration module and wrap it as a BaseMigration (None when it has none)"""
+        # Load migration module
+        spec = importlib.util.spec_from_file_location(migration_file.stem, migration_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        # Method 1: Look for BaseMigration subclass (class-based migrations 001-011)
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (isinstance(attr, type) and 
+                issubclass(attr, BaseMigration) and 
+                attr not in (BaseMigration, CachedMigration)):
+                
+                migration = attr()
+                if migration.version:
+                    return migration
+        
+        # Method 1b: Look for migration instance (instantiated migrations like 018-022)
+        if hasattr(module, 'migration'):
+            migration_instance = getattr(module, 'migration')
+            if isinstance(migration_instance, BaseMigration) and migration_instance.version:
+                return migration_instance
+        
+        # Method 2: Look for plain Migration class (standalone migrations 012+)
+        if hasattr(module, 'Migration'):
+            migration_class = getattr(module, 'Migration')
+            if isinstance(migration_class, type):
+                migration_instance = migration_class()
+                if hasattr(migration_instance, 'version') and migration_instance.version:
+                    # Create wrapper to make it compatible with BaseMigration interface
+                    return self._create_migration_wrapper(migration_instance, module, migration_file)
+        
+        # Extract version from filename (e.g., "013_equipment_change_logging.py" -> "013")
+        version_match = migration_file.stem.split('_')[0]
+        if version_match.isdigit():
+            # Method 3: Look for standalone up/down functions (function-based migrations)
+            if hasattr(module, 'up') and hasattr(module, 'down'):
+                return self._create_function_wrapper(module, migration_file, version_match)
+            
+            # Method 4: Look for migrate_up/migrate_down functions (cursor-based migrations)
+            if hasattr(module, 'migrate_up') and hasattr(module, 'migrate_down'):
+                return self._create_cursor_migration_wrapper(module, migration_file, version_match)
+            
+            # Method 5: Look for run_migration function (legacy function-based migrations)
+            if hasattr(module, 'run_migration'):
+                return self._create_run_migration_wrapper(module, migration_file, version_match)
+        
+        self.logger.warning(f"⚠️  No migration class or functions found in {migration_file}")
+        return None
+    
+    @staticmethod
+    def _discovery_cache_entry(migration: Optional[BaseMigration], stat: os.stat_result,
+                               content_hash: str) -> Dict[str, Any]:
+        """Metadata cached for a migration file; version None marks files without a migration"""
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': content_hash, 'version': None}
+        if migration is not None:
+            entry.update({
+                'version': migration.version,
+                'description': migration.description or migration.__class__.__name__,
+                'dependencies': list(migration.dependencies),
+                'environments': list(migration.environments),
+                'target_database': getattr(migration, 'target_database', None),
+                'checksum': migration.get_checksum(),
+            })
+        return entry
+    
+    def _read_discovery_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.discovery_cache_path) as f:
+                cache = json.load(f)
+            if cache.get('cache_version') == DISCOVERY_CACHE_VERSION:
+                return cache.get('files', {})
+        except (OSError, ValueError):
+            pass
+        return {}
+    
+    def _write_discovery_cache(self, entries: Dict[str, Dict[str, Any]]):
+        tmp_path = self.discovery_cache_path.with_name(f"{self.discovery_cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'cache_version': DISCOVERY_CACHE_VERSION, 'files': entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.discovery_cache_path)
+        except OSError as e:
+            # Read-only migrations directory: discovery still works, just without the cache
+            self.logger.debug(f"Could not write migration discovery cache {self.discovery_cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
     def _create_migration_wrapper(self, migration_instance, module, migration_file):
         """Create a BaseMigration wrapper for plain Migration class instances"""
         manager_logger = self.logger  # Capture the manager's logger
@@ -519,30 +614,44 @@ class DatabaseMigrationManager:
     def get_applied_migrations(self) -> List[str]:
         """Get list of already applied migration versions"""
         try:
-            conn = sqlite3.connect(self.database_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT version FROM database_migrations 
-                WHERE success = 1 
-                ORDER BY applied_at
-            """)
-            
-            versions = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return versions
-            
-        except sqlite3.OperationalError:
-            # Migrations table doesn't exist yet
-            return []
+            return [record['version'] for record in self._get_applied_records() or []]
         except Exception as e:
             self.logger.error(f"❌ Failed to get applied migrations: {e}")
             return []
     
-    def get_pending_migrations(self) -> List[BaseMigration]:
+    def _get_applied_records(self) -> Optional[List[Dict[str, Any]]]:
+        """All successfully applied migrations in one query, oldest first (None without a migrations table)"""
+        try:
+            conn = sqlite3.connect(self.database_path)
+            try:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT version, name, applied_at, environment, success, error_message
+                    FROM database_migrations
+                    WHERE success = 1
+                    ORDER BY applied_at
+                """)
+                return [{
+                    'version': row[0],
+                    'name': row[1],
+                    'applied_at': row[2],
+                    'environment': row[3],
+                    'success': bool(row[4]),
+                    'error_message': row[5]
+                } for row in cursor.fetchall()]
+            finally:
+                conn.close()
+        except sqlite3.OperationalError:
+            # Migrations table doesn't exist yet
+            return None
+    
+    def get_pending_migrations(self, all_migrations: Optional[Dict[str, BaseMigration]] = None,
+                               applied_versions: Optional[set] = None) -> List[BaseMigration]:
         """Get list of pending migrations in dependency order"""
-        all_migrations = self.discover_migrations()
-        applied_versions = set(self.get_applied_migrations())
+        if all_migrations is None:
+            all_migrations = self.discover_migrations()
+        if applied_versions is None:
+            applied_versions = set(self.get_applied_migrations())
         
         # Filter out already applied migrations and check environment compatibility
         pending = []
@@ -557,13 +666,15 @@ class DatabaseMigrationManager:
                 pending.append(migration)
         
         # Sort by dependencies and version
-        return self._sort_migrations_by_dependencies(pending)
+        return self._sort_migrations_by_dependencies(pending, applied_versions)
     
-    def _sort_migrations_by_dependencies(self, migrations: List[BaseMigration]) -> List[BaseMigration]:
+    def _sort_migrations_by_dependencies(self, migrations: List[BaseMigration],
+                                         applied_versions: Optional[set] = None) -> List[BaseMigration]:
         """Sort migrations by their dependencies"""
         sorted_migrations = []
         remaining = migrations.copy()
-        applied_versions = set(self.get_applied_migrations())
+        if applied_versions is None:
+            applied_versions = set(self.get_applied_migrations())
         
         while remaining:
             progress_made = False
@@ -687,39 +798,16 @@ class DatabaseMigrationManager:
     def get_migration_status(self) -> Dict[str, Any]:
         """Get comprehensive migration status"""
         all_migrations = self.discover_migrations()
-        applied_migrations = self.get_applied_migrations()
-        pending_migrations = self.get_pending_migrations()
         
-        # Get detailed migration info
-        applied_details = []
-        pending_details = []
+        # Applied versions and their details come from a single query
+        applied_records = self._get_applied_records()
+        migrations_table_exists = applied_records is not None
+        applied_records = applied_records or []
+        applied_migrations = [record['version'] for record in applied_records]
+        applied_details = applied_records[::-1]
         
-        # Get applied migration details from database
-        try:
-            conn = sqlite3.connect(self.database_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT version, name, applied_at, environment, success, error_message
-                FROM database_migrations
-                WHERE success = 1
-                ORDER BY applied_at DESC
-            """)
-            
-            for row in cursor.fetchall():
-                applied_details.append({
-                    'version': row[0],
-                    'name': row[1],
-                    'applied_at': row[2],
-                    'environment': row[3],
-                    'success': bool(row[4]),
-                    'error_message': row[5]
-                })
-            
-            conn.close()
-        except Exception:
-            # If migrations table doesn't exist or other error
-            pass
+        pending_migrations = self.get_pending_migrations(all_migrations, set(applied_migrations))
+        pending_details = []
         
         # Get pending migration details
         for migration in pending_migrations:
@@ -745,7 +833,7 @@ class DatabaseMigrationManager:
             "applied_details": applied_details,
             "pending_details": pending_details,
             "database_exists": os.path.exists(self.database_path),
-            "migrations_table_exists": self._migrations_table_exists()
+            "migrations_table_exists": migrations_table_exists
         }
     
     def _migrations_table_exists(self) -> bool:
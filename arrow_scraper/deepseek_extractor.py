@@ -4,10 +4,11 @@ Production DeepSeek Arrow Extractor
 Intelligent extraction of arrow specifications using DeepSeek API
 """
 
+import asyncio
 import json
 import re
 import os
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -19,12 +20,15 @@ load_dotenv()
 class DeepSeekArrowExtractor:
     """Production-ready arrow specification extractor using DeepSeek API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_tokens: int = 4000):
         """Initialize the extractor with DeepSeek API key"""
         self.api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
         if not self.api_key:
             raise ValueError("DeepSeek API key is required")
         
+        # Output token limit per request (long spec tables were truncated at 1000)
+        self.max_tokens = max_tokens
+        
         self.client = OpenAI(
             api_key=self.api_key,
             base_url="https://api.deepseek.com"
@@ -66,8 +70,9 @@ class DeepSeekArrowExtractor:
         # Default fallback
         return 'target'
     
-    def _extract_main_content(self, content: str) -> str:
-        """Extract the main product content, skipping navigation and headers"""
+    def _extract_main_content(self, content: str, max_chars: Optional[int] = 6000) -> str:
+        """Extract the main product content, skipping navigation and headers.
+        Pass max_chars=None to keep everything relevant (chunked extraction handles size)."""
         
         # Split content into chunks
         lines = content.split('\n')
@@ -94,7 +99,6 @@ class DeepSeekArrowExtractor:
             has_spec_keywords = any(keyword in line_lower for keyword in spec_keywords)
             
             # Look for numeric patterns that suggest specifications
-            import re
             has_spine_pattern = bool(re.search(r'\b[2-7]\d{2}\b', line))  # 200-799
             has_diameter_pattern = bool(re.search(r'\b0\.[2-4]\d{2}\b', line))  # 0.2xx
             has_gpi_pattern = bool(re.search(r'\d+\.\d+\s*gpi\b', line_lower))
@@ -109,21 +113,26 @@ class DeepSeekArrowExtractor:
         if relevant_sections:
             main_content = '\n'.join(relevant_sections)
             # Limit to reasonable size
-            return main_content[:6000] if len(main_content) > 6000 else main_content
+            return main_content[:max_chars] if max_chars else main_content
         
         # Fallback: skip first 2000 chars (navigation) and take next 4000
         if len(content) > 2000:
-            return content[2000:6000]
+            return content[2000:6000] if max_chars else content[2000:]
         else:
             return content[:4000]
     
-    def extract_arrows_from_content(self, content: str, source_url: str, manufacturer: str) -> List[ArrowSpecification]:
-        """Extract arrow specifications from webpage content"""
-        
-        # Find the main content by skipping navigation and focusing on product details
-        content_excerpt = self._extract_main_content(content)
-        
-        extraction_prompt = f"""
+    def _build_extraction_prompt(self, content_excerpt: str, multi_page: bool = False) -> str:
+        """Build the extraction prompt for a single page or a packed group of pages"""
+
+        multi_page_rules = ""
+        if multi_page:
+            multi_page_rules = """
+        MULTI-PAGE INPUT:
+        - The content contains several pages, each starting with a line like "=== PAGE 2 ==="
+        - Add "source_page": <page number> to every arrow so it can be attributed to its page
+        """
+
+        return f"""
         You are an expert arrow specification extractor. Analyze the webpage content and extract detailed arrow specifications.
 
         Return ONLY a valid JSON object with this exact structure:
@@ -176,77 +185,196 @@ class DeepSeekArrowExtractor:
         8. Skip arrows without complete technical specs
         9. Return empty array if no valid arrows found
 
+        {multi_page_rules}
         CONTENT TO ANALYZE:
         {content_excerpt}
         
         Extract all arrow models with complete specifications. Focus on technical data and usage descriptions.
         """
+    
+    def _parse_extraction_response(self, result: str) -> List[Dict[str, Any]]:
+        """Parse the raw LLM response into a list of arrow dicts"""
+        cleaned_result = self.clean_json_response(result)
+        
+        try:
+            data = json.loads(cleaned_result)
+        except json.JSONDecodeError as e:
+            print(f"JSON parsing failed: {e}")
+            print(f"Raw response: {result[:200]}...")
+            return []
+        
+        return [arrow for arrow in data.get('arrows', []) if isinstance(arrow, dict)]
+    
+    def _build_arrow_specifications(self, arrow_dicts: List[Dict[str, Any]], source_url: str, manufacturer: str) -> List[ArrowSpecification]:
+        """Convert parsed arrow dicts to ArrowSpecification objects"""
+        arrows = []
+        for arrow_data in arrow_dicts:
+            try:
+                arrow_data.pop('source_page', None)
+                
+                # Normalize arrow type
+                arrow_type = self.normalize_arrow_type(arrow_data.get('arrow_type', ''))
+                if arrow_type:
+                    arrow_data['arrow_type'] = arrow_type
+                else:
+                    arrow_data.pop('arrow_type', None)
+                
+                # Validate and clean numeric fields
+                if 'inner_diameter' in arrow_data and arrow_data['inner_diameter'] is None:
+                    arrow_data.pop('inner_diameter', None)
+                
+                # Ensure spine_options is a list of integers
+                if 'spine_options' in arrow_data:
+                    spines = arrow_data['spine_options']
+                    if isinstance(spines, list):
+                        arrow_data['spine_options'] = [int(s) for s in spines if isinstance(s, (int, str)) and str(s).isdigit()]
+                
+                # Ensure length_options is a list of integers if present
+                if 'length_options' in arrow_data and arrow_data['length_options']:
+                    lengths = arrow_data['length_options']
+                    if isinstance(lengths, list):
+                        arrow_data['length_options'] = [int(l) for l in lengths if isinstance(l, (int, str)) and str(l).replace('.', '').isdigit()]
+                
+                # Create arrow specification
+                arrow = ArrowSpecification(
+                    manufacturer=manufacturer,
+                    source_url=source_url,
+                    **arrow_data
+                )
+                arrows.append(arrow)
+                
+            except Exception as e:
+                print(f"Warning: Failed to create arrow specification: {e}")
+                print(f"Data: {arrow_data}")
+                continue
+        
+        return arrows
+    
+    @staticmethod
+    def merge_arrow_dicts(arrow_dicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge partial results from chunked pages by model name"""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for arrow in arrow_dicts:
+            key = (arrow.get('model_name') or '').strip().lower()
+            if not key:
+                continue
+            if key not in merged:
+                merged[key] = dict(arrow)
+                continue
+            
+            existing = merged[key]
+            for field, value in arrow.items():
+                if value in (None, '', []):
+                    continue
+                if field in ('spine_options', 'length_options', 'recommended_use') and isinstance(value, list):
+                    combined = list(existing.get(field) or [])
+                    combined.extend(v for v in value if v not in combined)
+                    existing[field] = sorted(combined) if field != 'recommended_use' else combined
+                elif existing.get(field) in (None, '', []):
+                    existing[field] = value
+        return list(merged.values())
+    
+    def extract_arrows_from_content(self, content: str, source_url: str, manufacturer: str) -> List[ArrowSpecification]:
+        """Extract arrow specifications from webpage content"""
+        
+        # Find the main content by skipping navigation and focusing on product details
+        content_excerpt = self._extract_main_content(content)
+        extraction_prompt = self._build_extraction_prompt(content_excerpt)
         
         try:
             response = self.client.chat.completions.create(
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": extraction_prompt}],
-                max_tokens=1000,
+                max_tokens=self.max_tokens,
                 temperature=0.1
             )
             
             result = response.choices[0].message.content.strip()
-            cleaned_result = self.clean_json_response(result)
-            
-            # Parse JSON response
-            try:
-                data = json.loads(cleaned_result)
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing failed: {e}")
-                print(f"Raw response: {result[:200]}...")
-                return []
-            
-            # Convert to ArrowSpecification objects
-            arrows = []
-            for arrow_data in data.get('arrows', []):
-                try:
-                    # Normalize arrow type
-                    arrow_type = self.normalize_arrow_type(arrow_data.get('arrow_type', ''))
-                    if arrow_type:
-                        arrow_data['arrow_type'] = arrow_type
-                    else:
-                        arrow_data.pop('arrow_type', None)
-                    
-                    # Validate and clean numeric fields
-                    if 'inner_diameter' in arrow_data and arrow_data['inner_diameter'] is None:
-                        arrow_data.pop('inner_diameter', None)
-                    
-                    # Ensure spine_options is a list of integers
-                    if 'spine_options' in arrow_data:
-                        spines = arrow_data['spine_options']
-                        if isinstance(spines, list):
-                            arrow_data['spine_options'] = [int(s) for s in spines if isinstance(s, (int, str)) and str(s).isdigit()]
-                    
-                    # Ensure length_options is a list of integers if present
-                    if 'length_options' in arrow_data and arrow_data['length_options']:
-                        lengths = arrow_data['length_options']
-                        if isinstance(lengths, list):
-                            arrow_data['length_options'] = [int(l) for l in lengths if isinstance(l, (int, str)) and str(l).replace('.', '').isdigit()]
-                    
-                    # Create arrow specification
-                    arrow = ArrowSpecification(
-                        manufacturer=manufacturer,
-                        source_url=source_url,
-                        **arrow_data
-                    )
-                    arrows.append(arrow)
-                    
-                except Exception as e:
-                    print(f"Warning: Failed to create arrow specification: {e}")
-                    print(f"Data: {arrow_data}")
-                    continue
-            
-            return arrows
+            arrow_dicts = self._parse_extraction_response(result)
+            return self._build_arrow_specifications(arrow_dicts, source_url, manufacturer)
             
         except Exception as e:
             print(f"Error during extraction: {e}")
             return []
     
+    async def extract_arrows_from_pages(self, pages: List[Dict[str, str]], manufacturer: str,
+                                        llm_client=None, request_token_limit: int = 6000,
+                                        max_pages_per_request: int = 5) -> Dict[str, List[ArrowSpecification]]:
+        """
+        Extract arrows from many pages concurrently.
+        pages: [{'url': ..., 'content': ...}]. Short pages are packed into one request,
+        long pages are split into chunks whose results are merged by model name.
+        Returns {url: [ArrowSpecification, ...]}.
+        """
+        from async_llm_client import AsyncDeepSeekClient, estimate_tokens, pack_pages, split_into_chunks
+        
+        owns_client = llm_client is None
+        if owns_client:
+            llm_client = AsyncDeepSeekClient(self.api_key)
+        
+        prepared = [{'url': page['url'], 'content': self._extract_main_content(page.get('content', ''), max_chars=None)}
+                    for page in pages]
+        short_pages = [p for p in prepared if estimate_tokens(p['content']) <= request_token_limit // 2]
+        long_pages = [p for p in prepared if estimate_tokens(p['content']) > request_token_limit // 2]
+        
+        async def run_group(group: List[Dict[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
+            if len(group) == 1:
+                prompt = self._build_extraction_prompt(group[0]['content'])
+            else:
+                packed = '\n\n'.join(f"=== PAGE {i} ===\nURL: {p['url']}\n{p['content']}"
+                                       for i, p in enumerate(group, 1))
+                prompt = self._build_extraction_prompt(packed, multi_page=True)
+            
+            result = await llm_client.chat(prompt, max_tokens=self.max_tokens,
+                                           usage_key=manufacturer, pages=len(group))
+            if not result:
+                return {}
+            
+            by_url: Dict[str, List[Dict[str, Any]]] = {p['url']: [] for p in group}
+            for arrow in self._parse_extraction_response(result):
+                page_index = arrow.get('source_page', 1) if len(group) > 1 else 1
+                try:
+                    url = group[int(page_index) - 1]['url']
+                except (ValueError, TypeError, IndexError):
+                    url = group[0]['url']
+                by_url[url].append(arrow)
+            return by_url
+        
+        async def run_long_page(page: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+            chunks = split_into_chunks(page['content'], request_token_limit)
+            chunk_results = await asyncio.gather(
+                *(llm_client.chat(self._build_extraction_prompt(chunk), max_tokens=self.max_tokens,
+                                  usage_key=manufacturer, pages=0)
+                  for chunk in chunks),
+                return_exceptions=True
+            )
+            arrow_dicts = []
+            for result in chunk_results:
+                if isinstance(result, Exception):
+                    print(f"⚠️  Chunk extraction failed for {page['url']}: {str(result)[:100]}")
+                    continue
+                if result:
+                    arrow_dicts.extend(self._parse_extraction_response(result))
+            llm_client.record_pages(manufacturer)
+            return {page['url']: self.merge_arrow_dicts(arrow_dicts)}
+        
+        tasks = [run_group(group) for group in pack_pages(short_pages, request_token_limit, max_pages_per_request)]
+        tasks.extend(run_long_page(page) for page in long_pages)
+        
+        results: Dict[str, List[ArrowSpecification]] = {}
+        try:
+            for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    print(f"⚠️  Batched extraction failed: {str(outcome)[:100]}")
+                    continue
+                for url, arrow_dicts in outcome.items():
+                    results[url] = self._build_arrow_specifications(arrow_dicts, url, manufacturer)
+        finally:
+            if owns_client:
+                await llm_client.close()
+        
+        return results
+    
     def test_extraction(self) -> bool:
         """Test the extractor with sample content"""
         test_content = """
@@ -4,6 +4,7 @@ DeepSeek Knowledge-Based Arrow Data Extractor
 Fallback system that queries DeepSeek directly for arrow specifications when scraping fails
 """
 
+import asyncio
 import json
 import re
 import requests
@@ -22,8 +23,9 @@ except ImportError:
 class DeepSeekKnowledgeExtractor:
     """Extract arrow specifications using DeepSeek's training knowledge as fallback"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_tokens: int = 3000):
         self.api_key = api_key
+        self.max_tokens = max_tokens  # Models with many spines were truncated at 1000
         self.base_url = "https://api.deepseek.com/v1/chat/completions"
         self.headers = {
             "Authorization": f"Bearer {api_key}",
@@ -148,7 +150,7 @@ JSON OUTPUT:"""
             "model": "deepseek-chat",
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.1,  # Low temperature for factual accuracy
-            "max_tokens": 1000
+            "max_tokens": self.max_tokens
         }
         
         try:
@@ -259,6 +261,48 @@ JSON OUTPUT:"""
             print(f"⚠️  Response parsing error: {str(e)[:100]}")
             return []
     
+    async def extract_many_from_knowledge(self, queries: List[Dict[str, str]], llm_client=None) -> Dict[str, List[Any]]:
+        """
+        Run knowledge queries concurrently through the async client.
+        queries: [{'url': ..., 'manufacturer': ..., 'model_name': ...}] (model_name optional).
+        Returns {url: [arrows]}; token usage is reported per manufacturer by the client.
+        """
+        from async_llm_client import AsyncDeepSeekClient, TokenBudgetExceeded
+        
+        owns_client = llm_client is None
+        if owns_client:
+            llm_client = AsyncDeepSeekClient(self.api_key)
+        
+        async def run_query(query: Dict[str, str]):
+            url = query['url']
+            manufacturer = query.get('manufacturer') or self._infer_manufacturer_from_url(url)
+            model_name = query.get('model_name') or self._extract_model_from_url(url)
+            prompt = self._create_knowledge_prompt(manufacturer, model_name, url)
+            
+            try:
+                response = await llm_client.chat(prompt, max_tokens=self.max_tokens, usage_key=manufacturer)
+            except TokenBudgetExceeded as e:
+                print(f"⚠️  Skipping {manufacturer} {model_name}: {e}")
+                return url, []
+            
+            if not response:
+                return url, []
+            return url, self._parse_knowledge_response(response, manufacturer, model_name, url)
+        
+        results: Dict[str, List[Any]] = {}
+        try:
+            for outcome in await asyncio.gather(*(run_query(q) for q in queries), return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    print(f"❌ DeepSeek knowledge extraction error: {str(outcome)[:100]}")
+                    continue
+                url, arrows = outcome
+                results[url] = arrows
+        finally:
+            if owns_client:
+                await llm_client.close()
+        
+        return results
+    
     def can_help_with_manufacturer(self, manufacturer: str) -> bool:
         """Check if this extractor can potentially help with a manufacturer"""
         
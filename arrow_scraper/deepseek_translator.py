@@ -10,16 +10,21 @@ from typing import Dict, Any, Optional, List
 import openai
 from pathlib import Path
 
+from translation_memory import TranslationMemory, batch_segments, build_batch_prompt, parse_batch_response, join_segments
+
 class DeepSeekTranslator:
     """Translation service using DeepSeek API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, memory: Optional[TranslationMemory] = None, use_memory: bool = True):
         """Initialize translator with DeepSeek API key"""
         self.client = openai.OpenAI(
             api_key=api_key,
             base_url="https://api.deepseek.com"
         )
         
+        # Segment-level translation memory shared across runs
+        self.memory = memory or (TranslationMemory() if use_memory else None)
+        
         # Language detection patterns
         self.language_indicators = {
             'german': [
@@ -104,37 +109,10 @@ class DeepSeekTranslator:
             }
         
         try:
-            # Create translation prompt
-            prompt = f"""
-Translate the following {source_language} text about archery arrows to {target_language}.
-Preserve all technical terms, specifications, measurements, and product names.
-Keep arrow spine numbers, diameters, weights, and brand names unchanged.
-Maintain the original structure and formatting.
-
-Text to translate:
-{text}
-
-Provide only the translation, no explanations."""
-
-            print(f"🌍 Translating {len(text)} characters from {source_language} to {target_language}...")
-            
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a professional translator specializing in archery and sporting goods terminology. Translate accurately while preserving technical specifications."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistent translations
-                max_tokens=4000
-            )
-            
-            translated_text = response.choices[0].message.content.strip()
-            
-            # Rate limiting
-            time.sleep(1)
+            if self.memory:
+                translated_text = self.translate_batch([text], source_language, target_language)[0]
+            else:
+                translated_text = self._translate_uncached(text, source_language, target_language)
             
             return {
                 'original_text': text,
@@ -156,6 +134,72 @@ Provide only the translation, no explanations."""
                 'error': str(e)
             }
     
+    def _chat(self, prompt: str) -> str:
+        """Single DeepSeek chat call with the translator system prompt"""
+        response = self.client.chat.completions.create(
+            model="deepseek-chat",
+            messages=[
+                {
+                    "role": "system", 
+                    "content": "You are a professional translator specializing in archery and sporting goods terminology. Translate accurately while preserving technical specifications."
+                },
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1,  # Low temperature for consistent translations
+            max_tokens=4000
+        )
+        
+        # Rate limiting
+        time.sleep(1)
+        
+        return response.choices[0].message.content.strip()
+    
+    def _translate_uncached(self, text: str, source_language: str, target_language: str) -> str:
+        """Translate one text with a dedicated request (no memory)"""
+        prompt = f"""
+Translate the following {source_language} text about archery arrows to {target_language}.
+Preserve all technical terms, specifications, measurements, and product names.
+Keep arrow spine numbers, diameters, weights, and brand names unchanged.
+Maintain the original structure and formatting.
+
+Text to translate:
+{text}
+
+Provide only the translation, no explanations."""
+
+        print(f"🌍 Translating {len(text)} characters from {source_language} to {target_language}...")
+        return self._chat(prompt)
+    
+    def translate_batch(self, texts: List[str], source_language: str, 
+                        target_language: str = 'english') -> List[str]:
+        """
+        Translate several texts through the translation memory.
+        Known segments come from memory; the rest are sent in as few batched requests as possible.
+        """
+        if not self.memory:
+            return [self._translate_uncached(t, source_language, target_language) if t and t.strip() else t
+                    for t in texts]
+        
+        texts = [t or '' for t in texts]
+        known, missing = self.memory.prepare(texts, source_language, target_language)
+        
+        # Untranslated segments go out in batches bounded by count and size
+        for batch in batch_segments(missing):
+            print(f"🌍 Translating {len(batch)} new segments from {source_language} to {target_language} "
+                  f"({len(known)} from memory)...")
+            translations = parse_batch_response(self._chat(build_batch_prompt(batch, source_language, target_language)), len(batch))
+            
+            if translations is None:
+                # Model broke the array contract: fall back to one request per segment
+                print("⚠️  Batch translation response malformed, translating segments individually")
+                translations = [self._translate_uncached(segment, source_language, target_language) for segment in batch]
+                self.memory.stats['llm_calls'] += len(batch) - 1
+            
+            self.memory.record_translations(batch, translations, source_language, target_language)
+            known.update(zip(batch, translations))
+        
+        return [join_segments(text, known) for text in texts]
+    
     def translate_arrow_data(self, arrow_data: Dict[str, Any], 
                             source_language: Optional[str] = None) -> Dict[str, Any]:
         """Translate arrow specification data"""
@@ -189,46 +233,51 @@ Provide only the translation, no explanations."""
         
         print(f"🔤 Translating arrow data from {source_language}...")
         
-        # Translate each field
-        for field in translatable_fields:
-            if field in arrow_data and arrow_data[field]:
-                original_value = arrow_data[field]
-                
-                # Skip very short values (likely already English or not worth translating)
-                if len(str(original_value)) < 10:
-                    continue
-                
-                translation_result = self.translate_text(
-                    str(original_value), 
-                    source_language=source_language
-                )
-                
-                if translation_result['translation_confidence'] > 0.5:
-                    # Store original and translated versions
-                    translated_data[f'{field}_original'] = original_value
-                    translated_data[field] = translation_result['translated_text']
-                    
-                    translation_info['translations_performed'].append({
-                        'field': field,
-                        'original': original_value,
-                        'translated': translation_result['translated_text'],
-                        'confidence': translation_result['translation_confidence']
-                    })
-                    
-                    print(f"   ✅ {field}: {original_value[:50]}... → {translation_result['translated_text'][:50]}...")
+        # Collect every translatable value first so they go out in one batched request
+        fields_to_translate = [
+            field for field in translatable_fields
+            if field in arrow_data and arrow_data[field]
+            # Skip very short values (likely already English or not worth translating)
+            and len(str(arrow_data[field])) >= 10
+        ]
+        spec_note_indexes = [
+            i for i, spec in enumerate(translated_data.get('spine_specifications') or [])
+            if isinstance(spec, dict) and spec.get('notes')
+        ]
+        texts = [str(arrow_data[field]) for field in fields_to_translate]
+        texts += [translated_data['spine_specifications'][i]['notes'] for i in spec_note_indexes]
+        
+        if not texts:
+            translated_data['translation_info'] = translation_info
+            return translated_data
+        
+        try:
+            translations = self.translate_batch(texts, source_language)
+        except Exception as e:
+            print(f"❌ Translation error: {e}")
+            translated_data['translation_info'] = translation_info
+            return translated_data
+        
+        for field, translated_text in zip(fields_to_translate, translations):
+            original_value = arrow_data[field]
+            # Store original and translated versions
+            translated_data[f'{field}_original'] = original_value
+            translated_data[field] = translated_text
+            
+            translation_info['translations_performed'].append({
+                'field': field,
+                'original': original_value,
+                'translated': translated_text,
+                'confidence': 0.9
+            })
+            
+            print(f"   ✅ {field}: {str(original_value)[:50]}... → {translated_text[:50]}...")
         
         # Translate spine specification notes if present
-        if 'spine_specifications' in translated_data:
-            for i, spec in enumerate(translated_data['spine_specifications']):
-                if 'notes' in spec and spec['notes']:
-                    translation_result = self.translate_text(
-                        spec['notes'], 
-                        source_language=source_language
-                    )
-                    
-                    if translation_result['translation_confidence'] > 0.5:
-                        translated_data['spine_specifications'][i]['notes_original'] = spec['notes']
-                        translated_data['spine_specifications'][i]['notes'] = translation_result['translated_text']
+        for i, translated_text in zip(spec_note_indexes, translations[len(fields_to_translate):]):
+            spec = translated_data['spine_specifications'][i]
+            spec['notes_original'] = spec['notes']
+            spec['notes'] = translated_text
         
         translated_data['translation_info'] = translation_info
         
@@ -259,6 +308,9 @@ Provide only the translation, no explanations."""
             
             translated_data['arrows'] = translated_arrows
         
+        if self.memory:
+            self.memory.print_run_report()
+        
         # Add metadata about translation
         translated_data['translation_metadata'] = {
             'translated_at': time.time(),
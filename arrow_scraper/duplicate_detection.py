@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Arrow Detection
+Model names are normalized, cut into character shingles and summarized as MinHash
+signatures. LSH banding over the signatures yields candidate pairs inside each
+manufacturer block (optionally only arrows with overlapping spines), and only those
+candidates are verified with SequenceMatcher - instead of comparing every pair.
+Shared by DatabaseCleaner and ArrowDataValidator duplicate detection and merging.
+
+Similar names are often different products of one line (Superdrive 23/25/27, Velocity and
+Velocity XT), so near-duplicate groups are for review; variant_tokens() tells them apart.
+"""
+
+import difflib
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Minimum SequenceMatcher ratio between normalized model names to call two arrows duplicates
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+# MinHash signature length, LSH bands (rows per band = NUM_PERM / BANDS) and shingle size.
+# Character bigrams in 32 bands of 3 rows make a pair with Jaccard 0.6 (one edit in a
+# ten-character name) collide in at least one band with probability > 0.999, and one with
+# Jaccard 0.4 with probability ~0.88
+NUM_PERM = 96
+BANDS = 32
+SHINGLE_SIZE = 2
+
+# Archery terms that add noise to model name comparisons
+NOISE_WORDS = frozenset(['arrow', 'shaft', 'hunting', 'target', 'carbon', 'aluminum', 'wood'])
+
+# Suffixes that name a different product of the same line (Velocity vs Velocity XT, Fulmen XL vs XXL)
+VARIANT_WORDS = frozenset(['x', 'xt', 'xl', 'xxl', 'xs', 'se', 'sl', 'lt', 'lrt', 'hd', 'sd', 'pro', 'plus',
+                           'max', 'lite', 'ultra', 'mini', 'micro', 'jr', 'fmj'])
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_model_name(model_name: Optional[str]) -> str:
+    """Normalize model name for better comparison"""
+    if not model_name:
+        return ""
+
+    normalized = model_name.lower().strip()
+
+    # Remove trademark symbols, normalize spacing and punctuation
+    normalized = re.sub(r'[™®©]', '', normalized)
+    normalized = re.sub(r'[_\-\s]+', ' ', normalized)
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+
+    words = [word for word in normalized.split() if word not in NOISE_WORDS]
+    return ' '.join(words).strip()
+
+
+def variant_tokens(model_name: Optional[str]) -> FrozenSet[str]:
+    """
+    Numbers (diameters, model numbers like the 23 in 'V Tac23') and variant suffixes of a model
+    name. Similar names whose tokens differ are different products, not spelling variants.
+    """
+    tokens = set()
+    # Letter and digit runs separately, so 'Pro-XT40' yields pro, xt and 40
+    for token in re.findall(r'[a-z]+|\d+(?:\.\d+)?', (model_name or '').lower()):
+        if token[0].isdigit():
+            tokens.add(f"{float(token):g}")
+        elif token in VARIANT_WORDS:
+            tokens.add(token)
+    return frozenset(tokens)
+
+
+def normalized_similarity(norm1: str, norm2: str) -> float:
+    """Similarity of two already normalized model names (1.0 for exact matches)"""
+    if not norm1 or not norm2:
+        return 0.0
+    if norm1 == norm2:
+        return 1.0
+    return difflib.SequenceMatcher(None, norm1, norm2).ratio()
+
+
+def model_name_similarity(name1: Optional[str], name2: Optional[str]) -> float:
+    """Calculate similarity score between two model names"""
+    return normalized_similarity(normalize_model_name(name1), normalize_model_name(name2))
+
+
+def spine_set(spines: Any) -> FrozenSet[str]:
+    """Spine values from a GROUP_CONCAT string or an iterable, as comparable strings"""
+    if not spines:
+        return frozenset()
+    if isinstance(spines, str):
+        spines = spines.split(',')
+    values = set()
+    for spine in spines:
+        text = str(spine).strip()
+        if not text:
+            continue
+        try:
+            text = f"{float(text):g}"
+        except ValueError:
+            text = text.lower()
+        values.add(text)
+    return frozenset(values)
+
+
+class NearDuplicateDetector:
+    """MinHash/LSH candidate generation plus SequenceMatcher verification for arrow model names"""
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD, block_on_spine: bool = False,
+                 num_perm: int = NUM_PERM, bands: int = BANDS, shingle_size: int = SHINGLE_SIZE, seed: int = 1):
+        """
+        Args:
+            threshold: Minimum similarity for a verified duplicate
+            block_on_spine: Only pair arrows whose spine sets overlap (arrows without spine
+                data are paired with anything in their manufacturer block)
+            num_perm: MinHash signature length
+            bands: LSH bands; num_perm must be divisible by bands
+            shingle_size: Characters per shingle
+            seed: Seed for the MinHash permutations (signatures are stable for a given seed)
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.block_on_spine = block_on_spine
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME) | 1, rng.randrange(0, _MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+        self._shingle_hashes: Dict[str, Tuple[int, ...]] = {}
+        self._band_keys: Dict[str, Tuple[int, ...]] = {}
+        self.stats = {'arrows': 0, 'candidate_pairs': 0, 'verified_pairs': 0}
+
+    def shingles(self, normalized: str) -> Set[str]:
+        """Character shingles of a normalized name (short names are one shingle)"""
+        size = self.shingle_size
+        if len(normalized) <= size:
+            return {normalized}
+        return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+    def signature(self, normalized: str) -> Tuple[int, ...]:
+        """MinHash signature of a normalized name"""
+        vectors = []
+        for shingle in self.shingles(normalized):
+            # The shingle vocabulary is small, so each shingle is permuted once
+            vector = self._shingle_hashes.get(shingle)
+            if vector is None:
+                h = zlib.crc32(shingle.encode('utf-8'))
+                vector = self._shingle_hashes[shingle] = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._perms)
+            vectors.append(vector)
+        return tuple(map(min, *vectors)) if len(vectors) > 1 else vectors[0]
+
+    def band_keys(self, normalized: str) -> Tuple[int, ...]:
+        """One hash per LSH band of the name's signature (cached per distinct name)"""
+        keys = self._band_keys.get(normalized)
+        if keys is None:
+            signature = self.signature(normalized)
+            rows = self.rows
+            keys = self._band_keys[normalized] = tuple(hash((band, signature[band * rows:(band + 1) * rows]))
+                                                       for band in range(self.bands))
+        return keys
+
+    def similarity(self, norm1: str, norm2: str) -> Optional[float]:
+        """Similarity of two normalized names, or None when it is below the threshold"""
+        if norm1 == norm2:
+            return 1.0
+        # real_quick_ratio/quick_ratio are cheap upper bounds of ratio()
+        matcher = difflib.SequenceMatcher(None, norm1, norm2)
+        if matcher.real_quick_ratio() < self.threshold or matcher.quick_ratio() < self.threshold:
+            return None
+        score = matcher.ratio()
+        return score if score >= self.threshold else None
+
+    def similar_pairs(self, arrows: Sequence[Mapping[str, Any]]) -> List[Tuple[int, int, float]]:
+        """
+        Verified (i, j, similarity) index pairs, i < j, sorted by (i, j). Only arrows sharing a
+        manufacturer and at least one LSH bucket (and a spine, when blocking on spine) are compared.
+
+        Args:
+            arrows: Rows/dicts with manufacturer and model_name (and spines when blocking on spine)
+        """
+        normalized = [normalize_model_name(arrow['model_name']) for arrow in arrows]
+        spines = [spine_set(arrow['spines']) for arrow in arrows] if self.block_on_spine else None
+
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for index, arrow in enumerate(arrows):
+            if normalized[index] and arrow['manufacturer']:
+                blocks[arrow['manufacturer'].strip().lower()].append(index)
+
+        verified = []
+        candidate_count = 0
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            # Buckets are keyed by band hash; a hash collision only adds a candidate
+            buckets: Dict[int, List[int]] = defaultdict(list)
+            for index in members:
+                for key in self.band_keys(normalized[index]):
+                    buckets[key].append(index)
+
+            # Candidates are collected per arrow so the block's pair set is never materialized
+            for i in members:
+                candidates = set()
+                for key in self.band_keys(normalized[i]):
+                    bucket = buckets[key]
+                    if len(bucket) > 1:
+                        candidates.update(bucket)
+                for j in sorted(j for j in candidates if j > i):
+                    if spines is not None and spines[i] and spines[j] and not spines[i] & spines[j]:
+                        continue
+                    candidate_count += 1
+                    score = self.similarity(normalized[i], normalized[j])
+                    if score is not None:
+                        verified.append((i, j, score))
+
+        verified.sort()
+        self.stats = {'arrows': len(arrows), 'candidate_pairs': candidate_count, 'verified_pairs': len(verified)}
+        return verified
+
+    def duplicate_groups(self, arrows: Sequence[Mapping[str, Any]]) -> List[List[Tuple[int, float]]]:
+        """
+        Greedy duplicate groups in input order: each not yet grouped arrow collects every later,
+        not yet grouped arrow similar to it. Groups are lists of (index, similarity) and start
+        with (leader index, 1.0); only groups with more than one arrow are returned.
+        """
+        neighbours: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        for i, j, score in self.similar_pairs(arrows):
+            neighbours[i].append((j, score))
+
+        grouped: Set[int] = set()
+        groups = []
+        for i in range(len(arrows)):
+            if i in grouped or i not in neighbours:
+                continue
+            group = [(i, 1.0)] + [(j, score) for j, score in neighbours[i] if j not in grouped]
+            if len(group) > 1:
+                grouped.update(index for index, _ in group)
+                groups.append(group)
+        return groups
@@ -9,30 +9,22 @@ specification images using EasyOCR.
 import requests
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Tuple
-from pathlib import Path
 from models import ArrowSpecification, SpineSpecification
+from ocr_service import OCRService, get_ocr_service
 
 class EasyOCRCarbonExpressExtractor:
     """Free OCR extractor for Carbon Express using EasyOCR"""
     
-    def __init__(self):
-        self.reader = None
-        self._initialize_reader()
+    def __init__(self, ocr_service: Optional[OCRService] = None):
+        # Shared warm worker pool: models load once per worker, not per extractor instance
+        self.ocr_service = ocr_service or get_ocr_service()
     
-    def _initialize_reader(self):
-        """Initialize EasyOCR reader"""
-        try:
-            import easyocr
-            print("🤖 Initializing EasyOCR...")
-            self.reader = easyocr.Reader(['en'], verbose=False)
-            print("✅ EasyOCR ready")
-        except ImportError:
-            print("❌ EasyOCR not available (pip install easyocr)")
-            self.reader = None
-        except Exception as e:
-            print(f"❌ EasyOCR initialization error: {e}")
-            self.reader = None
+    @property
+    def reader(self) -> Optional[OCRService]:
+        """OCR backend if EasyOCR is available (kept for callers checking `extractor.reader`)"""
+        return self.ocr_service if self.ocr_service.available else None
     
     def download_image(self, image_url: str) -> Optional[bytes]:
         """Download image and return bytes"""
@@ -46,32 +38,16 @@ class EasyOCRCarbonExpressExtractor:
     
     def extract_text_from_image(self, image_data: bytes) -> List[Tuple[str, float]]:
         """Extract text from image using EasyOCR"""
+        return self.extract_text_from_images([image_data])[0]
+    
+    def extract_text_from_images(self, images: List[bytes]) -> List[List[Tuple[str, float]]]:
+        """Extract text from several images in parallel on the warm OCR pool"""
         if not self.reader:
-            return []
+            return [[] for _ in images]
         
-        try:
-            # Save image temporarily
-            temp_path = "temp_carbon_express.png"
-            with open(temp_path, 'wb') as f:
-                f.write(image_data)
-            
-            # Extract text
-            results = self.reader.readtext(temp_path)
-            
-            # Clean up
-            Path(temp_path).unlink(missing_ok=True)
-            
-            # Return text with confidence
-            text_results = []
-            for (bbox, text, confidence) in results:
-                if confidence > 0.5:  # Only confident detections
-                    text_results.append((text.strip(), confidence))
-            
-            return text_results
-            
-        except Exception as e:
-            print(f"❌ OCR extraction error: {e}")
-            return []
+        # Only confident detections
+        return [[(text, confidence) for text, confidence in results if confidence > 0.5]
+                for results in self.ocr_service.ocr_images(images)]
     
     def parse_image_specifications(self, text_results: List[Tuple[str, float]], model_hint: str = "", manufacturer: str = "Unknown") -> Dict:
         """Parse OCR text results to extract arrow specifications from images"""
@@ -411,31 +387,32 @@ class EasyOCRCarbonExpressExtractor:
             print(f"   📋 {i}. {filename} → {img_url}")
         print()
         
-        # Try each image (process all images, don't return early)
+        # Download all images concurrently, then OCR them in parallel on the worker pool
+        with ThreadPoolExecutor(max_workers=min(8, len(spec_images))) as pool:
+            downloaded = list(pool.map(self.download_image, spec_images))
+        
+        ocr_inputs = [data for data in downloaded if data]
+        print(f"🤖 Starting OCR on {len(ocr_inputs)} images...")
+        ocr_outputs = iter(self.extract_text_from_images(ocr_inputs))
+        
+        # Parse each image (process all images, don't return early)
         all_arrows = []
         successful_extractions = 0
         
-        for i, image_url in enumerate(spec_images, 1):
+        for i, (image_url, image_data) in enumerate(zip(spec_images, downloaded), 1):
             filename = image_url.split('/')[-1].split('?')[0]
             print(f"📊 Processing image {i}/{len(spec_images)}: {filename}")
             
             try:
-                # Download image
-                image_data = self.download_image(image_url)
                 if not image_data:
                     print(f"❌ Failed to download image {i}: {filename}")
                     continue
                 
                 print(f"✓ Downloaded {len(image_data)} bytes")
                 
-                # Extract text using OCR
-                print(f"🤖 Starting OCR on {filename}...")
-                text_results = self.extract_text_from_image(image_data)
+                text_results = next(ocr_outputs)
                 if not text_results:
                     print(f"⚠️  No OCR text extracted from image {i}")
-                    # Debug: Check if reader is available
-                    if not self.reader:
-                        print(f"❌ EasyOCR reader not initialized!")
                     continue
                 
                 print(f"✓ OCR extracted {len(text_results)} text elements")
@@ -15,14 +15,16 @@ import sqlite3
 import json
 import os
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
 from unified_database import UnifiedDatabase
+from model_suggestion_index import get_model_suggestion_index
 
 class EquipmentLearningManager:
     """Manages auto-learning of manufacturers and equipment models"""
     
     def __init__(self):
         self.user_db = UnifiedDatabase()
+        # Shared per database; model usage is counted in memory and written in batches
+        self.model_index = get_model_suggestion_index(self.user_db.db_path)
     
     def learn_equipment_entry(self, manufacturer_name: str, model_name: str, 
                             category_name: str, user_id: int) -> Dict:
@@ -132,40 +134,16 @@ class EquipmentLearningManager:
             else:
                 learning_info['manufacturer_status'] = 'existing'
             
-            # Learn model name (always do this for usage statistics)
-            cursor.execute('''
-                INSERT OR REPLACE INTO equipment_models 
-                (manufacturer_name, model_name, category_name, usage_count, last_used, created_by_user_id, first_seen)
-                VALUES (
-                    ?, ?, ?, 
-                    COALESCE((SELECT usage_count FROM equipment_models 
-                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), 0) + 1,
-                    CURRENT_TIMESTAMP,
-                    ?,
-                    COALESCE((SELECT first_seen FROM equipment_models 
-                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), CURRENT_TIMESTAMP)
-                )
-            ''', (manufacturer_name, model_name, category_name,
-                  manufacturer_name, model_name, category_name,
-                  user_id,
-                  manufacturer_name, model_name, category_name))
+            conn.commit()
             
-            # Get the usage count for reporting
-            cursor.execute('''
-                SELECT usage_count FROM equipment_models 
-                WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?
-            ''', (manufacturer_name, model_name, category_name))
-            usage_result = cursor.fetchone()
-            learning_info['model_usage_count'] = usage_result['usage_count'] if usage_result else 1
+            # Learn model name (always do this for usage statistics); the index queues the
+            # equipment_models and equipment_usage_stats writes for its background writer
+            learning_info['model_usage_count'] = self.model_index.record_usage(
+                manufacturer_name, model_name, category_name, user_id)
             
             if learning_info['model_usage_count'] == 1:
                 learning_info['new_model'] = True
             
-            # Update usage statistics
-            self._update_usage_stats(cursor, manufacturer_name, model_name, category_name)
-            
-            conn.commit()
-            
         except Exception as e:
             print(f"Error in equipment learning: {e}")
             conn.rollback()
@@ -180,47 +158,11 @@ class EquipmentLearningManager:
         Get model name suggestions based on manufacturer and category
         Returns models ordered by usage frequency and relevance
         """
-        conn = self.user_db.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            # Base query for models
-            sql = '''
-                SELECT model_name, usage_count, last_used,
-                       (usage_count * 0.7 + 
-                        (julianday('now') - julianday(last_used)) * -0.3) as relevance_score
-                FROM equipment_models 
-                WHERE LOWER(manufacturer_name) = LOWER(?) AND category_name = ?
-            '''
-            params = [manufacturer_name, category_name]
-            
-            # Add query filtering if provided
-            if query:
-                sql += ' AND LOWER(model_name) LIKE LOWER(?)'
-                params.append(f'%{query}%')
-            
-            sql += ' ORDER BY relevance_score DESC, usage_count DESC LIMIT ?'
-            params.append(limit)
-            
-            cursor.execute(sql, params)
-            results = cursor.fetchall()
-            
-            suggestions = []
-            for row in results:
-                suggestions.append({
-                    'model_name': row['model_name'],
-                    'usage_count': row['usage_count'],
-                    'last_used': row['last_used'],
-                    'relevance_score': round(row['relevance_score'], 2)
-                })
-            
-            return suggestions
-            
+            return self.model_index.suggestions(manufacturer_name, category_name, query, limit)
         except Exception as e:
             print(f"Error getting model suggestions: {e}")
             return []
-        finally:
-            conn.close()
     
     def get_pending_manufacturers(self, status: str = 'pending', limit: int = 50) -> List[Dict]:
         """Get pending manufacturers for admin review"""
@@ -327,6 +269,8 @@ class EquipmentLearningManager:
     def get_equipment_usage_analytics(self, category_name: str = None, 
                                     days: int = 30) -> Dict:
         """Get equipment usage analytics"""
+        # Include usage still queued in the model index
+        self.model_index.flush()
         conn = self.user_db.get_connection()
         cursor = conn.cursor()
         
@@ -376,42 +320,6 @@ class EquipmentLearningManager:
         finally:
             conn.close()
     
-    def _update_usage_stats(self, cursor, manufacturer_name: str, model_name: str, category_name: str):
-        """Update monthly usage statistics"""
-        try:
-            # Get current month period
-            now = datetime.now()
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            
-            # Calculate next month start
-            if now.month == 12:
-                period_end = period_start.replace(year=now.year + 1, month=1)
-            else:
-                period_end = period_start.replace(month=now.month + 1)
-            
-            # Update or insert usage stats
-            cursor.execute('''
-                INSERT OR REPLACE INTO equipment_usage_stats 
-                (manufacturer_name, model_name, category_name, monthly_usage, total_usage, 
-                 period_start, period_end, last_updated)
-                VALUES (
-                    ?, ?, ?, 
-                    COALESCE((SELECT monthly_usage FROM equipment_usage_stats 
-                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ? 
-                             AND period_start = ?), 0) + 1,
-                    COALESCE((SELECT total_usage FROM equipment_usage_stats 
-                             WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?
-                             AND period_start = ?), 0) + 1,
-                    ?, ?, CURRENT_TIMESTAMP
-                )
-            ''', (manufacturer_name, model_name, category_name,
-                  manufacturer_name, model_name, category_name, period_start.date(),
-                  manufacturer_name, model_name, category_name, period_start.date(),
-                  period_start.date(), period_end.date()))
-                  
-        except Exception as e:
-            print(f"Warning: Could not update usage stats: {e}")
-
 def test_equipment_learning():
     """Test the equipment learning functionality"""
     learning = EquipmentLearningManager()
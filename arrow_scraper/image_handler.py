@@ -13,6 +13,12 @@ from urllib.parse import urlparse
 import logging
 from cdn_uploader import CDNUploader
 
+try:
+    from image_pipeline import ImagePipeline
+    IMAGE_PIPELINE_AVAILABLE = True
+except ImportError:
+    IMAGE_PIPELINE_AVAILABLE = False
+
 class ImageHandler:
     """Enhanced image handling with CDN upload capabilities"""
     
@@ -227,18 +233,51 @@ class ImageHandler:
     def process_multiple_images(self, image_urls: List[str], manufacturer: str, 
                                model_name: str) -> List[Dict[str, Any]]:
         """Process multiple images for a single arrow model"""
-        results = []
+        jobs = [(image_url, manufacturer, model_name, "primary" if i == 0 else f"detail_{i}")
+                for i, image_url in enumerate(image_urls)]
+        return self.process_image_jobs(jobs)
+    
+    def process_image_jobs(self, jobs: List[tuple], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Ingest (image_url, manufacturer, model_name, image_type) jobs concurrently:
+        pooled downloads, content/perceptual dedup, WebP variants, then parallel CDN uploads
+        """
+        if not IMAGE_PIPELINE_AVAILABLE:
+            # aiohttp missing: sequential fallback
+            return [self.process_image(*job) for job in jobs]
         
-        for i, image_url in enumerate(image_urls):
-            # Determine image type based on position
-            image_type = "primary" if i == 0 else f"detail_{i}"
-            
-            result = self.process_image(image_url, manufacturer, model_name, image_type)
-            results.append(result)
-            
-            # Rate limiting to be respectful
-            if i < len(image_urls) - 1:  # Don't sleep after last image
-                time.sleep(0.5)
+        if not hasattr(self, 'pipeline'):
+            self.pipeline = ImagePipeline(str(self.local_storage_dir))
+        results = self.pipeline.ingest_many_sync(jobs)
+        self.pipeline.print_stats()
+        
+        ok = [r for r in results if r['status'] == 'success']
+        cdn_results = {}
+        if self.cdn_enabled and self.cdn_uploader and ok:
+            uploads = []
+            for r in ok:
+                uploads.append((r['local_path'], r['manufacturer'], r['model_name'], 'primary'))
+                uploads.extend((path, r['manufacturer'], r['model_name'], size)
+                               for size, path in r.get('variants', {}).items())
+            # Duplicates across arrows share one file; upload each path once
+            unique_uploads = list({u[0]: u for u in uploads}.values())
+            for upload, cdn_result in zip(unique_uploads, self.cdn_uploader.upload_many(unique_uploads, max_workers)):
+                if cdn_result:
+                    cdn_results[upload[0]] = cdn_result
+        
+        for r in ok:
+            cdn_result = cdn_results.get(r['local_path'])
+            if cdn_result:
+                r.update({
+                    "cdn_url": cdn_result["cdn_url"],
+                    "cdn_type": cdn_result["cdn_type"],
+                    "cdn_metadata": cdn_result,
+                    "image_url": cdn_result["cdn_url"],
+                    "cdn_variants": {size: cdn_results[path]["cdn_url"]
+                                     for size, path in r.get('variants', {}).items() if path in cdn_results}
+                })
+            else:
+                r["image_url"] = self._generate_local_url(r['local_path'])
         
         return results
     
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Concurrent Image Ingest Pipeline
+Downloads arrow images through one pooled async HTTP client, stores each distinct image
+once (content hash, plus perceptual-hash near-duplicate detection within each model) and generates WebP
+thumbnail/medium variants at ingest so the API can serve small pre-sized files.
+"""
+
+import asyncio
+import hashlib
+import io
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Longest side in pixels for each pre-sized WebP variant
+VARIANT_SIZES = {
+    'thumb': 160,
+    'medium': 480,
+}
+
+# Max Hamming distance between 64-bit dHashes to treat two images as the same picture.
+# Only compared within one manufacturer/model: plain shafts on white look alike across models
+NEAR_DUPLICATE_DISTANCE = 6
+
+MIN_IMAGE_BYTES = 1024
+
+# (image_url, manufacturer, model_name, image_type)
+ImageJob = Tuple[str, str, str, str]
+
+
+def safe_name(value: str) -> str:
+    return "".join(c for c in value if c.isalnum() or c in (' ', '-', '_')).replace(' ', '_')
+
+
+def variant_path(images_dir: Path, filename: str, size: str) -> Path:
+    """Location of a pre-sized WebP variant for an original image file"""
+    return Path(images_dir) / 'variants' / size / f"{Path(filename).stem}.webp"
+
+
+def dhash(image: 'Image.Image') -> int:
+    """64-bit difference hash: robust to rescaling/recompression of the same picture"""
+    small = image.convert('L').resize((9, 8), Image.LANCZOS)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def build_variants(data: bytes, images_dir: Path, filename: str) -> Dict[str, Any]:
+    """Decode once, compute the perceptual hash and write all WebP variants (CPU bound, run in a thread)"""
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    info = {'width': image.width, 'height': image.height, 'phash': dhash(image), 'variants': {}}
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'P') else 'RGB')
+
+    for size, max_side in VARIANT_SIZES.items():
+        target = variant_path(images_dir, filename, size)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        variant = image.copy()
+        variant.thumbnail((max_side, max_side), Image.LANCZOS)
+        variant.save(target, 'WEBP', quality=80, method=4)
+        info['variants'][size] = str(target)
+
+    return info
+
+
+class ImageIndex:
+    """sqlite index of stored images by content hash, perceptual hash and source URL"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+        self._phashes = self._load_phashes()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS image_assets (
+                    content_hash TEXT PRIMARY KEY,
+                    phash TEXT,
+                    filename TEXT NOT NULL,
+                    width INTEGER,
+                    height INTEGER,
+                    bytes INTEGER,
+                    created_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS image_sources (
+                    source_url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    manufacturer TEXT,
+                    model_name TEXT,
+                    image_type TEXT
+                );
+            """)
+
+    def _load_phashes(self) -> Dict[Tuple[str, str], List[Tuple[int, str]]]:
+        phashes: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+        with self._get_connection() as conn:
+            for row in conn.execute("""
+                SELECT DISTINCT a.phash, a.content_hash, s.manufacturer, s.model_name
+                FROM image_assets a JOIN image_sources s ON s.content_hash = a.content_hash
+                WHERE a.phash IS NOT NULL
+            """):
+                phashes.setdefault((row['manufacturer'], row['model_name']), []).append(
+                    (int(row['phash'], 16), row['content_hash']))
+        return phashes
+
+    def by_source(self, source_url: str) -> Optional[sqlite3.Row]:
+        with self._get_connection() as conn:
+            return conn.execute("""
+                SELECT a.* FROM image_sources s JOIN image_assets a ON a.content_hash = s.content_hash
+                WHERE s.source_url = ?
+            """, (source_url,)).fetchone()
+
+    def by_hash(self, content_hash: str) -> Optional[sqlite3.Row]:
+        with self._get_connection() as conn:
+            return conn.execute("SELECT * FROM image_assets WHERE content_hash = ?", (content_hash,)).fetchone()
+
+    def near_duplicate(self, phash: int, manufacturer: str, model_name: str,
+                       max_distance: int = NEAR_DUPLICATE_DISTANCE) -> Optional[sqlite3.Row]:
+        """Closest stored image of the same manufacturer/model within max_distance"""
+        best = None
+        for known, content_hash in self._phashes.get((manufacturer, model_name), []):
+            distance = hamming(phash, known)
+            if distance <= max_distance and (best is None or distance < best[0]):
+                best = (distance, content_hash)
+        return self.by_hash(best[1]) if best else None
+
+    def add_asset(self, content_hash: str, filename: str, size: int, info: Dict[str, Any],
+                  manufacturer: str, model_name: str):
+        phash = info.get('phash')
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT OR IGNORE INTO image_assets (content_hash, phash, filename, width, height, bytes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (content_hash, f"{phash:016x}" if phash is not None else None, filename,
+                  info.get('width'), info.get('height'), size, time.time()))
+        if phash is not None:
+            self._phashes.setdefault((manufacturer, model_name), []).append((phash, content_hash))
+
+    def add_source(self, source_url: str, content_hash: str, manufacturer: str, model_name: str, image_type: str):
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO image_sources (source_url, content_hash, manufacturer, model_name, image_type)
+                VALUES (?, ?, ?, ?, ?)
+            """, (source_url, content_hash, manufacturer, model_name, image_type))
+
+
+class ImagePipeline:
+    """Pooled async downloader with content/perceptual dedup and WebP variants"""
+
+    def __init__(self, images_dir: str = "./data/images", concurrency: int = 8, per_host: int = 4,
+                 max_retries: int = 3, timeout: int = 30, near_duplicate_distance: int = NEAR_DUPLICATE_DISTANCE):
+        self.images_dir = Path(images_dir)
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.near_duplicate_distance = near_duplicate_distance
+        self.index = ImageIndex(self.images_dir / 'image_index.db')
+        self._hash_locks: Dict[str, asyncio.Lock] = {}
+        self.stats = {'downloaded': 0, 'cached': 0, 'exact_duplicates': 0, 'near_duplicates': 0,
+                      'stored': 0, 'failed': 0, 'bytes_downloaded': 0}
+
+    def _result_for_asset(self, asset: sqlite3.Row, job: ImageJob, status: str, **extra) -> Dict[str, Any]:
+        image_url, manufacturer, model_name, image_type = job
+        filename = asset['filename']
+        variants = {size: str(variant_path(self.images_dir, filename, size))
+                    for size in VARIANT_SIZES if variant_path(self.images_dir, filename, size).exists()}
+        return {
+            "original_url": image_url,
+            "local_path": str(self.images_dir / filename),
+            "content_hash": asset['content_hash'],
+            "variants": variants,
+            "width": asset['width'],
+            "height": asset['height'],
+            "status": "success",
+            "dedup": status,
+            "manufacturer": manufacturer,
+            "model_name": model_name,
+            "image_type": image_type,
+            "processed_at": time.time(),
+            **extra
+        }
+
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        for attempt in range(self.max_retries):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    if not content_type.startswith('image/'):
+                        raise ValueError(f"Invalid content type: {content_type}")
+                    data = await response.read()
+                    if len(data) < MIN_IMAGE_BYTES:
+                        raise ValueError(f"File too small: {len(data)} bytes")
+                    return data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                wait_time = 2 ** attempt
+                print(f"⚠️  Download attempt {attempt + 1} failed for {url}, retrying in {wait_time}s: {e}")
+                await asyncio.sleep(wait_time)
+
+    async def _ingest_one(self, session: aiohttp.ClientSession, job: ImageJob) -> Dict[str, Any]:
+        image_url, manufacturer, model_name, image_type = job
+
+        # Same source URL already ingested: no network round trip at all
+        known = self.index.by_source(image_url)
+        if known and (self.images_dir / known['filename']).exists():
+            self.stats['cached'] += 1
+            return self._result_for_asset(known, job, 'cached')
+
+        try:
+            data = await self._download(session, image_url)
+        except Exception as e:
+            self.stats['failed'] += 1
+            return {"original_url": image_url, "local_path": None, "image_url": image_url,
+                    "status": "error", "error": str(e), "processed_at": time.time()}
+
+        self.stats['downloaded'] += 1
+        self.stats['bytes_downloaded'] += len(data)
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        # Different URLs serving identical bytes in the same batch must not store twice
+        lock = self._hash_locks.setdefault(content_hash, asyncio.Lock())
+        async with lock:
+            return await self._store(data, content_hash, job)
+
+    async def _store(self, data: bytes, content_hash: str, job: ImageJob) -> Dict[str, Any]:
+        image_url, manufacturer, model_name, image_type = job
+        asset = self.index.by_hash(content_hash)
+        if asset:
+            self.stats['exact_duplicates'] += 1
+            self.index.add_source(image_url, content_hash, manufacturer, model_name, image_type)
+            return self._result_for_asset(asset, job, 'exact_duplicate')
+
+        extension = Path(urlparse(image_url).path).suffix.lower() or '.jpg'
+        filename = f"{safe_name(manufacturer)}_{safe_name(model_name)}_{content_hash[:12]}{extension}"
+
+        info: Dict[str, Any] = {}
+        if PIL_AVAILABLE:
+            try:
+                info = await asyncio.to_thread(build_variants, data, self.images_dir, filename)
+            except Exception as e:
+                print(f"⚠️  Could not decode {image_url} for variants: {e}")
+
+        # Same picture of this model re-encoded or resized by the manufacturer site: reuse the stored copy
+        if info.get('phash') is not None:
+            near = self.index.near_duplicate(info['phash'], manufacturer, model_name, self.near_duplicate_distance)
+            if near:
+                self.stats['near_duplicates'] += 1
+                for variant in info.get('variants', {}).values():
+                    Path(variant).unlink(missing_ok=True)
+                self.index.add_source(image_url, near['content_hash'], manufacturer, model_name, image_type)
+                return self._result_for_asset(near, job, 'near_duplicate', near_duplicate_of=near['content_hash'])
+
+        (self.images_dir / filename).write_bytes(data)
+        self.index.add_asset(content_hash, filename, len(data), info, manufacturer, model_name)
+        self.index.add_source(image_url, content_hash, manufacturer, model_name, image_type)
+        self.stats['stored'] += 1
+        return self._result_for_asset(self.index.by_hash(content_hash), job, 'stored')
+
+    async def ingest_many(self, jobs: List[ImageJob]) -> List[Dict[str, Any]]:
+        """Ingest images concurrently; results are returned in input order"""
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        headers = {'User-Agent': 'ArrowTuner Image Scraper 1.0'}
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout, headers=headers) as session:
+            # Identical URLs in one batch share a single download
+            unique: Dict[str, asyncio.Task] = {}
+            for job in jobs:
+                if job[0] not in unique:
+                    unique[job[0]] = asyncio.create_task(self._ingest_one(session, job))
+            await asyncio.gather(*unique.values())
+
+        results = []
+        for job in jobs:
+            result = dict(unique[job[0]].result())
+            result.update({"manufacturer": job[1], "model_name": job[2], "image_type": job[3]})
+            results.append(result)
+        return results
+
+    def ingest_many_sync(self, jobs: List[ImageJob]) -> List[Dict[str, Any]]:
+        """Blocking wrapper for callers outside an event loop (async callers await ingest_many)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ingest_many(jobs))
+        raise RuntimeError("ingest_many_sync() cannot run inside an event loop; await ingest_many() instead")
+
+    def print_stats(self):
+        s = self.stats
+        print(f"🖼️  Images: {s['stored']} stored, {s['exact_duplicates']} exact dupes, "
+              f"{s['near_duplicates']} near dupes, {s['cached']} cached, {s['failed']} failed "
+              f"({s['bytes_downloaded'] / 1024:.0f} KB downloaded)")
@@ -7,9 +7,12 @@ Imports arrow data from existing JSON files only, no scraping
 import os
 import json
 import sqlite3
+import itertools
 from pathlib import Path
 from datetime import datetime
 
+from json_stream import ArrowExportStream
+
 def create_wood_arrow_data():
     """Create wood arrow data if not present"""
     print("🌳 Creating wood arrow data...")
@@ -185,15 +188,16 @@ def import_from_json_files():
         try:
             print(f"📄 Processing {json_file.name}...")
             
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            manufacturer = data.get('manufacturer', 'Unknown')
-            arrows = data.get('arrows', [])
+            # Stream arrows one at a time, large exports are never fully loaded
+            stream = ArrowExportStream(json_file)
+            manufacturer = stream.header.get('manufacturer', 'Unknown')
+            arrows = iter(stream)
+            first_arrow = next(arrows, None)
             
-            if not arrows:
+            if first_arrow is None:
                 print(f"  ⚠️ No arrows found in {json_file.name}")
                 continue
+            arrows = itertools.chain([first_arrow], arrows)
             
             processed_manufacturers.add(manufacturer)
             arrows_in_file = 0
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Parallel Import Pipeline
+Manufacturer files are parsed and normalized concurrently in a process pool (material
+normalization, German decimal conversion, diameter classification, content hashing) and
+the normalized batches are fed through a bounded queue to one writer thread, so SQLite
+still only ever sees a single writer.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from german_number_converter import preprocess_german_arrow_data
+from json_stream import ArrowExportStream
+try:
+    from models import classify_diameter as diameter_category_for
+except ImportError:
+    # models.py needs pydantic; without it imports leave diameter_category untouched
+    diameter_category_for = None
+
+# Arrows per normalized batch sent to the writer (one commit each)
+PIPELINE_BATCH_SIZE = 500
+
+# Normalized batches allowed in flight per worker before workers block
+QUEUE_BATCHES_PER_WORKER = 4
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_material(material: Optional[str]) -> str:
+    """Normalize material string to standard format"""
+    if not material:
+        return "Carbon"
+
+    material_lower = material.lower()
+
+    if "wood" in material_lower or "cedar" in material_lower:
+        return "Wood"
+    elif "aluminum" in material_lower and "carbon" in material_lower:
+        return "Carbon / Aluminum"
+    elif "aluminum" in material_lower or "alloy" in material_lower:
+        return "Aluminum"
+    else:
+        return "Carbon"
+
+
+def classify_diameter(inner_diameter: Optional[float], outer_diameter: Optional[float]) -> str:
+    """Classify arrow diameter into category"""
+    diameter = inner_diameter or outer_diameter
+
+    if not diameter or not isinstance(diameter, (int, float)):
+        return "Standard target"
+
+    if diameter < 0.200:
+        return "Ultra-thin"
+    elif diameter < 0.220:
+        return "Thin"
+    elif diameter < 0.250:
+        return "Small hunting"
+    elif diameter < 0.270:
+        return "Standard target"
+    elif diameter < 0.320:
+        return "Standard hunting"
+    elif diameter < 0.360:
+        return "Large hunting"
+    else:
+        return "Heavy hunting"
+
+
+def arrow_content_hash(arrow: Dict[str, Any]) -> str:
+    """SHA256 of the imported fields of one raw arrow entry"""
+    arrow_hash_data = {
+        "model_name": arrow.get("model_name"),
+        "spine_specifications": arrow.get("spine_specifications", []),
+        "material": arrow.get("material"),
+        "arrow_type": arrow.get("arrow_type"),
+        "description": arrow.get("description"),
+        "source_url": arrow.get("source_url"),
+        "primary_image_url": arrow.get("primary_image_url")
+    }
+    data_str = json.dumps(arrow_hash_data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
+
+
+def normalize_arrow(arrow: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the import-ready form of a raw arrow: German decimals converted, material
+    normalized and each spine specification tagged with its diameter category
+    """
+    specs = [dict(spec) if isinstance(spec, dict) else spec
+             for spec in arrow.get("spine_specifications") or []]
+    normalized = preprocess_german_arrow_data(dict(arrow, spine_specifications=specs))
+    normalized["model_name"] = (arrow.get("model_name") or "").strip()
+    normalized["material"] = normalize_material(arrow.get("material"))
+    for spec in specs:
+        if isinstance(spec, dict):
+            spec["diameter_category"] = diameter_category_value(spec.get("inner_diameter"), spec.get("outer_diameter"))
+    return normalized
+
+
+def diameter_category_value(inner_diameter: Optional[float], outer_diameter: Optional[float]) -> Optional[str]:
+    """
+    models.DiameterCategory value stored in spine_specifications.diameter_category
+    (the same value arrow_database and migrate_diameter_categories write), or None
+    """
+    diameter = inner_diameter or outer_diameter
+    if diameter_category_for is None or not isinstance(diameter, (int, float)) or not diameter:
+        return None
+    return diameter_category_for(diameter).value
+
+
+# Set in each pool process by _init_worker
+_worker_queue = None
+
+
+def _init_worker(queue):
+    global _worker_queue
+    _worker_queue = queue
+
+
+def _normalize_file(file_name: str, json_file: str, batch_size: int) -> int:
+    """Pool task: stream one file and queue normalized (model, arrow, hash) batches"""
+    arrows_read = 0
+    manufacturer = None
+    try:
+        stream = ArrowExportStream(json_file)
+        manufacturer = stream.header.get("manufacturer")
+        if manufacturer is None or not stream.has_array:
+            stream.close()
+            _worker_queue.put(("error", file_name, manufacturer, "Missing required fields", True))
+            return 0
+
+        skipped = 0
+        batch: List[Tuple[str, Dict[str, Any], str]] = []
+        for arrow in stream:
+            arrows_read += 1
+            model_name = (arrow.get("model_name") or "").strip() if isinstance(arrow, dict) else ""
+            if not model_name:
+                skipped += 1
+                continue
+            batch.append((model_name, normalize_arrow(arrow), arrow_content_hash(arrow)))
+            if len(batch) >= batch_size:
+                _worker_queue.put(("batch", file_name, manufacturer, batch))
+                batch = []
+        if batch:
+            _worker_queue.put(("batch", file_name, manufacturer, batch))
+        _worker_queue.put(("done", file_name, manufacturer, skipped))
+    except Exception as e:
+        _worker_queue.put(("error", file_name, manufacturer, str(e), arrows_read == 0))
+    return arrows_read
+
+
+class ParallelImportPipeline:
+    """Process-pool parse/normalize stage feeding a single SQLite writer thread"""
+
+    def __init__(self, manager, workers: Optional[int] = None, batch_size: int = PIPELINE_BATCH_SIZE):
+        """
+        Args:
+            manager: DatabaseImportManager whose database and batch writer are used
+            workers: Pool size (defaults to the CPU count)
+            batch_size: Arrows per normalized batch / writer commit
+        """
+        self.manager = manager
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def run(self, files: Dict[str, Path], force_update: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Import files concurrently
+
+        Args:
+            files: File name -> path of the files to import
+            force_update: Rewrite every arrow even if its content hash is unchanged
+
+        Returns:
+            File name -> import stats (same keys as DatabaseImportManager.last_import_stats,
+            plus "load_error" when the file could not be opened as an arrow export)
+        """
+        if not files:
+            return {}
+
+        workers = min(self.workers, len(files))
+        # fork avoids re-importing the caller's __main__ (api.py, startup scripts) in every worker
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(start_method)
+        queue = context.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+        results: Dict[str, Dict[str, Any]] = {}
+        writer = threading.Thread(target=self._writer, args=(queue, len(files), force_update, results),
+                                  name="import-writer", daemon=True)
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(queue,)) as pool:
+            futures = {pool.submit(_normalize_file, name, str(path), self.batch_size): name
+                       for name, path in files.items()}
+            # Workers are forked on submit; the writer thread starts afterwards
+            writer.start()
+            for future, name in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    # Worker process died before reporting; unblock the writer for this file
+                    queue.put(("error", name, None, f"Worker failed: {e}", True))
+
+        writer.join()
+        elapsed = time.perf_counter() - started
+        total = sum(s.get("inserted", 0) + s.get("updated", 0) + s.get("unchanged", 0) for s in results.values())
+        logger.info(f"⚡ Parallel import: {len(files)} files with {workers} workers in {elapsed:.2f}s "
+                    f"({round(total / elapsed, 1) if elapsed > 0 else None} arrows/s)")
+        return results
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0,
+                "specs_inserted": 0, "specs_updated": 0, "specs_deleted": 0, "not_in_source": 0}
+
+    def _writer(self, queue, file_count: int, force_update: bool, results: Dict[str, Dict[str, Any]]):
+        """Single writer: apply normalized batches as they arrive, one commit per batch"""
+        manager = self.manager
+        conn = sqlite3.connect(manager.database_path)
+        cursor = conn.cursor()
+        setup_error = None
+        try:
+            manager._ensure_import_state_table(cursor)
+            conn.commit()
+            gpi_required, has_diameter_category = manager._spec_columns(cursor)
+        except Exception as e:
+            setup_error = str(e)
+            logger.error(f"Database error preparing parallel import: {e}")
+
+        # The writer keeps draining the queue even after errors so workers never block
+        states: Dict[str, Dict[str, Any]] = {}
+        finished = 0
+        while finished < file_count:
+            message = queue.get()
+            kind, file_name, manufacturer = message[:3]
+            state = states.get(file_name)
+
+            if kind == "batch":
+                if state is None:
+                    state = states[file_name] = {"existing": {}, "existing_models": set(), "seen": set(),
+                                                 "started": time.perf_counter(), "stats": self._new_stats(),
+                                                 "now": datetime.now().isoformat(), "error": setup_error}
+                    if not setup_error:
+                        try:
+                            state["existing"] = manager._load_existing_arrows(cursor, manufacturer)
+                            state["existing_models"] = set(state["existing"])
+                        except Exception as e:
+                            state["error"] = str(e)
+                if state["error"]:
+                    continue
+                # Last occurrence of a model within the batch wins
+                batch = {model_name: (arrow, content_hash) for model_name, arrow, content_hash in message[3]}
+                try:
+                    with conn:
+                        manager._write_arrow_batch(cursor, manufacturer, batch, state["existing"], state["seen"],
+                                                   gpi_required, force_update, state["now"], state["stats"],
+                                                   has_diameter_category)
+                except Exception as e:
+                    logger.error(f"Database error during import of {file_name}: {e}")
+                    state["error"] = str(e)
+                continue
+
+            finished += 1
+            stats = state["stats"] if state else self._new_stats()
+            if kind == "done":
+                stats["skipped"] += message[3]
+            else:
+                stats["error"] = message[3]
+                stats["load_error"] = message[4]
+            if state:
+                if state["error"]:
+                    stats["error"] = state["error"]
+                stats["not_in_source"] = len(state["existing_models"] - state["seen"])
+                elapsed = time.perf_counter() - state["started"]
+                stats["seconds"] = round(elapsed, 3)
+                stats["arrows_per_second"] = round(len(state["seen"]) / elapsed, 1) if elapsed > 0 else None
+            elif setup_error and "error" not in stats:
+                stats["error"] = setup_error
+            stats["manufacturer"] = manufacturer
+            results[file_name] = stats
+
+        conn.close()
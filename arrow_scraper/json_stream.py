@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streaming Reader for Arrow JSON Exports
+Incremental (ijson-style) parsing of {"manufacturer": ..., "arrows": [...]} files: the
+top-level keys are collected as a small header and arrows are yielded one at a time,
+so peak memory stays flat no matter how large an aggregated export gets.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+# Characters that terminate a bare scalar (number, true, false, null)
+_SCALAR_END = _WHITESPACE + ',]}'
+
+
+class JSONStreamError(ValueError):
+    """Raised when an export is not a JSON object or is truncated"""
+    pass
+
+
+class _Scanner:
+    """Minimal pull parser over a text file, decoding one value at a time with raw_decode"""
+
+    def __init__(self, f):
+        self._f = f
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed text so the buffer never holds more than about one chunk plus one value
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at EOF)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise JSONStreamError(f"Expected '{char}' but found '{found or 'EOF'}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed"""
+        first = self.peek()
+        if not first:
+            raise JSONStreamError("Unexpected end of file")
+        while True:
+            if first not in '{["':
+                # A bare number split across chunks would decode as a shorter number
+                end = self._pos
+                while end < len(self._buf) and self._buf[end] not in _SCALAR_END:
+                    end += 1
+                if end == len(self._buf) and self._fill():
+                    continue
+            try:
+                result, end = self._decoder.raw_decode(self._buf, self._pos)
+                self._pos = end
+                return result
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise JSONStreamError(f"Invalid or truncated JSON: {e}") from e
+
+    def skip_array(self):
+        """Consume an array element by element without keeping it"""
+        for _ in self.array_items():
+            pass
+
+    def array_items(self) -> Iterator[Any]:
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise JSONStreamError(f"Expected ',' or ']' in array but found '{separator or 'EOF'}'")
+
+
+class ArrowExportStream:
+    """
+    Stream an arrow export file.
+
+    `header` holds every top-level key except the arrays being streamed; iterating yields
+    the entries of `array_key` one by one. Keys that appear after the array are added to
+    `header` once iteration finishes.
+    """
+
+    def __init__(self, path, array_key: str = 'arrows', required_keys: Iterable[str] = ('manufacturer',)):
+        self.path = Path(path)
+        self.array_key = array_key
+        self.header: Dict[str, Any] = {}
+        self.has_array = False
+        self.items_read = 0
+        self._f = None
+        self._scanner: Optional[_Scanner] = None
+
+        self._open()
+        missing = [key for key in required_keys if key not in self.header]
+        if missing and self.has_array:
+            # Required keys sit after the array: collect them with a header-only pass first
+            trailing = read_export_header(self.path, array_key)
+            self.header.update({key: trailing[key] for key in missing if key in trailing})
+
+    def _open(self):
+        self._f = open(self.path, 'r', encoding='utf-8')
+        self._scanner = _Scanner(self._f)
+        self._scanner.expect('{')
+        self._read_keys_until_array()
+
+    def _read_keys_until_array(self):
+        """Read top-level key/value pairs until the streamed array (or the end of the object)"""
+        scanner = self._scanner
+        while True:
+            char = scanner.peek()
+            if char == '}':
+                scanner._pos += 1
+                self.close()
+                return
+            if char == ',':
+                scanner._pos += 1
+                continue
+            key = scanner.value()
+            if not isinstance(key, str):
+                raise JSONStreamError("Expected an object key")
+            scanner.expect(':')
+            if key == self.array_key and scanner.peek() == '[':
+                self.has_array = True
+                return
+            if scanner.peek() == '[':
+                # Other large arrays (e.g. spine tables) are skipped, not buffered
+                scanner.skip_array()
+                self.header.setdefault(key, None)
+            else:
+                self.header[key] = scanner.value()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.has_array or self._scanner is None:
+            return
+        try:
+            for item in self._scanner.array_items():
+                self.items_read += 1
+                yield item
+            self._read_keys_until_array()
+        finally:
+            self.close()
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_export_header(path, array_key: str = 'arrows') -> Dict[str, Any]:
+    """All top-level keys of an export, consuming the arrow array without keeping it"""
+    stream = ArrowExportStream(path, array_key, required_keys=())
+    for _ in stream:
+        pass
+    return stream.header
+
+
+def iter_arrows(path, array_key: str = 'arrows') -> Iterator[Dict[str, Any]]:
+    """Yield arrows from an export one at a time"""
+    yield from ArrowExportStream(path, array_key, required_keys=())
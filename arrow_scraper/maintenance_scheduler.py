@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Database Maintenance Scheduler
+Background maintenance for the unified database that replaces the blocking VACUUM/ANALYZE/REINDEX
+admin endpoints.
+
+Every tick reads cheap stats (page count, freelist count, MAX(rowid) row estimates against the
+ones recorded at the last ANALYZE; exact COUNT(*) only inside DB_MAINTENANCE_WINDOW) and plans
+small steps: PRAGMA incremental_vacuum in page batches, ANALYZE of tables whose row count drifted
+since they were last analyzed (with PRAGMA analysis_limit), and a periodic PRAGMA optimize. Ticks
+only run while traffic is low (few API requests in this worker, no database writes for a few
+seconds, optionally inside DB_MAINTENANCE_WINDOW), stop when their time budget is used up, and give
+up a step instead of waiting when a writer holds the lock. Each step is its own short write
+transaction, so user requests queue behind at most one step.
+
+With several gunicorn workers every worker runs a scheduler thread; a lease row in
+database_maintenance_state lets only one of them do the work. Admin requests are stored in the
+same table, so whichever worker holds the lease picks them up.
+"""
+
+import atexit
+import os
+import socket
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import sqlite3
+
+# Seconds between ticks, and work budget per tick
+TICK_INTERVAL = 30.0
+TICK_BUDGET_MS = 250.0
+# Pause between steps so queued writers get the lock
+STEP_PAUSE = 0.05
+# Give up a step when the write lock is not free within this many ms
+BUSY_TIMEOUT_MS = 100
+
+# Low traffic: at most LOW_TRAFFIC_REQUESTS API requests in the last minute (this worker)
+# and no request or database write in the last IDLE_SECONDS
+LOW_TRAFFIC_REQUESTS = 30
+IDLE_SECONDS = 3.0
+
+# Incremental vacuum: start once this many pages are free, adapt the batch so a step stays
+# near VACUUM_STEP_TARGET_MS
+VACUUM_MIN_FREE_PAGES = 64
+VACUUM_STEP_PAGES = 128
+VACUUM_MAX_STEP_PAGES = 4096
+VACUUM_STEP_TARGET_MS = 40.0
+# Suggest converting to auto_vacuum=INCREMENTAL when this share of a non-incremental file is free
+CONVERSION_FREE_RATIO = 0.2
+
+# Targeted ANALYZE: tables with indexes whose row count changed by this fraction (and at least
+# ANALYZE_MIN_CHANGED rows) since the last ANALYZE; rows sampled per index
+ANALYZE_CHANGE_FRACTION = 0.1
+ANALYZE_MIN_CHANGED = 200
+ANALYSIS_LIMIT = 1000
+
+# Hours between PRAGMA optimize runs
+OPTIMIZE_INTERVAL_HOURS = 6
+# Seconds a tick's stats stay valid
+STATS_TTL = 300.0
+# Admin-requested runs ignore the traffic check (not the lock timeout) for this long
+REQUEST_TTL = 600.0
+LEASE_SECONDS = TICK_INTERVAL * 3
+
+LOG_RETENTION = 500
+
+
+def ensure_maintenance_tables(conn: sqlite3.Connection):
+    """Create database_maintenance_state / database_maintenance_log (idempotent, see migration 069)"""
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS database_maintenance_state (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            expires_at REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS database_maintenance_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            operation TEXT NOT NULL,
+            target TEXT,
+            started_at TIMESTAMP NOT NULL,
+            duration_ms REAL,
+            pages INTEGER,
+            detail TEXT,
+            owner TEXT
+        )
+    ''')
+    conn.commit()
+
+
+def parse_window(window: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'01:00-05:30' -> (60, 330) minutes after midnight, None when unset or invalid"""
+    if not window:
+        return None
+    try:
+        start, end = window.split('-')
+        to_minutes = lambda value: int(value.split(':')[0]) * 60 + int(value.split(':')[1])
+        return to_minutes(start.strip()), to_minutes(end.strip())
+    except (ValueError, IndexError):
+        print(f"⚠️ Ignoring invalid DB_MAINTENANCE_WINDOW '{window}' (expected HH:MM-HH:MM)")
+        return None
+
+
+class MaintenanceScheduler:
+    """Plans and runs bounded maintenance steps for one database file"""
+
+    def __init__(self, db_path: str, tick_interval: float = TICK_INTERVAL,
+                 tick_budget_ms: float = TICK_BUDGET_MS, window: Optional[str] = None):
+        """
+        Args:
+            db_path: Database to maintain
+            tick_interval: Seconds between ticks of the background thread
+            tick_budget_ms: Work per tick before the remaining steps wait for the next tick
+            window: Optional local time window 'HH:MM-HH:MM' outside which nothing is planned
+        """
+        self.db_path = str(db_path)
+        self.tick_interval = tick_interval
+        self.tick_budget_ms = tick_budget_ms
+        self.window = parse_window(window if window is not None else os.environ.get('DB_MAINTENANCE_WINDOW'))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.vacuum_step_pages = VACUUM_STEP_PAGES
+        self._requests: Deque[float] = deque()
+        self._last_request = 0.0
+        self._stats: Optional[Dict[str, Any]] = None
+        self._stats_at = 0.0
+        self._tables_ready = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {'ticks': 0, 'steps': 0, 'skipped_busy': 0, 'skipped_traffic': 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit: every step opens and commits its own short transaction
+        return sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+
+    # Traffic
+
+    def note_request(self):
+        """Record an API request (called before every request) and start the thread on first use"""
+        now = time.monotonic()
+        with self._lock:
+            self._last_request = now
+            self._requests.append(now)
+            while self._requests and now - self._requests[0] > 60:
+                self._requests.popleft()
+        self.start()
+
+    def _last_write_age(self) -> float:
+        """Seconds since the database (or its WAL) was last written"""
+        newest = 0.0
+        for suffix in ('', '-wal'):
+            try:
+                newest = max(newest, os.stat(self.db_path + suffix).st_mtime)
+            except OSError:
+                pass
+        return time.time() - newest
+
+    def traffic(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            recent = sum(1 for t in self._requests if now - t <= 60)
+            idle = round(now - self._last_request, 1) if self._last_request else None
+        return {'requests_last_minute': recent, 'seconds_since_request': idle,
+                'seconds_since_write': round(self._last_write_age(), 1)}
+
+    def in_window(self) -> bool:
+        if self.window is None:
+            return True
+        start, end = self.window
+        now = datetime.now()
+        minutes = now.hour * 60 + now.minute
+        return start <= minutes < end if start <= end else minutes >= start or minutes < end
+
+    def _requests_quiet(self) -> bool:
+        traffic = self.traffic()
+        idle = traffic['seconds_since_request']
+        return traffic['requests_last_minute'] <= LOW_TRAFFIC_REQUESTS and (idle is None or idle >= IDLE_SECONDS)
+
+    def is_low_traffic(self) -> bool:
+        return self._requests_quiet() and self._last_write_age() >= IDLE_SECONDS
+
+    # Lease and admin requests
+
+    def _acquire_lease(self, conn: sqlite3.Connection) -> bool:
+        now = time.time()
+        cursor = conn.execute('''
+            INSERT INTO database_maintenance_state (key, value, expires_at) VALUES ('lease', ?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at
+            WHERE database_maintenance_state.value = excluded.value OR database_maintenance_state.expires_at < ?
+        ''', (self.owner, now + LEASE_SECONDS, now))
+        return cursor.rowcount == 1
+
+    def request_run(self, vacuum: bool = False) -> Dict[str, Any]:
+        """
+        Ask the lease holder to run all pending maintenance now instead of waiting for low traffic.
+        vacuum=True also converts a database without incremental auto_vacuum (one full VACUUM,
+        still only started once no writes are happening).
+        """
+        self._store_request(vacuum)
+        self._wakeup.set()
+        self.start()
+        return self.status()
+
+    def _store_request(self, vacuum: bool):
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        try:
+            ensure_maintenance_tables(conn)
+            conn.execute('''
+                INSERT OR REPLACE INTO database_maintenance_state (key, value, expires_at)
+                VALUES ('request', ?, ?)
+            ''', ('vacuum' if vacuum else 'run', time.time() + REQUEST_TTL))
+        finally:
+            conn.close()
+        self._stats = None
+
+    @staticmethod
+    def _pending_request(conn: sqlite3.Connection) -> Optional[str]:
+        row = conn.execute('''
+            SELECT value FROM database_maintenance_state WHERE key = 'request' AND expires_at > ?
+        ''', (time.time(),)).fetchone()
+        return row[0] if row else None
+
+    # Stats and planning
+
+    def collect_stats(self, conn: sqlite3.Connection, exact: bool = False) -> Dict[str, Any]:
+        """
+        Page/freelist counts and tables whose row count drifted since their last ANALYZE.
+        Row counts are MAX(rowid) estimates (one index seek per table); exact=True runs
+        COUNT(*), a full scan per table, and is only used inside the maintenance window.
+        """
+        pragma = lambda name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+        stats = {
+            'page_size': pragma('page_size'),
+            'page_count': pragma('page_count'),
+            'freelist_count': pragma('freelist_count'),
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(pragma('auto_vacuum'), 'unknown'),
+            'journal_mode': pragma('journal_mode'),
+        }
+        stats['free_mb'] = round(stats['freelist_count'] * stats['page_size'] / (1024 * 1024), 2)
+
+        analyzed: Dict[str, int] = {}
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+            for table, stat in conn.execute('SELECT tbl, stat FROM sqlite_stat1'):
+                try:
+                    analyzed[table] = max(analyzed.get(table, 0), int(str(stat).split()[0]))
+                except (ValueError, IndexError):
+                    continue
+        # sqlite_stat1 only estimates row counts under analysis_limit; prefer the count recorded
+        # when this scheduler analyzed the table, measured the same way as the current one
+        baseline_key = 'analyzed_rows:' if exact else 'analyzed_max_rowid:'
+        for key, value in conn.execute('''
+            SELECT key, value FROM database_maintenance_state WHERE key LIKE ? || '%'
+        ''', (baseline_key,)).fetchall():
+            analyzed[key.split(':', 1)[1]] = int(value)
+
+        stale = []
+        for (table,) in conn.execute('''
+            SELECT DISTINCT m.name FROM sqlite_master m
+            JOIN sqlite_master i ON i.tbl_name = m.name AND i.type = 'index'
+            WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+        ''').fetchall():
+            rows = self._row_count(conn, table, exact)
+            if rows is None:
+                continue
+            before = analyzed.get(table)
+            changed = rows if before is None else abs(rows - before)
+            if changed >= max(ANALYZE_MIN_CHANGED, (before or 0) * ANALYZE_CHANGE_FRACTION):
+                stale.append({'table': table, 'rows': rows, 'analyzed_rows': before, 'changed': changed})
+        stats['stale_tables'] = sorted(stale, key=lambda t: t['changed'], reverse=True)
+        stats['row_counts'] = 'exact' if exact else 'max_rowid'
+
+        row = conn.execute('''
+            SELECT MAX(started_at) FROM database_maintenance_log WHERE operation = 'optimize'
+        ''').fetchone()
+        stats['last_optimize'] = row[0] if row else None
+        stats['needs_conversion'] = (stats['auto_vacuum'] != 'incremental' and stats['page_count'] > 0 and
+                                     stats['freelist_count'] >= VACUUM_MIN_FREE_PAGES and
+                                     stats['freelist_count'] / stats['page_count'] >= CONVERSION_FREE_RATIO)
+        return stats
+
+    @staticmethod
+    def _row_count(conn: sqlite3.Connection, table: str, exact: bool) -> Optional[int]:
+        """COUNT(*) when exact, else MAX(rowid) like backup_engine.cheap_table_stats (None: no rowid)"""
+        try:
+            if exact:
+                return conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            return conn.execute(f'SELECT MAX(rowid) FROM "{table}"').fetchone()[0] or 0
+        except sqlite3.OperationalError as e:
+            if 'rowid' in str(e):
+                # WITHOUT ROWID tables have no cheap estimate
+                return None
+            raise
+
+    def _exact_counts_allowed(self) -> bool:
+        """Full-scan row counts only inside an explicitly configured maintenance window"""
+        return self.window is not None and self.in_window()
+
+    @staticmethod
+    def plan(stats: Dict[str, Any], request: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+        """Steps to run, most valuable first: (operation, target)"""
+        tasks: List[Tuple[str, Optional[str]]] = []
+        if request == 'vacuum' and stats['auto_vacuum'] != 'incremental':
+            tasks.append(('convert_incremental', None))
+        elif stats['auto_vacuum'] == 'incremental' and stats['freelist_count'] >= (1 if request else VACUUM_MIN_FREE_PAGES):
+            tasks.append(('incremental_vacuum', None))
+        tasks.extend(('analyze', table['table']) for table in stats['stale_tables'])
+
+        last = stats.get('last_optimize')
+        overdue = True
+        if last:
+            try:
+                overdue = (datetime.now() - datetime.fromisoformat(last)).total_seconds() >= OPTIMIZE_INTERVAL_HOURS * 3600
+            except ValueError:
+                pass
+        if overdue or request:
+            tasks.append(('optimize', None))
+        return tasks
+
+    # Steps
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection, deadline: float) -> Dict[str, Any]:
+        """Free pages in batches until the freelist is empty or the tick budget is used"""
+        freed = 0
+        while time.perf_counter() < deadline:
+            free = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            if free == 0:
+                break
+            pages = min(free, self.vacuum_step_pages)
+            started = time.perf_counter()
+            # execute() steps the pragma once (one page); executescript runs it to completion
+            conn.executescript(f'PRAGMA incremental_vacuum({int(pages)})')
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            freed += pages
+            if elapsed_ms < VACUUM_STEP_TARGET_MS / 2:
+                self.vacuum_step_pages = min(VACUUM_MAX_STEP_PAGES, self.vacuum_step_pages * 2)
+            elif elapsed_ms > VACUUM_STEP_TARGET_MS:
+                self.vacuum_step_pages = max(16, self.vacuum_step_pages // 2)
+            time.sleep(STEP_PAUSE)
+        return {'pages': freed, 'detail': f"step {self.vacuum_step_pages} pages"}
+
+    def _run_step(self, conn: sqlite3.Connection, operation: str, target: Optional[str],
+                  deadline: float) -> Dict[str, Any]:
+        if operation == 'incremental_vacuum':
+            return self._incremental_vacuum(conn, deadline)
+        if operation == 'analyze':
+            conn.execute(f'PRAGMA analysis_limit = {ANALYSIS_LIMIT}')
+            conn.execute(f'ANALYZE "{target}"')
+            rows = conn.execute(f'SELECT COUNT(*) FROM "{target}"').fetchone()[0]
+            max_rowid = self._row_count(conn, target, exact=False)
+            conn.executemany('''
+                INSERT OR REPLACE INTO database_maintenance_state (key, value, expires_at) VALUES (?, ?, NULL)
+            ''', [(f'analyzed_rows:{target}', rows)] +
+                ([(f'analyzed_max_rowid:{target}', max_rowid)] if max_rowid is not None else []))
+            return {'detail': f"{rows} rows"}
+        if operation == 'optimize':
+            conn.execute(f'PRAGMA analysis_limit = {ANALYSIS_LIMIT}')
+            conn.execute('PRAGMA optimize')
+            return {}
+        if operation == 'convert_incremental':
+            # The one full rewrite: only auto_vacuum=INCREMENTAL lets later space reclaims be incremental
+            pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            conn.execute('VACUUM')
+            return {'pages': pages}
+        raise ValueError(f"Unknown maintenance operation: {operation}")
+
+    def _log(self, conn: sqlite3.Connection, operation: str, target: Optional[str], started_at: str,
+             duration_ms: float, result: Dict[str, Any]):
+        conn.execute('''
+            INSERT INTO database_maintenance_log (operation, target, started_at, duration_ms, pages, detail, owner)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (operation, target, started_at, round(duration_ms, 2), result.get('pages'), result.get('detail'),
+              self.owner))
+        conn.execute('''
+            DELETE FROM database_maintenance_log
+            WHERE id <= (SELECT MAX(id) FROM database_maintenance_log) - ?
+        ''', (LOG_RETENTION,))
+
+    def tick(self, force: bool = False) -> List[Dict[str, Any]]:
+        """One bounded maintenance pass; returns the steps performed (force skips the traffic check)"""
+        self.stats['ticks'] += 1
+        if not Path(self.db_path).exists():
+            return []
+
+        performed = []
+        conn = self._connect()
+        try:
+            if not self._tables_ready:
+                ensure_maintenance_tables(conn)
+                self._tables_ready = True
+            request = self._pending_request(conn)
+            urgent = force or request is not None
+            if not urgent and not (self.in_window() and self.is_low_traffic()):
+                self.stats['skipped_traffic'] += 1
+                return []
+            if request == 'vacuum' and not force and self._last_write_age() < IDLE_SECONDS:
+                # The full VACUUM waits for a moment without writes even when requested
+                return []
+            if not self._acquire_lease(conn):
+                return []
+            # Stats collection counts against the tick budget
+            deadline = time.perf_counter() + self.tick_budget_ms / 1000
+            if self._stats is None or time.monotonic() - self._stats_at > STATS_TTL or urgent:
+                self._stats = self.collect_stats(conn, exact=self._exact_counts_allowed())
+                self._stats_at = time.monotonic()
+            tasks = self.plan(self._stats, request)
+
+            for operation, target in tasks:
+                if time.perf_counter() >= deadline:
+                    break
+                # Our own steps touch the file, so only new requests end the tick early
+                if not urgent and not self._requests_quiet():
+                    self.stats['skipped_traffic'] += 1
+                    break
+                started_at = datetime.now().isoformat()
+                started = time.perf_counter()
+                try:
+                    result = self._run_step(conn, operation, target, deadline)
+                except sqlite3.OperationalError as e:
+                    if 'locked' in str(e) or 'busy' in str(e):
+                        # A writer holds the lock: leave the rest for the next tick
+                        self.stats['skipped_busy'] += 1
+                        break
+                    print(f"⚠️ Maintenance step {operation} {target or ''} failed: {e}")
+                    continue
+                duration_ms = (time.perf_counter() - started) * 1000
+                self._log(conn, operation, target, started_at, duration_ms, result)
+                performed.append({'operation': operation, 'target': target,
+                                  'duration_ms': round(duration_ms, 2), **result})
+                self.stats['steps'] += 1
+                time.sleep(STEP_PAUSE)
+            else:
+                # Everything planned is done: drop the admin request
+                if request:
+                    conn.execute("DELETE FROM database_maintenance_state WHERE key = 'request'")
+            if performed:
+                self._stats = None
+        except sqlite3.OperationalError as e:
+            if 'locked' in str(e) or 'busy' in str(e):
+                self.stats['skipped_busy'] += 1
+            else:
+                print(f"⚠️ Database maintenance tick failed: {e}")
+        except sqlite3.Error as e:
+            print(f"⚠️ Database maintenance tick failed: {e}")
+        finally:
+            conn.close()
+
+        if performed:
+            summary = ', '.join(f"{step['operation']}{' ' + step['target'] if step['target'] else ''}"
+                                for step in performed)
+            print(f"🧹 Database maintenance: {summary}")
+        return performed
+
+    def run_pending(self, vacuum: bool = False, max_seconds: float = 60.0) -> List[Dict[str, Any]]:
+        """Request a run and tick until it is done or max_seconds passed (CLI / health checker)"""
+        self._store_request(vacuum)
+        performed: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            performed.extend(self.tick(force=True))
+            conn = self._connect()
+            try:
+                if self._pending_request(conn) is None:
+                    break
+            finally:
+                conn.close()
+            time.sleep(STEP_PAUSE)
+        return performed
+
+    # Status
+
+    def status(self, log_limit: int = 20) -> Dict[str, Any]:
+        """Current stats, plan, lease holder and recent maintenance steps"""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            ensure_maintenance_tables(conn)
+            stats = self.collect_stats(conn)
+            request = self._pending_request(conn)
+            lease = conn.execute('''
+                SELECT value, expires_at FROM database_maintenance_state WHERE key = 'lease'
+            ''').fetchone()
+            log = [dict(zip(('operation', 'target', 'started_at', 'duration_ms', 'pages', 'detail', 'owner'), row))
+                   for row in conn.execute('''
+                       SELECT operation, target, started_at, duration_ms, pages, detail, owner
+                       FROM database_maintenance_log ORDER BY id DESC LIMIT ?
+                   ''', (log_limit,)).fetchall()]
+        finally:
+            conn.close()
+        return {
+            'database': stats,
+            'plan': [{'operation': operation, 'target': target} for operation, target in self.plan(stats, request)],
+            'pending_request': request,
+            'lease_owner': lease[0] if lease and lease[1] > time.time() else None,
+            'worker': self.owner,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'window': os.environ.get('DB_MAINTENANCE_WINDOW'),
+            'low_traffic': self.is_low_traffic(),
+            'traffic': self.traffic(),
+            'scheduler': dict(self.stats),
+            'recent_steps': log,
+        }
+
+    # Background thread
+
+    def start(self):
+        """Start the background thread (per process: threads do not survive a gunicorn fork)"""
+        if self._thread is None and not self._closed:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._loop, name="db-maintenance", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+
+    def _loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.tick_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"⚠️ Database maintenance error: {e}")
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+
+
+def maintenance_enabled() -> bool:
+    return os.environ.get('DB_MAINTENANCE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Bounded database maintenance")
+    parser.add_argument("database", help="Path to the unified database")
+    parser.add_argument("--run", action="store_true", help="Run pending maintenance now")
+    parser.add_argument("--convert", action="store_true",
+                        help="Switch to auto_vacuum=INCREMENTAL (one full VACUUM) before running")
+    parser.add_argument("--max-seconds", type=float, default=60.0)
+    args = parser.parse_args()
+
+    scheduler = MaintenanceScheduler(args.database)
+    if args.run or args.convert:
+        for step in scheduler.run_pending(vacuum=args.convert, max_seconds=args.max_seconds):
+            print(f"   {step['operation']:20s} {step['target'] or '':28s} {step['duration_ms']:8.1f}ms"
+                  f"{'  ' + str(step['pages']) + ' pages' if step.get('pages') else ''}")
+    print(json.dumps(scheduler.status(), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,36 @@ Features:
 - Common name variations and aliases
 - Manufacturer category specialization detection
 - Smart linking with confidence scoring
+- Prebuilt suggestion index (word/trigram inverted indexes + character count filter) for autocomplete
 """
 
 import re
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from catalog_snapshot import get_catalog_version
+
+# Business suffixes dropped by normalize_name
+BUSINESS_SUFFIXES = ['inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co', 'archery', 'arrows', 'products']
+_SUFFIX_PATTERN = re.compile(r'\b(?:' + '|'.join(re.escape(suffix) for suffix in BUSINESS_SUFFIXES) + r')\b')
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Frontend equipment categories -> category_specializations keys
+CATEGORY_MAPPING = {
+    'string': 'strings',
+    'sight': 'sights',
+    'scope': 'scopes',
+    'stabilizer': 'stabilizers',
+    'arrow rest': 'arrow_rests',
+    'weight': 'weights',
+    'plunger': 'plungers',
+    'other': 'other'
+}
 
 class ManufacturerMatcher:
     """Smart manufacturer matching with fuzzy algorithms and alias detection"""
@@ -83,35 +108,39 @@ class ManufacturerMatcher:
             'sh': 'spot-hogg',
             'bs': 'b-stinger'
         }
+        
+        # Alias, abbreviation and specialist tables normalized once instead of per comparison
+        self._alias_lookup: Dict[str, List[str]] = defaultdict(list)
+        for canonical_name, aliases in self.manufacturer_aliases.items():
+            for variant in [canonical_name] + aliases:
+                normalized = self.normalize_name(variant)
+                if canonical_name not in self._alias_lookup[normalized]:
+                    self._alias_lookup[normalized].append(canonical_name)
+        self._normalized_abbreviations = {abbrev: self.normalize_name(full_name)
+                                          for abbrev, full_name in self.common_abbreviations.items()}
+        self._normalized_specialists = {category: {self.normalize_name(name) for name in specialists}
+                                        for category, specialists in self.category_specializations.items()}
     
     def normalize_name(self, name: str) -> str:
         """Normalize manufacturer name for comparison"""
         if not name:
             return ""
         
-        # Convert to lowercase and remove extra spaces
-        normalized = re.sub(r'\s+', ' ', name.lower().strip())
-        
-        # Remove common business suffixes
-        business_suffixes = ['inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co', 'archery', 'arrows', 'products']
-        for suffix in business_suffixes:
-            pattern = r'\b' + re.escape(suffix) + r'\b'
-            normalized = re.sub(pattern, '', normalized).strip()
-        
-        # Remove punctuation and special characters
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
+        # Lowercase, drop common business suffixes, then punctuation and extra spaces
+        normalized = _SUFFIX_PATTERN.sub('', name.lower())
+        normalized = _PUNCTUATION_PATTERN.sub(' ', normalized)
+        return _WHITESPACE_PATTERN.sub(' ', normalized).strip()
     
     def calculate_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity score between two names using multiple algorithms"""
         if not name1 or not name2:
             return 0.0
         
-        norm1 = self.normalize_name(name1)
-        norm2 = self.normalize_name(name2)
-        
+        return self.normalized_similarity(self.normalize_name(name1), self.normalize_name(name2))
+    
+    def normalized_similarity(self, norm1: str, norm2: str,
+                              words1: Optional[Set[str]] = None, words2: Optional[Set[str]] = None) -> float:
+        """calculate_similarity for names that are already normalized (word sets may be passed in)"""
         # Exact match after normalization
         if norm1 == norm2:
             return 1.0
@@ -123,16 +152,15 @@ class ManufacturerMatcher:
         similarities.append(SequenceMatcher(None, norm1, norm2).ratio())
         
         # 2. Word overlap ratio
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
+        words1 = set(norm1.split()) if words1 is None else words1
+        words2 = set(norm2.split()) if words2 is None else words2
         if words1 or words2:
             overlap = len(words1.intersection(words2))
             total = len(words1.union(words2))
             similarities.append(overlap / total if total > 0 else 0.0)
         
-        # 3. Substring matching
-        longer = max(norm1, norm2, key=len)
-        shorter = min(norm1, norm2, key=len)
+        # 3. Substring matching (sorted is stable, so equal-length names never count as substrings)
+        shorter, longer = sorted((norm1, norm2), key=len)
         if len(shorter) >= 3 and shorter in longer:
             similarities.append(0.8)  # High score for substring matches
         
@@ -146,32 +174,15 @@ class ManufacturerMatcher:
     
     def check_abbreviation_match(self, name1: str, name2: str) -> float:
         """Check if names match through common abbreviations"""
-        # Check if one name is in abbreviations dict
-        for abbrev, full_name in self.common_abbreviations.items():
-            if (name1 == abbrev and self.normalize_name(full_name) == name2) or \
-               (name2 == abbrev and self.normalize_name(full_name) == name1):
-                return 0.9  # High confidence for known abbreviations
+        if self._normalized_abbreviations.get(name1) == name2 or \
+           self._normalized_abbreviations.get(name2) == name1:
+            return 0.9  # High confidence for known abbreviations
         
         return 0.0
     
     def check_alias_match(self, input_name: str) -> List[str]:
         """Check if input name matches any known aliases"""
-        normalized_input = self.normalize_name(input_name)
-        matches = []
-        
-        for canonical_name, aliases in self.manufacturer_aliases.items():
-            # Check if input matches canonical name
-            if self.normalize_name(canonical_name) == normalized_input:
-                matches.append(canonical_name)
-                continue
-            
-            # Check if input matches any alias
-            for alias in aliases:
-                if self.normalize_name(alias) == normalized_input:
-                    matches.append(canonical_name)
-                    break
-        
-        return matches
+        return list(self._alias_lookup.get(self.normalize_name(input_name), []))
     
     def find_best_matches(self, input_name: str, manufacturer_list: List[Dict], 
                          category: str = None, min_confidence: float = 0.6) -> List[Dict]:
@@ -225,27 +236,9 @@ class ManufacturerMatcher:
             return False
         
         category_lower = category.lower()
-        manufacturer_lower = self.normalize_name(manufacturer_name)
-        
-        # Map frontend categories to internal categories
-        category_mapping = {
-            'string': 'strings',
-            'sight': 'sights',
-            'scope': 'scopes',
-            'stabilizer': 'stabilizers',
-            'arrow rest': 'arrow_rests',
-            'weight': 'weights',
-            'plunger': 'plungers',
-            'other': 'other'
-        }
-        
-        internal_category = category_mapping.get(category_lower, category_lower)
-        
-        if internal_category in self.category_specializations:
-            specialists = self.category_specializations[internal_category]
-            return any(self.normalize_name(specialist) == manufacturer_lower for specialist in specialists)
-        
-        return False
+        internal_category = CATEGORY_MAPPING.get(category_lower, category_lower)
+        specialists = self._normalized_specialists.get(internal_category)
+        return bool(specialists) and self.normalize_name(manufacturer_name) in specialists
     
     def get_manufacturer_suggestions(self, input_name: str, manufacturer_list: List[Dict], 
                                    category: str = None, limit: int = 10) -> List[Dict]:
@@ -304,6 +297,276 @@ class ManufacturerMatcher:
         
         return None
 
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ManufacturerSuggestionIndex:
+    """
+    Prebuilt index over one manufacturer list for find_best_matches/suggestions/linking
+    
+    Names are normalized once at build time and alias/abbreviation tables are resolved
+    against the list. Candidates come from exact/alias/abbreviation lookups, a word and a
+    trigram inverted index (word overlap and substring scores) and count filtering over a
+    character inverted index: SequenceMatcher.ratio() can never exceed the shared character
+    count bound, so names below it are skipped without being compared. Results are the
+    same as the ManufacturerMatcher scan over the list.
+    """
+    
+    def __init__(self, manufacturers: List[Dict], matcher: Optional[ManufacturerMatcher] = None):
+        self.matcher = matcher or ManufacturerMatcher()
+        self.manufacturers = list(manufacturers)
+        self.built_at = time.time()
+        
+        normalize = self.matcher.normalize_name
+        self._names_lower = [(m.get('name') or '').lower() for m in self.manufacturers]
+        self._norms = [normalize(m.get('name') or '') for m in self.manufacturers]
+        self._words = [set(norm.split()) for norm in self._norms]
+        
+        self._by_norm: Dict[str, List[int]] = defaultdict(list)
+        self._word_index: Dict[str, Set[int]] = defaultdict(set)
+        self._trigram_index: Dict[str, Set[int]] = defaultdict(set)
+        self._char_index: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        self._raw_trigram_index: Dict[str, Set[int]] = defaultdict(set)
+        for index, norm in enumerate(self._norms):
+            if not self.manufacturers[index].get('name'):
+                continue
+            self._by_norm[norm].append(index)
+            for word in self._words[index]:
+                self._word_index[word].add(index)
+            for trigram in _trigrams(norm):
+                self._trigram_index[trigram].add(index)
+            # One posting per character occurrence: ('a', 2) lists names with at least two a's
+            for char, count in Counter(norm).items():
+                for occurrence in range(1, count + 1):
+                    self._char_index[(char, occurrence)].append(index)
+            for trigram in _trigrams(self._names_lower[index]):
+                self._raw_trigram_index[trigram].add(index)
+        
+        # Alias and abbreviation tables resolved against this manufacturer list once
+        self._alias_targets: Dict[str, List[int]] = {}
+        for variant, canonical_names in self.matcher._alias_lookup.items():
+            targets = []
+            for canonical_name in canonical_names:
+                targets.extend(self._by_norm.get(normalize(canonical_name), []))
+            if targets:
+                self._alias_targets[variant] = targets
+        self._abbreviation_targets: Dict[str, Set[int]] = defaultdict(set)
+        for abbrev, full_name in self.matcher._normalized_abbreviations.items():
+            # Input is the abbreviation -> manufacturers with the full name, and vice versa
+            self._abbreviation_targets[abbrev].update(self._by_norm.get(full_name, []))
+            self._abbreviation_targets[full_name].update(self._by_norm.get(abbrev, []))
+        
+        self._specialists: Dict[str, Set[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.manufacturers)
+    
+    def _specialist_ids(self, category: str) -> Set[int]:
+        """Manufacturer positions that specialize in category (resolved once per category)"""
+        ids = self._specialists.get(category)
+        if ids is None:
+            ids = self._specialists[category] = {
+                index for index, manufacturer in enumerate(self.manufacturers)
+                if manufacturer.get('name') and self.matcher.is_category_specialist(manufacturer['name'], category)
+            }
+        return ids
+    
+    def _candidates(self, norm: str, min_similarity: float) -> Set[int]:
+        """Positions whose similarity to norm can reach min_similarity"""
+        candidates = set(self._by_norm.get(norm, []))
+        candidates.update(self._abbreviation_targets.get(norm, ()))
+        
+        # Word overlap needs a shared word, substring matches (3+ chars) a shared trigram
+        for word in norm.split():
+            candidates.update(self._word_index.get(word, ()))
+        for trigram in _trigrams(norm):
+            candidates.update(self._trigram_index.get(trigram, ()))
+        
+        # SequenceMatcher ratio <= 2 * shared characters / total length
+        shared = Counter()
+        for char, count in Counter(norm).items():
+            for occurrence in range(1, count + 1):
+                shared.update(self._char_index.get((char, occurrence), ()))
+        length = len(norm)
+        norms = self._norms
+        candidates.update(index for index, matched in shared.items()
+                          if 2.0 * matched / (length + len(norms[index])) >= min_similarity)
+        return candidates
+    
+    def find_best_matches(self, input_name: str, category: str = None, min_confidence: float = 0.6,
+                          include: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
+        """ManufacturerMatcher.find_best_matches over the indexed list"""
+        if not input_name or not self.manufacturers:
+            return []
+        
+        norm = self.matcher.normalize_name(input_name)
+        
+        # First check for exact alias matches
+        alias_ids = [index for index in self._alias_targets.get(norm, [])
+                     if include is None or include(self.manufacturers[index])]
+        if alias_ids:
+            return [{
+                'manufacturer': self.manufacturers[index],
+                'confidence': 0.95,
+                'match_type': 'alias',
+                'reason': f'Known alias match: {input_name} → {self.manufacturers[index]["name"]}'
+            } for index in alias_ids]
+        
+        words = set(norm.split())
+        specialists = self._specialist_ids(category) if category else set()
+        matches = []
+        for index in sorted(self._candidates(norm, min_confidence)):
+            manufacturer = self.manufacturers[index]
+            if include is not None and not include(manufacturer):
+                continue
+            similarity = self.matcher.normalized_similarity(norm, self._norms[index], words, self._words[index])
+            if similarity >= min_confidence:
+                match_info = {
+                    'manufacturer': manufacturer,
+                    'confidence': similarity,
+                    'match_type': 'fuzzy',
+                    'reason': f'Fuzzy match (similarity: {similarity:.2f})'
+                }
+                
+                # Boost confidence if manufacturer specializes in the category
+                if index in specialists:
+                    match_info['confidence'] = min(1.0, similarity + 0.1)
+                    match_info['reason'] += f' + category specialist ({category})'
+                
+                matches.append(match_info)
+        
+        return sorted(matches, key=lambda x: x['confidence'], reverse=True)
+    
+    def get_suggestions(self, input_name: str, category: str = None, limit: int = 10,
+                        include: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
+        """ManufacturerMatcher.get_manufacturer_suggestions over the indexed list"""
+        if not input_name:
+            candidates = [index for index, manufacturer in enumerate(self.manufacturers)
+                          if include is None or include(manufacturer)]
+            if category:
+                # Category specialists first, then others
+                specialists = self._specialist_ids(category)
+                candidates = [i for i in candidates if i in specialists] + [i for i in candidates if i not in specialists]
+            return [self.manufacturers[index] for index in candidates[:limit]]
+        
+        # High-confidence matches first (a category boost lifts a 0.5 similarity to 0.6)
+        suggestions = []
+        seen = set()
+        for match in self.find_best_matches(input_name, category, min_confidence=0.5 if category else 0.6,
+                                            include=include):
+            if match['confidence'] >= 0.6:
+                suggestions.append(match['manufacturer'])
+                seen.add(id(match['manufacturer']))
+        
+        # Add partial string matches that weren't caught by fuzzy matching
+        input_lower = input_name.lower()
+        if len(input_lower) >= 3:
+            partial = set.intersection(*(self._raw_trigram_index.get(trigram, set())
+                                         for trigram in _trigrams(input_lower)))
+        else:
+            partial = range(len(self.manufacturers))
+        for index in sorted(partial):
+            manufacturer = self.manufacturers[index]
+            if id(manufacturer) in seen or input_lower not in self._names_lower[index]:
+                continue
+            if include is None or include(manufacturer):
+                suggestions.append(manufacturer)
+                seen.add(id(manufacturer))
+        
+        return suggestions[:limit]
+    
+    def link_manufacturer(self, input_name: str, category: str = None) -> Optional[Dict]:
+        """ManufacturerMatcher.link_manufacturer over the indexed list"""
+        matches = self.find_best_matches(input_name, category, min_confidence=0.8)
+        
+        if matches and matches[0]['confidence'] >= 0.8:
+            return {
+                'manufacturer_id': matches[0]['manufacturer']['id'],
+                'manufacturer_name': matches[0]['manufacturer']['name'],
+                'confidence': matches[0]['confidence'],
+                'match_type': matches[0]['match_type'],
+                'reason': matches[0]['reason']
+            }
+        
+        return None
+
+
+class ManufacturerIndexCache:
+    """
+    Suggestion index over the manufacturers table, rebuilt when the catalog version changes
+    (writes to manufacturers and manufacturer_equipment_categories bump it through the
+    catalog_version triggers, so every worker follows) or on invalidate()
+    """
+    
+    def __init__(self, db_path, check_interval: float = 2.0):
+        """
+        Args:
+            db_path: Arrow database
+            check_interval: Seconds between catalog version checks
+        """
+        self.db_path = str(db_path)
+        self.check_interval = check_interval
+        self.matcher = ManufacturerMatcher()
+        self._index: Optional[ManufacturerSuggestionIndex] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def invalidate(self):
+        """Force a rebuild on next use (call after writing manufacturers or their categories)"""
+        with self._lock:
+            self._index = None
+    
+    def _load_manufacturers(self, conn: sqlite3.Connection) -> List[Dict]:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('SELECT id, name, website_url, country, is_active FROM manufacturers ORDER BY name')
+        manufacturers = [{
+            'id': row['id'],
+            'name': row['name'],
+            'website': row['website_url'],
+            'country': row['country'] or 'Unknown',
+            'is_active': bool(row['is_active']) if row['is_active'] is not None else True,
+            'categories': []
+        } for row in cursor.fetchall()]
+        
+        try:
+            cursor.execute('SELECT manufacturer_id, category_name FROM manufacturer_equipment_categories')
+            by_id = {manufacturer['id']: manufacturer for manufacturer in manufacturers}
+            for row in cursor.fetchall():
+                manufacturer = by_id.get(row['manufacturer_id'])
+                if manufacturer and row['category_name'] not in manufacturer['categories']:
+                    manufacturer['categories'].append(row['category_name'])
+        except sqlite3.OperationalError:
+            pass  # No equipment categories table
+        return manufacturers
+    
+    def current(self) -> ManufacturerSuggestionIndex:
+        """Index for the current manufacturers, rebuilt when they changed"""
+        with self._lock:
+            now = time.monotonic()
+            if self._index is not None and now - self._checked_at < self.check_interval:
+                return self._index
+            self._checked_at = now
+            
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # Without version tracking (migration 066) changes can't be seen: rebuild every interval
+                version = get_catalog_version(conn)
+                if self._index is not None and version is not None and version == self._version:
+                    return self._index
+                
+                started = time.perf_counter()
+                self._index = ManufacturerSuggestionIndex(self._load_manufacturers(conn), self.matcher)
+                self._version = version
+                print(f"🔤 Manufacturer suggestion index built: {len(self._index)} manufacturers "
+                      f"in {(time.perf_counter() - started) * 1000:.1f}ms (catalog v{version})")
+                return self._index
+            finally:
+                conn.close()
+
+
 def test_manufacturer_matcher():
     """Test the manufacturer matching functionality"""
     matcher = ManufacturerMatcher()
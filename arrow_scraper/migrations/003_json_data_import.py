@@ -53,11 +53,11 @@ class JsonDataImportMigration(BaseMigration):
                 print(f"🔄 Found {len(json_files)} JSON files to import")
                 
                 # Use the import_all_json_files method instead of manual iteration
-                result = importer.import_all_json_files(force_update=False)
+                result = importer.import_all_json_files(force_update=False, only_changed=True)
                 
-                imported_count = result.get('imported_files', 0)
-                skipped_count = result.get('skipped_files', 0)
-                error_count = result.get('failed_files', 0)
+                imported_count = result.get('files_processed', 0)
+                skipped_count = result.get('files_skipped', 0)
+                error_count = len(result.get('errors', []))
                 
                 if imported_count > 0:
                     print(f"✅ Imported {imported_count} manufacturer data files")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Migration 066: Catalog version tracking
+
+Adds a single-row catalog_version counter that triggers on arrows,
+spine_specifications and manufacturers bump on every write. The catalog
+snapshot (catalog_snapshot.py) is regenerated whenever this version changes.
+"""
+
+import sqlite3
+import sys
+import os
+
+CATALOG_TABLES = ("arrows", "spine_specifications", "manufacturers")
+EVENTS = ("INSERT", "UPDATE", "DELETE")
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 66,
+        'description': 'Catalog version counter and triggers for catalog snapshots',
+        'author': 'System',
+        'created_at': '2025-12-05',
+        'target_database': 'arrow',
+        'dependencies': ['065'],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create catalog_version and its triggers"""
+    conn = cursor.connection
+
+    print("Adding catalog version tracking...")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0)")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+
+    for table in CATALOG_TABLES:
+        if table not in existing_tables:
+            print(f"ℹ️ {table} table not found, skipping triggers")
+            continue
+        for event in EVENTS:
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS catalog_version_{table}_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+                END
+            """)
+        print(f"✅ Catalog version triggers on {table}")
+
+    conn.commit()
+    print("✅ Migration 066 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the triggers and the catalog_version table"""
+    conn = cursor.connection
+
+    for table in CATALOG_TABLES:
+        for event in EVENTS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS catalog_version_{table}_{event.lower()}")
+    cursor.execute("DROP TABLE IF EXISTS catalog_version")
+
+    conn.commit()
+    print("✅ Catalog version tracking removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Migration 067: Catalog change log for incremental validation
+
+Adds catalog_change_log, appended to by triggers on arrows, spine_specifications and
+manufacturers, and the run_mode/change_seq/arrows_revalidated columns on
+validation_runs. ArrowDataValidator.validate_changed_data revalidates only the
+arrows logged after the last completed run's change_seq.
+
+(arrow_change_log is the unrelated setup arrow change history from migrations 014/023.)
+"""
+
+import sqlite3
+import sys
+import os
+
+# Trigger bodies; rows with arrow_id NULL are manufacturer-level changes
+CHANGE_LOG_TRIGGERS = {
+    'arrows': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NEW.id, NEW.manufacturer);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NEW.id, NEW.manufacturer); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) SELECT OLD.id, OLD.manufacturer "
+                  "WHERE OLD.id != NEW.id OR OLD.manufacturer IS NOT NEW.manufacturer;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (OLD.id, OLD.manufacturer);",
+    },
+    'spine_specifications': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT NEW.arrow_id, (SELECT manufacturer FROM arrows WHERE id = NEW.arrow_id);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT NEW.arrow_id, (SELECT manufacturer FROM arrows WHERE id = NEW.arrow_id); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT OLD.arrow_id, (SELECT manufacturer FROM arrows WHERE id = OLD.arrow_id) "
+                  "WHERE OLD.arrow_id IS NOT NEW.arrow_id;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) "
+                  "SELECT OLD.arrow_id, (SELECT manufacturer FROM arrows WHERE id = OLD.arrow_id);",
+    },
+    'manufacturers': {
+        'insert': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, NEW.name);",
+        'update': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, NEW.name); "
+                  "INSERT INTO catalog_change_log (arrow_id, manufacturer) SELECT NULL, OLD.name "
+                  "WHERE OLD.name IS NOT NEW.name;",
+        'delete': "INSERT INTO catalog_change_log (arrow_id, manufacturer) VALUES (NULL, OLD.name);",
+    },
+}
+
+RUN_COLUMNS = {
+    'run_mode': "TEXT DEFAULT 'full'",
+    'change_seq': "INTEGER",
+    'arrows_revalidated': "INTEGER",
+}
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 67,
+        'description': 'Catalog change log and validation run watermarks for incremental validation',
+        'author': 'System',
+        'created_at': '2025-12-08',
+        'target_database': 'arrow',
+        'dependencies': ['056', '066'],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create catalog_change_log, its triggers and the validation_runs columns"""
+    conn = cursor.connection
+
+    print("Adding catalog change log...")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS catalog_change_log (
+            change_seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            arrow_id INTEGER,
+            manufacturer TEXT,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+
+    for table, events in CHANGE_LOG_TRIGGERS.items():
+        for event in events:
+            # Triggers of the first version of this migration wrote into arrow_change_log
+            cursor.execute(f"DROP TRIGGER IF EXISTS arrow_change_log_{table}_{event}")
+        if table not in existing_tables:
+            print(f"ℹ️ {table} table not found, skipping triggers")
+            continue
+        for event, body in events.items():
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS catalog_change_log_{table}_{event}
+                AFTER {event.upper()} ON {table}
+                BEGIN
+                    {body}
+                END
+            """)
+        print(f"✅ Change log triggers on {table}")
+
+    if 'validation_runs' in existing_tables:
+        cursor.execute("PRAGMA table_info(validation_runs)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column, definition in RUN_COLUMNS.items():
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE validation_runs ADD COLUMN {column} {definition}")
+                print(f"✅ Added validation_runs.{column}")
+    else:
+        print("ℹ️ validation_runs table not found, skipping run columns")
+
+    conn.commit()
+    print("✅ Migration 067 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the triggers and catalog_change_log (validation_runs columns are left in place)"""
+    conn = cursor.connection
+
+    for table, events in CHANGE_LOG_TRIGGERS.items():
+        for event in events:
+            cursor.execute(f"DROP TRIGGER IF EXISTS catalog_change_log_{table}_{event}")
+    cursor.execute("DROP TABLE IF EXISTS catalog_change_log")
+
+    conn.commit()
+    print("✅ Catalog change log removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Migration 068: Query benchmark history
+
+Adds query_benchmark_runs and query_benchmark_results. Every database health check
+replays the API's hot queries (query_benchmark.py) and stores p50/p95/p99 and the
+EXPLAIN QUERY PLAN fingerprint per query, so the admin health view can show
+latency trends, regressions and plan changes.
+"""
+
+import sqlite3
+import sys
+import os
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 68,
+        'description': 'Query benchmark runs and per-query latency history',
+        'author': 'System',
+        'created_at': '2025-12-15',
+        'target_database': 'arrow',
+        'dependencies': [],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create query_benchmark_runs and query_benchmark_results"""
+    conn = cursor.connection
+
+    print("Adding query benchmark history...")
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS query_benchmark_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TIMESTAMP NOT NULL,
+            duration_ms REAL,
+            iterations INTEGER,
+            warmup INTEGER,
+            sqlite_version TEXT,
+            triggered_by TEXT DEFAULT 'manual'
+        )
+    ''')
+    print("✅ Created query_benchmark_runs table")
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS query_benchmark_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            query_name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            p50_ms REAL,
+            p95_ms REAL,
+            p99_ms REAL,
+            mean_ms REAL,
+            max_ms REAL,
+            iterations INTEGER,
+            avg_rows REAL,
+            plan_fingerprint TEXT,
+            query_plan TEXT,
+            error TEXT,
+            FOREIGN KEY (run_id) REFERENCES query_benchmark_runs (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_query_benchmark_results_query
+        ON query_benchmark_results (query_name, run_id DESC)
+    ''')
+    print("✅ Created query_benchmark_results table")
+
+    conn.commit()
+    print("✅ Migration 068 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the query benchmark history"""
+    conn = cursor.connection
+
+    cursor.execute("DROP INDEX IF EXISTS idx_query_benchmark_results_query")
+    cursor.execute("DROP TABLE IF EXISTS query_benchmark_results")
+    cursor.execute("DROP TABLE IF EXISTS query_benchmark_runs")
+
+    conn.commit()
+    print("✅ Query benchmark history removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
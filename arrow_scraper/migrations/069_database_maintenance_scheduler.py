@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Migration 069: Database maintenance scheduler
+
+Adds database_maintenance_state (scheduler lease, queued admin requests, row counts at the
+last ANALYZE) and database_maintenance_log (one row per maintenance step). The background
+scheduler (maintenance_scheduler.py) replaces the blocking VACUUM/ANALYZE/REINDEX endpoints.
+"""
+
+import sqlite3
+import sys
+import os
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 69,
+        'description': 'Background database maintenance scheduler state and log',
+        'author': 'System',
+        'created_at': '2025-12-16',
+        'target_database': 'arrow',
+        'dependencies': [],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create database_maintenance_state and database_maintenance_log"""
+    conn = cursor.connection
+
+    print("Adding database maintenance scheduler tables...")
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS database_maintenance_state (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            expires_at REAL
+        )
+    ''')
+    print("✅ Created database_maintenance_state table")
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS database_maintenance_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            operation TEXT NOT NULL,
+            target TEXT,
+            started_at TIMESTAMP NOT NULL,
+            duration_ms REAL,
+            pages INTEGER,
+            detail TEXT,
+            owner TEXT
+        )
+    ''')
+    print("✅ Created database_maintenance_log table")
+
+    conn.commit()
+    print("✅ Migration 069 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the maintenance scheduler tables"""
+    conn = cursor.connection
+
+    cursor.execute("DROP TABLE IF EXISTS database_maintenance_log")
+    cursor.execute("DROP TABLE IF EXISTS database_maintenance_state")
+
+    conn.commit()
+    print("✅ Database maintenance scheduler tables removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Migration 070: Users version tracking
+
+Adds a single-row users_version counter that triggers on users bump on every
+update or delete. Each API worker caches user rows for token_required
+(user_cache.py) and drops them when this version changes, so suspensions and
+admin changes made in one worker reach the others within about a second.
+"""
+
+import sqlite3
+import sys
+import os
+
+EVENTS = ("UPDATE", "DELETE")
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 70,
+        'description': 'Users version counter and triggers for the auth user cache',
+        'author': 'System',
+        'created_at': '2025-12-18',
+        'target_database': 'arrow',
+        'dependencies': [],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create users_version and its triggers"""
+    conn = cursor.connection
+
+    print("Adding users version tracking...")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO users_version (id, version) VALUES (1, 0)")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'users'")
+    if not cursor.fetchone():
+        print("ℹ️ users table not found, skipping triggers")
+    else:
+        for event in EVENTS:
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS users_version_{event.lower()}
+                AFTER {event} ON users
+                BEGIN
+                    UPDATE users_version SET version = version + 1 WHERE id = 1;
+                END
+            """)
+        print("✅ Users version triggers on users")
+
+    conn.commit()
+    print("✅ Migration 070 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the triggers and the users_version table"""
+    conn = cursor.connection
+
+    for event in EVENTS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS users_version_{event.lower()}")
+    cursor.execute("DROP TABLE IF EXISTS users_version")
+
+    conn.commit()
+    print("✅ Users version tracking removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
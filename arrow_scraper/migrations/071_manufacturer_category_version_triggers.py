@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Migration 071: Catalog version triggers on manufacturer equipment categories
+
+Writes to manufacturer_equipment_categories now bump catalog_version like
+arrows, spine_specifications and manufacturers do. Each API worker caches a
+manufacturer suggestion index (manufacturer_matcher.py) that includes these
+categories and rebuilds it when the version changes, so a category edit made
+through one worker reaches the others within a few seconds.
+"""
+
+import sqlite3
+import sys
+import os
+
+EVENTS = ("INSERT", "UPDATE", "DELETE")
+TABLE = "manufacturer_equipment_categories"
+
+def get_migration_info():
+    """Return migration metadata"""
+    return {
+        'version': 71,
+        'description': 'Catalog version triggers on manufacturer equipment categories',
+        'author': 'System',
+        'created_at': '2025-12-19',
+        'target_database': 'arrow',
+        'dependencies': ['066'],
+        'environments': ['all']
+    }
+
+def migrate_up(cursor):
+    """Create the catalog_version triggers on manufacturer_equipment_categories"""
+    conn = cursor.connection
+
+    print("Adding catalog version triggers on manufacturer equipment categories...")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0)")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (TABLE,))
+    if not cursor.fetchone():
+        print(f"ℹ️ {TABLE} table not found, skipping triggers")
+    else:
+        for event in EVENTS:
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS catalog_version_{TABLE}_{event.lower()}
+                AFTER {event} ON {TABLE}
+                BEGIN
+                    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+                END
+            """)
+        print(f"✅ Catalog version triggers on {TABLE}")
+
+    conn.commit()
+    print("✅ Migration 071 completed successfully")
+
+    return True
+
+def migrate_down(cursor):
+    """Drop the manufacturer_equipment_categories triggers"""
+    conn = cursor.connection
+
+    for event in EVENTS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS catalog_version_{TABLE}_{event.lower()}")
+
+    conn.commit()
+    print("✅ Manufacturer category version triggers removed")
+
+    return True
+
+# Allow running directly for testing
+if __name__ == '__main__':
+    db_paths = [
+        'databases/arrow_database.db',
+        '../databases/arrow_database.db',
+        'arrow_scraper/databases/arrow_database.db'
+    ]
+
+    db_path = None
+    for path in db_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("❌ Could not find database")
+        sys.exit(1)
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        migrate_up(cursor)
+        print("✅ Migration completed successfully")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Model Suggestion Index
+In-memory typeahead index over equipment_models, one bucket per (manufacturer, category).
+
+The old relevance score, usage_count * 0.7 - days since last use * 0.3, only shifts by the same
+amount for every model as time passes, so each model keeps a static weight
+(0.7 * usage_count + 0.3 * julianday(last_used)) and buckets stay sorted by it. A suggestion
+query walks the bucket in weight order and stops after `limit` matches; when the query is rare
+(counted over the bucket's joined model names), all matches are found by searching that text instead.
+
+Learned entries update the index in place and are queued; a background thread writes the
+queued usage counts (equipment_models, equipment_usage_stats) in batches.
+"""
+
+import atexit
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import sqlite3
+
+# Relevance weights (same as the previous SQL ORDER BY)
+USAGE_WEIGHT = 0.7
+RECENCY_WEIGHT = 0.3
+
+# Entries ranked highest are scanned first; past this many the joined-name search is used
+RANKED_SCAN_MIN = 64
+RANKED_SCAN_PER_RESULT = 8
+# Cost of resolving one joined-name match relative to checking one ranked entry
+FIND_COST_RATIO = 8
+
+# Seconds between batched writes, and queued keys that trigger an early write
+FLUSH_INTERVAL = 2.0
+FLUSH_BATCH_SIZE = 500
+
+# Seconds between checks for equipment_models rows written by other processes
+CHECK_INTERVAL = 5.0
+
+_JULIAN_UNIX_EPOCH = 2440587.5
+_SEPARATOR = '\n'
+
+
+def utc_timestamp() -> str:
+    """Current time in CURRENT_TIMESTAMP format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def julian_day(timestamp: Optional[str]) -> Optional[float]:
+    """julianday() of an SQLite timestamp string (None when it cannot be parsed)"""
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(timestamp).replace('Z', ''))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (parsed - datetime(1970, 1, 1)).total_seconds() / 86400.0 + _JULIAN_UNIX_EPOCH
+
+
+def julian_now() -> float:
+    return time.time() / 86400.0 + _JULIAN_UNIX_EPOCH
+
+
+class ModelEntry:
+    """One learned (manufacturer, model, category) row"""
+
+    __slots__ = ('manufacturer_name', 'model_name', 'lower', 'usage_count', 'last_used', 'weight')
+
+    def __init__(self, manufacturer_name: str, model_name: str, usage_count: int, last_used: Optional[str]):
+        self.manufacturer_name = manufacturer_name
+        self.model_name = model_name
+        self.lower = model_name.lower()
+        self.usage_count = usage_count or 0
+        self.last_used = last_used
+        self.weight = self._weight()
+
+    def _weight(self) -> Optional[float]:
+        last_used = julian_day(self.last_used)
+        if last_used is None:
+            return None
+        return self.usage_count * USAGE_WEIGHT + last_used * RECENCY_WEIGHT
+
+    def rank_key(self) -> Tuple[float, int, str]:
+        # Rows without last_used have a NULL relevance score and sort last
+        weight = self.weight if self.weight is not None else float('-inf')
+        return (-weight, -self.usage_count, self.lower)
+
+    def suggestion(self, now: float) -> Dict[str, Any]:
+        relevance = None if self.weight is None else round(self.weight - now * RECENCY_WEIGHT, 2)
+        return {
+            'model_name': self.model_name,
+            'usage_count': self.usage_count,
+            'last_used': self.last_used,
+            'relevance_score': relevance,
+        }
+
+
+class ModelBucket:
+    """Models of one (manufacturer, category), kept in relevance order"""
+
+    def __init__(self):
+        self.entries: Dict[Tuple[str, str], ModelEntry] = {}
+        self._keys: List[Tuple[float, int, str]] = []
+        self._ranked: List[ModelEntry] = []
+        # Lowercase names joined by newlines, and each name's start offset
+        self._names: List[str] = []
+        self._starts: List[int] = []
+        self._owners: List[ModelEntry] = []
+        self._text: Optional[str] = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    def add(self, entry: ModelEntry):
+        self.entries[(entry.manufacturer_name, entry.model_name)] = entry
+        self._insert_ranked(entry)
+        self._names.append(entry.lower)
+        self._starts.append(self._length)
+        self._owners.append(entry)
+        self._length += len(entry.lower) + 1
+        self._text = None
+
+    def update(self, entry: ModelEntry, usage_count: int, last_used: Optional[str]):
+        """Change an entry's usage and move it to its new rank"""
+        key = entry.rank_key()
+        position = bisect_right(self._keys, key) - 1
+        while self._ranked[position] is not entry:
+            position -= 1
+        del self._keys[position]
+        del self._ranked[position]
+        entry.usage_count = usage_count
+        entry.last_used = last_used
+        entry.weight = entry._weight()
+        self._insert_ranked(entry)
+
+    def _insert_ranked(self, entry: ModelEntry):
+        key = entry.rank_key()
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ranked.insert(position, entry)
+
+    def top(self, limit: int) -> List[ModelEntry]:
+        return self._ranked[:limit]
+
+    def search(self, query: str, limit: int) -> List[ModelEntry]:
+        """Highest ranked entries whose lowercase name contains query"""
+        if limit <= 0:
+            return []
+        ranked = self._ranked
+        scan = max(RANKED_SCAN_MIN, limit * RANKED_SCAN_PER_RESULT)
+        matches = []
+        for entry in ranked[:scan]:
+            if query in entry.lower:
+                matches.append(entry)
+                if len(matches) == limit:
+                    return matches
+        if len(ranked) <= scan or _SEPARATOR in query:
+            if len(ranked) > scan:
+                matches.extend(entry for entry in ranked[scan:] if query in entry.lower)
+            return matches[:limit]
+
+        if self._text is None:
+            self._text = _SEPARATOR.join(self._names) + _SEPARATOR
+        text, starts, owners = self._text, self._starts, self._owners
+        occurrences = text.count(query)
+        if not occurrences:
+            return matches
+
+        # Common queries: keep scanning in rank order (about limit * size / occurrences entries)
+        if limit * len(ranked) <= occurrences * occurrences * FIND_COST_RATIO:
+            for entry in ranked[scan:]:
+                if query in entry.lower:
+                    matches.append(entry)
+                    if len(matches) == limit:
+                        break
+            return matches
+
+        # Rare queries: find every occurrence in the joined names
+        found = {}
+        position = text.find(query)
+        while position >= 0:
+            index = bisect_right(starts, position) - 1
+            entry = owners[index]
+            found[id(entry)] = entry
+            # Continue after this name; later occurrences in it add nothing
+            position = text.find(query, starts[index] + len(entry.lower) + 1)
+        return sorted(found.values(), key=ModelEntry.rank_key)[:limit]
+
+
+class ModelSuggestionIndex:
+    """Typeahead index over equipment_models with batched, asynchronous usage writes"""
+
+    def __init__(self, db_path: str, flush_interval: float = FLUSH_INTERVAL,
+                 flush_batch_size: int = FLUSH_BATCH_SIZE, check_interval: float = CHECK_INTERVAL):
+        """
+        Args:
+            db_path: Unified database holding equipment_models
+            flush_interval: Seconds between batched usage writes
+            flush_batch_size: Queued models that trigger a write before the interval ends
+            check_interval: Seconds between checks for rows written by other processes
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.check_interval = check_interval
+        self._buckets: Dict[Tuple[str, str], ModelBucket] = {}
+        self._loaded = False
+        self._stale = False
+        self._known_max_id: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+        # Queued usage per (manufacturer, model, category): count, last_used, user_id
+        self._pending: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {'flushes': 0, 'rows_written': 0, 'reloads': 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _max_id(cursor) -> Optional[int]:
+        # INSERT OR REPLACE gives every learned row a new AUTOINCREMENT id, so MAX(id) changes on each write
+        cursor.execute('SELECT MAX(id) FROM equipment_models')
+        return cursor.fetchone()[0]
+
+    def load(self):
+        """(Re)build every bucket from equipment_models"""
+        started = time.perf_counter()
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            max_id = self._max_id(cursor)
+            cursor.execute('''
+                SELECT manufacturer_name, model_name, category_name, usage_count, last_used
+                FROM equipment_models
+            ''')
+            buckets: Dict[Tuple[str, str], ModelBucket] = {}
+            for row in cursor:
+                entry = ModelEntry(row['manufacturer_name'], row['model_name'], row['usage_count'], row['last_used'])
+                key = (row['manufacturer_name'].lower(), row['category_name'])
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = ModelBucket()
+                bucket.add(entry)
+        finally:
+            conn.close()
+
+        with self._lock:
+            # Usage queued but not yet written is re-applied on top of the reloaded rows
+            for (manufacturer, model, category), queued in self._pending.items():
+                bucket = buckets.setdefault((manufacturer.lower(), category), ModelBucket())
+                entry = bucket.entries.get((manufacturer, model))
+                if entry is None:
+                    bucket.add(ModelEntry(manufacturer, model, queued['count'], queued['last_used']))
+                else:
+                    bucket.update(entry, entry.usage_count + queued['count'], queued['last_used'])
+            self._buckets = buckets
+            self._known_max_id = max_id
+            self._loaded = True
+            self._stale = False
+            self._checked_at = time.monotonic()
+            self.stats['reloads'] += 1
+        count = sum(len(bucket) for bucket in buckets.values())
+        print(f"🔤 Model suggestion index loaded: {count} models in {len(buckets)} buckets "
+              f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    def _ensure_current(self):
+        """Load on first use; reload when another process has written equipment_models"""
+        if self._loaded and not self._stale:
+            now = time.monotonic()
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                conn = self._connect()
+                try:
+                    if self._max_id(conn.cursor()) == self._known_max_id:
+                        return
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                print(f"⚠️ Model suggestion index check failed: {e}")
+                return
+        self.load()
+
+    def suggestions(self, manufacturer_name: str, category_name: str,
+                    query: str = "", limit: int = 10) -> List[Dict[str, Any]]:
+        """Models of a manufacturer/category containing query (case-insensitive), best first"""
+        with self._lock:
+            self._ensure_current()
+            bucket = self._buckets.get(((manufacturer_name or '').lower(), category_name))
+            if bucket is None:
+                return []
+            entries = bucket.search(query.lower(), limit) if query else bucket.top(limit)
+            now = julian_now()
+            return [entry.suggestion(now) for entry in entries]
+
+    def record_usage(self, manufacturer_name: str, model_name: str, category_name: str,
+                     user_id: Optional[int]) -> int:
+        """Count one use of a model in the index and queue the write; returns the new usage count"""
+        last_used = utc_timestamp()
+        with self._lock:
+            self._ensure_current()
+            key = (manufacturer_name.lower(), category_name)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = ModelBucket()
+            entry = bucket.entries.get((manufacturer_name, model_name))
+            if entry is None:
+                entry = ModelEntry(manufacturer_name, model_name, 1, last_used)
+                bucket.add(entry)
+            else:
+                bucket.update(entry, entry.usage_count + 1, last_used)
+
+            queued = self._pending.setdefault((manufacturer_name, model_name, category_name),
+                                              {'count': 0, 'last_used': last_used, 'user_id': user_id,
+                                               'periods': {}})
+            queued['count'] += 1
+            queued['last_used'] = last_used
+            queued['user_id'] = user_id
+            period = _month_period(datetime.now())
+            queued['periods'][period] = queued['periods'].get(period, 0) + 1
+            pending_count = len(self._pending)
+            usage_count = entry.usage_count
+
+        self._start_writer()
+        if pending_count >= self.flush_batch_size:
+            self._wakeup.set()
+        return usage_count
+
+    def _start_writer(self):
+        if self._writer is None and not self._closed:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, name="model-usage-writer",
+                                                    daemon=True)
+                    self._writer.start()
+                    atexit.register(self.close)
+
+    def _write_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Write queued usage in one transaction; returns the number of models written"""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            conn = self._connect()
+            try:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                max_id_before = self._max_id(cursor)
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO equipment_models
+                    (manufacturer_name, model_name, category_name, usage_count, last_used, created_by_user_id, first_seen)
+                    VALUES (
+                        ?, ?, ?,
+                        COALESCE((SELECT usage_count FROM equipment_models
+                                 WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), 0) + ?,
+                        ?,
+                        ?,
+                        COALESCE((SELECT first_seen FROM equipment_models
+                                 WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?), ?)
+                    )
+                ''', [(manufacturer, model, category,
+                       manufacturer, model, category, queued['count'],
+                       queued['last_used'],
+                       queued['user_id'],
+                       manufacturer, model, category, queued['last_used'])
+                      for (manufacturer, model, category), queued in batch.items()])
+                _write_usage_stats(cursor, batch)
+                max_id_after = self._max_id(cursor)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"⚠️ Could not write model usage ({len(batch)} models), retrying next flush: {e}")
+                with self._lock:
+                    for key, queued in batch.items():
+                        newer = self._pending.get(key)
+                        if newer is None:
+                            self._pending[key] = queued
+                        else:
+                            newer['count'] += queued['count']
+                            for period, count in queued['periods'].items():
+                                newer['periods'][period] = newer['periods'].get(period, 0) + count
+                return 0
+            finally:
+                conn.close()
+
+            with self._lock:
+                if max_id_before != self._known_max_id:
+                    # Another process wrote since the last load; pick its rows up on the next query
+                    self._stale = True
+                self._known_max_id = max_id_after
+            self.stats['flushes'] += 1
+            self.stats['rows_written'] += len(batch)
+            return len(batch)
+
+    def close(self):
+        """Stop the writer thread and write what is still queued"""
+        self._closed = True
+        self._wakeup.set()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+
+def _month_period(now: datetime) -> Tuple[str, str]:
+    period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if now.month == 12:
+        period_end = period_start.replace(year=now.year + 1, month=1)
+    else:
+        period_end = period_start.replace(month=now.month + 1)
+    return (period_start.date().isoformat(), period_end.date().isoformat())
+
+
+def _write_usage_stats(cursor, batch: Dict[Tuple[str, str, str], Dict[str, Any]]):
+    """Add queued counts to the monthly equipment_usage_stats rows"""
+    rows = []
+    for (manufacturer, model, category), queued in batch.items():
+        for (period_start, period_end), count in queued['periods'].items():
+            rows.append((manufacturer, model, category,
+                         manufacturer, model, category, period_start, count,
+                         manufacturer, model, category, period_start, count,
+                         period_start, period_end))
+    try:
+        cursor.executemany('''
+            INSERT OR REPLACE INTO equipment_usage_stats
+            (manufacturer_name, model_name, category_name, monthly_usage, total_usage,
+             period_start, period_end, last_updated)
+            VALUES (
+                ?, ?, ?,
+                COALESCE((SELECT monthly_usage FROM equipment_usage_stats
+                         WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?
+                         AND period_start = ?), 0) + ?,
+                COALESCE((SELECT total_usage FROM equipment_usage_stats
+                         WHERE manufacturer_name = ? AND model_name = ? AND category_name = ?
+                         AND period_start = ?), 0) + ?,
+                ?, ?, CURRENT_TIMESTAMP
+            )
+        ''', rows)
+    except sqlite3.Error as e:
+        print(f"Warning: Could not update usage stats: {e}")
+
+
+_indexes: Dict[str, ModelSuggestionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_model_suggestion_index(db_path: str) -> ModelSuggestionIndex:
+    """Shared index for a database (one per process)"""
+    with _indexes_lock:
+        index = _indexes.get(db_path)
+        if index is None:
+            index = _indexes[db_path] = ModelSuggestionIndex(db_path)
+        return index
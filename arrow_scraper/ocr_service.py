@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Warm EasyOCR Worker Pool
+
+A small process pool where every worker loads one easyocr.Reader at start-up and keeps it
+for its whole lifetime. Images are preprocessed (grayscale, downscale, crop to the
+spec-table region) inside the worker and results are cached by image hash, so a full
+spec-sheet image set is OCR'd across cores without ever reloading the model.
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+OCRResult = List[Tuple[str, float]]
+
+# Bump when preprocessing changes so stale cache entries are not reused
+PREPROCESS_VERSION = 1
+
+# Per-process reader, loaded once by each pool worker
+_worker_reader = None
+
+
+def _init_worker(languages: List[str]):
+    """Pool initializer: load the EasyOCR model once per worker process"""
+    global _worker_reader
+    import easyocr
+    _worker_reader = easyocr.Reader(languages, verbose=False)
+
+
+def preprocess_image(image_data: bytes, max_side: int = 2000, crop: bool = True):
+    """Grayscale, downscale and crop an image to its text-bearing region; returns a numpy array"""
+    import numpy as np
+    from PIL import Image, ImageOps
+
+    image = Image.open(io.BytesIO(image_data))
+    image = ImageOps.exif_transpose(image).convert('L')
+
+    # Downscale large spec sheets, OCR time grows with pixel count
+    width, height = image.size
+    scale = max_side / max(width, height)
+    if scale < 1:
+        image = image.resize((int(width * scale), int(height * scale)), Image.LANCZOS)
+
+    if crop:
+        # Crop to the bounding box of dark (text/grid) pixels so the table region fills the frame
+        dark = image.point(lambda p: 255 if p < 160 else 0)
+        pixels = np.asarray(dark)
+        row_density = (pixels > 0).mean(axis=1)
+        rows = np.where(row_density > 0.01)[0]
+        if rows.size:
+            # Rows must carry some ink to count, which drops blank margins and faint backgrounds
+            bbox = dark.getbbox()
+            if bbox:
+                left, _, right, _ = bbox
+                top, bottom = int(rows[0]), int(rows[-1]) + 1
+                pad = 10
+                image = image.crop((max(0, left - pad), max(0, top - pad),
+                                    min(image.width, right + pad), min(image.height, bottom + pad)))
+
+    return np.asarray(image)
+
+
+def _ocr_in_worker(image_data: bytes, max_side: int, crop: bool) -> OCRResult:
+    """Run preprocessing + OCR with the worker's warm reader"""
+    if _worker_reader is None:
+        raise RuntimeError("OCR worker reader not initialized")
+    try:
+        array = preprocess_image(image_data, max_side=max_side, crop=crop)
+    except Exception:
+        # Unsupported format for PIL: let EasyOCR decode the raw bytes itself
+        array = image_data
+    results = _worker_reader.readtext(array)
+    return [(text.strip(), float(confidence)) for (_bbox, text, confidence) in results]
+
+
+class OCRService:
+    """Process pool of warm EasyOCR readers with an image-hash result cache"""
+
+    def __init__(self, workers: Optional[int] = None, languages: Optional[List[str]] = None,
+                 cache_dir: str = "data/ocr_cache", max_side: int = 2000, crop: bool = True):
+        self.languages = languages or ['en']
+        self.workers = workers if workers is not None else max(1, min(4, (os.cpu_count() or 2) // 2))
+        self.cache_dir = Path(cache_dir)
+        self.max_side = max_side
+        self.crop = crop
+        self._memory_cache = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.available = self._check_available()
+        self.stats = {'images': 0, 'cache_hits': 0, 'ocr_runs': 0}
+
+    @staticmethod
+    def _check_available() -> bool:
+        try:
+            import easyocr  # noqa: F401
+            return True
+        except ImportError:
+            print("❌ EasyOCR not available (pip install easyocr)")
+            return False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                print(f"🤖 Starting {self.workers} warm EasyOCR worker(s)...")
+                # spawn: torch does not survive fork reliably
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.languages,)
+                )
+            return self._executor
+
+    def _cache_key(self, image_data: bytes) -> str:
+        digest = hashlib.sha256(image_data).hexdigest()
+        return f"{digest}_v{PREPROCESS_VERSION}_{self.max_side}_{int(self.crop)}"
+
+    def _cache_get(self, key: str) -> Optional[OCRResult]:
+        if key in self._memory_cache:
+            return self._memory_cache[key]
+        cache_file = self.cache_dir / f"{key}.json"
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    result = [tuple(item) for item in json.load(f)]
+                self._memory_cache[key] = result
+                return result
+            except (json.JSONDecodeError, OSError):
+                return None
+        return None
+
+    def _cache_put(self, key: str, result: OCRResult):
+        self._memory_cache[key] = result
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️  OCR cache write failed: {e}")
+
+    def ocr_images(self, images: List[bytes]) -> List[OCRResult]:
+        """OCR a batch of images in parallel; order of results matches the input"""
+        if not self.available:
+            return [[] for _ in images]
+
+        results: List[Optional[OCRResult]] = [None] * len(images)
+        pending = {}
+        for i, image_data in enumerate(images):
+            self.stats['images'] += 1
+            key = self._cache_key(image_data)
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                results[i] = cached
+            else:
+                pending[i] = key
+
+        if pending:
+            executor = self._get_executor()
+            futures = {i: executor.submit(_ocr_in_worker, images[i], self.max_side, self.crop) for i in pending}
+            for i, future in futures.items():
+                try:
+                    result = future.result()
+                    self.stats['ocr_runs'] += 1
+                    self._cache_put(pending[i], result)
+                    results[i] = result
+                except Exception as e:
+                    print(f"❌ OCR extraction error: {e}")
+                    results[i] = []
+
+        return results
+
+    def ocr_image(self, image_data: bytes) -> OCRResult:
+        """OCR a single image (cached)"""
+        return self.ocr_images([image_data])[0]
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+_shared_service: Optional[OCRService] = None
+
+
+def get_ocr_service(**kwargs) -> OCRService:
+    """Process-wide OCR service so every extractor reuses the same warm workers"""
+    global _shared_service
+    if _shared_service is None:
+        workers = kwargs.pop('workers', None)
+        if workers is None and os.getenv("OCR_WORKERS"):
+            workers = int(os.getenv("OCR_WORKERS"))
+        _shared_service = OCRService(workers=workers, **kwargs)
+    return _shared_service
@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Performance Monitor
+Per-request SQL and hot-path instrumentation for the API.
+
+- The shared database classes (ArrowDatabase, UnifiedDatabase, ComponentDatabase,
+  CompatibilityEngine) open their connections through connect(), which returns a sqlite3
+  connection whose cursors count and time every statement (execute plus fetch*) against the
+  request being served on this thread.
+- Statements are grouped by shape (literals and IN lists collapsed). A request that runs the
+  same shape more than N_PLUS_ONE_THRESHOLD times is flagged as an N+1 pattern.
+- @timed("name") / span("name") time named hot-path sections (spine service, matching engine,
+  ballistics, compatibility). Span times are inclusive of nested spans.
+- Aggregates use fixed-bucket histograms so they can be merged across gunicorn workers: every
+  worker writes its totals to PERF_STATS_DIR every FLUSH_INTERVAL seconds and the admin
+  endpoint merges the files. p50/p95 are estimated from the buckets like Prometheus
+  histogram_quantile().
+
+Statements run outside a request (scripts, background threads) are not recorded.
+Set PERF_MONITORING=0 to return plain sqlite3 connections and skip all bookkeeping.
+"""
+
+import functools
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PERF_MONITORING_ENABLED = os.environ.get('PERF_MONITORING', '1') != '0'
+N_PLUS_ONE_THRESHOLD = int(os.environ.get('PERF_N_PLUS_ONE_THRESHOLD', 10))
+FLUSH_INTERVAL = 10.0          # seconds between writes of this worker's totals
+STALE_WORKER_SECONDS = 3600    # ignore files of workers that stopped writing an hour ago
+MAX_STATEMENT_SHAPES = 500
+N_PLUS_ONE_FINDINGS = 50
+OTHER_STATEMENTS = '(other statements)'
+
+# Upper bounds in milliseconds; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 50, 75, 100, 150, 200, 300,
+                      500, 750, 1000, 1500, 2000, 3000, 5000, 10000, 30000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class Histogram:
+    """Fixed-bucket histogram (mergeable across workers)"""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: 'Histogram'):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by linear interpolation inside the bucket that contains it"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                if i == len(self.bounds):
+                    return float(self.bounds[-1])
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return float(self.bounds[-1])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'counts': self.counts, 'total': self.total, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], bounds=LATENCY_BUCKETS_MS) -> 'Histogram':
+        histogram = cls(bounds)
+        if len(data.get('counts', [])) == len(histogram.counts):
+            histogram.counts = list(data['counts'])
+            histogram.total = data.get('total', 0.0)
+            histogram.count = data.get('count', 0)
+        return histogram
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_sql(sql: str) -> str:
+    """Statement shape: literals become ?, IN lists collapse to IN (?...), whitespace collapses"""
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _IN_LIST.sub('IN (?...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()[:500]
+
+
+class RequestStats:
+    """What one request did: statements per shape and time per span"""
+
+    __slots__ = ('endpoint', 'started', 'status_code', 'queries', 'query_ms', 'statements', 'spans')
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.status_code: Optional[int] = None
+        self.queries = 0
+        self.query_ms = 0.0
+        self.statements: Dict[str, List[float]] = {}   # shape -> [count, ms, max ms]
+        self.spans: Dict[str, List[float]] = {}        # name -> [count, ms]
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.query_ms = 0.0
+        self.max_queries = 0
+        self.n_plus_one = 0
+        self.spans: Dict[str, List[float]] = {}
+
+    def merge(self, other: 'EndpointStats'):
+        self.requests += other.requests
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+        self.queries.merge(other.queries)
+        self.query_ms += other.query_ms
+        self.max_queries = max(self.max_queries, other.max_queries)
+        self.n_plus_one += other.n_plus_one
+        for name, (count, ms) in other.spans.items():
+            totals = self.spans.setdefault(name, [0, 0.0])
+            totals[0] += count
+            totals[1] += ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests, 'errors': self.errors,
+            'latency': self.latency.to_dict(), 'queries': self.queries.to_dict(),
+            'query_ms': self.query_ms, 'max_queries': self.max_queries,
+            'n_plus_one': self.n_plus_one, 'spans': self.spans,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EndpointStats':
+        stats = cls()
+        stats.requests = data.get('requests', 0)
+        stats.errors = data.get('errors', 0)
+        stats.latency = Histogram.from_dict(data.get('latency', {}))
+        stats.queries = Histogram.from_dict(data.get('queries', {}), QUERY_COUNT_BUCKETS)
+        stats.query_ms = data.get('query_ms', 0.0)
+        stats.max_queries = data.get('max_queries', 0)
+        stats.n_plus_one = data.get('n_plus_one', 0)
+        stats.spans = {name: list(totals) for name, totals in data.get('spans', {}).items()}
+        return stats
+
+
+class PerfMonitor:
+    """Aggregates request, statement and span timings for this worker"""
+
+    def __init__(self, stats_dir: Optional[str] = None):
+        self._stats_dir = stats_dir
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.endpoints: Dict[str, EndpointStats] = {}
+            self.statements: Dict[str, List[float]] = {}   # shape -> [count, ms, max ms]
+            self.spans: Dict[str, Histogram] = {}
+            self.n_plus_one: deque = deque(maxlen=N_PLUS_ONE_FINDINGS)
+            self._reported_n_plus_one = set()
+
+    @property
+    def stats_dir(self) -> Path:
+        if self._stats_dir is None:
+            configured = os.environ.get('PERF_STATS_DIR')
+            db_path = os.environ.get('ARROW_DATABASE_PATH')
+            if configured:
+                self._stats_dir = configured
+            elif db_path:
+                self._stats_dir = str(Path(db_path).parent / 'perf_stats')
+            else:
+                self._stats_dir = os.path.join(tempfile.gettempdir(), 'arrowtuner_perf_stats')
+        return Path(self._stats_dir)
+
+    # Request lifecycle (Flask before_request, after_request and teardown_request)
+
+    def begin_request(self, endpoint: str):
+        self._local.request = RequestStats(endpoint)
+
+    def record_status(self, status_code: int):
+        """Status of the response about to be sent (after_request)"""
+        stats: Optional[RequestStats] = getattr(self._local, 'request', None)
+        if stats is not None:
+            stats.status_code = status_code
+
+    def end_request(self, status_code: Optional[int] = None):
+        """
+        Fold the request into the aggregates and clear it from this thread. Called from
+        teardown_request, which runs even when after_request was skipped; a request without
+        a recorded status counts as a 500.
+        """
+        stats: Optional[RequestStats] = getattr(self._local, 'request', None)
+        if stats is None:
+            return
+        self._local.request = None
+        if status_code is None:
+            status_code = stats.status_code if stats.status_code is not None else 500
+        elapsed_ms = (time.perf_counter() - stats.started) * 1000
+
+        repeated = [(shape, int(totals[0])) for shape, totals in stats.statements.items()
+                    if totals[0] > N_PLUS_ONE_THRESHOLD]
+        with self._lock:
+            endpoint = self.endpoints.get(stats.endpoint)
+            if endpoint is None:
+                endpoint = self.endpoints[stats.endpoint] = EndpointStats()
+            endpoint.requests += 1
+            if status_code >= 500:
+                endpoint.errors += 1
+            endpoint.latency.observe(elapsed_ms)
+            endpoint.queries.observe(stats.queries)
+            endpoint.query_ms += stats.query_ms
+            endpoint.max_queries = max(endpoint.max_queries, stats.queries)
+            for name, (count, ms) in stats.spans.items():
+                totals = endpoint.spans.setdefault(name, [0, 0.0])
+                totals[0] += count
+                totals[1] += ms
+
+            for shape, (count, ms, max_ms) in stats.statements.items():
+                if shape not in self.statements and len(self.statements) >= MAX_STATEMENT_SHAPES:
+                    shape = OTHER_STATEMENTS
+                totals = self.statements.setdefault(shape, [0, 0.0, 0.0])
+                totals[0] += count
+                totals[1] += ms
+                totals[2] = max(totals[2], max_ms)
+
+            if repeated:
+                endpoint.n_plus_one += 1
+                for shape, count in repeated:
+                    self.n_plus_one.append({'endpoint': stats.endpoint, 'statement': shape,
+                                            'count': count, 'at': time.time()})
+            new_findings = [(shape, count) for shape, count in repeated
+                            if (stats.endpoint, shape) not in self._reported_n_plus_one]
+            self._reported_n_plus_one.update((stats.endpoint, shape) for shape, _ in new_findings)
+
+        for shape, count in new_findings:
+            print(f"⚠️ Possible N+1 in {stats.endpoint}: statement ran {count} times: {shape[:160]}")
+
+        if time.monotonic() - self._flushed_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    # Hooks for instrumented cursors and spans
+
+    def record_statement(self, sql: str, seconds: float) -> Optional[str]:
+        stats: Optional[RequestStats] = getattr(self._local, 'request', None)
+        if stats is None:
+            return None
+        ms = seconds * 1000
+        shape = normalize_sql(sql)
+        totals = stats.statements.get(shape)
+        if totals is None:
+            stats.statements[shape] = [1, ms, ms]
+        else:
+            totals[0] += 1
+            totals[1] += ms
+            totals[2] = max(totals[2], ms)
+        stats.queries += 1
+        stats.query_ms += ms
+        return shape
+
+    def record_fetch(self, shape: str, seconds: float):
+        """Rows are produced lazily, so fetch time belongs to the statement that produced them"""
+        stats: Optional[RequestStats] = getattr(self._local, 'request', None)
+        if stats is None:
+            return
+        ms = seconds * 1000
+        totals = stats.statements.get(shape)
+        if totals is not None:
+            totals[1] += ms
+        stats.query_ms += ms
+
+    def record_span(self, name: str, seconds: float):
+        ms = seconds * 1000
+        stats: Optional[RequestStats] = getattr(self._local, 'request', None)
+        if stats is not None:
+            totals = stats.spans.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += ms
+        with self._lock:
+            histogram = self.spans.get(name)
+            if histogram is None:
+                histogram = self.spans[name] = Histogram()
+            histogram.observe(ms)
+
+    # Cross-worker aggregation
+
+    def snapshot(self) -> Dict[str, Any]:
+        """This worker's totals in the on-disk format"""
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'started_at': self.started_at,
+                'written_at': time.time(),
+                'endpoints': {key: stats.to_dict() for key, stats in self.endpoints.items()},
+                'statements': {shape: list(totals) for shape, totals in self.statements.items()},
+                'spans': {name: histogram.to_dict() for name, histogram in self.spans.items()},
+                'n_plus_one': list(self.n_plus_one),
+            }
+
+    def _worker_file(self) -> Path:
+        return self.stats_dir / f"worker-{os.getpid()}.json"
+
+    def flush(self):
+        """Write this worker's totals for the merged report (failures only cost the cross-worker view)"""
+        self._flushed_at = time.monotonic()
+        try:
+            self.stats_dir.mkdir(parents=True, exist_ok=True)
+            path = self._worker_file()
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"⚠️ Could not write performance stats: {e}")
+
+    def _worker_snapshots(self) -> List[Dict[str, Any]]:
+        snapshots = [self.snapshot()]
+        own = self._worker_file()
+        cutoff = time.time() - STALE_WORKER_SECONDS
+        try:
+            paths = list(self.stats_dir.glob('worker-*.json'))
+        except OSError:
+            paths = []
+        for path in paths:
+            if path == own:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    continue
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def merged(self) -> Dict[str, Any]:
+        """Totals of every worker that wrote recently (this one live)"""
+        endpoints: Dict[str, EndpointStats] = {}
+        statements: Dict[str, List[float]] = {}
+        spans: Dict[str, Histogram] = {}
+        findings = []
+        snapshots = self._worker_snapshots()
+        for snapshot in snapshots:
+            for key, data in snapshot.get('endpoints', {}).items():
+                endpoints.setdefault(key, EndpointStats()).merge(EndpointStats.from_dict(data))
+            for shape, (count, ms, max_ms) in snapshot.get('statements', {}).items():
+                totals = statements.setdefault(shape, [0, 0.0, 0.0])
+                totals[0] += count
+                totals[1] += ms
+                totals[2] = max(totals[2], max_ms)
+            for name, data in snapshot.get('spans', {}).items():
+                spans.setdefault(name, Histogram()).merge(Histogram.from_dict(data))
+            findings.extend(snapshot.get('n_plus_one', []))
+        findings.sort(key=lambda finding: finding['at'], reverse=True)
+        return {
+            'workers': len(snapshots),
+            'since': min(snapshot.get('started_at', time.time()) for snapshot in snapshots),
+            'endpoints': endpoints,
+            'statements': statements,
+            'spans': spans,
+            'n_plus_one': findings[:N_PLUS_ONE_FINDINGS],
+        }
+
+    # Reports
+
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        """JSON report for /api/admin/perf"""
+        merged = self.merged()
+
+        def rounded(value):
+            return round(value, 2) if value is not None else None
+
+        endpoints = []
+        for key, stats in merged['endpoints'].items():
+            method, _, rule = key.partition(' ')
+            requests = stats.requests or 1
+            top_spans = sorted(stats.spans.items(), key=lambda item: item[1][1], reverse=True)[:5]
+            endpoints.append({
+                'method': method,
+                'endpoint': rule,
+                'requests': stats.requests,
+                'errors': stats.errors,
+                'p50_ms': rounded(stats.latency.quantile(0.5)),
+                'p95_ms': rounded(stats.latency.quantile(0.95)),
+                'avg_ms': rounded(stats.latency.total / requests),
+                'total_ms': rounded(stats.latency.total),
+                'queries_per_request': rounded(stats.queries.total / requests),
+                'queries_p95': rounded(stats.queries.quantile(0.95)),
+                'max_queries': stats.max_queries,
+                'query_ms_per_request': rounded(stats.query_ms / requests),
+                'n_plus_one_requests': stats.n_plus_one,
+                'spans': [{'name': name, 'calls': count, 'total_ms': rounded(ms)}
+                          for name, (count, ms) in top_spans],
+            })
+        endpoints.sort(key=lambda entry: entry['total_ms'], reverse=True)
+
+        statements = [{
+            'statement': shape,
+            'count': int(count),
+            'total_ms': rounded(ms),
+            'avg_ms': rounded(ms / count) if count else None,
+            'max_ms': rounded(max_ms),
+        } for shape, (count, ms, max_ms) in merged['statements'].items()]
+
+        spans = [{
+            'name': name,
+            'calls': histogram.count,
+            'p50_ms': rounded(histogram.quantile(0.5)),
+            'p95_ms': rounded(histogram.quantile(0.95)),
+            'total_ms': rounded(histogram.total),
+        } for name, histogram in merged['spans'].items()]
+        spans.sort(key=lambda entry: entry['total_ms'], reverse=True)
+
+        return {
+            'enabled': PERF_MONITORING_ENABLED,
+            'workers': merged['workers'],
+            'since': merged['since'],
+            'n_plus_one_threshold': N_PLUS_ONE_THRESHOLD,
+            'endpoints': endpoints,
+            'slowest_statements': sorted(statements, key=lambda entry: entry['max_ms'], reverse=True)[:limit],
+            'busiest_statements': sorted(statements, key=lambda entry: entry['total_ms'], reverse=True)[:limit],
+            'spans': spans,
+            'n_plus_one': merged['n_plus_one'],
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4) of the merged totals"""
+        merged = self.merged()
+        lines = []
+
+        def label(value: str) -> str:
+            return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram_lines(name, labels, histogram, scale):
+            cumulative = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound * scale:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{{labels}}} {histogram.total * scale:.6f}')
+            lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+
+        endpoints = sorted(merged['endpoints'].items())
+        endpoint_labels = {}
+        for key, _ in endpoints:
+            method, _, rule = key.partition(' ')
+            endpoint_labels[key] = f'method="{label(method)}",endpoint="{label(rule)}"'
+
+        metric('arrowtuner_perf_workers', 'gauge', 'Workers included in these totals')
+        lines.append(f"arrowtuner_perf_workers {merged['workers']}")
+
+        metric('arrowtuner_http_requests_total', 'counter', 'Requests handled')
+        for key, stats in endpoints:
+            lines.append(f"arrowtuner_http_requests_total{{{endpoint_labels[key]}}} {stats.requests}")
+
+        metric('arrowtuner_http_request_errors_total', 'counter', 'Requests answered with a 5xx status')
+        for key, stats in endpoints:
+            lines.append(f"arrowtuner_http_request_errors_total{{{endpoint_labels[key]}}} {stats.errors}")
+
+        metric('arrowtuner_http_request_duration_seconds', 'histogram', 'Request latency')
+        for key, stats in endpoints:
+            histogram_lines('arrowtuner_http_request_duration_seconds', endpoint_labels[key], stats.latency, 0.001)
+
+        metric('arrowtuner_sql_queries_per_request', 'histogram', 'SQL statements per request')
+        for key, stats in endpoints:
+            histogram_lines('arrowtuner_sql_queries_per_request', endpoint_labels[key], stats.queries, 1)
+
+        metric('arrowtuner_sql_query_seconds_total', 'counter', 'Time spent in SQL statements')
+        for key, stats in endpoints:
+            lines.append(f"arrowtuner_sql_query_seconds_total{{{endpoint_labels[key]}}} {stats.query_ms / 1000:.6f}")
+
+        metric('arrowtuner_n_plus_one_requests_total', 'counter',
+               f'Requests that repeated one statement shape more than {N_PLUS_ONE_THRESHOLD} times')
+        for key, stats in endpoints:
+            lines.append(f"arrowtuner_n_plus_one_requests_total{{{endpoint_labels[key]}}} {stats.n_plus_one}")
+
+        metric('arrowtuner_span_duration_seconds', 'histogram', 'Hot-path span duration (inclusive)')
+        for name, histogram in sorted(merged['spans'].items()):
+            histogram_lines('arrowtuner_span_duration_seconds', f'span="{label(name)}"', histogram, 0.001)
+
+        return '\n'.join(lines) + '\n'
+
+
+monitor = PerfMonitor()
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports each statement (and the fetches that follow it) to the monitor"""
+
+    _perf_shape = None
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._perf_shape = monitor.record_statement(sql, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._perf_shape = monitor.record_statement(sql, time.perf_counter() - start)
+
+    def executescript(self, sql_script):
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            self._perf_shape = monitor.record_statement(sql_script, time.perf_counter() - start)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        if self._perf_shape is not None:
+            monitor.record_fetch(self._perf_shape, time.perf_counter() - start)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        if self._perf_shape is not None:
+            monitor.record_fetch(self._perf_shape, time.perf_counter() - start)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        if self._perf_shape is not None:
+            monitor.record_fetch(self._perf_shape, time.perf_counter() - start)
+        return rows
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """sqlite3 connection whose cursors (including conn.execute shortcuts) are instrumented"""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+def connect(database, **kwargs) -> sqlite3.Connection:
+    """sqlite3.connect for the shared database classes (instrumented unless PERF_MONITORING=0)"""
+    if PERF_MONITORING_ENABLED:
+        kwargs.setdefault('factory', InstrumentedConnection)
+    return sqlite3.connect(database, **kwargs)
+
+
+@contextmanager
+def span(name: str):
+    """Time a named hot-path section"""
+    if not PERF_MONITORING_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        monitor.record_span(name, time.perf_counter() - start)
+
+
+def timed(name: str):
+    """Decorator form of span()"""
+    def decorator(func):
+        if not PERF_MONITORING_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                monitor.record_span(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
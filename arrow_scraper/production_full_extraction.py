@@ -20,13 +20,18 @@ sys.path.append(str(Path(__file__).parent))
 
 from crawl4ai import AsyncWebCrawler
 from deepseek_extractor import DeepSeekArrowExtractor
+from async_llm_client import AsyncDeepSeekClient
 from models import ArrowSpecification, ManufacturerData, ScrapingSession
 
 class ProductionArrowScraper:
     """Production-scale scraper for complete arrow database extraction"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrency: int = 4, token_budget: int = None):
         self.extractor = DeepSeekArrowExtractor(api_key)
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self.token_budget = token_budget
+        self.llm_client = None
         self.session_id = f"production_full_{int(time.time())}"
         
         # Setup logging
@@ -264,43 +269,22 @@ class ProductionArrowScraper:
             
             print(f"\n🔄 Batch {batch_num + 1}/{total_batches} ({len(batch_urls)} URLs)")
             
-            # Process batch
+            # Crawl the batch, then extract all pages concurrently (packed/chunked LLM requests)
+            pages = []
             for i, url in enumerate(batch_urls, start_idx + 1):
                 print(f"\n🔗 [{i}/{len(urls_to_scrape)}] {url}")
                 
                 try:
-                    # Crawl the page
                     result = await crawler.arun(url=url, bypass_cache=True)
                     
                     if result.success:
                         content = result.markdown or result.html or ""
                         print(f"   ✓ Crawled ({len(content)} chars)")
-                        
-                        # Extract arrow specifications
-                        arrows = self.extractor.extract_arrows_from_content(
-                            content=content,
-                            source_url=url,
-                            manufacturer=manufacturer
-                        )
-                        
-                        if arrows:
-                            print(f"   🎉 Extracted {len(arrows)} arrows!")
-                            for j, arrow in enumerate(arrows, 1):
-                                print(f"      {j}. {arrow.model_name}")
-                                if len(arrow.spine_options) > 5:
-                                    spine_display = f"{arrow.spine_options[:3]}...{arrow.spine_options[-2:]} ({len(arrow.spine_options)} total)"
-                                else:
-                                    spine_display = str(arrow.spine_options)
-                                print(f"         Spines: {spine_display}")
-                                print(f"         {arrow.diameter}\" OD | {arrow.gpi_weight} GPI")
-                            all_arrows.extend(arrows)
-                            successful_extractions += 1
-                        else:
-                            print(f"   ⚠️  No arrows extracted")
+                        pages.append({'url': url, 'content': content})
                     else:
                         print(f"   ❌ Failed to crawl: {result.error_message}")
                     
-                    # Rate limiting between requests
+                    # Rate limiting between crawl requests
                     await asyncio.sleep(0.5)
                     
                 except Exception as e:
@@ -308,6 +292,30 @@ class ProductionArrowScraper:
                     print(f"   ❌ Error: {e}")
                     continue
             
+            if not pages:
+                continue
+            
+            print(f"\n🤖 Extracting {len(pages)} pages concurrently...")
+            extracted = await self.extractor.extract_arrows_from_pages(pages, manufacturer, self.llm_client)
+            
+            for page in pages:
+                url = page['url']
+                arrows = extracted.get(url, [])
+                if arrows:
+                    print(f"   🎉 {url}: extracted {len(arrows)} arrows!")
+                    for j, arrow in enumerate(arrows, 1):
+                        print(f"      {j}. {arrow.model_name}")
+                        if len(arrow.spine_options) > 5:
+                            spine_display = f"{arrow.spine_options[:3]}...{arrow.spine_options[-2:]} ({len(arrow.spine_options)} total)"
+                        else:
+                            spine_display = str(arrow.spine_options)
+                        print(f"         Spines: {spine_display}")
+                        print(f"         {arrow.diameter}\" OD | {arrow.gpi_weight} GPI")
+                    all_arrows.extend(arrows)
+                    successful_extractions += 1
+                else:
+                    print(f"   ⚠️  {url}: no arrows extracted")
+            
             # Longer pause between batches
             if batch_num < total_batches - 1:
                 print(f"   ⏸️  Batch pause (2s)...")
@@ -346,7 +354,13 @@ class ProductionArrowScraper:
         all_manufacturer_data = {}
         total_arrows_extracted = 0
         
-        async with AsyncWebCrawler(verbose=False) as crawler:
+        self.llm_client = AsyncDeepSeekClient(
+            self.api_key,
+            max_concurrency=self.max_concurrency,
+            token_budget=self.token_budget
+        )
+        
+        async with self.llm_client, AsyncWebCrawler(verbose=False) as crawler:
             for i, (manufacturer, config) in enumerate(self.manufacturers.items(), 1):
                 try:
                     print(f"\n{'='*80}")
@@ -371,6 +385,8 @@ class ProductionArrowScraper:
                     print(f"❌ Failed to scrape {manufacturer}: {e}")
                     continue
         
+        self.llm_client.print_usage_report()
+        
         return all_manufacturer_data
     
     def save_production_results(self, all_data: Dict[str, ManufacturerData]):
@@ -532,8 +548,9 @@ async def main():
     print("This will extract ALL arrow specifications from ALL manufacturers")
     print("Estimated time: 15-30 minutes depending on response times")
     
-    # Create production scraper
-    scraper = ProductionArrowScraper(api_key)
+    # Create production scraper (optional per-run token budget, e.g. DEEPSEEK_TOKEN_BUDGET=2000000)
+    token_budget = int(os.getenv("DEEPSEEK_TOKEN_BUDGET", "0")) or None
+    scraper = ProductionArrowScraper(api_key, token_budget=token_budget)
     
     # Run complete extraction
     all_data = await scraper.run_production_extraction()
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Query Latency Benchmark
+Replays the API's hot queries (both search_arrows variants, get_arrow_by_id, setup arrows,
+the change-log union, journal full-text search and spine chart lookups) with parameters
+sampled from the database itself. Each query is warmed up, run N times and summarized as
+p50/p95/p99 together with a fingerprint of its EXPLAIN QUERY PLAN. Runs are stored in
+query_benchmark_runs / query_benchmark_results so the admin health view can show trends,
+latency regressions and plan changes.
+
+The SQL below mirrors the production queries; keep it in sync when those change.
+"""
+
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+BENCHMARK_ITERATIONS = 50
+WARMUP_ITERATIONS = 5
+
+# Parameter sets sampled per query; iterations cycle through them
+PARAMETER_SETS = 16
+
+# A query regressed when its p95 exceeds the median p95 of the last REGRESSION_WINDOW runs by
+# this factor and by at least REGRESSION_MIN_MS
+REGRESSION_WINDOW = 5
+REGRESSION_FACTOR = 1.5
+REGRESSION_MIN_MS = 1.0
+
+ParameterSampler = Callable[[sqlite3.Connection, int], List[Sequence[Any]]]
+
+
+@dataclass
+class HotQuery:
+    """A production query and how to sample representative parameters for it"""
+    name: str
+    description: str
+    sql: str
+    tables: Sequence[str]
+    sample_parameters: ParameterSampler
+
+
+def _column(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> List[Any]:
+    return [row[0] for row in conn.execute(sql, params).fetchall()]
+
+
+def _search_terms(conn: sqlite3.Connection, count: int) -> List[str]:
+    """Words users actually search for: first words of model names"""
+    words = []
+    for model_name in _column(conn, "SELECT model_name FROM arrows WHERE model_name IS NOT NULL "
+                                     "ORDER BY RANDOM() LIMIT ?", (count * 4,)):
+        for word in re.findall(r'[A-Za-z]{3,}', model_name):
+            words.append(word)
+            break
+    return list(dict.fromkeys(words))[:count]
+
+
+def _sample_catalog_search(conn, count):
+    manufacturers = _column(conn, "SELECT DISTINCT manufacturer FROM arrows WHERE manufacturer IS NOT NULL "
+                                  "ORDER BY RANDOM() LIMIT ?", (count,))
+    spine_windows = [(300, 400), (400, 500), (500, 700), (250, 350)]
+    return [(f"%{manufacturer}%", *spine_windows[i % len(spine_windows)], 50)
+            for i, manufacturer in enumerate(manufacturers)]
+
+
+def _sample_unified_search(conn, count):
+    return [tuple([f"%{term}%"] * 4 + [50]) for term in _search_terms(conn, count)]
+
+
+def _sample_arrow_ids(conn, count):
+    return [(arrow_id,) for arrow_id in _column(conn, "SELECT id FROM arrows ORDER BY RANDOM() LIMIT ?", (count,))]
+
+
+def _sample_setups_with_arrows(conn, count):
+    return [(setup_id,) for setup_id in _column(conn, '''
+        SELECT setup_id FROM setup_arrows GROUP BY setup_id ORDER BY COUNT(*) DESC LIMIT ?
+    ''', (count,))]
+
+
+def _sample_change_log_setups(conn, count):
+    setup_ids = _column(conn, '''
+        SELECT bow_setup_id FROM setup_change_log GROUP BY bow_setup_id ORDER BY COUNT(*) DESC LIMIT ?
+    ''', (count,))
+    if not setup_ids:
+        setup_ids = _column(conn, "SELECT id FROM bow_setups ORDER BY RANDOM() LIMIT ?", (count,))
+    return [(setup_id, setup_id, setup_id, 50) for setup_id in setup_ids]
+
+
+def _sample_journal_searches(conn, count):
+    samples = []
+    for user_id, title in conn.execute('''
+        SELECT user_id, title FROM journal_entries ORDER BY RANDOM() LIMIT ?
+    ''', (count,)).fetchall():
+        words = re.findall(r'[A-Za-z]{3,}', title or '')
+        if words:
+            samples.append((user_id, words[0].lower(), 20, 0))
+    return samples
+
+
+def _sample_spine_charts(conn, count):
+    return [tuple(row) for row in conn.execute('''
+        SELECT DISTINCT manufacturer, bow_type FROM manufacturer_spine_charts_enhanced
+        WHERE is_active = 1 ORDER BY RANDOM() LIMIT ?
+    ''', (count,)).fetchall()]
+
+
+HOT_QUERIES: List[HotQuery] = [
+    HotQuery(
+        name='search_arrows_catalog',
+        description='ArrowDatabase.search_arrows: manufacturer filter plus spine range subquery',
+        sql='''
+            SELECT DISTINCT
+                a.id, a.manufacturer, a.model_name, a.material, a.arrow_type,
+                a.description, a.image_url, a.created_at,
+                COUNT(s.id) as spine_count,
+                MIN(s.spine) as min_spine, MAX(s.spine) as max_spine,
+                MIN(s.gpi_weight) as min_gpi, MAX(s.gpi_weight) as max_gpi,
+                MIN(s.outer_diameter) as min_diameter, MAX(s.outer_diameter) as max_diameter,
+                COUNT(CASE WHEN s.length_options IS NOT NULL AND s.length_options != '' AND s.length_options != '[]'
+                      THEN 1 END) as spines_with_length,
+                GROUP_CONCAT(DISTINCT s.length_options) as all_length_options
+            FROM arrows a
+            LEFT JOIN spine_specifications s ON a.id = s.arrow_id
+            WHERE 1=1 AND a.manufacturer LIKE ?
+             AND a.id IN (
+                SELECT DISTINCT arrow_id FROM spine_specifications
+                WHERE 1=1 AND spine >= ? AND spine <= ?)
+            GROUP BY a.id
+            ORDER BY a.manufacturer, a.model_name
+            LIMIT ?
+        ''',
+        tables=('arrows', 'spine_specifications'),
+        sample_parameters=_sample_catalog_search,
+    ),
+    HotQuery(
+        name='search_arrows_unified',
+        description='UnifiedDatabase.search_arrows: free-text search over active manufacturers',
+        sql='''
+            SELECT DISTINCT a.*, m.is_active as manufacturer_active,
+                   GROUP_CONCAT(ss.spine) as spines,
+                   GROUP_CONCAT(ss.outer_diameter) as diameters,
+                   GROUP_CONCAT(ss.gpi_weight) as gpi_weights,
+                   MIN(ss.spine) as min_spine,
+                   MAX(ss.spine) as max_spine
+            FROM arrows a
+            JOIN manufacturers m ON a.manufacturer = m.name
+            LEFT JOIN spine_specifications ss ON a.id = ss.arrow_id
+            WHERE m.is_active = TRUE
+              AND (a.manufacturer LIKE ? OR a.model_name LIKE ? OR a.material LIKE ? OR a.description LIKE ?)
+            GROUP BY a.id
+            ORDER BY a.manufacturer, a.model_name
+            LIMIT ?
+        ''',
+        tables=('arrows', 'manufacturers', 'spine_specifications'),
+        sample_parameters=_sample_unified_search,
+    ),
+    HotQuery(
+        name='get_arrow_by_id',
+        description='UnifiedDatabase.get_arrow_by_id with aggregated spine data',
+        sql='''
+            SELECT a.*, m.is_active as manufacturer_active,
+                   GROUP_CONCAT(ss.spine) as spines,
+                   GROUP_CONCAT(ss.outer_diameter) as diameters,
+                   GROUP_CONCAT(ss.gpi_weight) as gpi_weights
+            FROM arrows a
+            JOIN manufacturers m ON a.manufacturer = m.name
+            LEFT JOIN spine_specifications ss ON a.id = ss.arrow_id
+            WHERE a.id = ? AND m.is_active = TRUE
+            GROUP BY a.id
+        ''',
+        tables=('arrows', 'manufacturers', 'spine_specifications'),
+        sample_parameters=_sample_arrow_ids,
+    ),
+    HotQuery(
+        name='setup_arrows',
+        description='UnifiedDatabase.get_setup_arrows for a bow setup',
+        sql='''
+            SELECT sa.*, a.manufacturer, a.model_name, a.material,
+                   ss.spine, ss.outer_diameter, ss.gpi_weight, m.is_active as manufacturer_active
+            FROM setup_arrows sa
+            JOIN arrows a ON sa.arrow_id = a.id
+            LEFT JOIN manufacturers m ON a.manufacturer = m.name
+            LEFT JOIN spine_specifications ss ON a.id = ss.arrow_id
+                AND ss.spine = sa.calculated_spine
+            WHERE sa.setup_id = ?
+            ORDER BY sa.created_at DESC
+        ''',
+        tables=('setup_arrows', 'arrows', 'manufacturers', 'spine_specifications'),
+        sample_parameters=_sample_setups_with_arrows,
+    ),
+    HotQuery(
+        name='change_log_union',
+        description='ChangeLogService unified change history (equipment, setup and arrow changes)',
+        sql='''
+            SELECT
+                'equipment' as change_source, ecl.id, ecl.bow_equipment_id as item_id, ecl.change_type,
+                ecl.field_name, ecl.old_value, ecl.new_value, ecl.change_description, ecl.change_reason,
+                ecl.created_at, be.manufacturer_name, be.model_name, be.category_name
+            FROM equipment_change_log ecl
+            LEFT JOIN bow_equipment be ON ecl.bow_equipment_id = be.id
+            JOIN bow_setups bs ON be.bow_setup_id = bs.id
+            WHERE bs.id = ?
+            UNION ALL
+            SELECT
+                'setup' as change_source, scl.id, NULL as item_id, scl.change_type,
+                scl.field_name, scl.old_value, scl.new_value, scl.change_description, NULL as change_reason,
+                scl.created_at, NULL as manufacturer_name, NULL as model_name, NULL as category_name
+            FROM setup_change_log scl
+            WHERE scl.bow_setup_id = ?
+            UNION ALL
+            SELECT
+                'arrow' as change_source, acl.id, sa.arrow_id as item_id, acl.change_type,
+                acl.field_name, acl.old_value, acl.new_value, acl.change_description, acl.change_reason,
+                acl.created_at, a.manufacturer as manufacturer_name, a.model_name, NULL as category_name
+            FROM arrow_change_log acl
+            LEFT JOIN setup_arrows sa ON acl.setup_arrow_id = sa.id
+            LEFT JOIN arrows a ON sa.arrow_id = a.id
+            WHERE sa.setup_id = ?
+            ORDER BY created_at DESC
+            LIMIT ?
+        ''',
+        tables=('equipment_change_log', 'bow_equipment', 'bow_setups', 'setup_change_log',
+                'arrow_change_log', 'setup_arrows', 'arrows'),
+        sample_parameters=_sample_change_log_setups,
+    ),
+    HotQuery(
+        name='journal_fts',
+        description='Journal entry list with a full-text search term',
+        sql='''
+            SELECT
+                je.*,
+                bs.name as setup_name,
+                bs.bow_type,
+                (SELECT COUNT(*) FROM journal_attachments ja WHERE ja.journal_entry_id = je.id) as attachment_count,
+                (SELECT ja.cdn_url FROM journal_attachments ja WHERE ja.journal_entry_id = je.id AND ja.is_primary = 1 LIMIT 1) as primary_image_url
+            FROM journal_entries je
+            LEFT JOIN bow_setups bs ON je.bow_setup_id = bs.id
+            WHERE je.user_id = ? AND je.id IN (SELECT rowid FROM journal_fts WHERE journal_fts MATCH ?)
+            ORDER BY je.created_at DESC
+            LIMIT ? OFFSET ?
+        ''',
+        tables=('journal_entries', 'journal_fts', 'journal_attachments', 'bow_setups'),
+        sample_parameters=_sample_journal_searches,
+    ),
+    HotQuery(
+        name='spine_chart_lookup',
+        description='UnifiedSpineService manufacturer chart lookup (system default for manufacturer and bow type)',
+        sql='''
+            SELECT manufacturer, model, spine_grid, chart_notes, spine_system
+            FROM manufacturer_spine_charts_enhanced
+            WHERE manufacturer = ? AND bow_type = ? AND is_active = 1 AND is_system_default = 1
+            ORDER BY calculation_priority ASC
+            LIMIT 1
+        ''',
+        tables=('manufacturer_spine_charts_enhanced',),
+        sample_parameters=_sample_spine_charts,
+    ),
+]
+
+
+def ensure_benchmark_tables(conn: sqlite3.Connection):
+    """Create query_benchmark_runs / query_benchmark_results (idempotent, see migration 068)"""
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS query_benchmark_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TIMESTAMP NOT NULL,
+            duration_ms REAL,
+            iterations INTEGER,
+            warmup INTEGER,
+            sqlite_version TEXT,
+            triggered_by TEXT DEFAULT 'manual'
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS query_benchmark_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            query_name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            p50_ms REAL,
+            p95_ms REAL,
+            p99_ms REAL,
+            mean_ms REAL,
+            max_ms REAL,
+            iterations INTEGER,
+            avg_rows REAL,
+            plan_fingerprint TEXT,
+            query_plan TEXT,
+            error TEXT,
+            FOREIGN KEY (run_id) REFERENCES query_benchmark_runs (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_query_benchmark_results_query
+        ON query_benchmark_results (query_name, run_id DESC)
+    ''')
+    conn.commit()
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(-(-q * len(sorted_samples) // 100)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, params: Sequence[Any]) -> List[str]:
+    """EXPLAIN QUERY PLAN as indented lines"""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+def plan_fingerprint(plan: Sequence[str]) -> str:
+    """Stable hash of a query plan; subquery numbers and other literals are ignored"""
+    normalized = "\n".join(re.sub(r'\d+', 'N', line) for line in plan)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:12]
+
+
+class QueryBenchmark:
+    """Replays HOT_QUERIES against a database and keeps a history of the results"""
+
+    def __init__(self, iterations: int = BENCHMARK_ITERATIONS, warmup: int = WARMUP_ITERATIONS,
+                 queries: Optional[List[HotQuery]] = None, seed: Optional[int] = None):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.queries = queries if queries is not None else HOT_QUERIES
+        self.rng = random.Random(seed)
+
+    def run(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Benchmark every hot query on conn; queries whose tables or data are missing are skipped"""
+        started_at = datetime.now().isoformat()
+        started = time.perf_counter()
+        existing_tables = set(_column(conn, "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"))
+
+        results = {}
+        for query in self.queries:
+            missing = [table for table in query.tables if table not in existing_tables]
+            if missing:
+                results[query.name] = {'status': 'skipped', 'reason': f"missing tables: {', '.join(missing)}"}
+                continue
+            try:
+                results[query.name] = self._run_query(conn, query)
+            except sqlite3.Error as e:
+                print(f"⚠️  Benchmark query {query.name} failed: {e}")
+                results[query.name] = {'status': 'error', 'error': str(e)}
+
+        return {
+            'started_at': started_at,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'iterations': self.iterations,
+            'warmup': self.warmup,
+            'sqlite_version': sqlite3.sqlite_version,
+            'results': results,
+        }
+
+    def _run_query(self, conn: sqlite3.Connection, query: HotQuery) -> Dict[str, Any]:
+        parameter_sets = query.sample_parameters(conn, PARAMETER_SETS)
+        if not parameter_sets:
+            return {'status': 'skipped', 'reason': 'no representative data'}
+        self.rng.shuffle(parameter_sets)
+
+        for i in range(self.warmup):
+            conn.execute(query.sql, parameter_sets[i % len(parameter_sets)]).fetchall()
+
+        timings = []
+        total_rows = 0
+        for i in range(self.iterations):
+            params = parameter_sets[i % len(parameter_sets)]
+            start = time.perf_counter()
+            rows = conn.execute(query.sql, params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+            total_rows += len(rows)
+
+        plan = explain_query_plan(conn, query.sql, parameter_sets[0])
+        timings.sort()
+        return {
+            'status': 'ok',
+            'description': query.description,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'max_ms': round(timings[-1], 3),
+            'iterations': len(timings),
+            'avg_rows': round(total_rows / len(timings), 1),
+            'plan_fingerprint': plan_fingerprint(plan),
+            'query_plan': plan,
+        }
+
+    @staticmethod
+    def compare_with_history(conn: sqlite3.Connection, run: Dict[str, Any]):
+        """Mark regressions and plan changes against earlier stored runs (call before save_run)"""
+        for name, result in run['results'].items():
+            if result.get('status') != 'ok':
+                continue
+            history = conn.execute('''
+                SELECT r.p95_ms, r.plan_fingerprint
+                FROM query_benchmark_results r
+                WHERE r.query_name = ? AND r.status = 'ok'
+                ORDER BY r.run_id DESC
+                LIMIT ?
+            ''', (name, REGRESSION_WINDOW)).fetchall()
+            if not history:
+                result['regression'] = False
+                result['plan_changed'] = False
+                continue
+            baseline = sorted(row[0] for row in history)[len(history) // 2]
+            result['baseline_p95_ms'] = baseline
+            result['regression'] = (result['p95_ms'] > baseline * REGRESSION_FACTOR and
+                                    result['p95_ms'] - baseline >= REGRESSION_MIN_MS)
+            result['previous_plan_fingerprint'] = history[0][1]
+            result['plan_changed'] = history[0][1] != result['plan_fingerprint']
+
+    @staticmethod
+    def save_run(conn: sqlite3.Connection, run: Dict[str, Any], triggered_by: str = 'manual') -> int:
+        """Store a run and its per-query results; returns the run id"""
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO query_benchmark_runs (started_at, duration_ms, iterations, warmup, sqlite_version, triggered_by)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (run['started_at'], run['duration_ms'], run['iterations'], run['warmup'],
+              run['sqlite_version'], triggered_by))
+        run_id = cursor.lastrowid
+        cursor.executemany('''
+            INSERT INTO query_benchmark_results
+            (run_id, query_name, status, p50_ms, p95_ms, p99_ms, mean_ms, max_ms, iterations, avg_rows,
+             plan_fingerprint, query_plan, error)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [(run_id, name, result['status'], result.get('p50_ms'), result.get('p95_ms'), result.get('p99_ms'),
+               result.get('mean_ms'), result.get('max_ms'), result.get('iterations'), result.get('avg_rows'),
+               result.get('plan_fingerprint'),
+               json.dumps(result['query_plan']) if 'query_plan' in result else None,
+               result.get('error') or result.get('reason'))
+              for name, result in run['results'].items()])
+        conn.commit()
+        run['run_id'] = run_id
+        return run_id
+
+    @staticmethod
+    def history(conn: sqlite3.Connection, limit: int = 20) -> Dict[str, Any]:
+        """p50/p95/p99 and plan fingerprints of the last limit runs, oldest first, per query"""
+        runs = [dict(zip(('id', 'started_at', 'duration_ms', 'triggered_by'), row)) for row in conn.execute('''
+            SELECT id, started_at, duration_ms, triggered_by FROM query_benchmark_runs ORDER BY id DESC LIMIT ?
+        ''', (limit,)).fetchall()][::-1]
+        if not runs:
+            return {'runs': [], 'queries': {}}
+
+        queries: Dict[str, List[Dict[str, Any]]] = {}
+        for run_id, name, p50, p95, p99, fingerprint in conn.execute('''
+            SELECT run_id, query_name, p50_ms, p95_ms, p99_ms, plan_fingerprint
+            FROM query_benchmark_results
+            WHERE run_id >= ? AND status = 'ok'
+            ORDER BY run_id
+        ''', (runs[0]['id'],)).fetchall():
+            queries.setdefault(name, []).append({'run_id': run_id, 'p50_ms': p50, 'p95_ms': p95,
+                                                 'p99_ms': p99, 'plan_fingerprint': fingerprint})
+        return {'runs': runs, 'queries': queries}
+
+
+def benchmark_database(conn: sqlite3.Connection, iterations: int = BENCHMARK_ITERATIONS,
+                       warmup: int = WARMUP_ITERATIONS, triggered_by: str = 'manual',
+                       persist: bool = True) -> Dict[str, Any]:
+    """Run the benchmark on conn, compare it with stored runs and (optionally) store it"""
+    benchmark = QueryBenchmark(iterations=iterations, warmup=warmup)
+    run = benchmark.run(conn)
+    try:
+        ensure_benchmark_tables(conn)
+        QueryBenchmark.compare_with_history(conn, run)
+        if persist:
+            QueryBenchmark.save_run(conn, run, triggered_by)
+    except sqlite3.Error as e:
+        # Read-only or locked databases still get a result, just no history
+        print(f"⚠️  Could not store query benchmark run: {e}")
+    return run
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the API's hot queries")
+    parser.add_argument("database", help="Path to the unified database")
+    parser.add_argument("--iterations", type=int, default=BENCHMARK_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=WARMUP_ITERATIONS)
+    parser.add_argument("--no-save", action="store_true", help="Do not store the run")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.database)
+    try:
+        run = benchmark_database(conn, args.iterations, args.warmup, triggered_by='cli', persist=not args.no_save)
+    finally:
+        conn.close()
+
+    print(f"📊 Query benchmark ({run['iterations']} iterations, {run['duration_ms']:.0f}ms total):")
+    for name, result in run['results'].items():
+        if result['status'] != 'ok':
+            print(f"   {name:24s} {result['status']}: {result.get('reason') or result.get('error')}")
+            continue
+        flags = (" ⚠️ regression" if result.get('regression') else "") + \
+                (" 🔀 plan changed" if result.get('plan_changed') else "")
+        print(f"   {name:24s} p50 {result['p50_ms']:8.3f}ms  p95 {result['p95_ms']:8.3f}ms  "
+              f"p99 {result['p99_ms']:8.3f}ms  plan {result['plan_fingerprint']}{flags}")
+
+
+if __name__ == "__main__":
+    main()
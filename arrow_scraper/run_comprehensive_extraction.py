@@ -68,8 +68,9 @@ class DirectLLMExtractor:
             print(f"⚠️ Failed to download image {image_url}: {e}")
             return None
     
-    def extract_arrow_data(self, content: str, url: str) -> List[ArrowSpecification]:
-        """Extract arrow data using direct API call"""
+    def extract_arrow_data(self, content: str, url: str, reduced: bool = False) -> List[ArrowSpecification]:
+        """Extract arrow data using direct API call.
+        reduced=True means content already went through ContentReducer and is sent as-is."""
         
         # Look for table data in content
         content_lower = content.lower()
@@ -217,6 +218,11 @@ class DirectLLMExtractor:
                 specs_check = content_to_send.lower().find('specs specs-loaded')
                 print(f"🔢 Sending {len(content_to_send)} chars to API (spine at {spine_check}, specs at {specs_check})")
         
+        # Reduced content is already budgeted, positional slicing would only cut spec blocks
+        if reduced:
+            content_to_send = content
+            print(f"🔢 Sending {len(content_to_send)} chars of reduced content to API")
+        
         # Determine manufacturer-specific instructions
         manufacturer_hints = ""
         if "skylonarchery.com" in url.lower():
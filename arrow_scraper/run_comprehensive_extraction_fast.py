@@ -24,17 +24,24 @@ from crawl4ai import AsyncWebCrawler
 from models import ArrowSpecification, SpineSpecification, ManufacturerData, ScrapingSession, ScrapingResult
 from run_comprehensive_extraction import DirectLLMExtractor as OriginalExtractor
 from content_pattern_learner import ContentPatternLearner
+from content_reducer import ContentReducer, record_corpus_page
 
 class FastDirectLLMExtractor(OriginalExtractor):
     """Optimized extractor with pattern learning for faster content extraction"""
     
-    def __init__(self, api_key: str, manufacturer_name: str = None, skip_images: bool = True, enable_learning: bool = True, use_api: bool = True):
+    def __init__(self, api_key: str, manufacturer_name: str = None, skip_images: bool = True, enable_learning: bool = True, use_api: bool = True,
+                 token_budget: int = 3000, record_corpus_dir: Optional[str] = None):
         super().__init__(api_key)
         self.manufacturer_name = manufacturer_name  # Use consistent name from config
         self.skip_images = skip_images  # Skip image downloads by default
         self.enable_learning = enable_learning
         self.use_api = use_api  # Whether to use DeepSeek API or not
         
+        # Token-budgeted content reduction (replaces fixed character offsets)
+        self.content_reducer = ContentReducer(token_budget=token_budget)
+        self.record_corpus_dir = record_corpus_dir or os.getenv("EXTRACTION_CORPUS_DIR")
+        self.reduction_stats = {'pages': 0, 'original_tokens': 0, 'reduced_tokens': 0}
+        
         # Initialize pattern learner
         if enable_learning:
             self.pattern_learner = ContentPatternLearner()
@@ -44,40 +51,51 @@ class FastDirectLLMExtractor(OriginalExtractor):
     def extract_arrow_data(self, content: str, url: str) -> List[ArrowSpecification]:
         """Extract arrow data with pattern learning and consistent manufacturer naming"""
         
-        # Use pattern learning to optimize content slice if available
-        optimized_content = content
+        # Reduce content to the most spec-dense blocks, boosted by learned per-domain selectors
+        learned_selectors = []
         if self.pattern_learner and self.manufacturer_name:
-            optimization = self.pattern_learner.get_optimized_content_slice(url, content, self.manufacturer_name)
-            if optimization:
-                pattern_type, slice_start, slice_end = optimization
-                optimized_content = content[slice_start:slice_end]
-                print(f"🎯 Using learned {pattern_type} pattern: {len(optimized_content)} chars (vs {len(content)} original)")
+            learned_selectors = self.pattern_learner.get_block_selectors(url, self.manufacturer_name)
+        
+        reduction = self.content_reducer.reduce(content, learned_selectors=learned_selectors)
+        self.reduction_stats['pages'] += 1
+        self.reduction_stats['original_tokens'] += reduction.original_tokens
+        self.reduction_stats['reduced_tokens'] += reduction.reduced_tokens
+        is_reduced = reduction.reduced_tokens < reduction.original_tokens
+        if is_reduced:
+            print(f"🎯 Reduced content: {reduction.blocks_selected}/{reduction.blocks_total} blocks, "
+                  f"{reduction.reduced_tokens} tokens (vs {reduction.original_tokens}, saved {reduction.tokens_saved})")
         
         # Extract arrows based on mode
         arrows = []
         if self.use_api:
             # Use DeepSeek API for extraction
-            arrows = super().extract_arrow_data(optimized_content, url)
+            arrows = super().extract_arrow_data(reduction.content, url, reduced=is_reduced)
         else:
             # Fast mode - no API calls, just return empty list for pattern learning
             print(f"⚡ FAST MODE: Skipping API extraction, analyzing content structure only")
-            # We still want to learn patterns from the content structure
             arrows = []
         
-        # Learn from content structure (even if no arrows extracted in fast mode)
+        # Learn which blocks carried the specs so future pages of this domain favour them
         if self.pattern_learner and self.manufacturer_name:
             try:
-                # In fast mode, we learn from content structure even without extracted data
                 self.pattern_learner.learn_successful_pattern(
                     url=url,
                     content=content,
                     manufacturer=self.manufacturer_name,
                     extraction_method="text",
-                    extracted_data=arrows  # Empty list in fast mode, but still learns content patterns
+                    extracted_data=arrows,
+                    selectors=reduction.selectors
                 )
             except Exception as e:
                 print(f"⚠️  Pattern learning error: {e}")
         
+        # Record page + result so the reducer can be evaluated offline (python content_reducer.py <corpus_dir>)
+        if self.record_corpus_dir and arrows:
+            try:
+                record_corpus_page(self.record_corpus_dir, url, self.manufacturer_name or '', content, arrows)
+            except Exception as e:
+                print(f"⚠️  Corpus recording error: {e}")
+        
         # Override manufacturer name with config value if provided
         if self.manufacturer_name and arrows:
             for arrow in arrows:
@@ -97,6 +115,12 @@ class FastDirectLLMExtractor(OriginalExtractor):
     
     def finalize_learning(self):
         """Save learned patterns and show statistics"""
+        stats = self.reduction_stats
+        if stats['pages']:
+            saved = stats['original_tokens'] - stats['reduced_tokens']
+            print(f"\n✂️  Content reduction: {stats['pages']} pages, {saved} tokens saved "
+                  f"({saved / stats['pages']:.0f} per page)")
+        
         if self.pattern_learner:
             try:
                 self.pattern_learner.save_patterns()
@@ -4,6 +4,7 @@ Show all available scraped data and research findings
 """
 
 import json
+import os
 from pathlib import Path
 
 def show_manufacturer_research():
@@ -61,6 +62,40 @@ def show_manufacturer_research():
         print("❌ No manufacturer research data found")
         return None
 
+def show_catalog_snapshot():
+    """Show the arrow catalog from the memory-mapped catalog snapshot"""
+    
+    from catalog_snapshot import CatalogSnapshotManager
+    
+    candidates = [os.environ.get('ARROW_DATABASE_PATH'),
+                  Path(__file__).parent.parent / "databases" / "arrow_database.db",
+                  Path(__file__).parent / "databases" / "arrow_database.db",
+                  Path(__file__).parent / "arrow_database.db"]
+    db_path = next((Path(p) for p in candidates if p and Path(p).exists()), None)
+    if not db_path:
+        print("❌ No arrow database found for catalog snapshot")
+        return None
+    
+    # Reuses the snapshot file when the catalog version is unchanged
+    snapshot = CatalogSnapshotManager(db_path).current()
+    if not snapshot:
+        print("❌ Catalog snapshot unavailable")
+        return None
+    
+    stats = snapshot.statistics()
+    print(f"\n📦 ARROW CATALOG (snapshot v{snapshot.catalog_version})")
+    print("=" * 50)
+    print(f"Arrows: {stats['total_arrows']}, spine specs: {stats['total_specifications']}, "
+          f"manufacturers: {stats['total_manufacturers']}")
+    print(f"Spine range: {stats['spine_range']['min_spine']} - {stats['spine_range']['max_spine']}")
+    for entry in stats['manufacturers'][:10]:
+        print(f"  • {entry['manufacturer']}: {entry['arrow_count']} arrows, {entry['spec_count']} specs")
+    print("Materials:")
+    for material, count in snapshot.value_counts('arrows', 'material').items():
+        print(f"  • {material}: {count}")
+    
+    return stats
+
 def show_technical_patterns():
     """Show the technical patterns we've detected"""
     
@@ -162,6 +197,9 @@ def main():
     # Show manufacturer research
     research_data = show_manufacturer_research()
     
+    # Show arrow catalog
+    show_catalog_snapshot()
+    
     # Show technical patterns
     patterns = show_technical_patterns()
     
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Streaming Sitemap Reader with Lastmod Diffing
+Reads XML sitemaps (plain or gzipped, including sitemap indexes) with iterparse so large
+retailer catalogs never sit in memory, and keeps per-URL lastmod/content hashes between
+runs so refreshes only touch URLs that are new or changed since the last successful scrape.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import sqlite3
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Rows fetched/written per round trip while diffing a sitemap
+DIFF_BATCH_SIZE = 500
+
+
+@dataclass
+class SitemapEntry:
+    """One <url> entry from a sitemap"""
+    loc: str
+    lastmod: Optional[str] = None
+    sitemap: str = ""
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _is_remote(source: str) -> bool:
+    return source.startswith('http://') or source.startswith('https://')
+
+
+def _open_stream(source: str, timeout: int = 60):
+    """Open a local path or URL as a binary stream, transparently gunzipping"""
+    if _is_remote(source):
+        import requests
+        response = requests.get(source, stream=True, timeout=timeout,
+                                headers={'User-Agent': 'Mozilla/5.0 (compatible; ArrowTuner sitemap reader)'})
+        response.raise_for_status()
+        # Content-Encoding: gzip is undone by urllib3, .xml.gz payloads are handled below
+        response.raw.decode_content = True
+        stream = io.BufferedReader(response.raw)
+    else:
+        stream = open(source, 'rb')
+
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        stream = io.BufferedReader(gzip.GzipFile(fileobj=stream))
+    return stream
+
+
+def _resolve_child(parent: str, child: str) -> str:
+    """Child sitemaps in a local index may be given relative to the index file"""
+    if _is_remote(child) or _is_remote(parent):
+        return child
+    child_path = Path(child)
+    if child_path.is_absolute() or child_path.exists():
+        return child
+    return str(Path(parent).parent / child_path)
+
+
+def _iter_json_entries(stream, source: str) -> Iterator[SitemapEntry]:
+    """Legacy JSON sitemap export: a list of {'loc': ..., 'lastmod': ...} objects"""
+    items = ijson.items(stream, 'item') if IJSON_AVAILABLE else json.load(stream)
+    for item in items:
+        if isinstance(item, dict) and item.get('loc'):
+            yield SitemapEntry(loc=item['loc'].strip(), lastmod=item.get('lastmod'), sitemap=source)
+
+
+def iter_sitemap_entries(source: str, child_filter: Optional[Callable[[str, Optional[str]], bool]] = None) -> Iterator[SitemapEntry]:
+    """
+    Stream <url> entries from a sitemap, following sitemap indexes recursively.
+    child_filter(loc, lastmod) can return False to skip reading an unchanged child sitemap.
+    """
+    stream = _open_stream(str(source))
+    children = []
+    try:
+        head = stream.peek(64).lstrip()
+        if head[:1] in (b'[', b'{'):
+            yield from _iter_json_entries(stream, str(source))
+            return
+
+        root = None
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            if root is None:
+                root = elem
+                continue
+            if event != 'end':
+                continue
+
+            name = _local_name(elem.tag)
+            if name not in ('url', 'sitemap'):
+                continue
+
+            loc, lastmod = None, None
+            for child in elem:
+                child_name = _local_name(child.tag)
+                if child_name == 'loc' and child.text:
+                    loc = child.text.strip()
+                elif child_name == 'lastmod' and child.text:
+                    lastmod = child.text.strip()
+
+            if loc:
+                if name == 'url':
+                    yield SitemapEntry(loc=loc, lastmod=lastmod, sitemap=str(source))
+                else:
+                    children.append((loc, lastmod))
+
+            # Drop parsed entries so memory stays flat on large sitemaps
+            elem.clear()
+            root.clear()
+    finally:
+        stream.close()
+
+    for child_loc, child_lastmod in children:
+        child_source = _resolve_child(str(source), child_loc)
+        if child_filter and not child_filter(child_source, child_lastmod):
+            continue
+        yield from iter_sitemap_entries(child_source, child_filter)
+
+
+def content_hash(content) -> str:
+    """Stable hash for scraped page content or an extracted product dict"""
+    if not isinstance(content, (str, bytes)):
+        content = json.dumps(content, sort_keys=True, default=str)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+class SitemapState:
+    """Per-URL lastmod and content hashes persisted between scraper runs"""
+
+    def __init__(self, db_path: str = "data/sitemap_state.db", recheck_days: int = 30):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # URLs without <lastmod> are re-scraped once their last scrape is this old
+        self.recheck_days = recheck_days
+        self.stats = {'seen': 0, 'new': 0, 'changed': 0, 'unchanged': 0, 'skipped_sitemaps': 0}
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sitemap_urls (
+                    loc TEXT PRIMARY KEY,
+                    sitemap TEXT,
+                    lastmod TEXT,
+                    scraped_lastmod TEXT,
+                    content_hash TEXT,
+                    first_seen TEXT,
+                    last_seen TEXT,
+                    scraped_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_sitemap_urls_sitemap ON sitemap_urls(sitemap);
+                CREATE TABLE IF NOT EXISTS sitemap_files (
+                    sitemap TEXT PRIMARY KEY,
+                    lastmod TEXT,
+                    last_read TEXT
+                );
+            """)
+
+    def _needs_scrape(self, entry: SitemapEntry, row: Optional[sqlite3.Row], cutoff: str) -> Optional[str]:
+        """Return 'new'/'changed' if the entry must be scraped, None if unchanged"""
+        if row is None:
+            return 'new'
+        if row['scraped_at'] is None:
+            return 'changed'
+        if entry.lastmod:
+            return 'changed' if entry.lastmod != row['scraped_lastmod'] else None
+        # No lastmod published: fall back to periodic re-checks, content hash decides afterwards
+        return 'changed' if row['scraped_at'] < cutoff else None
+
+    def _child_filter(self, skipped: List[str]):
+        """Skip child sitemaps whose <lastmod> matches the one we fully read last time"""
+        def should_read(loc: str, lastmod: Optional[str]) -> bool:
+            if not lastmod:
+                return True
+            with self._get_connection() as conn:
+                row = conn.execute("SELECT lastmod FROM sitemap_files WHERE sitemap = ?", (loc,)).fetchone()
+            if row and row['lastmod'] == lastmod:
+                skipped.append(loc)
+                self.stats['skipped_sitemaps'] += 1
+                return False
+            self._pending_children[loc] = lastmod
+            return True
+        return should_read
+
+    def _flush(self, conn: sqlite3.Connection, batch: List[SitemapEntry], now: str, cutoff: str) -> List[SitemapEntry]:
+        placeholders = ','.join('?' * len(batch))
+        rows = {row['loc']: row for row in conn.execute(
+            f"SELECT * FROM sitemap_urls WHERE loc IN ({placeholders})", [e.loc for e in batch])}
+
+        changed = []
+        for entry in batch:
+            reason = self._needs_scrape(entry, rows.get(entry.loc), cutoff)
+            if reason:
+                self.stats[reason] += 1
+                changed.append(entry)
+            else:
+                self.stats['unchanged'] += 1
+
+        conn.executemany("""
+            INSERT INTO sitemap_urls (loc, sitemap, lastmod, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(loc) DO UPDATE SET
+                sitemap = excluded.sitemap, lastmod = excluded.lastmod, last_seen = excluded.last_seen
+        """, [(e.loc, e.sitemap, e.lastmod, now, now) for e in batch])
+        conn.commit()
+        return changed
+
+    def iter_changed(self, source: str, url_filter: Optional[Callable[[str], bool]] = None) -> Iterator[SitemapEntry]:
+        """Stream a sitemap and yield only entries that are new or changed since the last successful scrape"""
+        now = datetime.now().isoformat()
+        cutoff = (datetime.now() - timedelta(days=self.recheck_days)).isoformat()
+        skipped: List[str] = []
+        self._pending_children: Dict[str, Optional[str]] = {}
+        self.stats = {key: 0 for key in self.stats}
+
+        conn = self._get_connection()
+        try:
+            batch: List[SitemapEntry] = []
+            current_sitemap = None
+            for entry in iter_sitemap_entries(source, child_filter=self._child_filter(skipped)):
+                if url_filter and not url_filter(entry.loc):
+                    continue
+                self.stats['seen'] += 1
+                if entry.sitemap != current_sitemap:
+                    self._mark_sitemap_read(conn, current_sitemap, now)
+                    current_sitemap = entry.sitemap
+                batch.append(entry)
+                if len(batch) >= DIFF_BATCH_SIZE:
+                    yield from self._flush(conn, batch, now, cutoff)
+                    batch = []
+            if batch:
+                yield from self._flush(conn, batch, now, cutoff)
+            self._mark_sitemap_read(conn, current_sitemap, now)
+
+            # Unchanged child sitemaps can still hold URLs whose last scrape never succeeded
+            for sitemap in skipped:
+                for row in conn.execute("""
+                    SELECT loc, lastmod, sitemap FROM sitemap_urls
+                    WHERE sitemap = ? AND (scraped_at IS NULL OR lastmod IS NOT scraped_lastmod)
+                """, (sitemap,)).fetchall():
+                    if url_filter and not url_filter(row['loc']):
+                        continue
+                    self.stats['changed'] += 1
+                    yield SitemapEntry(loc=row['loc'], lastmod=row['lastmod'], sitemap=row['sitemap'])
+        finally:
+            conn.close()
+
+    def _mark_sitemap_read(self, conn: sqlite3.Connection, sitemap: Optional[str], now: str):
+        """Remember a child sitemap's lastmod once all of its entries were streamed"""
+        if sitemap is None or sitemap not in self._pending_children:
+            return
+        conn.execute("""
+            INSERT INTO sitemap_files (sitemap, lastmod, last_read) VALUES (?, ?, ?)
+            ON CONFLICT(sitemap) DO UPDATE SET lastmod = excluded.lastmod, last_read = excluded.last_read
+        """, (sitemap, self._pending_children.pop(sitemap), now))
+        conn.commit()
+
+    def changed_urls(self, source: str, url_filter: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Convenience wrapper returning the new/changed URLs as a list"""
+        return [entry.loc for entry in self.iter_changed(source, url_filter)]
+
+    def mark_scraped(self, loc: str, content=None) -> bool:
+        """Record a successful scrape; returns True if the content differs from the previous scrape"""
+        new_hash = content_hash(content) if content is not None else None
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT lastmod, content_hash FROM sitemap_urls WHERE loc = ?", (loc,)).fetchone()
+            conn.execute("""
+                INSERT INTO sitemap_urls (loc, lastmod, scraped_lastmod, content_hash, first_seen, last_seen, scraped_at)
+                VALUES (?, NULL, NULL, ?, ?, ?, ?)
+                ON CONFLICT(loc) DO UPDATE SET
+                    scraped_lastmod = sitemap_urls.lastmod,
+                    content_hash = COALESCE(excluded.content_hash, sitemap_urls.content_hash),
+                    scraped_at = excluded.scraped_at
+            """, (loc, new_hash, datetime.now().isoformat(), datetime.now().isoformat(), datetime.now().isoformat()))
+        return row is None or new_hash is None or row['content_hash'] != new_hash
+
+    def print_report(self):
+        """Print the delta summary for the last iter_changed() run"""
+        s = self.stats
+        print(f"🗺️  Sitemap delta: {s['seen']} URLs seen, {s['new']} new, {s['changed']} changed, "
+              f"{s['unchanged']} unchanged, {s['skipped_sitemaps']} unchanged sitemaps skipped")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Incremental Snapshot Store
+Frequent (e.g. hourly) backups without paying the full database size every time. Each database
+is copied consistently with the stepwise online backup (StreamingBackupEngine.consistent_copy),
+cut into fixed-size chunks aligned to SQLite pages and hashed with SHA-256. Only chunks the
+store does not have yet are compressed and written; a snapshot itself is a small JSON manifest
+listing the chunk hashes of every database. Restore reassembles the files from the manifest.
+
+SQLite updates pages in place, so a changed row only changes the chunks holding its pages and
+page-aligned fixed chunks deduplicate as well as content-defined ones would.
+
+Layout:
+    <store>/chunks/ab/abcdef...       zlib-compressed chunk, named by the hash of its raw bytes
+    <store>/manifests/<id>.json       one manifest per snapshot
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows development setups: fall back to the in-process lock
+    fcntl = None
+
+from backup_engine import StreamingBackupEngine, cheap_table_stats
+
+# Chunk size; rounded up to the database page size when pages are larger
+CHUNK_SIZE = 64 * 1024
+
+CHUNK_COMPRESSION_LEVEL = 6
+
+# Unreferenced chunks younger than this are kept by prune(): a snapshot running in another
+# process may be about to reference them (reused chunks are touched when a snapshot uses them)
+PRUNE_GRACE_SECONDS = 3600
+
+MANIFEST_VERSION = "1.0"
+
+# Snapshot ids become file names (manifests/<id>.json, .<id>.<db>.staging)
+SNAPSHOT_ID_PATTERN = re.compile(r'[A-Za-z0-9_.-]+')
+
+_store_locks: Dict[str, threading.Lock] = {}
+_store_locks_guard = threading.Lock()
+
+
+def _store_lock(store_dir: Path) -> threading.Lock:
+    with _store_locks_guard:
+        return _store_locks.setdefault(str(store_dir.resolve()), threading.Lock())
+
+
+@contextmanager
+def _store_file_lock(store_dir: Path) -> Iterator[None]:
+    """
+    Exclusive lock on <store>/.lock. Snapshot jobs run in their own processes (see
+    backup_engine.start_backup_job), so the thread lock alone does not keep a snapshot and a
+    prune, or two snapshots, from running at the same time.
+    """
+    if fcntl is None:
+        yield
+        return
+    store_dir.mkdir(parents=True, exist_ok=True)
+    with open(store_dir / ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def valid_snapshot_id(snapshot_id: Optional[str]) -> bool:
+    """Whether snapshot_id is a plain file name (no path separators, no '..')"""
+    return bool(snapshot_id) and SNAPSHOT_ID_PATTERN.fullmatch(snapshot_id) is not None and '..' not in snapshot_id
+
+
+def chunk_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class SnapshotStore:
+    """Content-addressed chunk store plus one manifest per snapshot"""
+
+    def __init__(self, store_dir, chunk_size: int = CHUNK_SIZE, engine: Optional[StreamingBackupEngine] = None):
+        """
+        Args:
+            store_dir: Directory holding chunks/ and manifests/
+            chunk_size: Bytes per chunk for new snapshots (existing manifests keep their own)
+            engine: Engine used for the consistent copy (its progress callback receives updates)
+        """
+        self.store_dir = Path(store_dir)
+        self.chunks_dir = self.store_dir / "chunks"
+        self.manifests_dir = self.store_dir / "manifests"
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.engine = engine or StreamingBackupEngine()
+        self._lock = _store_lock(self.store_dir)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize snapshot creation and pruning across threads and processes"""
+        with self._lock, _store_file_lock(self.store_dir):
+            yield
+
+    def _report(self, **state):
+        if self.engine.progress:
+            self.engine.progress(state)
+
+    # Chunks and manifests
+
+    def chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def manifest_path(self, snapshot_id: str) -> Path:
+        return self.manifests_dir / f"{snapshot_id}.json"
+
+    def has_chunk(self, digest: str) -> bool:
+        return self.chunk_path(digest).exists()
+
+    def write_chunk(self, digest: str, compressed: bytes):
+        """Store an already compressed chunk (written to a temp file and renamed)"""
+        path = self.chunk_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        temp_path = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+
+    def import_chunk(self, digest: str, compressed: bytes):
+        """Store a compressed chunk fetched from elsewhere (e.g. the CDN) after checking its hash"""
+        if chunk_hash(zlib.decompress(compressed)) != digest:
+            raise ValueError(f"Chunk {digest[:12]} does not match its hash")
+        self.write_chunk(digest, compressed)
+
+    def read_chunk(self, digest: str) -> bytes:
+        """Raw chunk bytes, verified against the hash"""
+        with open(self.chunk_path(digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if chunk_hash(data) != digest:
+            raise ValueError(f"Chunk {digest[:12]} is corrupt")
+        return data
+
+    def missing_chunks(self, digests: Iterable[str]) -> List[str]:
+        return [digest for digest in dict.fromkeys(digests) if not self.has_chunk(digest)]
+
+    def load_manifest(self, snapshot_id: str) -> Dict[str, Any]:
+        path = self.manifest_path(snapshot_id)
+        if not path.exists():
+            raise FileNotFoundError(f"Snapshot not found: {snapshot_id}")
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def save_manifest(self, manifest: Dict[str, Any]):
+        path = self.manifest_path(manifest["snapshot_id"])
+        temp_path = path.with_suffix('.json.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def manifest_chunks(manifest: Dict[str, Any]) -> List[str]:
+        """Distinct chunk hashes referenced by a manifest, in file order"""
+        digests = []
+        for database in manifest.get("databases", {}).values():
+            digests.extend(database.get("chunks", []))
+        return list(dict.fromkeys(digests))
+
+    # Snapshots
+
+    def create_snapshot(self, databases: List[Tuple[str, Path]], snapshot_id: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Snapshot every database, storing only chunks the store does not have yet
+
+        Args:
+            databases: (database name, path) pairs, e.g. ("arrow_database.db", Path(...))
+            snapshot_id: Manifest name (default snapshot_<timestamp>)
+            metadata: Extra fields stored in the manifest
+
+        Returns:
+            The manifest, including new/reused chunk counts and bytes written
+        """
+        if not snapshot_id:
+            snapshot_id = f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if not valid_snapshot_id(snapshot_id):
+            raise ValueError(f"Invalid snapshot id: {snapshot_id!r}")
+        if self.manifest_path(snapshot_id).exists():
+            raise FileExistsError(f"Snapshot already exists: {snapshot_id}")
+
+        started = time.perf_counter()
+        manifest = {
+            **(metadata or {}),
+            "snapshot_id": snapshot_id,
+            "created_at": datetime.now().isoformat(),
+            "version": MANIFEST_VERSION,
+            "hash": "sha256",
+            "chunk_compression": "zlib",
+            "databases": {},
+        }
+        totals = {"new_chunks": 0, "reused_chunks": 0, "bytes_written": 0, "logical_bytes": 0}
+
+        with self._locked():
+            total_pages = sum(self._page_count(db_path) for _, db_path in databases)
+            pages_before = 0
+            for name, db_path in databases:
+                db_path = Path(db_path)
+                staging_path = self.store_dir / f".{snapshot_id}.{name}.staging"
+                with self.engine.consistent_copy(db_path, staging_path, name, pages_before, total_pages) \
+                        as (copy, size, pages):
+                    self._report(phase='chunking', database=name)
+                    entry = self._store_copy(copy, size, totals)
+                pages_before += pages
+                entry["stats"] = self._database_stats(db_path)
+                manifest["databases"][name] = entry
+
+            manifest.update(totals)
+            manifest["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+            self.save_manifest(manifest)
+
+        print(f"📸 Snapshot {snapshot_id}: {totals['new_chunks']} new / {totals['reused_chunks']} reused chunks, "
+              f"{totals['bytes_written'] / (1024 * 1024):.2f} MB written for "
+              f"{totals['logical_bytes'] / (1024 * 1024):.2f} MB of databases")
+        return manifest
+
+    def _store_copy(self, copy, size: int, totals: Dict[str, int]) -> Dict[str, Any]:
+        """Chunk, hash and store one database copy; returns its manifest entry"""
+        header = copy.read(100)
+        # Page size is a big-endian u16 at offset 16; 1 means 65536
+        page_size = int.from_bytes(header[16:18], 'big') if len(header) >= 18 else 0
+        page_size = 65536 if page_size == 1 else (page_size or 4096)
+        chunk_size = max(page_size, self.chunk_size // page_size * page_size)
+
+        digests = []
+        seen: Set[str] = set()
+        data = header + copy.read(chunk_size - len(header))
+        while data:
+            digest = chunk_hash(data)
+            digests.append(digest)
+            if digest not in seen:
+                seen.add(digest)
+                path = self.chunk_path(digest)
+                if path.exists():
+                    # Touch reused chunks so a concurrent prune keeps them
+                    os.utime(path)
+                    totals["reused_chunks"] += 1
+                else:
+                    compressed = zlib.compress(data, CHUNK_COMPRESSION_LEVEL)
+                    self.write_chunk(digest, compressed)
+                    totals["new_chunks"] += 1
+                    totals["bytes_written"] += len(compressed)
+            data = copy.read(chunk_size)
+        totals["logical_bytes"] += size
+        return {"size": size, "page_size": page_size, "chunk_size": chunk_size, "chunks": digests}
+
+    @staticmethod
+    def _page_count(db_path: Path) -> int:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _database_stats(db_path: Path) -> Dict[str, Any]:
+        try:
+            conn = sqlite3.connect(f"file:{Path(db_path).resolve()}?mode=ro", uri=True)
+            try:
+                return cheap_table_stats(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            return {"error": str(e)}
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """Snapshot summaries, newest first"""
+        snapshots = []
+        for path in self.manifests_dir.glob("*.json"):
+            try:
+                with open(path, 'r') as f:
+                    manifest = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Could not read snapshot manifest {path.name}: {e}")
+                continue
+            snapshots.append({
+                "snapshot_id": manifest.get("snapshot_id", path.stem),
+                "created_at": manifest.get("created_at", "Unknown"),
+                "databases": {name: {"size_mb": entry.get("size", 0) / (1024 * 1024),
+                                     "chunks": len(entry.get("chunks", [])),
+                                     "stats": entry.get("stats", {})}
+                              for name, entry in manifest.get("databases", {}).items()},
+                "new_chunks": manifest.get("new_chunks", 0),
+                "reused_chunks": manifest.get("reused_chunks", 0),
+                "written_mb": manifest.get("bytes_written", 0) / (1024 * 1024),
+                "manifest_path": str(path),
+            })
+        return sorted(snapshots, key=lambda s: s["created_at"], reverse=True)
+
+    def store_usage(self) -> Dict[str, Any]:
+        """Chunk count and bytes on disk"""
+        chunk_count = 0
+        total_bytes = 0
+        for path in self.chunks_dir.glob("*/*"):
+            if path.suffix != '.tmp':
+                chunk_count += 1
+                total_bytes += path.stat().st_size
+        return {"chunks": chunk_count, "size_mb": total_bytes / (1024 * 1024),
+                "snapshots": len(list(self.manifests_dir.glob("*.json")))}
+
+    def verify_snapshot(self, snapshot_id: str) -> List[str]:
+        """Chunk hashes of a snapshot that are missing or corrupt (empty when restorable)"""
+        problems = []
+        for digest in self.manifest_chunks(self.load_manifest(snapshot_id)):
+            try:
+                self.read_chunk(digest)
+            except (OSError, ValueError, zlib.error):
+                problems.append(digest)
+        return problems
+
+    def restore_snapshot(self, snapshot_id: str, targets: Dict[str, Path]) -> List[str]:
+        """
+        Reassemble databases of a snapshot over their target paths
+
+        Each file is rebuilt next to its target, checked (chunk hashes, size, PRAGMA quick_check)
+        and only then moved over the target; an existing target is kept as .pre_restore_<timestamp>.db.
+
+        Args:
+            targets: Database name -> path to restore to; names missing from the snapshot are skipped
+
+        Returns:
+            Names of the restored databases
+        """
+        manifest = self.load_manifest(snapshot_id)
+        restored = []
+        for name, target in targets.items():
+            entry = manifest["databases"].get(name)
+            if entry is None:
+                print(f"⚠️  {name} not found in snapshot {snapshot_id}")
+                continue
+            target = Path(target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = target.with_name(f"{target.name}.snapshot_restore")
+            try:
+                with open(temp_path, 'wb') as out:
+                    for digest in entry["chunks"]:
+                        out.write(self.read_chunk(digest))
+                if temp_path.stat().st_size != entry["size"]:
+                    raise ValueError(f"{name} reassembled to {temp_path.stat().st_size} bytes, "
+                                     f"expected {entry['size']}")
+                conn = sqlite3.connect(temp_path)
+                try:
+                    check = conn.execute("PRAGMA quick_check").fetchone()[0]
+                finally:
+                    conn.close()
+                if check != 'ok':
+                    raise ValueError(f"{name} failed quick_check: {check}")
+
+                if target.exists():
+                    backup_existing = target.with_suffix(f".pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db")
+                    shutil.copy2(target, backup_existing)
+                    print(f"   📋 Existing database backed up to: {backup_existing.name}")
+                os.replace(temp_path, target)
+                print(f"   ✅ Database restored from snapshot: {target.name}")
+                restored.append(name)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        return restored
+
+    def prune(self, keep: int = 48) -> Dict[str, int]:
+        """Delete all but the newest keep snapshots, then chunks no remaining snapshot references"""
+        with self._locked():
+            snapshots = self.list_snapshots()
+            for snapshot in snapshots[keep:]:
+                Path(snapshot["manifest_path"]).unlink(missing_ok=True)
+
+            referenced: Set[str] = set()
+            for path in self.manifests_dir.glob("*.json"):
+                try:
+                    with open(path, 'r') as f:
+                        referenced.update(self.manifest_chunks(json.load(f)))
+                except (OSError, json.JSONDecodeError):
+                    # An unreadable manifest makes every chunk potentially referenced
+                    print(f"⚠️  Could not read {path.name}, skipping chunk cleanup")
+                    return {"snapshots_removed": max(0, len(snapshots) - keep), "chunks_removed": 0}
+
+            cutoff = time.time() - PRUNE_GRACE_SECONDS
+            chunks_removed = 0
+            # Also removes temp files left behind by interrupted snapshots
+            for path in self.chunks_dir.glob("*/*"):
+                name = path.name
+                if name in referenced:
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        chunks_removed += 1
+                except FileNotFoundError:
+                    continue
+
+        removed = max(0, len(snapshots) - keep)
+        print(f"🗑️  Pruned {removed} snapshots and {chunks_removed} unreferenced chunks")
+        return {"snapshots_removed": removed, "chunks_removed": chunks_removed}
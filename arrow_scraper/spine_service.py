@@ -11,6 +11,7 @@ import json
 import sqlite3
 from spine_calculator import SpineCalculator, BowConfiguration, BowType
 from arrow_database import ArrowDatabase
+from perf_monitor import timed
 
 
 class UnifiedSpineService:
@@ -24,6 +25,7 @@ class UnifiedSpineService:
         self.db = ArrowDatabase()
         self._cache = {}  # Cache for calculation parameters
     
+    @timed('spine.calculate')
     def calculate_spine(
         self,
         draw_weight: float,
@@ -446,6 +448,7 @@ class UnifiedSpineService:
         
         return None
     
+    @timed('spine.calculate_for_setup')
     def calculate_spine_for_bow_setup(self, bow_setup_data: Dict[str, Any], arrow_data: Dict[str, Any]) -> Optional[int]:
         """
         Calculate spine specifically for adding arrows to bow setups.
@@ -1097,8 +1100,24 @@ class UnifiedSpineService:
         return base_spine
 
 
-# Global instance for easy import
-spine_service = UnifiedSpineService()
+# Global instance for easy import, created on first use so importing this module
+# (e.g. in the gunicorn master with --preload) does not open a database connection
+_spine_service = None
+
+
+def get_spine_service() -> UnifiedSpineService:
+    """Shared UnifiedSpineService instance"""
+    global _spine_service
+    if _spine_service is None:
+        _spine_service = UnifiedSpineService()
+    return _spine_service
+
+
+def __getattr__(name):
+    # Keep `from spine_service import spine_service` working
+    if name == 'spine_service':
+        return get_spine_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def calculate_unified_spine(
@@ -1123,7 +1142,7 @@ def calculate_unified_spine(
     
     This is the function that should be imported and used throughout the system.
     """
-    return spine_service.calculate_spine(
+    return get_spine_service().calculate_spine(
         draw_weight=draw_weight,
         arrow_length=arrow_length,
         point_weight=point_weight,
@@ -1144,4 +1163,4 @@ def calculate_spine_for_setup(bow_setup_data: Dict[str, Any], arrow_data: Dict[s
     """
     Convenience function for calculating spine when adding arrows to bow setups.
     """
-    return spine_service.calculate_spine_for_bow_setup(bow_setup_data, arrow_data)
\ No newline at end of file
+    return get_spine_service().calculate_spine_for_bow_setup(bow_setup_data, arrow_data)
\ No newline at end of file
@@ -33,12 +33,65 @@ try:
     from models import TranslationService, SpineSpecification
 except ImportError:
     # DeepSeek-based translation service
+    from translation_memory import TranslationMemory, batch_segments, build_batch_prompt, parse_batch_response, join_segments
+
     class TranslationService:
-        def __init__(self, api_key):
+        def __init__(self, api_key, memory=None):
             self.api_key = api_key
+            # Segment-level translation memory shared across runs
+            self.memory = memory or TranslationMemory()
+        
+        async def translate_texts(self, texts, source_lang='de', target_lang='en'):
+            """Translate several texts; known segments come from memory, the rest go out in bounded batches"""
+            known, missing = self.memory.prepare(texts, source_lang, target_lang)
+            
+            for batch in batch_segments(missing):
+                translations = await self._translate_batch(batch, source_lang, target_lang)
+                
+                if translations is None:
+                    # Batch failed or came back malformed: one request per segment
+                    translations = [await self.translate_text(segment, source_lang, target_lang) for segment in batch]
+                    self.memory.stats['llm_calls'] += len(batch) - 1
+                
+                # Failed segments stay untranslated in the output and are not remembered, so the next run retries them
+                translated = [(segment, translation) for segment, translation in zip(batch, translations) if translation]
+                if translated:
+                    self.memory.record_translations([segment for segment, _ in translated],
+                                                    [translation for _, translation in translated],
+                                                    source_lang, target_lang)
+                    known.update(translated)
+            
+            return [join_segments(text, known) for text in texts]
+        
+        async def _translate_batch(self, segments, source_lang, target_lang):
+            """One request for a batch of segments; None if it fails or the response is malformed"""
+            try:
+                import httpx
+                
+                data = {
+                    "model": "deepseek-chat",
+                    "messages": [{"role": "user", "content": build_batch_prompt(segments, source_lang, target_lang)}],
+                    "temperature": 0.1,
+                    "max_tokens": 4000
+                }
+                headers = {
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.post("https://api.deepseek.com/v1/chat/completions", headers=headers, json=data)
+                
+                if response.status_code != 200:
+                    print(f"Translation API error: {response.status_code}")
+                    return None
+                result = response.json()
+                return parse_batch_response(result['choices'][0]['message']['content'], len(segments))
+            except Exception as e:
+                print(f"Translation error: {e}")
+                return None
         
         async def translate_text(self, text, source_lang='de', target_lang='en'):
-            """Translate text using DeepSeek API"""
+            """Translate text using DeepSeek API; None when the request fails"""
             try:
                 import httpx
                 
@@ -108,11 +161,11 @@ English translation:"""
                             return translated_text.strip()
                     else:
                         print(f"Translation API error: {response.status_code}")
-                        return text  # Return original if translation fails
+                    return None
                         
             except Exception as e:
                 print(f"Translation error: {e}")
-                return text  # Return original text if translation fails
+                return None
     
     # Simple spine specification for compatibility
     class SpineSpecification:
@@ -122,6 +175,8 @@ English translation:"""
 import re
 from bs4 import BeautifulSoup
 
+from sitemap_stream import SitemapState, iter_sitemap_entries
+
 class TopHatManualExtractor:
     """Manual extraction using regex and BeautifulSoup as fallback"""
     
@@ -309,9 +364,11 @@ class TopHatProduct:
 class TopHatArcheryScraper:
     """Scraper for TopHat Archery using crawl4ai"""
     
-    def __init__(self, deepseek_api_key: str, sitemap_path: str):
+    def __init__(self, deepseek_api_key: str, sitemap_path: str, sitemap_state: Optional[SitemapState] = None):
         self.deepseek_api_key = deepseek_api_key
         self.sitemap_path = sitemap_path
+        # Per-URL lastmod/content hashes so refreshes only touch the delta
+        self.sitemap_state = sitemap_state or SitemapState()
         self.translation_service = TranslationService(deepseek_api_key)
         self.manual_extractor = TopHatManualExtractor()
         
@@ -404,13 +461,14 @@ class TopHatArcheryScraper:
             """
         )
     
-    def load_sitemap_urls(self) -> List[str]:
-        """Load URLs from sitemap JSON file"""
+    def load_sitemap_urls(self, only_changed: bool = True) -> List[str]:
+        """Stream URLs from the sitemap (JSON, XML, gzip or sitemap index); by default only new/changed ones"""
         try:
-            with open(self.sitemap_path, 'r', encoding='utf-8') as f:
-                sitemap_data = json.load(f)
-            
-            urls = [entry['loc'] for entry in sitemap_data if 'loc' in entry]
+            if only_changed:
+                urls = self.sitemap_state.changed_urls(str(self.sitemap_path))
+                self.sitemap_state.print_report()
+            else:
+                urls = [entry.loc for entry in iter_sitemap_entries(str(self.sitemap_path))]
             self.logger.info(f"Loaded {len(urls)} URLs from sitemap")
             return urls
             
@@ -492,35 +550,27 @@ class TopHatArcheryScraper:
         try:
             translations_made = []
             
-            # Translate title if it contains German
-            if product.title and self._is_german_text(product.title):
-                self.logger.info(f"Translating title: {product.title[:50]}...")
-                translated_title = await self.translation_service.translate_text(
-                    product.title, source_lang='de', target_lang='en'
-                )
-                if translated_title and translated_title != product.title:
-                    product.title = translated_title
-                    translations_made.append("title")
-            
-            # Translate description if it contains German
-            if product.description and self._is_german_text(product.description):
-                self.logger.info(f"Translating description: {product.description[:50]}...")
-                translated_desc = await self.translation_service.translate_text(
-                    product.description, source_lang='de', target_lang='en'
-                )
-                if translated_desc and translated_desc != product.description:
-                    product.description = translated_desc
-                    translations_made.append("description")
-            
-            # Translate arrow_type if it contains German
-            if product.arrow_type and self._is_german_text(product.arrow_type):
-                self.logger.info(f"Translating arrow type: {product.arrow_type}")
-                translated_type = await self.translation_service.translate_text(
-                    product.arrow_type, source_lang='de', target_lang='en'
+            # Collect German fields and translate them together in one batch
+            fields = [name for name in ('title', 'description', 'arrow_type')
+                      if getattr(product, name) and self._is_german_text(getattr(product, name))]
+            if not fields:
+                self.logger.debug("No translation needed or no German text detected")
+                return
+            
+            originals = [getattr(product, name) for name in fields]
+            self.logger.info(f"Translating {', '.join(fields)}: {originals[0][:50]}...")
+            if hasattr(self.translation_service, 'translate_texts'):
+                translations = await self.translation_service.translate_texts(
+                    originals, source_lang='de', target_lang='en'
                 )
-                if translated_type and translated_type != product.arrow_type:
-                    product.arrow_type = translated_type
-                    translations_made.append("arrow_type")
+            else:
+                translations = [await self.translation_service.translate_text(text, source_lang='de', target_lang='en')
+                                for text in originals]
+            
+            for name, original, translated in zip(fields, originals, translations):
+                if translated and translated != original:
+                    setattr(product, name, translated)
+                    translations_made.append(name)
             
             if translations_made:
                 self.logger.info(f"Successfully translated: {', '.join(translations_made)}")
@@ -617,9 +667,9 @@ class TopHatArcheryScraper:
             "arrows": result_arrows
         }
     
-    async def scrape_all_products(self, limit: Optional[int] = None) -> List[TopHatProduct]:
+    async def scrape_all_products(self, limit: Optional[int] = None, only_changed: bool = True) -> List[TopHatProduct]:
         """Scrape all products from sitemap URLs"""
-        urls = self.load_sitemap_urls()
+        urls = self.load_sitemap_urls(only_changed=only_changed)
         
         if limit:
             urls = urls[:limit]
@@ -634,6 +684,8 @@ class TopHatArcheryScraper:
                 product = await self.scrape_product(url, crawler)
                 if product:
                     products.append(product)
+                    if not self.sitemap_state.mark_scraped(url, product.__dict__):
+                        self.logger.debug(f"Content unchanged since last scrape: {url}")
                     self.logger.info(f"Successfully extracted: {product.manufacturer} {product.model_name} spine {product.spine}")
                 else:
                     self.logger.warning(f"Failed to extract product from {url}")
@@ -646,6 +698,9 @@ class TopHatArcheryScraper:
                     self.logger.info(f"Progress: {i}/{len(urls)} URLs processed, {len(products)} products extracted")
         
         self.logger.info(f"Scraping complete: {len(products)} products extracted from {len(urls)} URLs")
+        memory = getattr(self.translation_service, 'memory', None)
+        if memory:
+            memory.print_run_report()
         return products
     
     def save_results(self, products: List[TopHatProduct], output_file: str):
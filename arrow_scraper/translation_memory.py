@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Persistent Translation Memory for Scraper Translation
+Segment-level store keyed by normalized source text + language pair, pre-seeded with
+archery spec vocabulary, so repeated labels, boilerplate and descriptions are translated once
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Keep batched requests well inside the 4000 output-token limit
+MAX_SEGMENTS_PER_BATCH = 40
+MAX_CHARS_PER_BATCH = 6000
+
+# Translators in this repo use both language names and ISO codes
+LANGUAGE_CODES = {
+    'german': 'de', 'deutsch': 'de', 'de': 'de',
+    'english': 'en', 'en': 'en',
+    'italian': 'it', 'it': 'it',
+    'french': 'fr', 'fr': 'fr',
+    'spanish': 'es', 'es': 'es',
+}
+
+# Common archery spec vocabulary, seeded so the first run already avoids these calls
+SEED_VOCABULARY = {
+    ('de', 'en'): {
+        'Durchmesser': 'Diameter',
+        'Außendurchmesser': 'Outer diameter',
+        'Innendurchmesser': 'Inner diameter',
+        'Pfeildurchmesser (Innen)': 'Arrow diameter (inner)',
+        'Pfeildurchmesser (Außen)': 'Arrow diameter (outer)',
+        'Gewicht': 'Weight',
+        'Gewichtstoleranz': 'Weight tolerance',
+        'Spine': 'Spine',
+        'Spinewert': 'Spine value',
+        'Länge': 'Length',
+        'Auslieferungslänge': 'Delivered length',
+        'Geradheit': 'Straightness',
+        'Rundlaufgenauigkeit': 'Straightness tolerance',
+        'Toleranz': 'Tolerance',
+        'Material': 'Material',
+        'Marke': 'Brand',
+        'Hersteller': 'Manufacturer',
+        'Preis': 'Price',
+        'Farbe': 'Color',
+        'Artikelnummer': 'Item number',
+        'Lieferumfang': 'Scope of delivery',
+        'Technische Daten': 'Technical data',
+        'Empfohlener Einsatzweck': 'Recommended use',
+        'Einsatzzweck': 'Intended use',
+        'Jagd': 'Hunting',
+        'Scheibe': 'Target',
+        'Zielscheibe': 'Target',
+        'Halle': 'Indoor',
+        'Freizeit': 'Recreational',
+        'Pfeil': 'Arrow',
+        'Pfeile': 'Arrows',
+        'Pfeilschaft': 'Arrow shaft',
+        'Schaft': 'Shaft',
+        'Schäfte': 'Shafts',
+        'Carbonschaft': 'Carbon shaft',
+        'Nocke': 'Nock',
+        'Spitze': 'Point',
+        'Einschraubspitze': 'Screw-in point',
+        'Zuggewicht': 'Draw weight',
+        'Bogen': 'Bow',
+        'Zoll': 'inch',
+        'Stück': 'Piece',
+        'Auf Lager': 'In stock',
+    },
+    ('it', 'en'): {
+        'Diametro': 'Diameter',
+        'Peso': 'Weight',
+        'Lunghezza': 'Length',
+        'Grani': 'Grains',
+        'Freccia': 'Arrow',
+        'Frecce': 'Arrows',
+        'Asta': 'Shaft',
+        'Carbonio': 'Carbon',
+        'Caccia': 'Hunting',
+    },
+    ('fr', 'en'): {
+        'Diamètre': 'Diameter',
+        'Poids': 'Weight',
+        'Longueur': 'Length',
+        'Flèche': 'Arrow',
+        'Tube': 'Shaft',
+        'Chasse': 'Hunting',
+    },
+}
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-ZÄÖÜ0-9])')
+UNIT_TOKENS = re.compile(r'\b(?:mm|cm|in|gr|gpi|g|eur)\b', re.IGNORECASE)
+
+
+def language_code(language: Optional[str]) -> str:
+    """Map a language name or code to an ISO code"""
+    if not language:
+        return 'auto'
+    return LANGUAGE_CODES.get(language.lower(), language.lower())
+
+
+def is_untranslatable(segment: str) -> bool:
+    """Numbers, units and punctuation only (e.g. '8,4 GPI', '±.001"') pass through unchanged"""
+    return not re.search(r'[^\W\d_]', UNIT_TOKENS.sub('', segment))
+
+
+def normalize_segment(text: str) -> str:
+    """Normalized lookup key: NFC, case-folded, whitespace collapsed"""
+    text = unicodedata.normalize('NFC', text)
+    return re.sub(r'\s+', ' ', text).strip().casefold()
+
+
+def split_segments(text: str) -> List[str]:
+    """Split text into translatable segments (lines, then sentences)"""
+    segments = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        segments.extend(s.strip() for s in SENTENCE_SPLIT.split(line) if s.strip())
+    return segments
+
+
+def join_segments(original: str, translations: Dict[str, str]) -> str:
+    """Rebuild text from translated segments, preserving the original line structure"""
+    lines = []
+    for line in original.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            lines.append(line)
+            continue
+        parts = [s.strip() for s in SENTENCE_SPLIT.split(stripped) if s.strip()]
+        lines.append(' '.join(translations.get(part, part) for part in parts))
+    return '\n'.join(lines)
+
+
+def build_batch_prompt(segments: List[str], source_lang: str, target_lang: str) -> str:
+    """Prompt that translates a list of segments in one request"""
+    numbered = json.dumps(segments, ensure_ascii=False, indent=0)
+    return f"""Translate each {source_lang} archery text segment in this JSON array to {target_lang}.
+
+RULES:
+- Preserve exact measurements and numbers (±.001", 8.4 GPI, spine 300, etc.)
+- Keep product names and brand names unchanged
+- Keep archery terms accurate (Target, 3D, Field, etc.)
+- Return ONLY a JSON array of strings with exactly {len(segments)} translations, in the same order
+
+Segments:
+{numbered}"""
+
+
+def batch_segments(segments: List[str]) -> List[List[str]]:
+    """Group segments into batches bounded by MAX_SEGMENTS_PER_BATCH and MAX_CHARS_PER_BATCH"""
+    batches, current, current_chars = [], [], 0
+    for segment in segments:
+        if current and (len(current) >= MAX_SEGMENTS_PER_BATCH or current_chars + len(segment) > MAX_CHARS_PER_BATCH):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(segment)
+        current_chars += len(segment)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(response_text: str, expected: int) -> Optional[List[str]]:
+    """Parse a JSON array of translations; None if the shape doesn't match"""
+    cleaned = re.sub(r'```(?:json)?', '', response_text).strip()
+    match = re.search(r'\[.*\]', cleaned, re.DOTALL)
+    if not match:
+        return None
+    try:
+        translations = json.loads(match.group())
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(translations, list) or len(translations) != expected:
+        return None
+    return [str(t).strip() for t in translations]
+
+
+class TranslationMemory:
+    """SQLite-backed segment translation memory"""
+
+    def __init__(self, db_path: str = "data/translation_memory.db", seed: bool = True):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, str, str], str] = {}
+        self.stats = {
+            'segments_requested': 0,
+            'cache_hits': 0,
+            'segments_translated': 0,
+            'texts_requested': 0,
+            'llm_calls': 0,
+        }
+        self._init_db()
+        if seed:
+            self.seed_vocabulary()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS translation_segments (
+                    source_key TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    origin TEXT DEFAULT 'llm',
+                    hit_count INTEGER DEFAULT 0,
+                    created_at TEXT,
+                    last_used_at TEXT,
+                    PRIMARY KEY (source_key, source_lang, target_lang)
+                )
+            ''')
+
+    def seed_vocabulary(self):
+        """Insert the built-in spec vocabulary (existing entries are kept)"""
+        now = datetime.now().isoformat()
+        rows = [
+            (normalize_segment(src), pair[0], pair[1], src, tgt, 'seed', now)
+            for pair, vocabulary in SEED_VOCABULARY.items()
+            for src, tgt in vocabulary.items()
+        ]
+        with self._lock, self._get_connection() as conn:
+            conn.executemany('''
+                INSERT OR IGNORE INTO translation_segments
+                (source_key, source_lang, target_lang, source_text, translated_text, origin, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+    def lookup_many(self, segments: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """Return {segment: translation} for every segment found in memory"""
+        src, tgt = language_code(source_lang), language_code(target_lang)
+        found: Dict[str, str] = {}
+        missing_keys: Dict[str, List[str]] = {}
+
+        for segment in segments:
+            key = normalize_segment(segment)
+            cached = self._cache.get((key, src, tgt))
+            if cached is not None:
+                found[segment] = cached
+            else:
+                missing_keys.setdefault(key, []).append(segment)
+
+        if missing_keys:
+            with self._lock, self._get_connection() as conn:
+                keys = list(missing_keys)
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = conn.execute(f'''
+                        SELECT source_key, translated_text FROM translation_segments
+                        WHERE source_lang = ? AND target_lang = ? AND source_key IN ({placeholders})
+                    ''', [src, tgt] + chunk).fetchall()
+                    for row in rows:
+                        self._cache[(row['source_key'], src, tgt)] = row['translated_text']
+                        for segment in missing_keys[row['source_key']]:
+                            found[segment] = row['translated_text']
+
+                hit_keys = {normalize_segment(s) for s in found} & set(missing_keys)
+                if hit_keys:
+                    conn.executemany('''
+                        UPDATE translation_segments SET hit_count = hit_count + 1, last_used_at = ?
+                        WHERE source_key = ? AND source_lang = ? AND target_lang = ?
+                    ''', [(datetime.now().isoformat(), key, src, tgt) for key in hit_keys])
+
+        return found
+
+    def store_many(self, pairs: List[Tuple[str, str]], source_lang: str, target_lang: str, origin: str = 'llm'):
+        """Persist (source, translation) pairs"""
+        src, tgt = language_code(source_lang), language_code(target_lang)
+        now = datetime.now().isoformat()
+        rows = []
+        for source, translated in pairs:
+            key = normalize_segment(source)
+            self._cache[(key, src, tgt)] = translated
+            rows.append((key, src, tgt, source, translated, origin, now, now))
+        with self._lock, self._get_connection() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO translation_segments
+                (source_key, source_lang, target_lang, source_text, translated_text, origin, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+    def prepare(self, texts: List[str], source_lang: str, target_lang: str) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Segment texts and resolve what memory already knows.
+        Returns (known translations by segment, unique segments still needing translation).
+        """
+        self.stats['texts_requested'] += len(texts)
+        segments = []
+        for text in texts:
+            segments.extend(split_segments(text))
+
+        self.stats['segments_requested'] += len(segments)
+        known = {s: s for s in segments if is_untranslatable(s)}
+        known.update(self.lookup_many([s for s in segments if s not in known], source_lang, target_lang))
+        self.stats['cache_hits'] += sum(1 for s in segments if s in known)
+
+        missing = list(dict.fromkeys(s for s in segments if s not in known))
+        return known, missing
+
+    def record_translations(self, segments: List[str], translations: List[str], source_lang: str, target_lang: str):
+        """Store a batch response and count the LLM call"""
+        self.stats['llm_calls'] += 1
+        self.stats['segments_translated'] += len(segments)
+        self.store_many(list(zip(segments, translations)), source_lang, target_lang)
+
+    def get_run_report(self) -> Dict[str, float]:
+        """Cache hit rate and LLM calls avoided for this run"""
+        requested = self.stats['segments_requested']
+        # Without memory every text (field) was one LLM call
+        calls_avoided = max(0, self.stats['texts_requested'] - self.stats['llm_calls'])
+        return {
+            **self.stats,
+            'hit_rate': self.stats['cache_hits'] / requested if requested else 0.0,
+            'calls_avoided': calls_avoided,
+        }
+
+    def print_run_report(self):
+        report = self.get_run_report()
+        print(f"🧠 Translation memory: {report['cache_hits']}/{report['segments_requested']} segments from memory "
+              f"({report['hit_rate']:.1%} hit rate), {report['llm_calls']} LLM calls, "
+              f"{report['calls_avoided']} calls avoided")
@@ -9,8 +9,6 @@ import math
 from typing import Dict, List, Any, Tuple, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime
-import numpy as np
-from scipy import stats
 
 class TuningRuleEngine:
     """Base class for all tuning rule processing"""
@@ -492,6 +490,10 @@ class WalkbackTuningRules(TuningRuleEngine):
             "reference_distance": 20  # distance where offsets are measured from
         }
         """
+        # numpy/scipy take ~1s to import; only walkback analysis needs them
+        import numpy as np
+        from scipy import stats
+
         distances = np.array(test_data.get('distances_m', []))
         offsets = np.array(test_data.get('x_offsets_cm', []))
         
@@ -10,6 +10,9 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from user_cache import invalidate_user
+import perf_monitor
+
 class UnifiedDatabase:
     """
     Unified database class that combines arrow and user data functionality
@@ -61,7 +64,7 @@ class UnifiedDatabase:
     
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
+        conn = perf_monitor.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
     
@@ -136,7 +139,9 @@ class UnifiedDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(f'UPDATE users SET {set_clause} WHERE id = ?', values)
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        invalidate_user(user_id)
+        return updated
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID (backwards compatible)"""
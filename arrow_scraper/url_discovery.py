@@ -13,6 +13,7 @@ import time
 from pathlib import Path
 import validators
 from url_manager import URLManager
+from async_discovery_crawler import AsyncDiscoveryCrawler, run_crawl
 
 class URLDiscovery:
     """Discovers and categorizes URLs from manufacturer pages"""
@@ -109,7 +110,8 @@ class URLDiscovery:
         }
     
     def discover_urls(self, base_url: str, content_type: str = 'auto', 
-                     max_depth: int = 2, max_urls: int = 50) -> Dict[str, List[str]]:
+                     max_depth: int = 2, max_urls: int = 50, max_pages: int = 200,
+                     time_budget: float = 30.0) -> Dict[str, List[str]]:
         """Discover URLs from a base page"""
         print(f"🔍 Starting URL discovery from: {base_url}")
         print(f"   Content type: {content_type}")
@@ -140,6 +142,7 @@ class URLDiscovery:
             print(f"📊 Found {len(links)} links on base page")
             
             processed_urls = set()
+            total_found = 0
             
             for link in links:
                 href = link.get('href')
@@ -166,10 +169,12 @@ class URLDiscovery:
                 if total_found >= max_urls:
                     break
             
-            # If we need more URLs and depth allows, crawl one level deeper
+            # If we need more URLs and depth allows, crawl the category pages breadth-first
             if max_depth > 1 and total_found < max_urls:
-                print(f"🔄 Crawling one level deeper...")
-                discovered = self._crawl_deeper(discovered, base_url, content_type, max_urls - total_found)
+                print(f"🔄 Crawling deeper (up to {max_depth - 1} more levels)...")
+                discovered = self._crawl_deeper(discovered, base_url, content_type, max_urls - total_found,
+                                                max_depth=max_depth - 1, max_pages=max_pages,
+                                                time_budget=time_budget)
             
             # Summary
             total_discovered = sum(len(urls) for urls in discovered.values())
@@ -247,59 +252,46 @@ class URLDiscovery:
         return any(indicator in url_lower for indicator in product_indicators)
     
     def _crawl_deeper(self, current_discovered: Dict[str, List[str]], 
-                     base_url: str, content_type: str, remaining_slots: int) -> Dict[str, List[str]]:
-        """Crawl one level deeper from category pages"""
+                     base_url: str, content_type: str, remaining_slots: int,
+                     max_depth: int = 1, max_pages: int = 200, time_budget: float = 30.0,
+                     per_domain_concurrency: int = 4) -> Dict[str, List[str]]:
+        """Crawl category pages breadth-first with the async discovery crawler"""
         
-        category_pages = []
+        # Every category/listing page found so far seeds the frontier
+        seeds = [(url, category)
+                 for category, urls in current_discovered.items()
+                 for url in urls if self._looks_like_category_page(url)]
+        if not seeds:
+            return current_discovered
         
-        # Look for category/listing pages first
-        for category, urls in current_discovered.items():
-            if not urls:
-                continue
-            
-            # Find URLs that look like category pages
-            for url in urls[:3]:  # Check first 3 URLs per category
-                if self._looks_like_category_page(url):
-                    category_pages.append((url, category))
+        def handle_link(url: str, link: Any, category: Optional[str], depth: int):
+            # Product pages inherit the category of the listing they were found on;
+            # nested listing pages are expanded while depth allows
+            if self._looks_like_category_page(url):
+                return None, True
+            if self._looks_like_product_page(url, link.get_text()):
+                return category, False
+            return None, False
         
-        discovered_count = 0
+        crawler = AsyncDiscoveryCrawler(
+            max_depth=max_depth,
+            per_domain_concurrency=per_domain_concurrency,
+            max_pages=max_pages,
+            max_seconds=time_budget,
+            max_urls=remaining_slots
+        )
+        already_seen = [url for urls in current_discovered.values() for url in urls]
+        result = run_crawl(crawler, seeds, handle_link, already_seen)
         
-        for category_url, category in category_pages:
-            if discovered_count >= remaining_slots:
-                break
-            
-            try:
-                print(f"   🔄 Crawling {category} category: {category_url}")
-                response = self.session.get(category_url, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    links = soup.find_all('a', href=True)
-                    
-                    for link in links[:20]:  # Limit to first 20 links
-                        href = link.get('href')
-                        if not href:
-                            continue
-                        
-                        full_url = urljoin(base_url, href)
-                        
-                        # Skip if already found
-                        if any(full_url in urls for urls in current_discovered.values()):
-                            continue
-                        
-                        if self._looks_like_product_page(full_url, link.get_text()):
-                            current_discovered[category].append(full_url)
-                            discovered_count += 1
-                            print(f"      🎯 Found {category}: {full_url}")
-                            
-                            if discovered_count >= remaining_slots:
-                                break
-                
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"   ⚠️  Error crawling {category_url}: {e}")
-                continue
+        for category, urls in result.discovered.items():
+            current_discovered.setdefault(category, [])
+            for url in urls:
+                current_discovered[category].append(url)
+                print(f"      🎯 Found {category}: {url}")
+        
+        stats = result.stats
+        print(f"   📊 Crawled {stats.pages_fetched} pages ({stats.pages_failed} failed) in {stats.elapsed_seconds:.1f}s, "
+              f"{stats.urls_found} new URLs, depth {stats.max_depth_reached}, stopped by {stats.stopped_by}")
         
         return current_discovered
     
@@ -400,6 +392,8 @@ if __name__ == "__main__":
     parser.add_argument('--auto-add', action='store_true', help='Automatically add all discovered URLs')
     parser.add_argument('--max-urls', type=int, default=50, help='Maximum URLs to discover')
     parser.add_argument('--validate', action='store_true', help='Validate discovered URLs')
+    parser.add_argument('--max-depth', type=int, default=2, help='Maximum crawl depth')
+    parser.add_argument('--time-budget', type=float, default=30.0, help='Crawl time budget in seconds')
     
     args = parser.parse_args()
     
@@ -407,7 +401,8 @@ if __name__ == "__main__":
         discovery = URLDiscovery()
         
         print(f"🚀 Starting URL discovery...")
-        discovered = discovery.discover_urls(args.url, args.type, max_urls=args.max_urls)
+        discovered = discovery.discover_urls(args.url, args.type, max_depth=args.max_depth,
+                                             max_urls=args.max_urls, time_budget=args.time_budget)
         
         if args.validate:
             discovered = discovery.validate_discovered_urls(discovered)
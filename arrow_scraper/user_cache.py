@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+User Cache
+In-process caches behind auth.token_required: decoded JWT payloads keyed by a hash of the token,
+and user rows keyed by user_id, so an authenticated request no longer builds a UnifiedDatabase,
+opens a connection and reads the user before the handler runs.
+
+Invalidation:
+- UnifiedDatabase/ArrowDatabase user writes (update_user, update_user_status, set_admin_status,
+  delete_user) drop this worker's entry immediately via invalidate_user().
+- Other workers follow a single-row users_version counter that triggers bump on every write to
+  the users table (including plain SQL updates), checked at most every VERSION_CHECK_INTERVAL
+  seconds. A suspension therefore reaches every worker within about a second. Migration 070
+  installs the counter; without it only the TTL applies.
+- Entries also expire after USER_CACHE_TTL seconds as a backstop.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 10))
+VERSION_CHECK_INTERVAL = 1.0
+USER_CACHE_SIZE = 4096
+TOKEN_CACHE_SIZE = 4096
+
+
+def get_user_version(conn: sqlite3.Connection) -> Optional[int]:
+    """Current users version, or None when version tracking is not installed"""
+    try:
+        row = conn.execute("SELECT version FROM users_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+class UserCache:
+    """Short-lived cache of decoded tokens and user rows for one worker process"""
+
+    def __init__(self, db, ttl: float = USER_CACHE_TTL, check_interval: float = VERSION_CHECK_INTERVAL):
+        """
+        Args:
+            db: UnifiedDatabase used to load users on a miss
+            ttl: Seconds a cached user row stays valid
+            check_interval: Seconds between users_version checks
+        """
+        self.db = db
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._users: "OrderedDict[int, tuple]" = OrderedDict()
+        self._tokens: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _read_version(self) -> Optional[int]:
+        conn = sqlite3.connect(self.db.db_path, timeout=1.0)
+        try:
+            return get_user_version(conn)
+        finally:
+            conn.close()
+
+    def _check_version(self):
+        """Drop every cached user when another worker (or plain SQL) changed the users table"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+        # Read outside the lock so other requests keep hitting the cache during the I/O
+        try:
+            version = self._read_version()
+        except sqlite3.Error as e:
+            # Locked or read-only database: rely on the TTL until the next check
+            print(f"⚠️ User cache version check failed: {e}")
+            return
+        with self._lock:
+            if version != self._version:
+                self._users.clear()
+                self._version = version
+
+    def decode_token(self, token: str, secret: str) -> Dict[str, Any]:
+        """jwt.decode with the result cached per token; raises the same jwt errors"""
+        import jwt  # only the API needs PyJWT; scrapers import the database modules without it
+
+        key = hashlib.sha256(token.encode()).hexdigest()
+        with self._lock:
+            payload = self._tokens.get(key)
+            if payload is not None:
+                self._tokens.move_to_end(key)
+        if payload is None:
+            payload = jwt.decode(token, secret, algorithms=["HS256"])
+            with self._lock:
+                self._tokens[key] = payload
+                if len(self._tokens) > TOKEN_CACHE_SIZE:
+                    self._tokens.popitem(last=False)
+        elif 'exp' in payload and time.time() >= payload['exp']:
+            with self._lock:
+                self._tokens.pop(key, None)
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload
+
+    def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """User row for user_id (a copy the caller may modify), or None if the user does not exist"""
+        self._check_version()
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._users.move_to_end(user_id)
+                self.hits += 1
+                return dict(entry[1])
+            version = self._version
+
+        self.misses += 1
+        user = self.db.get_user_by_id(user_id)
+        if user is None:
+            return None
+        with self._lock:
+            # Skip storing if the users table changed while we were reading
+            if version == self._version:
+                self._users[user_id] = (time.monotonic(), user)
+                if len(self._users) > USER_CACHE_SIZE:
+                    self._users.popitem(last=False)
+        return dict(user)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Forget one user (or every user) in this worker"""
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+            else:
+                self._users.pop(user_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'users': len(self._users),
+            'tokens': len(self._tokens),
+            'hits': self.hits,
+            'misses': self.misses,
+            'version': self._version,
+            'ttl_seconds': self.ttl,
+        }
+
+
+_user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    """Per-process user cache (created on first use, so nothing is opened at import time)"""
+    global _user_cache
+    if _user_cache is None:
+        from unified_database import UnifiedDatabase
+        _user_cache = UserCache(UnifiedDatabase())
+    return _user_cache
+
+
+def invalidate_user(user_id: Optional[int] = None):
+    """Called after user writes; other workers pick the change up through users_version"""
+    if _user_cache is not None:
+        _user_cache.invalidate(user_id)